@@ -0,0 +1,52 @@
+"""Replace overlapping student_attempts indexes with covering composites
+
+Revision ID: 20261016_attempt_indexes
+Revises: 20261016_partition_attempts
+Create Date: 2026-10-16
+
+단일 컬럼 인덱스(student_id, concept, attempted_at)와 (student_id, concept)는
+학생 접두 복합 인덱스와 겹치므로 제거하고, 학생-개념 시간순 조회를 위한
+커버링 인덱스를 만든다.
+
+- idx_student_concept_time: (student_id, concept, attempted_at, id) INCLUDE (is_correct, response_time_ms)
+- idx_student_date: (student_id, attempted_at, id)
+
+파티션 부모 테이블에 만들면 모든 파티션에 전파된다.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_attempt_indexes'
+down_revision = '20261016_partition_attempts'
+branch_labels = None
+depends_on = None
+
+TABLE = 'student_attempts'
+
+
+def upgrade():
+    for name in (
+        'ix_student_attempts_student_id',
+        'ix_student_attempts_concept',
+        'ix_student_attempts_attempted_at',
+        'idx_student_concept',
+        'idx_student_date',
+    ):
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+
+    op.execute(
+        f'CREATE INDEX idx_student_concept_time ON {TABLE} '
+        f'(student_id, concept, attempted_at, id) INCLUDE (is_correct, response_time_ms)'
+    )
+    op.execute(f'CREATE INDEX idx_student_date ON {TABLE} (student_id, attempted_at, id)')
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS idx_student_concept_time')
+    op.execute('DROP INDEX IF EXISTS idx_student_date')
+
+    op.execute(f'CREATE INDEX ix_student_attempts_student_id ON {TABLE} (student_id)')
+    op.execute(f'CREATE INDEX ix_student_attempts_concept ON {TABLE} (concept)')
+    op.execute(f'CREATE INDEX ix_student_attempts_attempted_at ON {TABLE} (attempted_at)')
+    op.execute(f'CREATE INDEX idx_student_concept ON {TABLE} (student_id, concept)')
+    op.execute(f'CREATE INDEX idx_student_date ON {TABLE} (student_id, attempted_at)')
@@ -0,0 +1,117 @@
+"""Partition student_attempts by month on attempted_at
+
+Revision ID: 20261016_partition_attempts
+Revises: 20260112_conversational
+Create Date: 2026-10-16
+
+student_attempts를 attempted_at 월별 RANGE 파티션 테이블로 바꾼다 (PostgreSQL 전용).
+
+- 기존 테이블이 있으면 이름을 바꾸고, 데이터가 있는 월 ~ 현재+MONTHS_AHEAD 월 파티션과
+  DEFAULT 파티션을 만든 뒤 행을 옮긴다. ID 시퀀스는 그대로 이어서 사용한다.
+- 파티션 키가 기본키에 포함되어야 하므로 기본키는 (id, attempted_at)이다.
+  id는 여전히 시퀀스로 유일하며 ORM은 id만 기본키로 취급한다.
+- 인덱스는 부모 테이블에 만들어 모든 파티션에 전파한다.
+
+이후 월 파티션 생성/분리는 scripts/manage_attempt_partitions.py (app/db/partitioning.py)로 한다.
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_partition_attempts'
+down_revision = '20260112_conversational'
+branch_labels = None
+depends_on = None
+
+TABLE = 'student_attempts'
+SEQUENCE = 'student_attempts_id_seq'
+MONTHS_AHEAD = 3
+
+COLUMNS = 'id, student_id, question_id, concept, is_correct, response_time_ms, attempted_at'
+
+INDEXES = (
+    ('ix_student_attempts_student_id', 'student_id'),
+    ('ix_student_attempts_concept', 'concept'),
+    ('ix_student_attempts_attempted_at', 'attempted_at'),
+    ('idx_student_concept', 'student_id, concept'),
+    ('idx_student_date', 'student_id, attempted_at'),
+)
+
+
+def _columns_ddl(primary_key: str) -> str:
+    return f"""
+        id INTEGER NOT NULL DEFAULT nextval('{SEQUENCE}'),
+        student_id VARCHAR(100) NOT NULL,
+        question_id VARCHAR(100) NOT NULL,
+        concept VARCHAR(100) NOT NULL,
+        is_correct BOOLEAN NOT NULL,
+        response_time_ms INTEGER,
+        attempted_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        PRIMARY KEY ({primary_key})
+    """
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + (value.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes():
+    for name, columns in INDEXES:
+        op.execute(f'CREATE INDEX {name} ON {TABLE} ({columns})')
+
+
+def upgrade():
+    bind = op.get_bind()
+    exists = sa.inspect(bind).has_table(TABLE)
+
+    if exists:
+        op.execute(f'ALTER TABLE {TABLE} RENAME TO {TABLE}_unpartitioned')
+        op.execute(f'ALTER TABLE {TABLE}_unpartitioned RENAME CONSTRAINT {TABLE}_pkey TO {TABLE}_unpartitioned_pkey')
+        op.execute(f'ALTER SEQUENCE {SEQUENCE} OWNED BY NONE')
+        first = bind.execute(sa.text(f'SELECT min(attempted_at) FROM {TABLE}_unpartitioned')).scalar()
+    else:
+        op.execute(f'CREATE SEQUENCE IF NOT EXISTS {SEQUENCE}')
+        first = None
+
+    op.execute(
+        f'CREATE TABLE {TABLE} ({_columns_ddl("id, attempted_at")}) '
+        f'PARTITION BY RANGE (attempted_at)'
+    )
+
+    now = datetime.utcnow()
+    month = datetime((first or now).year, (first or now).month, 1)
+    last = _add_months(datetime(now.year, now.month, 1), MONTHS_AHEAD)
+    while month <= last:
+        following = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {TABLE}_y{month.year:04d}m{month.month:02d} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat(sep=' ')}') TO ('{following.isoformat(sep=' ')}')"
+        )
+        month = following
+    op.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+
+    if exists:
+        op.execute(f'INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {TABLE}_unpartitioned')
+        op.execute(f'DROP TABLE {TABLE}_unpartitioned')
+
+    op.execute(f'ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id')
+    _create_indexes()
+
+
+def downgrade():
+    # 분리(DETACH)된 파티션의 행은 되돌리지 않는다
+    op.execute(f'ALTER TABLE {TABLE} RENAME TO {TABLE}_partitioned')
+    op.execute(f'ALTER TABLE {TABLE}_partitioned RENAME CONSTRAINT {TABLE}_pkey TO {TABLE}_partitioned_pkey')
+    op.execute(f'ALTER SEQUENCE {SEQUENCE} OWNED BY NONE')
+    for name, _ in INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+
+    op.execute(f'CREATE TABLE {TABLE} ({_columns_ddl("id")})')
+    op.execute(f'INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {TABLE}_partitioned')
+    op.execute(f'DROP TABLE {TABLE}_partitioned CASCADE')
+
+    op.execute(f'ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id')
+    _create_indexes()
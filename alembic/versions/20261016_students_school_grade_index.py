@@ -0,0 +1,30 @@
+"""Add (school_id, grade, id) index on students
+
+Revision ID: 20261016_students_index
+Revises: 20261016_attempt_indexes
+Create Date: 2026-10-16
+
+학교/학년 필터 조회와 StudentRepository.get_page() 키셋 페이지네이션을 위한 복합 인덱스.
+students는 파티션 테이블이 아니므로 CONCURRENTLY로 만들어 쓰기를 막지 않는다
+(트랜잭션 블록 밖에서 실행해야 하므로 autocommit_block 사용).
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_students_index'
+down_revision = '20261016_attempt_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_students_school_grade_id '
+            'ON students (school_id, grade, id)'
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_students_school_grade_id')
@@ -4,6 +4,19 @@ Learning Algorithms Package
 학습 분석 및 예측을 위한 알고리즘 모음
 """
 from app.algorithms.bkt import BayesianKnowledgeTracing
+from app.algorithms.bkt_fitting import BKTGridFitter
+from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+from app.algorithms.cat import AdaptiveTestSession
 from app.algorithms.irt import ItemResponseTheory
+from app.algorithms.item_bank_index import ItemBankIndex
+from app.algorithms.irt_calibration import JointMLECalibrator
 
-__all__ = ["BayesianKnowledgeTracing", "ItemResponseTheory"]
+__all__ = [
+    "AdaptiveTestSession",
+    "BayesianKnowledgeTracing",
+    "BKTGridFitter",
+    "ForgettingKnowledgeTracing",
+    "ItemResponseTheory",
+    "ItemBankIndex",
+    "JointMLECalibrator",
+]
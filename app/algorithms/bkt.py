@@ -21,8 +21,16 @@ BKT는 4가지 파라미터를 사용:
 
 3. 학습 전이:
    P(L_t) = P(L_t | evidence) + (1 - P(L_t | evidence)) * T
+
+배치 계산:
+   여러 시도 시퀀스를 (offsets, outcomes) 형태의 packed 배열로 받아
+   모든 시퀀스의 베이지안 업데이트를 NumPy로 한 번에 수행한다.
+   시퀀스 i의 관측값은 outcomes[offsets[i]:offsets[i+1]] 이다.
 """
-from typing import List, Union, Dict, Any
+from datetime import datetime, timedelta
+from typing import List, Union, Dict, Any, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 class BayesianKnowledgeTracing:
@@ -37,6 +45,9 @@ class BayesianKnowledgeTracing:
         Mastery: 0.65
     """
 
+    # 시도 간 시간 간격을 사용하는 모델인지 (False면 정답 여부 시퀀스만으로 계산 가능)
+    time_dependent = False
+
     def __init__(
         self,
         p_init: float = 0.1,
@@ -121,22 +132,364 @@ class BayesianKnowledgeTracing:
             else:
                 is_correct = attempt.is_correct
 
-            # 관측 결과에 따라 숙련도 업데이트
+            p_mastery = self.update(p_mastery, is_correct)
+
+        return p_mastery
+
+    def calculate_mastery_from_outcomes(
+        self,
+        outcomes: Union[Sequence[bool], bytes, bytearray, np.ndarray]
+    ) -> float:
+        """
+        정답 여부 시퀀스만으로 숙련도 계산
+
+        StudentAttemptRepository.get_outcomes()의 bool 배열을 그대로 받아
+        시도별 dict를 만들지 않고 calculate_mastery와 같은 값을 계산한다.
+
+        Args:
+            outcomes: 시간순 정답 여부 (bool 배열, bytes/bytearray의 0/1 등)
+
+        Returns:
+            현재 숙련도 확률 (0.0 ~ 1.0)
+
+        Examples:
+            >>> bkt = BayesianKnowledgeTracing()
+            >>> bkt.calculate_mastery_from_outcomes(np.array([True, True, False])) == \
+            ...     bkt.calculate_mastery([{"is_correct": c} for c in (True, True, False)])
+            True
+        """
+        p_mastery = self.p_init
+        for is_correct in np.asarray(outcomes, dtype=bool).tolist():
+            p_mastery = self.update(p_mastery, is_correct)
+        return p_mastery
+
+    def calculate_trajectory(
+        self,
+        attempts: List[Union[Dict[str, Any], Any]]
+    ) -> List[float]:
+        """
+        시도마다의 숙련도 궤적 계산 (한 번의 O(N) 순회)
+
+        trajectory[i]는 calculate_mastery(attempts[:i+1])와 같다.
+        즉 i번째 시도까지 관측한 뒤의 숙련도(필터링 추정)이다.
+
+        Args:
+            attempts: 시간순 시도 기록 리스트 (calculate_mastery와 동일 형식)
+
+        Returns:
+            시도 수와 같은 길이의 숙련도 리스트
+
+        Examples:
+            >>> bkt = BayesianKnowledgeTracing()
+            >>> attempts = [{"is_correct": True}, {"is_correct": False}]
+            >>> trajectory = bkt.calculate_trajectory(attempts)
+            >>> trajectory[-1] == bkt.calculate_mastery(attempts)
+            True
+        """
+        trajectory = []
+        p_mastery = self.p_init
+
+        for is_correct in self._outcomes(attempts):
+            p_mastery = self.update(p_mastery, is_correct)
+            trajectory.append(p_mastery)
+
+        return trajectory
+
+    def calculate_smoothed_trajectory(
+        self,
+        attempts: List[Union[Dict[str, Any], Any]]
+    ) -> List[float]:
+        """
+        전체 관측을 반영한 숙련도 궤적 계산 (forward-backward)
+
+        smoothed[i] = P(i번째 시도 이후 숙련 상태 | 모든 시도)
+        필터링 궤적과 같은 시점의 값이므로 마지막 값은 calculate_mastery와 같다.
+        이후의 정답이 이전 시점의 숙련 가능성을 높이는 것처럼,
+        나중 관측이 과거 추정을 보정한다.
+
+        숙련 상태는 잃지 않으므로(망각 없음) 역방향 단계는
+            P(K_t=1 | 전체) = P(K_t=1 | obs_1..t) / P(K_t+1=1 | obs_1..t) * P(K_t+1=1 | 전체)
+        로 계산된다.
+
+        Args:
+            attempts: 시간순 시도 기록 리스트
+
+        Returns:
+            시도 수와 같은 길이의 smoothed 숙련도 리스트
+        """
+        outcomes = self._outcomes(attempts)
+        if not outcomes:
+            return []
+
+        # Forward: 관측 반영 직후 사후확률(posteriors)과 전이 후 예측(priors)
+        posteriors = []
+        priors = []
+        p_mastery = self.p_init
+        for is_correct in outcomes:
             if is_correct:
-                # 정답: P(L | correct) 계산
-                p_mastery = self._update_correct(p_mastery)
-                # 학습 전이는 정답 후에만 적용 (실제 학습이 일어날 때)
-                p_mastery = p_mastery + (1 - p_mastery) * self.p_learn
+                posterior = self._update_correct(p_mastery)
+                p_mastery = posterior + (1 - posterior) * self.p_learn
             else:
-                # 오답: P(L | wrong) 계산
-                p_mastery = self._update_wrong(p_mastery)
-                # 오답 후에는 학습 전이 없음
-
-            # 확률 범위 보정 (수치 오차 방지)
+                posterior = self._update_wrong(p_mastery)
+                p_mastery = posterior
+            posteriors.append(max(0.0, min(1.0, posterior)))
             p_mastery = max(0.0, min(1.0, p_mastery))
+            priors.append(p_mastery)
+
+        # Backward: smoothed[i] = P(K_{i+2}=1 | 전체), 마지막은 필터링 값과 동일
+        smoothed = [0.0] * len(outcomes)
+        smoothed[-1] = priors[-1]
+        for i in range(len(outcomes) - 1, 0, -1):
+            if priors[i] == 0:
+                smoothed[i - 1] = 0.0
+            else:
+                smoothed[i - 1] = max(0.0, min(1.0, posteriors[i] / priors[i] * smoothed[i]))
+
+        return smoothed
+
+    @staticmethod
+    def _outcomes(attempts: List[Union[Dict[str, Any], Any]]) -> List[bool]:
+        """dict 또는 is_correct 속성 객체 리스트에서 정답 여부 추출"""
+        return [
+            attempt["is_correct"] if isinstance(attempt, dict) else attempt.is_correct
+            for attempt in attempts
+        ]
+
+    def update(self, p_mastery: float, is_correct: bool) -> float:
+        """
+        관측 1건에 대한 BKT 한 스텝 업데이트
+
+        저장된 숙련도 상태에 새 시도를 O(1)로 반영할 때 사용한다.
+        calculate_mastery는 이 메서드를 시도마다 반복 적용한 것과 같다.
+
+        Args:
+            p_mastery: 현재 숙련도 확률
+            is_correct: 정답 여부
+
+        Returns:
+            업데이트된 숙련도 확률
+
+        Examples:
+            >>> bkt = BayesianKnowledgeTracing()
+            >>> p = bkt.update(bkt.p_init, True)
+            >>> p == bkt.calculate_mastery([{"is_correct": True}])
+            True
+        """
+        # 관측 결과에 따라 숙련도 업데이트
+        if is_correct:
+            # 정답: P(L | correct) 계산
+            p_mastery = self._update_correct(p_mastery)
+            # 학습 전이는 정답 후에만 적용 (실제 학습이 일어날 때)
+            p_mastery = p_mastery + (1 - p_mastery) * self.p_learn
+        else:
+            # 오답: P(L | wrong) 계산
+            p_mastery = self._update_wrong(p_mastery)
+            # 오답 후에는 학습 전이 없음
+
+        # 확률 범위 보정 (수치 오차 방지)
+        return max(0.0, min(1.0, p_mastery))
+
+    def decay(self, p_mastery: float, elapsed: timedelta) -> float:
+        """
+        시간 경과에 따른 숙련도 감쇠 (기본 BKT는 망각 없음)
 
+        시간 인식 변형(ForgettingKnowledgeTracing)이 재정의한다.
+
+        Args:
+            p_mastery: 마지막 시도 직후 숙련도
+            elapsed: 마지막 시도 이후 경과 시간
+
+        Returns:
+            감쇠된 숙련도 (기본 BKT는 그대로 반환)
+        """
         return p_mastery
 
+    def mastery_at(
+        self,
+        attempts: List[Union[Dict[str, Any], Any]],
+        as_of: datetime
+    ) -> float:
+        """
+        특정 시각 기준 숙련도 계산
+
+        as_of 이후의 시도는 무시하고, 마지막 시도부터 as_of까지의 감쇠를 적용한다.
+
+        Args:
+            attempts: attempted_at을 포함한 시간순 시도 기록 리스트
+            as_of: 기준 시각
+
+        Returns:
+            as_of 시점의 숙련도
+        """
+        visible = [
+            attempt for attempt in attempts
+            if self._attempted_at(attempt) is None or self._attempted_at(attempt) <= as_of
+        ]
+        p_mastery = self.calculate_mastery(visible)
+
+        last_attempted_at = self._attempted_at(visible[-1]) if visible else None
+        if last_attempted_at is None:
+            return p_mastery
+        return self.decay(p_mastery, as_of - last_attempted_at)
+
+    @staticmethod
+    def _attempted_at(attempt: Union[Dict[str, Any], Any]) -> Optional[datetime]:
+        """dict 또는 객체에서 attempted_at 추출 (없으면 None)"""
+        if isinstance(attempt, dict):
+            return attempt.get("attempted_at")
+        return getattr(attempt, "attempted_at", None)
+
+    @property
+    def params(self) -> Tuple[float, float, float, float]:
+        """(p_init, p_learn, p_slip, p_guess) 튜플"""
+        return (self.p_init, self.p_learn, self.p_slip, self.p_guess)
+
+    @property
+    def params_key(self) -> str:
+        """
+        파라미터 식별 문자열
+
+        저장된 숙련도 상태가 어떤 파라미터로 계산되었는지 기록/비교할 때 사용한다.
+        """
+        return ",".join(repr(float(p)) for p in self.params)
+
+    def calculate_mastery_batch(
+        self,
+        offsets: Union[Sequence[int], np.ndarray],
+        outcomes: Union[Sequence[bool], np.ndarray]
+    ) -> np.ndarray:
+        """
+        여러 시도 시퀀스의 숙련도를 한 번에 계산 (벡터화)
+
+        시퀀스를 길이 내림차순으로 정렬해 t번째 스텝에서 아직 남은 시퀀스가
+        항상 앞쪽 prefix가 되도록 한 뒤, 스텝마다 활성 시퀀스 전체를
+        한 번의 배열 연산으로 업데이트한다. 반복 횟수는 시퀀스 수가 아니라
+        가장 긴 시퀀스 길이에 비례한다.
+
+        calculate_mastery와 동일한 순서로 부동소수점 연산을 수행하므로
+        스칼라 경로와 같은 값을 반환한다.
+
+        Args:
+            offsets: 길이 n+1의 정수 배열. offsets[0] == 0,
+                     offsets[-1] == len(outcomes), 단조 비감소
+            outcomes: 모든 시퀀스의 정답 여부를 이어 붙인 bool 배열
+
+        Returns:
+            길이 n의 숙련도 배열 (시퀀스 순서 유지)
+
+        Raises:
+            ValueError: offsets 형식이 잘못된 경우
+
+        Examples:
+            >>> bkt = BayesianKnowledgeTracing()
+            >>> offsets, outcomes = BayesianKnowledgeTracing.pack_sequences(
+            ...     [[True, True], [False], []]
+            ... )
+            >>> masteries = bkt.calculate_mastery_batch(offsets, outcomes)
+            >>> masteries.shape
+            (3,)
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        outcomes = np.asarray(outcomes, dtype=bool)
+        self.validate_packed(offsets, outcomes)
+
+        n_sequences = offsets.size - 1
+        if n_sequences == 0 or outcomes.size == 0:
+            return np.full(n_sequences, self.p_init, dtype=np.float64)
+
+        order, starts, active_counts = sequence_schedule(offsets)
+
+        p_sorted = np.full(n_sequences, self.p_init, dtype=np.float64)
+        slip_complement = 1 - self.p_slip
+        guess_complement = 1 - self.p_guess
+
+        for step, active in enumerate(active_counts.tolist()):
+            p_mastery = p_sorted[:active]
+            is_correct = outcomes[starts[:active] + step]
+            p_unknown = 1 - p_mastery
+
+            # 정답/오답 관측 각각의 사후확률 분자·분모 (_update_correct/_update_wrong과 동일)
+            numerator = np.where(
+                is_correct,
+                p_mastery * slip_complement,
+                p_mastery * self.p_slip
+            )
+            denominator = np.where(
+                is_correct,
+                p_mastery * slip_complement + p_unknown * self.p_guess,
+                p_mastery * self.p_slip + p_unknown * guess_complement
+            )
+
+            # 분모가 0이면 기존 값 유지 (수치 안정성)
+            posterior = np.divide(
+                numerator,
+                denominator,
+                out=p_mastery.copy(),
+                where=denominator != 0
+            )
+
+            # 학습 전이는 정답 후에만 적용
+            posterior = np.where(
+                is_correct,
+                posterior + (1 - posterior) * self.p_learn,
+                posterior
+            )
+
+            p_sorted[:active] = np.clip(posterior, 0.0, 1.0)
+
+        masteries = np.empty(n_sequences, dtype=np.float64)
+        masteries[order] = p_sorted
+        return masteries
+
+    @staticmethod
+    def pack_sequences(
+        sequences: Iterable[Iterable[bool]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        시도 시퀀스 리스트를 (offsets, outcomes) packed 배열로 변환
+
+        Args:
+            sequences: 시퀀스별 정답 여부(bool) 리스트
+
+        Returns:
+            (offsets, outcomes) 튜플
+        """
+        lengths = [0]
+        flat: List[bool] = []
+        for sequence in sequences:
+            before = len(flat)
+            flat.extend(sequence)
+            lengths.append(len(flat) - before)
+
+        offsets = np.cumsum(np.asarray(lengths, dtype=np.int64))
+        outcomes = np.asarray(flat, dtype=bool)
+        return offsets, outcomes
+
+    @staticmethod
+    def validate_packed(offsets: np.ndarray, outcomes: np.ndarray) -> None:
+        """
+        packed 배열의 offsets 검증
+
+        Args:
+            offsets: 시퀀스 경계 배열
+            outcomes: 관측값 배열
+
+        Raises:
+            ValueError: offsets가 1차원이 아니거나, 0으로 시작하지 않거나,
+                        len(outcomes)로 끝나지 않거나, 감소하는 구간이 있는 경우
+        """
+        if offsets.ndim != 1 or offsets.size == 0:
+            raise ValueError("offsets must be a non-empty 1-D array")
+        if outcomes.ndim != 1:
+            raise ValueError("outcomes must be a 1-D array")
+        if offsets[0] != 0 or offsets[-1] != outcomes.size:
+            raise ValueError(
+                f"offsets must start at 0 and end at len(outcomes)={outcomes.size}, "
+                f"got [{offsets[0]}, ..., {offsets[-1]}]"
+            )
+        if np.any(np.diff(offsets) < 0):
+            raise ValueError("offsets must be non-decreasing")
+
     def _update_correct(self, p_mastery: float) -> float:
         """
         정답 관측 시 숙련도 업데이트
@@ -196,3 +549,30 @@ class BayesianKnowledgeTracing:
             f"p_slip={self.p_slip}, "
             f"p_guess={self.p_guess})"
         )
+
+
+def sequence_schedule(offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    packed 시퀀스를 스텝 단위로 벡터화하기 위한 순회 계획 계산
+
+    시퀀스를 길이 내림차순으로 정렬하면 t번째 스텝에서 아직 관측이 남은
+    시퀀스는 항상 정렬 순서의 앞쪽 prefix가 된다.
+
+    Args:
+        offsets: 검증된 시퀀스 경계 배열 (길이 n+1)
+
+    Returns:
+        (order, starts, active_counts) 튜플
+        - order: 정렬 순서 → 원래 시퀀스 인덱스
+        - starts: 정렬 순서의 시퀀스 시작 위치
+        - active_counts: 스텝 t에서 활성 시퀀스 수 (길이 = 최대 시퀀스 길이)
+    """
+    lengths = np.diff(offsets)
+    order = np.argsort(-lengths, kind="stable")
+    sorted_lengths = lengths[order]
+    starts = offsets[:-1][order]
+    max_length = int(sorted_lengths[0]) if sorted_lengths.size else 0
+    active_counts = np.searchsorted(
+        -sorted_lengths, -np.arange(max_length), side="left"
+    )
+    return order, starts, active_counts
@@ -0,0 +1,234 @@
+"""
+BKT Parameter Fitting
+
+개념별 BKT 파라미터(p_init, p_learn, p_slip, p_guess)를 관측된 시도 기록으로부터
+추정하는 벡터화 그리드 서치
+
+방법:
+- 파라미터 후보 격자(G개)를 만들고, 모든 후보에 대한 로그우도를
+  (G, 시퀀스) 배열 연산으로 한 번에 계산한다.
+- 로그우도는 시퀀스 단위로 더해지므로 청크별로 누적할 수 있다.
+  → 전체 데이터를 메모리에 올리지 않고 한 번의 스트리밍으로 적합 가능
+
+관측 확률 (BayesianKnowledgeTracing과 동일한 모델):
+    P(correct_t) = P(L_t) * (1 - S) + (1 - P(L_t)) * G
+    로그우도 = Σ log P(obs_t)
+
+식별 가능성을 위해 p_slip, p_guess 후보는 0.5 미만으로 제한한다.
+"""
+from typing import Dict, Any, Optional, Sequence, Union
+
+import numpy as np
+
+from app.algorithms.bkt import BayesianKnowledgeTracing, sequence_schedule
+
+
+DEFAULT_P_INIT_GRID = (0.05, 0.15, 0.3, 0.5, 0.7)
+DEFAULT_P_LEARN_GRID = (0.02, 0.05, 0.1, 0.2, 0.3, 0.45)
+DEFAULT_P_SLIP_GRID = (0.02, 0.05, 0.1, 0.2, 0.3)
+DEFAULT_P_GUESS_GRID = (0.05, 0.1, 0.2, 0.3, 0.4)
+
+# log(0) 방지용
+_EPSILON = 1e-12
+
+
+class BKTGridFitter:
+    """
+    개념별 BKT 파라미터 그리드 서치 (청크 단위 누적)
+
+    Examples:
+        >>> fitter = BKTGridFitter()
+        >>> offsets, outcomes = BayesianKnowledgeTracing.pack_sequences(
+        ...     [[False, True, True], [True, True]]
+        ... )
+        >>> fitter.partial_fit("이차방정식", offsets, outcomes)
+        >>> bkt = fitter.best_model("이차방정식")
+    """
+
+    def __init__(
+        self,
+        p_init_grid: Sequence[float] = DEFAULT_P_INIT_GRID,
+        p_learn_grid: Sequence[float] = DEFAULT_P_LEARN_GRID,
+        p_slip_grid: Sequence[float] = DEFAULT_P_SLIP_GRID,
+        p_guess_grid: Sequence[float] = DEFAULT_P_GUESS_GRID
+    ):
+        """
+        그리드 초기화
+
+        Args:
+            p_init_grid: p_init 후보
+            p_learn_grid: p_learn 후보
+            p_slip_grid: p_slip 후보 (0.5 미만)
+            p_guess_grid: p_guess 후보 (0.5 미만)
+
+        Raises:
+            ValueError: 후보가 비어있거나 범위를 벗어난 경우
+        """
+        grids = {
+            "p_init": p_init_grid,
+            "p_learn": p_learn_grid,
+            "p_slip": p_slip_grid,
+            "p_guess": p_guess_grid,
+        }
+        for name, grid in grids.items():
+            if len(grid) == 0:
+                raise ValueError(f"{name} grid must not be empty")
+            for value in grid:
+                BayesianKnowledgeTracing._validate_probability(value, name)
+        for name in ("p_slip", "p_guess"):
+            if max(grids[name]) >= 0.5:
+                raise ValueError(f"{name} grid values must be below 0.5")
+
+        mesh = np.meshgrid(
+            *(np.asarray(grid, dtype=np.float64) for grid in grids.values()),
+            indexing="ij"
+        )
+        # (G, 1) 형태로 두어 (G, 시퀀스) 배열과 브로드캐스트
+        self.p_init, self.p_learn, self.p_slip, self.p_guess = (
+            axis.reshape(-1, 1) for axis in mesh
+        )
+        self.grid_size = self.p_init.shape[0]
+
+        # 개념별 누적 통계
+        self._log_likelihood: Dict[str, np.ndarray] = {}
+        self._n_sequences: Dict[str, int] = {}
+        self._n_attempts: Dict[str, int] = {}
+
+    def log_likelihood(
+        self,
+        offsets: Union[Sequence[int], np.ndarray],
+        outcomes: Union[Sequence[bool], np.ndarray]
+    ) -> np.ndarray:
+        """
+        packed 시퀀스 묶음에 대한 모든 후보의 로그우도 계산
+
+        Args:
+            offsets: 시퀀스 경계 배열 (길이 n+1)
+            outcomes: 정답 여부 배열
+
+        Returns:
+            길이 G의 로그우도 배열
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        outcomes = np.asarray(outcomes, dtype=bool)
+        BayesianKnowledgeTracing.validate_packed(offsets, outcomes)
+
+        total = np.zeros(self.grid_size, dtype=np.float64)
+        n_sequences = offsets.size - 1
+        if n_sequences == 0 or outcomes.size == 0:
+            return total
+
+        _, starts, active_counts = sequence_schedule(offsets)
+        p_mastery = np.repeat(self.p_init, n_sequences, axis=1)
+
+        for step, active in enumerate(active_counts.tolist()):
+            current = p_mastery[:, :active]
+            is_correct = outcomes[starts[:active] + step]
+
+            # 관측 확률 P(correct) = P(L)(1-S) + (1-P(L))G
+            known_correct = current * (1 - self.p_slip)
+            p_correct = known_correct + (1 - current) * self.p_guess
+            p_correct = np.clip(p_correct, _EPSILON, 1 - _EPSILON)
+
+            total += np.where(
+                is_correct, np.log(p_correct), np.log1p(-p_correct)
+            ).sum(axis=1)
+
+            # 사후확률 (오답 분모 = 1 - P(correct))
+            posterior = np.where(
+                is_correct,
+                known_correct / p_correct,
+                current * self.p_slip / (1 - p_correct)
+            )
+            # 학습 전이는 정답 후에만 적용
+            posterior = np.where(
+                is_correct,
+                posterior + (1 - posterior) * self.p_learn,
+                posterior
+            )
+            p_mastery[:, :active] = np.clip(posterior, 0.0, 1.0)
+
+        return total
+
+    def partial_fit(
+        self,
+        concept: str,
+        offsets: Union[Sequence[int], np.ndarray],
+        outcomes: Union[Sequence[bool], np.ndarray]
+    ) -> None:
+        """
+        한 청크의 시퀀스를 개념별 누적 로그우도에 반영
+
+        한 시퀀스(학생-개념)는 반드시 하나의 청크 안에 완결되어야 한다.
+
+        Args:
+            concept: 개념명
+            offsets: 시퀀스 경계 배열
+            outcomes: 정답 여부 배열
+        """
+        chunk_ll = self.log_likelihood(offsets, outcomes)
+
+        if concept not in self._log_likelihood:
+            self._log_likelihood[concept] = np.zeros(self.grid_size, dtype=np.float64)
+            self._n_sequences[concept] = 0
+            self._n_attempts[concept] = 0
+
+        self._log_likelihood[concept] += chunk_ll
+        self._n_sequences[concept] += len(offsets) - 1
+        self._n_attempts[concept] += len(outcomes)
+
+    @property
+    def concepts(self):
+        """누적된 개념 목록"""
+        return list(self._log_likelihood.keys())
+
+    def best_params(self, concept: str) -> Optional[Dict[str, Any]]:
+        """
+        개념의 최대우도 파라미터와 적합 통계
+
+        Args:
+            concept: 개념명
+
+        Returns:
+            {"p_init", "p_learn", "p_slip", "p_guess",
+             "log_likelihood", "n_sequences", "n_attempts"} 또는 None
+        """
+        if concept not in self._log_likelihood:
+            return None
+
+        ll = self._log_likelihood[concept]
+        best = int(np.argmax(ll))
+        return {
+            "p_init": float(self.p_init[best, 0]),
+            "p_learn": float(self.p_learn[best, 0]),
+            "p_slip": float(self.p_slip[best, 0]),
+            "p_guess": float(self.p_guess[best, 0]),
+            "log_likelihood": float(ll[best]),
+            "n_sequences": self._n_sequences[concept],
+            "n_attempts": self._n_attempts[concept],
+        }
+
+    def best_model(self, concept: str) -> Optional[BayesianKnowledgeTracing]:
+        """
+        개념의 최대우도 파라미터로 만든 BKT 인스턴스
+
+        Args:
+            concept: 개념명
+
+        Returns:
+            BayesianKnowledgeTracing 또는 None
+        """
+        params = self.best_params(concept)
+        if params is None:
+            return None
+
+        return BayesianKnowledgeTracing(
+            p_init=params["p_init"],
+            p_learn=params["p_learn"],
+            p_slip=params["p_slip"],
+            p_guess=params["p_guess"]
+        )
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return f"BKTGridFitter(grid_size={self.grid_size}, concepts={len(self._log_likelihood)})"
@@ -0,0 +1,262 @@
+"""
+Time-aware BKT with Forgetting
+
+시도 간 시간 간격에 따라 숙련도가 감쇠하는 BKT 변형
+
+표준 BKT는 한 번 숙련 상태가 되면 잃지 않는다고 가정하므로,
+오랫동안 학습하지 않은 학생도 마지막 숙련도를 그대로 유지한다.
+이 변형은 이전 시도 이후 경과 시간 Δt만큼 숙련도를 p_init 쪽으로 감쇠시킨다.
+
+감쇠 수식 (반감기 h일):
+   r = 0.5 ^ (Δt / h)
+   P(L) ← p_init + (P(L) - p_init) * r      (P(L) > p_init 인 경우만)
+
+감쇠는 다음 시도 직전과 조회 시점(as_of)에 적용되므로
+저장된 상태(마지막 시도 직후 P(L) + 시각)만 있으면 조회 시 지연 계산할 수 있다.
+"""
+from datetime import timedelta
+from typing import List, Union, Dict, Any, Optional
+
+from app.algorithms.bkt import BayesianKnowledgeTracing
+
+
+class ForgettingKnowledgeTracing(BayesianKnowledgeTracing):
+    """
+    망각(시간 감쇠)을 반영한 BKT
+
+    정답 여부만 받는 calculate_mastery_from_outcomes/calculate_mastery_batch는
+    시각 정보가 없으므로 attempted_at이 없는 시도와 같이 간격 0(감쇠 없음)으로
+    계산한다 (기본 BKT와 같은 값). 감쇠가 필요하면 시각이 있는 시도 기록을 넘긴다.
+
+    Examples:
+        >>> from datetime import datetime
+        >>> bkt = ForgettingKnowledgeTracing(half_life_days=30)
+        >>> attempts = [{"is_correct": True, "attempted_at": datetime(2026, 1, 1)}]
+        >>> fresh = bkt.mastery_at(attempts, datetime(2026, 1, 1))
+        >>> stale = bkt.mastery_at(attempts, datetime(2026, 4, 1))
+        >>> stale < fresh
+        True
+    """
+
+    time_dependent = True
+
+    def __init__(
+        self,
+        p_init: float = 0.1,
+        p_learn: float = 0.3,
+        p_slip: float = 0.1,
+        p_guess: float = 0.2,
+        half_life_days: float = 30.0
+    ):
+        """
+        초기화
+
+        Args:
+            p_init, p_learn, p_slip, p_guess: BayesianKnowledgeTracing과 동일
+            half_life_days: p_init 초과분이 절반으로 줄어드는 기간 (일)
+
+        Raises:
+            ValueError: 확률 범위 오류 또는 half_life_days <= 0
+        """
+        super().__init__(p_init=p_init, p_learn=p_learn, p_slip=p_slip, p_guess=p_guess)
+
+        if half_life_days <= 0:
+            raise ValueError(f"half_life_days must be positive, got {half_life_days}")
+
+        self.half_life_days = half_life_days
+
+    def retention(self, elapsed: timedelta) -> float:
+        """
+        경과 시간 동안의 유지율
+
+        Args:
+            elapsed: 경과 시간
+
+        Returns:
+            0.5 ^ (경과 일수 / 반감기), 경과 시간이 0 이하면 1.0
+        """
+        days = elapsed.total_seconds() / 86400
+        if days <= 0:
+            return 1.0
+        return 0.5 ** (days / self.half_life_days)
+
+    def decay(self, p_mastery: float, elapsed: timedelta) -> float:
+        """
+        경과 시간만큼 숙련도를 p_init 쪽으로 감쇠
+
+        Args:
+            p_mastery: 마지막 시도 직후 숙련도
+            elapsed: 마지막 시도 이후 경과 시간
+
+        Returns:
+            감쇠된 숙련도 (p_init 이하로는 내려가지 않음)
+        """
+        if p_mastery <= self.p_init:
+            return p_mastery
+        return self.p_init + (p_mastery - self.p_init) * self.retention(elapsed)
+
+    def calculate_trajectory(
+        self,
+        attempts: List[Union[Dict[str, Any], Any]]
+    ) -> List[float]:
+        """
+        시도 간 감쇠를 반영한 숙련도 궤적
+
+        attempted_at이 없는 시도는 직전 시도와 간격 0으로 취급한다.
+
+        Args:
+            attempts: 시간순 시도 기록 리스트 ({"is_correct", "attempted_at"} 또는 객체)
+
+        Returns:
+            시도별 숙련도 리스트
+        """
+        trajectory = []
+        p_mastery = self.p_init
+        previous_at = None
+
+        for attempt, is_correct in zip(attempts, self._outcomes(attempts)):
+            attempted_at = self._attempted_at(attempt)
+            if previous_at is not None and attempted_at is not None:
+                p_mastery = self.decay(p_mastery, attempted_at - previous_at)
+
+            p_mastery = self.update(p_mastery, is_correct)
+            trajectory.append(p_mastery)
+
+            if attempted_at is not None:
+                previous_at = attempted_at
+
+        return trajectory
+
+    def calculate_mastery(
+        self,
+        attempts: List[Union[Dict[str, Any], Any]]
+    ) -> float:
+        """
+        마지막 시도 직후 숙련도 (시도 간 감쇠 반영)
+
+        Args:
+            attempts: 시간순 시도 기록 리스트
+
+        Returns:
+            숙련도 확률 (0.0 ~ 1.0)
+        """
+        trajectory = self.calculate_trajectory(attempts)
+        return trajectory[-1] if trajectory else self.p_init
+
+    def calculate_smoothed_trajectory(
+        self,
+        attempts: List[Union[Dict[str, Any], Any]]
+    ) -> List[float]:
+        """
+        시도 간 감쇠를 반영한 forward-backward smoothed 궤적
+
+        감쇠는 2상태 전이로 본다 (r = 유지율):
+            P(숙련 → 미숙련) = (1 - r)(1 - p_init),  P(미숙련 → 숙련) = (1 - r) p_init
+        이 전이를 직전 필터링 값에 적용하면 decay()와 같은 값이 된다.
+        decay()처럼 직전 필터링 값이 p_init 이하인 구간은 감쇠하지 않는다.
+
+        Forward에서 시도마다 (이전 상태, 이후 상태) 결합확률을 구해 두고,
+        Backward는 같은 결합확률로
+            P(S_t-1 | 전체) = Σ P(S_t-1, S_t | obs_1..t) / P(S_t | obs_1..t) * P(S_t | 전체)
+        를 계산한다. 마지막 값은 calculate_mastery와 같다.
+
+        Args:
+            attempts: 시간순 시도 기록 리스트 ({"is_correct", "attempted_at"} 또는 객체)
+
+        Returns:
+            시도 수와 같은 길이의 smoothed 숙련도 리스트
+        """
+        outcomes = self._outcomes(attempts)
+        if not outcomes:
+            return []
+
+        # Forward: joints[t][a][b] = P(S_t-1 = a, S_t = b | obs_1..t), filtered[t] = P(S_t = 1 | obs_1..t)
+        joints = []
+        filtered = []
+        p_mastery = self.p_init
+        previous_at = None
+        for attempt, is_correct in zip(attempts, outcomes):
+            attempted_at = self._attempted_at(attempt)
+            retention = 1.0
+            if previous_at is not None and attempted_at is not None and p_mastery > self.p_init:
+                retention = self.retention(attempted_at - previous_at)
+            relearn = (1 - retention) * self.p_init
+            forget = (1 - retention) * (1 - self.p_init)
+            # transition[a][k] = P(시도 직전 상태 k | 직전 시도 후 상태 a)
+            transition = (
+                (1 - relearn, relearn),
+                (forget, 1 - forget),
+            )
+            # P(관측 | 미숙련), P(관측 | 숙련)
+            emission = (
+                self.p_guess if is_correct else 1 - self.p_guess,
+                1 - self.p_slip if is_correct else self.p_slip,
+            )
+            learn = self.p_learn if is_correct else 0.0
+
+            prior = (1 - p_mastery, p_mastery)
+            joint = [[0.0, 0.0], [0.0, 0.0]]
+            for a in (0, 1):
+                # 시도 직전 미숙련(k=0): 관측 후 learn 확률로 숙련, 숙련(k=1): 유지
+                unknown = prior[a] * transition[a][0] * emission[0]
+                known = prior[a] * transition[a][1] * emission[1]
+                joint[a][0] = unknown * (1 - learn)
+                joint[a][1] = unknown * learn + known
+            total = sum(joint[0]) + sum(joint[1])
+            joint = [[value / total for value in row] for row in joint]
+
+            p_mastery = max(0.0, min(1.0, joint[0][1] + joint[1][1]))
+            joints.append(joint)
+            filtered.append(p_mastery)
+            if attempted_at is not None:
+                previous_at = attempted_at
+
+        # Backward: smoothed[t] = P(S_t = 1 | 전체)
+        smoothed = [0.0] * len(outcomes)
+        smoothed[-1] = filtered[-1]
+        for t in range(len(outcomes) - 1, 0, -1):
+            joint = joints[t]
+            posterior = (1 - smoothed[t], smoothed[t])
+            marginal = (joint[0][0] + joint[1][0], joint[0][1] + joint[1][1])
+            known = sum(
+                joint[1][b] / marginal[b] * posterior[b]
+                for b in (0, 1) if marginal[b] > 0
+            )
+            smoothed[t - 1] = max(0.0, min(1.0, known))
+
+        return smoothed
+
+    @property
+    def params_key(self) -> str:
+        """파라미터 식별 문자열 (반감기 포함)"""
+        return f"{super().params_key},h={float(self.half_life_days)!r}"
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"ForgettingKnowledgeTracing("
+            f"p_init={self.p_init}, "
+            f"p_learn={self.p_learn}, "
+            f"p_slip={self.p_slip}, "
+            f"p_guess={self.p_guess}, "
+            f"half_life_days={self.half_life_days})"
+        )
+
+
+def create_bkt(
+    half_life_days: Optional[float] = None,
+    **params: float
+) -> BayesianKnowledgeTracing:
+    """
+    설정에 맞는 BKT 인스턴스 생성
+
+    Args:
+        half_life_days: 망각 반감기 (None이면 망각 없는 기본 BKT)
+        **params: p_init, p_learn, p_slip, p_guess
+
+    Returns:
+        BayesianKnowledgeTracing 또는 ForgettingKnowledgeTracing
+    """
+    if half_life_days is None:
+        return BayesianKnowledgeTracing(**params)
+    return ForgettingKnowledgeTracing(half_life_days=half_life_days, **params)
@@ -0,0 +1,243 @@
+"""
+Computerized Adaptive Testing (CAT) Session
+
+한 학생의 적응형 진단 세션 상태와 진행 규칙
+
+진행 방식:
+1. 현재 θ에서 정보량이 가장 큰 미출제 문항 선택 (ItemBankIndex.top_k)
+2. 응답 후 θ를 직전 추정치에서 시작하는 Newton 스텝으로 갱신 (warm start)
+3. 표준오차 SE(θ)가 임계값 이하가 되면 종료 (최소/최대 문항 수 적용)
+
+θ 추정은 N(prior_mean, prior_sd²) 사전분포를 둔 MAP(Bayes modal)이므로
+전부 정답/오답인 초반 응답 패턴에서도 ±5로 발산하지 않는다.
+
+    score(θ) = Σ a(y - P) - (θ - μ) / σ²
+    info(θ)  = Σ a² P(1 - P) + 1 / σ²
+    SE(θ)    = 1 / sqrt(info(θ))
+
+세션은 to_dict()/from_dict()로 JSON 직렬화되어
+WorkflowSession.workflow_metadata에 저장된다.
+"""
+import math
+from typing import Any, Dict, List, Optional
+
+from app.algorithms.item_bank_index import ItemBankIndex
+
+
+class AdaptiveTestSession:
+    """
+    적응형 진단 세션
+
+    Examples:
+        >>> index = ItemBankIndex([
+        ...     {"question_id": f"q{i}", "concept": "일차함수", "difficulty": d}
+        ...     for i, d in enumerate([-2.0, -1.0, 0.0, 1.0, 2.0])
+        ... ])
+        >>> session = AdaptiveTestSession(max_items=3)
+        >>> item = session.select_next(index)
+        >>> item["question_id"]
+        'q2'
+        >>> session.record_response("q2", True)
+        >>> session.theta > 0
+        True
+    """
+
+    STOP_SE_THRESHOLD = "se_threshold"
+    STOP_MAX_ITEMS = "max_items"
+    STOP_ITEM_BANK_EXHAUSTED = "item_bank_exhausted"
+
+    def __init__(
+        self,
+        se_threshold: float = 0.3,
+        min_items: int = 3,
+        max_items: int = 20,
+        prior_mean: float = 0.0,
+        prior_sd: float = 1.0,
+        concepts: Optional[List[str]] = None
+    ):
+        """
+        초기화
+
+        Args:
+            se_threshold: 종료 기준 표준오차
+            min_items: 최소 출제 문항 수
+            max_items: 최대 출제 문항 수
+            prior_mean: θ 사전분포 평균 (시작 θ)
+            prior_sd: θ 사전분포 표준편차 (시작 SE)
+            concepts: 출제 개념 제한 (None이면 전체)
+
+        Raises:
+            ValueError: 잘못된 종료 조건 또는 사전분포
+        """
+        if se_threshold <= 0:
+            raise ValueError(f"se_threshold must be positive, got {se_threshold}")
+        if not 1 <= min_items <= max_items:
+            raise ValueError(
+                f"must satisfy 1 <= min_items <= max_items, got {min_items}, {max_items}"
+            )
+        if prior_sd <= 0:
+            raise ValueError(f"prior_sd must be positive, got {prior_sd}")
+
+        self.se_threshold = se_threshold
+        self.min_items = min_items
+        self.max_items = max_items
+        self.prior_mean = prior_mean
+        self.prior_sd = prior_sd
+        self.concepts = concepts
+
+        self.theta = prior_mean
+        self.standard_error = prior_sd
+        self.responses: List[Dict[str, Any]] = []
+        self.pending: Optional[Dict[str, Any]] = None
+        self.stop_reason: Optional[str] = None
+
+        # Newton 설정 (ItemResponseTheory와 동일)
+        self.max_iterations = 20
+        self.tolerance = 0.001
+
+    @property
+    def administered(self) -> List[str]:
+        """응답한 문항 ID 목록 (출제 순)"""
+        return [response["question_id"] for response in self.responses]
+
+    @property
+    def is_finished(self) -> bool:
+        """종료 여부"""
+        return self.stop_reason is not None
+
+    def select_next(self, index: ItemBankIndex) -> Optional[Dict[str, Any]]:
+        """
+        다음 문항 선택
+
+        종료 조건을 먼저 확인하며, 종료되면 None을 반환하고 stop_reason을 기록한다.
+        응답 대기 중인 문항이 있으면 그 문항을 다시 반환한다.
+
+        Args:
+            index: 문항 은행 인덱스
+
+        Returns:
+            {"question_id", "concept", "difficulty", "discrimination", "information"} 또는 None
+        """
+        if self.is_finished:
+            return None
+        if self.pending is not None:
+            return self.pending
+
+        n_answered = len(self.responses)
+        if n_answered >= self.max_items:
+            self.stop_reason = self.STOP_MAX_ITEMS
+            return None
+        if n_answered >= self.min_items and self.standard_error <= self.se_threshold:
+            self.stop_reason = self.STOP_SE_THRESHOLD
+            return None
+
+        candidates = index.top_k(
+            self.theta, k=1, exclude=set(self.administered), concepts=self.concepts
+        )
+        if not candidates:
+            self.stop_reason = self.STOP_ITEM_BANK_EXHAUSTED
+            return None
+
+        self.pending = candidates[0]
+        return self.pending
+
+    def record_response(self, question_id: str, is_correct: bool) -> None:
+        """
+        대기 중인 문항의 응답 기록 후 θ, SE 갱신
+
+        Args:
+            question_id: 응답한 문제 ID (대기 중인 문항이어야 함)
+            is_correct: 정답 여부
+
+        Raises:
+            ValueError: 대기 중인 문항이 없거나 다른 문항에 응답한 경우
+        """
+        if self.pending is None:
+            raise ValueError("no question is awaiting a response")
+        if question_id != self.pending["question_id"]:
+            raise ValueError(
+                f"expected response to {self.pending['question_id']}, got {question_id}"
+            )
+
+        self.responses.append({
+            "question_id": question_id,
+            "difficulty": self.pending["difficulty"],
+            "discrimination": self.pending["discrimination"],
+            "is_correct": bool(is_correct),
+        })
+        self.pending = None
+        self.theta, self.standard_error = self._estimate(self.theta)
+
+    def _estimate(self, theta: float) -> tuple:
+        """직전 θ에서 시작하는 MAP Newton 반복, (θ, SE) 반환"""
+        variance = self.prior_sd ** 2
+        information = 1.0 / variance
+
+        for _ in range(self.max_iterations):
+            score = -(theta - self.prior_mean) / variance
+            information = 1.0 / variance
+
+            for response in self.responses:
+                a = response["discrimination"]
+                exponent = max(-20.0, min(20.0, -a * (theta - response["difficulty"])))
+                p = 1.0 / (1.0 + math.exp(exponent))
+                score += a * ((1.0 if response["is_correct"] else 0.0) - p)
+                information += a * a * p * (1 - p)
+
+            step = score / information
+            theta = max(-5.0, min(5.0, theta + step))
+            if abs(step) < self.tolerance:
+                break
+
+        return theta, 1.0 / math.sqrt(information)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 상태"""
+        return {
+            "se_threshold": self.se_threshold,
+            "min_items": self.min_items,
+            "max_items": self.max_items,
+            "prior_mean": self.prior_mean,
+            "prior_sd": self.prior_sd,
+            "concepts": self.concepts,
+            "theta": self.theta,
+            "standard_error": self.standard_error,
+            "responses": self.responses,
+            "pending": self.pending,
+            "stop_reason": self.stop_reason,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AdaptiveTestSession":
+        """
+        to_dict() 상태에서 복원
+
+        Args:
+            data: to_dict() 결과
+
+        Returns:
+            AdaptiveTestSession 인스턴스
+        """
+        session = cls(
+            se_threshold=data["se_threshold"],
+            min_items=data["min_items"],
+            max_items=data["max_items"],
+            prior_mean=data["prior_mean"],
+            prior_sd=data["prior_sd"],
+            concepts=data.get("concepts"),
+        )
+        session.theta = data["theta"]
+        session.standard_error = data["standard_error"]
+        session.responses = list(data["responses"])
+        session.pending = data.get("pending")
+        session.stop_reason = data.get("stop_reason")
+        return session
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"AdaptiveTestSession(theta={self.theta:.3f}, "
+            f"standard_error={self.standard_error:.3f}, "
+            f"answered={len(self.responses)}, "
+            f"stop_reason={self.stop_reason})"
+        )
@@ -10,19 +10,76 @@ Reference:
 IRT Models:
 - 1PL (Rasch): P(correct|θ,b) = 1 / (1 + exp(-(θ - b)))
 - 2PL: P(correct|θ,a,b) = 1 / (1 + exp(-a(θ - b)))
+- 3PL: P(correct|θ,a,b,c) = c + (1 - c) / (1 + exp(-a(θ - b)))
 
 Parameters:
 - θ (theta): Student ability
 - b: Item difficulty
-- a: Discrimination (2PL only)
+- a: Discrimination (2PL/3PL)
+- c: Guessing (3PL only)
 
 용도:
 - 적응형 테스트 (Adaptive Testing)
 - 문제 난이도 자동 추정
 - 학생 능력 측정
+
+배치 추정:
+   학생×문항 응답 행렬을 희소(COO) 배열 (student_indices, item_indices, responses)로
+   받아 모든 학생의 θ를 한 번의 Newton-Raphson 루프로 추정한다.
+   학생별 score/information은 np.bincount로 집계하고,
+   수렴한 학생의 응답은 다음 반복부터 계산에서 제외한다.
+
+베이지안 추정 (EAP/MAP):
+   MLE는 전부 정답/오답인 응답 패턴에서 ±5로 발산한다.
+   EAP는 θ ~ N(μ, σ²) 사전분포를 Gauss-Hermite 구적점 위에서 적분한다.
+   구적점/가중치는 import 시 한 번 계산하고, 문항별 구적점 로그우도 행
+   (log P, log(1-P))은 (b, a, c, μ, σ) 키로 캐시되므로 추정 한 번은
+
+       log posterior = y·log P + (1-y)·log(1-P) + log w   (응답 수 × 구적점 수)
+
+   행렬곱과 정규화뿐이다. MAP는 EAP 평균에서 시작하는 Fisher scoring으로 구한다.
 """
 import math
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+QUADRATURE_POINTS = 41
+
+
+def _gauss_hermite_grid(n_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """표준정규 N(0, 1)용 Gauss-Hermite 구적점과 정규화된 가중치"""
+    nodes, weights = np.polynomial.hermite_e.hermegauss(n_points)
+    return nodes, weights / weights.sum()
+
+
+# import 시 한 번 계산되는 구적 격자
+_QUADRATURE_NODES, _QUADRATURE_WEIGHTS = _gauss_hermite_grid(QUADRATURE_POINTS)
+_QUADRATURE_LOG_WEIGHTS = np.log(_QUADRATURE_WEIGHTS)
+
+
+def _probability_array(theta, difficulty, discrimination=1.0, guessing=0.0):
+    """3PL 정답 확률 (브로드캐스팅, 지수 ±20 클리핑)"""
+    exponent = np.clip(-discrimination * (theta - difficulty), -20, 20)
+    return guessing + (1.0 - guessing) / (1.0 + np.exp(exponent))
+
+
+@lru_cache(maxsize=65536)
+def _item_log_likelihoods(
+    difficulty: float,
+    discrimination: float,
+    guessing: float,
+    prior_mean: float,
+    prior_sd: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """문항의 구적점별 (log P, log(1-P)) 행 (캐시)"""
+    p = _probability_array(prior_mean + prior_sd * _QUADRATURE_NODES, difficulty, discrimination, guessing)
+    log_p, log_q = np.log(p), np.log1p(-p)
+    log_p.flags.writeable = False
+    log_q.flags.writeable = False
+    return log_p, log_q
 
 
 class ItemResponseTheory:
@@ -45,28 +102,30 @@ class ItemResponseTheory:
         self,
         theta: float,
         difficulty: float,
-        discrimination: float = 1.0
+        discrimination: float = 1.0,
+        guessing: float = 0.0
     ) -> float:
         """
-        정답 확률 계산 (1PL/2PL 모델)
+        정답 확률 계산 (1PL/2PL/3PL 모델)
 
         Args:
             theta: 학생 능력
             difficulty: 문제 난이도
             discrimination: 변별도 (기본값: 1.0 for 1PL)
+            guessing: 추측 확률 c (기본값: 0.0, 1PL/2PL)
 
         Returns:
-            정답 확률 (0.0 ~ 1.0)
+            정답 확률 (c ~ 1.0)
 
         Formula:
-            P(correct|θ,a,b) = 1 / (1 + exp(-a(θ - b)))
+            P(correct|θ,a,b,c) = c + (1 - c) / (1 + exp(-a(θ - b)))
         """
         exponent = -discrimination * (theta - difficulty)
 
         # 수치 안정성을 위한 클리핑
         exponent = max(-20, min(20, exponent))
 
-        probability = 1.0 / (1.0 + math.exp(exponent))
+        probability = guessing + (1.0 - guessing) / (1.0 + math.exp(exponent))
 
         return probability
 
@@ -134,6 +193,98 @@ class ItemResponseTheory:
 
         return theta
 
+    def estimate_abilities_batch(
+        self,
+        student_indices: Union[Sequence[int], np.ndarray],
+        item_indices: Union[Sequence[int], np.ndarray],
+        responses: Union[Sequence[bool], np.ndarray],
+        item_difficulties: Union[Sequence[float], np.ndarray],
+        n_students: Optional[int] = None,
+        item_discriminations: Optional[Union[Sequence[float], np.ndarray]] = None,
+        initial_theta: Union[float, Sequence[float], np.ndarray] = 0.0
+    ) -> np.ndarray:
+        """
+        여러 학생의 능력 동시 추정 (벡터화 Newton-Raphson)
+
+        estimate_ability와 같은 갱신식·수렴 조건·클리핑을 학생별로 적용한다.
+        수렴했거나 정보량이 부족한 학생은 마스킹되어 더 이상 반복하지 않는다.
+
+        Args:
+            student_indices: 응답별 학생 인덱스 (0 ~ n_students-1)
+            item_indices: 응답별 문항 인덱스
+            responses: 응답별 정답 여부
+            item_difficulties: 문항별 난이도 b
+            n_students: 학생 수 (기본값: max(student_indices) + 1)
+            item_discriminations: 문항별 변별도 a (기본값: 1.0, 1PL)
+            initial_theta: 초기 능력 (스칼라 또는 학생별 배열)
+
+        Returns:
+            길이 n_students의 θ 배열 (응답이 없는 학생은 0.0)
+
+        Raises:
+            ValueError: 응답 배열 길이가 서로 다른 경우
+
+        Examples:
+            >>> irt = ItemResponseTheory()
+            >>> thetas = irt.estimate_abilities_batch(
+            ...     student_indices=[0, 0, 1, 1],
+            ...     item_indices=[0, 1, 0, 1],
+            ...     responses=[True, False, True, True],
+            ...     item_difficulties=[0.0, 1.0]
+            ... )
+            >>> thetas.shape
+            (2,)
+        """
+        students = np.asarray(student_indices, dtype=np.int64)
+        items = np.asarray(item_indices, dtype=np.int64)
+        y = np.asarray(responses, dtype=np.float64)
+
+        if not (students.shape == items.shape == y.shape) or students.ndim != 1:
+            raise ValueError("student_indices, item_indices and responses must be 1-D arrays of equal length")
+
+        if n_students is None:
+            n_students = int(students.max()) + 1 if students.size else 0
+
+        theta = np.empty(n_students, dtype=np.float64)
+        theta[:] = initial_theta
+
+        # 응답이 없는 학생은 estimate_ability와 같이 0.0
+        has_responses = np.bincount(students, minlength=n_students) > 0
+        theta[~has_responses] = 0.0
+        if not students.size:
+            return theta
+
+        b = np.asarray(item_difficulties, dtype=np.float64)[items]
+        if item_discriminations is None:
+            a = np.ones_like(b)
+        else:
+            a = np.asarray(item_discriminations, dtype=np.float64)[items]
+
+        active = has_responses.copy()
+
+        for _ in range(self.max_iterations):
+            exponent = np.clip(-a * (theta[students] - b), -20, 20)
+            p = 1.0 / (1.0 + np.exp(exponent))
+
+            # 학생별 score = Σ a(y - P), information = Σ a²P(1-P)
+            score = np.bincount(students, weights=a * (y - p), minlength=n_students)
+            information = np.bincount(students, weights=a * a * p * (1 - p), minlength=n_students)
+
+            # 수렴 또는 정보량 부족 학생은 이번 반복부터 고정
+            active &= (np.abs(score) >= self.tolerance) & (information >= 1e-10)
+            if not active.any():
+                break
+
+            theta[active] += score[active] / information[active]
+            theta[active] = np.clip(theta[active], -5.0, 5.0)
+
+            # 활성 학생의 응답만 남겨 다음 반복 비용 축소
+            keep = active[students]
+            if not keep.all():
+                students, y, a, b = students[keep], y[keep], a[keep], b[keep]
+
+        return theta
+
     def estimate_difficulty(
         self,
         attempts: List[Dict[str, Any]],
@@ -198,7 +349,8 @@ class ItemResponseTheory:
         self,
         theta: float,
         difficulty: float,
-        discrimination: float = 1.0
+        discrimination: float = 1.0,
+        guessing: float = 0.0
     ) -> float:
         """
         Fisher 정보량 계산
@@ -207,18 +359,199 @@ class ItemResponseTheory:
             theta: 학생 능력
             difficulty: 문제 난이도
             discrimination: 변별도
+            guessing: 추측 확률 c (3PL)
 
         Returns:
             정보량 (높을수록 정확한 측정)
 
         Formula:
-            I(θ) = a² * P(θ) * (1 - P(θ))
+            I(θ) = a² * (1 - P) / P * ((P - c) / (1 - c))²
+            (c = 0이면 a² * P(θ) * (1 - P(θ)))
         """
-        p = self.calculate_probability(theta, difficulty, discrimination)
-        information = (discrimination ** 2) * p * (1 - p)
+        p = self.calculate_probability(theta, difficulty, discrimination, guessing)
+        if guessing == 0.0:
+            return (discrimination ** 2) * p * (1 - p)
+
+        information = (discrimination ** 2) * (1 - p) / p * ((p - guessing) / (1 - guessing)) ** 2
 
         return information
 
+    @staticmethod
+    def _item_parameters(attempt: Dict[str, Any]) -> Tuple[float, float, float]:
+        """시도 기록에서 (b, a, c) 추출 (a 기본값 1.0, c 기본값 0.0)"""
+        difficulty = float(attempt["difficulty"])
+        discrimination = float(attempt.get("discrimination", 1.0))
+        guessing = float(attempt.get("guessing", 0.0))
+
+        if not 0.0 <= guessing < 1.0:
+            raise ValueError(f"guessing must be in [0, 1), got {guessing}")
+
+        return difficulty, discrimination, guessing
+
+    def estimate_ability_eap(
+        self,
+        attempts: List[Dict[str, Any]],
+        prior_mean: float = 0.0,
+        prior_sd: float = 1.0
+    ) -> Dict[str, float]:
+        """
+        학생 능력 추정 (EAP, Expected A Posteriori)
+
+        Gauss-Hermite 구적으로 사후분포 평균/표준편차를 계산한다.
+        반복 해법 없이 캐시된 문항 행의 합과 정규화만 수행하며,
+        전부 정답/오답인 응답에서도 유한한 값을 준다.
+
+        Args:
+            attempts: 시도 기록 리스트
+                      각 시도는 {"difficulty", "is_correct", ("discrimination"), ("guessing")}
+            prior_mean: 사전분포 평균
+            prior_sd: 사전분포 표준편차
+
+        Returns:
+            {"theta": 사후 평균, "standard_error": 사후 표준편차}
+
+        Raises:
+            ValueError: prior_sd <= 0 또는 guessing이 [0, 1) 밖인 경우
+
+        Examples:
+            >>> irt = ItemResponseTheory()
+            >>> result = irt.estimate_ability_eap([
+            ...     {"difficulty": 0.0, "is_correct": True},
+            ...     {"difficulty": 1.0, "is_correct": True}
+            ... ])
+            >>> 0 < result["theta"] < 5
+            True
+        """
+        if prior_sd <= 0:
+            raise ValueError(f"prior_sd must be positive, got {prior_sd}")
+
+        log_posterior = _QUADRATURE_LOG_WEIGHTS.copy()
+        for attempt in attempts:
+            log_p, log_q = _item_log_likelihoods(*self._item_parameters(attempt), prior_mean, prior_sd)
+            log_posterior += log_p if attempt["is_correct"] else log_q
+
+        return self._posterior_moments(log_posterior, prior_mean, prior_sd)
+
+    @staticmethod
+    def _posterior_moments(log_posterior: np.ndarray, prior_mean: float, prior_sd: float):
+        """구적점 로그 사후확률 → (평균, 표준편차), 마지막 축 기준"""
+        weights = np.exp(log_posterior - log_posterior.max(axis=-1, keepdims=True))
+        weights /= weights.sum(axis=-1, keepdims=True)
+
+        nodes = prior_mean + prior_sd * _QUADRATURE_NODES
+        mean = weights @ nodes
+        variance = weights @ (nodes ** 2) - mean ** 2
+        sd = np.sqrt(np.maximum(variance, 0.0))
+
+        if np.ndim(mean) == 0:
+            return {"theta": float(mean), "standard_error": float(sd)}
+        return {"theta": mean, "standard_error": sd}
+
+    def estimate_ability_map(
+        self,
+        attempts: List[Dict[str, Any]],
+        prior_mean: float = 0.0,
+        prior_sd: float = 1.0
+    ) -> Dict[str, float]:
+        """
+        학생 능력 추정 (MAP, Maximum A Posteriori)
+
+        EAP 평균에서 시작하는 Fisher scoring으로 사후분포 최빈값을 찾는다.
+        시작점이 최빈값에 가까워 보통 몇 번의 반복으로 수렴한다.
+
+        Args:
+            attempts: estimate_ability_eap와 동일
+            prior_mean: 사전분포 평균
+            prior_sd: 사전분포 표준편차
+
+        Returns:
+            {"theta": 사후 최빈값, "standard_error": 1 / sqrt(정보량 + 1/σ²)}
+
+        Examples:
+            >>> irt = ItemResponseTheory()
+            >>> result = irt.estimate_ability_map([{"difficulty": 0.0, "is_correct": False}])
+            >>> result["theta"] < 0
+            True
+        """
+        theta = self.estimate_ability_eap(attempts, prior_mean, prior_sd)["theta"]
+        parameters = [self._item_parameters(attempt) for attempt in attempts]
+        outcomes = [1.0 if attempt["is_correct"] else 0.0 for attempt in attempts]
+        variance = prior_sd ** 2
+
+        for _ in range(self.max_iterations):
+            score = -(theta - prior_mean) / variance
+            information = 1.0 / variance
+
+            for (b, a, c), y in zip(parameters, outcomes):
+                p = self.calculate_probability(theta, b, a, c)
+                # 3PL score: a (y - P)(P - c) / (P(1 - c))
+                score += a * (y - p) * (p - c) / (p * (1 - c))
+                information += self.calculate_information(theta, b, a, c)
+
+            step = score / information
+            theta = max(-5.0, min(5.0, theta + step))
+            if abs(step) < self.tolerance:
+                break
+
+        information = 1.0 / variance + sum(
+            self.calculate_information(theta, b, a, c) for b, a, c in parameters
+        )
+        return {"theta": theta, "standard_error": 1.0 / math.sqrt(information)}
+
+    def estimate_abilities_eap_batch(
+        self,
+        response_matrix: Union[Sequence[Sequence[float]], np.ndarray],
+        item_difficulties: Union[Sequence[float], np.ndarray],
+        item_discriminations: Optional[Union[Sequence[float], np.ndarray]] = None,
+        item_guessings: Optional[Union[Sequence[float], np.ndarray]] = None,
+        prior_mean: float = 0.0,
+        prior_sd: float = 1.0
+    ) -> Dict[str, np.ndarray]:
+        """
+        여러 학생의 EAP 동시 추정 (행렬곱)
+
+        Args:
+            response_matrix: (학생 수 × 문항 수) 응답 행렬, 1=정답, 0=오답, NaN=미응답
+            item_difficulties: 문항별 난이도 b
+            item_discriminations: 문항별 변별도 a (기본값: 1.0)
+            item_guessings: 문항별 추측 확률 c (기본값: 0.0)
+            prior_mean: 사전분포 평균
+            prior_sd: 사전분포 표준편차
+
+        Returns:
+            {"theta": 학생별 사후 평균 배열, "standard_error": 학생별 사후 표준편차 배열}
+
+        Raises:
+            ValueError: 응답 행렬과 문항 수 불일치, prior_sd <= 0
+
+        Examples:
+            >>> irt = ItemResponseTheory()
+            >>> result = irt.estimate_abilities_eap_batch(
+            ...     [[1, 0], [1, float("nan")]], item_difficulties=[0.0, 1.0]
+            ... )
+            >>> result["theta"].shape
+            (2,)
+        """
+        if prior_sd <= 0:
+            raise ValueError(f"prior_sd must be positive, got {prior_sd}")
+
+        responses = np.asarray(response_matrix, dtype=np.float64)
+        b = np.asarray(item_difficulties, dtype=np.float64)
+        if responses.ndim != 2 or responses.shape[1] != b.size:
+            raise ValueError("response_matrix must be 2-D with one column per item")
+
+        a = np.ones_like(b) if item_discriminations is None else np.asarray(item_discriminations, dtype=np.float64)
+        c = np.zeros_like(b) if item_guessings is None else np.asarray(item_guessings, dtype=np.float64)
+
+        # (문항 수 × 구적점 수) 로그우도 테이블
+        nodes = prior_mean + prior_sd * _QUADRATURE_NODES
+        p = _probability_array(nodes[None, :], b[:, None], a[:, None], c[:, None])
+        correct = (responses == 1.0).astype(np.float64)
+        wrong = (responses == 0.0).astype(np.float64)
+
+        log_posterior = correct @ np.log(p) + wrong @ np.log1p(-p) + _QUADRATURE_LOG_WEIGHTS
+        return self._posterior_moments(log_posterior, prior_mean, prior_sd)
+
     def select_best_question(
         self,
         student_ability: float,
@@ -227,6 +560,9 @@ class ItemResponseTheory:
         """
         적응형 테스트를 위한 최적 문제 선택
 
+        후보 전체를 선형 탐색하므로 대규모 문항 은행에서는
+        ItemBankIndex.top_k를 사용한다.
+
         Args:
             student_ability: 현재 추정된 학생 능력
             question_difficulties: 사용 가능한 문제들의 난이도 리스트
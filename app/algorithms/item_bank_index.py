@@ -0,0 +1,238 @@
+"""
+Item Bank Index
+
+최대 정보량 문항 선택을 위한 문항 은행 인덱스
+
+ItemResponseTheory.select_best_question은 후보 전체를 훑으며 정보량을 다시 계산한다.
+문항이 수십만 개면 매 선택이 전체 스캔이 되므로, 이 인덱스는 문항을
+
+    (개념, 변별도 구간) 파티션 → 난이도 오름차순 배열
+
+로 나눠 두고 θ 위치를 이분 탐색한 뒤 θ에 가까운 문항부터 바깥으로 넓혀 간다.
+
+2PL 정보량 I = a² · g(a·|θ - b|), g(x) = σ(x)σ(-x) 는 |θ - b|에 대해 단조 감소하므로
+변별도 구간 [a_min, a_max] 안에서 거리 d 이상인 문항의 정보량은
+
+    I ≤ a_max² · g(a_min · d)
+
+로 위에서 제한된다. 파티션별 상한을 우선순위 큐로 관리하면서 k번째 정보량보다
+상한이 작아지는 순간 탐색을 멈추므로, θ 근처의 문항만 방문한다 (정확한 top-k).
+"""
+import bisect
+import heapq
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+DEFAULT_DISCRIMINATION_EDGES = (0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0)
+
+
+def _logistic_information(x: float) -> float:
+    """g(x) = σ(x)σ(-x) (x는 a·|θ - b|)"""
+    x = min(abs(x), 20.0)
+    e = math.exp(-x)
+    return e / ((1.0 + e) ** 2)
+
+
+class _Partition:
+    """한 (개념, 변별도 구간)의 난이도 정렬 배열"""
+
+    __slots__ = ("difficulties", "discriminations", "question_ids", "concept", "a_min", "a_max")
+
+    def __init__(self, concept: str, items: List[Tuple[float, float, str]]):
+        items.sort()
+        self.concept = concept
+        self.difficulties = [item[0] for item in items]
+        self.discriminations = [item[1] for item in items]
+        self.question_ids = [item[2] for item in items]
+        self.a_min = min(self.discriminations)
+        self.a_max = max(self.discriminations)
+
+    def bound(self, distance: float) -> float:
+        """거리 distance 이상인 문항의 정보량 상한"""
+        return self.a_max * self.a_max * _logistic_information(self.a_min * distance)
+
+
+class ItemBankIndex:
+    """
+    난이도 정렬 + 변별도 구간 문항 인덱스
+
+    Examples:
+        >>> index = ItemBankIndex([
+        ...     {"question_id": "q1", "concept": "일차함수", "difficulty": -1.0},
+        ...     {"question_id": "q2", "concept": "일차함수", "difficulty": 0.4},
+        ...     {"question_id": "q3", "concept": "이차함수", "difficulty": 0.5},
+        ... ])
+        >>> [item["question_id"] for item in index.top_k(theta=0.5, k=2)]
+        ['q3', 'q2']
+        >>> [item["question_id"] for item in index.top_k(0.5, k=1, concepts=["일차함수"])]
+        ['q2']
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        discrimination_edges: Sequence[float] = DEFAULT_DISCRIMINATION_EDGES
+    ):
+        """
+        인덱스 구성 (O(n log n), 한 번만)
+
+        Args:
+            items: 문항 목록. 딕셔너리 또는 ItemBankItem처럼 question_id, concept,
+                   difficulty, (discrimination) 속성을 가진 객체
+            discrimination_edges: 변별도 구간 경계 (오름차순)
+
+        Raises:
+            ValueError: 변별도가 0 이하인 문항
+        """
+        self.discrimination_edges = tuple(sorted(discrimination_edges))
+
+        grouped: Dict[Tuple[str, int], List[Tuple[float, float, str]]] = {}
+        for item in items:
+            question_id = self._field(item, "question_id")
+            concept = self._field(item, "concept")
+            difficulty = float(self._field(item, "difficulty"))
+            discrimination = float(self._field(item, "discrimination", 1.0))
+
+            if discrimination <= 0:
+                raise ValueError(
+                    f"discrimination must be positive, got {discrimination} for {question_id}"
+                )
+
+            bucket = bisect.bisect_right(self.discrimination_edges, discrimination)
+            grouped.setdefault((concept, bucket), []).append((difficulty, discrimination, question_id))
+
+        self._partitions: Dict[str, List[_Partition]] = {}
+        for (concept, _), partition_items in sorted(grouped.items()):
+            self._partitions.setdefault(concept, []).append(_Partition(concept, partition_items))
+
+        self._size = sum(len(p) for p in grouped.values())
+
+    @staticmethod
+    def _field(item: Any, name: str, default: Any = None) -> Any:
+        """딕셔너리 또는 객체에서 필드 추출"""
+        if isinstance(item, dict):
+            value = item.get(name, default)
+        else:
+            value = getattr(item, name, default)
+        return default if value is None else value
+
+    def __len__(self) -> int:
+        """인덱스된 문항 수"""
+        return self._size
+
+    @property
+    def concepts(self) -> List[str]:
+        """인덱스된 개념 목록"""
+        return sorted(self._partitions)
+
+    def top_k(
+        self,
+        theta: float,
+        k: int = 1,
+        exclude: Optional[Iterable[str]] = None,
+        concepts: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        θ에서 정보량이 가장 큰 문항 k개
+
+        Args:
+            theta: 현재 추정 능력
+            k: 반환할 문항 수
+            exclude: 제외할 question_id 집합 (이미 출제한 문항 등)
+            concepts: 허용할 개념 목록 (None이면 전체)
+
+        Returns:
+            정보량 내림차순 [{"question_id", "concept", "difficulty",
+            "discrimination", "information"}, ...]
+        """
+        if k <= 0:
+            return []
+
+        excluded = exclude if isinstance(exclude, (set, frozenset)) else set(exclude or ())
+        if concepts is None:
+            partitions = [p for group in self._partitions.values() for p in group]
+        else:
+            partitions = [p for concept in concepts for p in self._partitions.get(concept, ())]
+
+        # 파티션별 커서: θ 왼쪽(left)과 오른쪽(right) 다음 후보 위치
+        cursors = []
+        frontier = []
+        for pid, partition in enumerate(partitions):
+            right = bisect.bisect_left(partition.difficulties, theta)
+            cursors.append([right - 1, right])
+            self._push(frontier, pid, partition, cursors[pid], theta)
+
+        best: List[Tuple[float, int, str, Dict[str, Any]]] = []  # 최소 힙 (정보량, 순번, ID, 항목)
+        counter = 0
+
+        while frontier:
+            neg_bound, pid, _ = heapq.heappop(frontier)
+            if len(best) >= k and -neg_bound <= best[0][0]:
+                break
+
+            partition = partitions[pid]
+            cursor = cursors[pid]
+            position = self._take_nearest(partition, cursor, theta)
+            self._push(frontier, pid, partition, cursor, theta)
+
+            question_id = partition.question_ids[position]
+            if question_id in excluded:
+                continue
+
+            difficulty = partition.difficulties[position]
+            discrimination = partition.discriminations[position]
+            information = discrimination * discrimination * _logistic_information(
+                discrimination * (theta - difficulty)
+            )
+
+            entry = (information, -counter, question_id, {
+                "question_id": question_id,
+                "concept": partition.concept,
+                "difficulty": difficulty,
+                "discrimination": discrimination,
+                "information": information,
+            })
+            counter += 1
+
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif information > best[0][0]:
+                heapq.heapreplace(best, entry)
+
+        return [entry[3] for entry in sorted(best, reverse=True)]
+
+    @staticmethod
+    def _take_nearest(partition: _Partition, cursor: List[int], theta: float) -> int:
+        """커서 양쪽 중 θ에 가까운 위치를 꺼내고 커서 이동"""
+        left, right = cursor
+        difficulties = partition.difficulties
+        take_left = right >= len(difficulties) or (
+            left >= 0 and theta - difficulties[left] <= difficulties[right] - theta
+        )
+        if take_left:
+            cursor[0] -= 1
+            return left
+        cursor[1] += 1
+        return right
+
+    @staticmethod
+    def _push(frontier: list, pid: int, partition: _Partition, cursor: List[int], theta: float) -> None:
+        """파티션의 다음 후보 거리로 상한을 계산해 큐에 추가 (남은 문항이 없으면 생략)"""
+        left, right = cursor
+        difficulties = partition.difficulties
+        distances = []
+        if left >= 0:
+            distances.append(theta - difficulties[left])
+        if right < len(difficulties):
+            distances.append(difficulties[right] - theta)
+        if distances:
+            heapq.heappush(frontier, (-partition.bound(min(distances)), pid, min(distances)))
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"ItemBankIndex(items={self._size}, "
+            f"concepts={len(self._partitions)}, "
+            f"discrimination_edges={self.discrimination_edges})"
+        )
@@ -9,6 +9,8 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import os
 
+from app.db.pool import pool_statistics
+from app.db.session import engine, replica_engines
 from app.routers import mastery, attempts, workflows, chat, workflows_templates, diagnosis
 
 # FastAPI 앱 생성
@@ -95,3 +97,11 @@ async def workflow_builder_page():
 async def diagnosis_events_page():
     """인지 진단 이벤트 로그 페이지"""
     return FileResponse(os.path.join(STATIC_DIR, "diagnosis_events.html"))
+
+
+@app.get("/metrics/db-pool")
+async def db_pool_metrics():
+    """DB 커넥션 풀 상태 (체크아웃/오버플로 수, 커넥션 대기 시간 히스토그램, 복제본별 풀)"""
+    stats = pool_statistics(engine)
+    stats["replicas"] = [pool_statistics(replica) for replica in replica_engines]
+    return stats
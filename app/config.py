@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Any, Dict, Literal, Optional, Union
 
 
 class Settings(BaseSettings):
@@ -28,10 +28,60 @@ class Settings(BaseSettings):
     def TEST_DATABASE_URL(self) -> str:
         return f"{self.DATABASE_URL}_test"
 
+    # Database Engine / Pool
+    DB_ECHO: Union[bool, Literal["debug"]] = False  # SQL 로깅 (True: 쿼리, "debug": 결과 행까지, 운영은 False)
+    DB_POOL_SIZE: int = 10  # 유지하는 커넥션 수
+    DB_MAX_OVERFLOW: int = 20  # pool_size를 넘어 임시로 여는 최대 커넥션 수
+    DB_POOL_TIMEOUT: float = 30  # 커넥션 대기 최대 시간 (초, 초과 시 TimeoutError)
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 커넥션은 재연결 (-1이면 사용 안 함)
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 끊어진 커넥션 감지
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg 커넥션별 prepared statement 캐시 (0이면 사용 안 함, pgbouncer transaction 모드)
+
+    # Read Replicas
+    DB_REPLICA_URLS: str = ""  # 읽기 전용 복제본 URL (쉼표 구분, get_replica_db 조회 엔드포인트만 사용, 비우면 모든 쿼리가 기본 DB)
+    DB_READ_YOUR_WRITES_SECONDS: float = 5  # 세션에서 쓰기 커밋 후 이 시간(초) 동안 읽기도 기본 DB
+
+    def engine_kwargs(self, url: str) -> Dict[str, Any]:
+        """
+        create_async_engine() 인자 (DB_* 설정 기반)
+
+        SQLite(테스트)는 풀 크기 설정을 받지 않으므로 echo/pre_ping만 적용한다.
+
+        Args:
+            url: 데이터베이스 URL
+
+        Returns:
+            엔진 생성 키워드 인자
+        """
+        options: Dict[str, Any] = {
+            "echo": self.DB_ECHO,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+        }
+        if url.startswith("sqlite"):
+            return options
+
+        options.update(
+            pool_size=self.DB_POOL_SIZE,
+            max_overflow=self.DB_MAX_OVERFLOW,
+            pool_timeout=self.DB_POOL_TIMEOUT,
+            pool_recycle=self.DB_POOL_RECYCLE,
+        )
+        if "+asyncpg" in url:
+            options["connect_args"] = {"prepared_statement_cache_size": self.DB_STATEMENT_CACHE_SIZE}
+        return options
+
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
 
+    # Mastery (BKT)
+    BKT_FORGETTING_HALF_LIFE_DAYS: Optional[float] = None  # 설정 시 시도 간/조회 시점 망각 감쇠 적용
+    MASTERY_MAX_CONCURRENCY: int = 8  # 여러 개념 숙련도 병렬 계산 시 동시 세션 수
+    MASTERY_SNAPSHOT_MAX_STALENESS_SECONDS: float = 300  # 프로파일 조회 시 스냅샷 허용 지연 (0이면 항상 실시간)
+
+    # Attempt Ingestion
+    ATTEMPT_INGEST_MAX_ROWS: int = 100000  # 대량 적재 요청당 최대 행 수
+
     # MCP Server Paths (상대 경로는 mathesis/ 기준)
     NODE2_MCP_PATH: str = "node2_q_dna/backend/mcp_server.py"
     NODE4_MCP_PATH: str = "node4_lab_node/backend/mcp_server.py"
@@ -0,0 +1,195 @@
+"""
+Monthly Range Partitioning (PostgreSQL)
+
+student_attempts는 attempted_at 기준 월별 RANGE 파티션 테이블이다
+(alembic/versions/20261016_partition_student_attempts.py).
+
+    student_attempts                      PARTITION BY RANGE (attempted_at)
+    ├── student_attempts_y2026m01         [2026-01-01, 2026-02-01)
+    ├── student_attempts_y2026m02         [2026-02-01, 2026-03-01)
+    ├── ...
+    └── student_attempts_default          DEFAULT (범위 밖 시도)
+
+attempted_at 범위 조건이 있는 쿼리(get_recent_attempts 등)는 해당 월 파티션만 읽는다
+(partition pruning). 새 달 파티션은 미리 만들어 두어야 하며(DEFAULT에 행이 쌓인 뒤에는
+같은 범위 파티션을 만들 수 없다), 오래된 파티션은 분리(DETACH)해 보관/삭제할 수 있다.
+
+Usage:
+    python scripts/manage_attempt_partitions.py --ahead 3
+    python scripts/manage_attempt_partitions.py --detach-before 2025-01
+"""
+import re
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+PARTITIONED_TABLE = "student_attempts"
+PARTITION_COLUMN = "attempted_at"
+DEFAULT_PARTITION_SUFFIX = "default"
+
+
+def month_floor(value: datetime) -> datetime:
+    """해당 월 1일 0시"""
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """월 시작 시각에 months개월 더하기"""
+    index = value.year * 12 + (value.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """
+    월 파티션 테이블 이름
+
+    Examples:
+        >>> partition_name("student_attempts", datetime(2026, 3, 15))
+        'student_attempts_y2026m03'
+    """
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def parse_partition_month(table: str, name: str) -> Optional[datetime]:
+    """
+    파티션 이름에서 월 시작 시각 추출
+
+    Returns:
+        월 시작 시각 (월 파티션 이름이 아니면 None, DEFAULT 포함)
+    """
+    match = re.fullmatch(rf"{re.escape(table)}_y(\d{{4}})m(\d{{2}})", name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+def month_ranges(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    """
+    start가 속한 월부터 end가 속한 월까지의 [월 시작, 다음 월 시작) 구간
+
+    Examples:
+        >>> [lo.month for lo, _ in month_ranges(datetime(2026, 11, 5), datetime(2027, 1, 2))]
+        [11, 12, 1]
+    """
+    ranges = []
+    month = month_floor(start)
+    last = month_floor(end)
+    while month <= last:
+        following = add_months(month, 1)
+        ranges.append((month, following))
+        month = following
+    return ranges
+
+
+def create_partition_ddl(table: str, month: datetime) -> str:
+    """월 파티션 생성 DDL (이미 있으면 무시)"""
+    lower = month_floor(month)
+    upper = add_months(lower, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, lower)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{lower.isoformat(sep=' ')}') TO ('{upper.isoformat(sep=' ')}')"
+    )
+
+
+def create_default_partition_ddl(table: str) -> str:
+    """DEFAULT 파티션 생성 DDL (어느 월 파티션에도 속하지 않는 행)"""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table}_{DEFAULT_PARTITION_SUFFIX} "
+        f"PARTITION OF {table} DEFAULT"
+    )
+
+
+def detach_partition_ddl(table: str, month: datetime) -> str:
+    """
+    월 파티션 분리 DDL
+
+    분리된 파티션은 일반 테이블로 남으므로 보관(pg_dump 등) 후 삭제할 수 있다.
+    DETACH ... CONCURRENTLY는 트랜잭션 블록 밖에서만 실행할 수 있고, DEFAULT 파티션이
+    있는 테이블에서는 PostgreSQL이 거부한다. student_attempts는 항상 DEFAULT 파티션을
+    두므로 일반 DETACH(부모 테이블 ACCESS EXCLUSIVE 잠금, 짧게 끝남)만 사용한다.
+    """
+    return f"ALTER TABLE {table} DETACH PARTITION {partition_name(table, month)}"
+
+
+async def list_partitions(conn: AsyncConnection, table: str = PARTITIONED_TABLE) -> List[str]:
+    """
+    현재 연결된 파티션 이름 목록
+
+    Args:
+        conn: PostgreSQL 연결
+        table: 파티션 부모 테이블
+
+    Returns:
+        파티션 이름 리스트 (이름순)
+    """
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table ORDER BY child.relname"
+        ),
+        {"table": table}
+    )
+    return [row[0] for row in result]
+
+
+async def ensure_partitions(
+    conn: AsyncConnection,
+    start: datetime,
+    end: datetime,
+    table: str = PARTITIONED_TABLE
+) -> List[str]:
+    """
+    start ~ end 월 파티션이 모두 있도록 생성
+
+    Args:
+        conn: PostgreSQL 연결
+        start: 첫 월 (포함)
+        end: 마지막 월 (포함)
+        table: 파티션 부모 테이블
+
+    Returns:
+        새로 만든 파티션 이름 리스트
+    """
+    existing = set(await list_partitions(conn, table))
+    created = []
+    for lower, _ in month_ranges(start, end):
+        name = partition_name(table, lower)
+        if name in existing:
+            continue
+        await conn.execute(text(create_partition_ddl(table, lower)))
+        created.append(name)
+    return created
+
+
+async def detach_partitions_before(
+    conn: AsyncConnection,
+    cutoff: datetime,
+    table: str = PARTITIONED_TABLE
+) -> List[str]:
+    """
+    cutoff 월 이전 월 파티션 분리 (보관용)
+
+    DEFAULT 파티션은 분리하지 않는다.
+
+    Args:
+        conn: PostgreSQL 연결
+        cutoff: 이 월 시작 전에 끝나는 파티션만 분리
+        table: 파티션 부모 테이블
+
+    Returns:
+        분리한 파티션 이름 리스트
+    """
+    cutoff = month_floor(cutoff)
+    detached = []
+    for name in await list_partitions(conn, table):
+        month = parse_partition_month(table, name)
+        if month is None or add_months(month, 1) > cutoff:
+            continue
+        await conn.execute(text(detach_partition_ddl(table, month)))
+        detached.append(name)
+    return detached
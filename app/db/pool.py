@@ -0,0 +1,137 @@
+"""
+Connection Pool Instrumentation
+
+커넥션 풀 사용량과 커넥션 대기 시간을 기록한다.
+
+- 체크아웃/오버플로 수는 풀 상태(QueuePool.checkedout() 등)를 그대로 읽는다.
+- 대기 시간은 pool.connect() 호출(빈 커넥션을 기다리거나 새로 여는 시간)을 재서
+  누적 히스토그램(Prometheus 방식 le 버킷)으로 모은다.
+- pool_timeout 초과로 커넥션을 얻지 못한 횟수를 센다.
+
+    engine = create_engine()           # app.db.session
+    pool_statistics(engine)            # GET /metrics/db-pool
+"""
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 커넥션 대기 시간 버킷 상한 (초)
+WAIT_BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """
+    커넥션 대기 시간 히스토그램과 타임아웃 횟수
+
+    Examples:
+        >>> metrics = PoolMetrics(buckets=(0.01, 0.1))
+        >>> metrics.observe_wait(0.05)
+        >>> metrics.histogram()
+        [{'le': 0.01, 'count': 0}, {'le': 0.1, 'count': 1}, {'le': '+Inf', 'count': 1}]
+    """
+
+    def __init__(self, buckets: Sequence[float] = WAIT_BUCKETS_SECONDS):
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_counts = [0] * (len(self.buckets) + 1)
+        self.wait_count = 0
+        self.wait_seconds_sum = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+
+    def observe_wait(self, seconds: float) -> None:
+        """커넥션 획득에 걸린 시간 기록"""
+        self._bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        self.wait_count += 1
+        self.wait_seconds_sum += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_timeout(self) -> None:
+        """pool_timeout 초과 기록"""
+        self.timeouts += 1
+
+    def histogram(self) -> List[Dict[str, Any]]:
+        """
+        누적 히스토그램
+
+        Returns:
+            [{"le": 버킷 상한(초), "count": 상한 이하 관측 수}, ..., {"le": "+Inf", ...}]
+            (마지막 버킷은 JSON으로 표현할 수 있도록 "+Inf" 문자열)
+        """
+        cumulative = 0
+        result = []
+        for upper, count in zip(self.buckets + ("+Inf",), self._bucket_counts):
+            cumulative += count
+            result.append({"le": upper, "count": cumulative})
+        return result
+
+    def reset(self) -> None:
+        """모든 관측값 초기화"""
+        self.__init__(self.buckets)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    connect() 소요 시간을 metrics에 기록하는 비동기 QueuePool
+
+    engine.dispose()가 풀을 다시 만들 때도 같은 metrics를 이어서 사용한다.
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe_wait(time.perf_counter() - started)
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def pool_statistics(engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    엔진 커넥션 풀 현재 상태와 대기 시간 통계
+
+    Args:
+        engine: 비동기 엔진
+
+    Returns:
+        {"pool_class", "size", "checked_in", "checked_out", "overflow", "max_overflow",
+         "timeout_seconds", "wait": {...} (계측 풀일 때만)}
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # overflow()는 아직 채워지지 않은 기본 커넥션을 음수로 센다
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout_seconds=pool.timeout(),
+        )
+
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats["wait"] = {
+            "count": metrics.wait_count,
+            "sum_seconds": metrics.wait_seconds_sum,
+            "max_seconds": metrics.wait_seconds_max,
+            "timeouts": metrics.timeouts,
+            "histogram": metrics.histogram(),
+        }
+    return stats
@@ -0,0 +1,179 @@
+"""
+Read-Replica Session Routing
+
+AsyncSession의 sync_session_class로 사용하는 RoutingSession이 문장 종류에 따라
+연결할 엔진을 고른다 (SQLAlchemy Session.get_bind 재정의).
+
+기본은 모든 문장을 기본(primary) DB로 보낸다. 읽은 값으로 다시 쓰는
+read-modify-write 흐름이 복제 지연으로 오래된 값을 읽으면 갱신이 유실되므로,
+복제본 읽기는 use_replica(session)로 표시한 읽기 전용 경로(프로파일, 기록 조회,
+템플릿 목록 등)에서만 사용한다. 표시한 세션에서는
+
+- 읽기 전용 SELECT (FOR UPDATE 제외)  → 복제본 (세션별로 라운드 로빈 선택 후 고정)
+- INSERT/UPDATE/DELETE, flush, text(), session.connection() → 기본 DB
+- 세션에서 쓰기가 발생하면 커밋 전까지, 그리고 커밋 후 read_your_writes_seconds 동안
+  읽기도 기본 DB로 보낸다 (복제 지연으로 방금 쓴 행이 안 보이는 문제 방지)
+
+use_primary(session)는 use_replica보다 우선한다.
+복제본이 없으면 모든 문장이 기본 DB로 간다.
+
+    router = DatabaseRouter(primary_engine, [replica_a, replica_b], read_your_writes_seconds=5)
+    session_maker = async_sessionmaker(
+        primary_engine, class_=AsyncSession, sync_session_class=RoutingSession, router=router
+    )
+"""
+import itertools
+import threading
+import time
+from typing import List, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+WRITE_PENDING_KEY = "routing_write_pending"
+LAST_WRITE_AT_KEY = "routing_last_write_at"
+REPLICA_KEY = "routing_replica"
+FORCE_PRIMARY_KEY = "routing_force_primary"
+USE_REPLICA_KEY = "routing_use_replica"
+
+
+class DatabaseRouter:
+    """
+    기본 DB와 복제본 엔진 목록, 복제본 라운드 로빈 선택기
+
+    Examples:
+        >>> router = DatabaseRouter(primary, [replica_a, replica_b])
+        >>> router.next_replica() is replica_a.sync_engine
+        True
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        read_your_writes_seconds: float = 5.0
+    ):
+        """
+        Args:
+            primary: 쓰기/강한 일관성 읽기용 엔진
+            replicas: 읽기 전용 복제본 엔진 목록
+            read_your_writes_seconds: 쓰기 커밋 후 읽기를 기본 DB로 보낼 시간 (초)
+        """
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._cycle = itertools.cycle(self.replicas) if self.replicas else None
+        self._lock = threading.Lock()
+
+    def next_replica(self) -> Optional[Engine]:
+        """
+        다음 복제본 (sync 엔진, 복제본이 없으면 None)
+        """
+        if self._cycle is None:
+            return None
+        with self._lock:
+            return next(self._cycle).sync_engine
+
+
+def is_read_only(clause) -> bool:
+    """
+    복제본으로 보내도 되는 문장인지 (SELECT이고 FOR UPDATE가 아님)
+    """
+    if clause is None or not getattr(clause, "is_select", False):
+        return False
+    return getattr(clause, "_for_update_arg", None) is None
+
+
+class RoutingSession(Session):
+    """
+    use_replica()로 표시하면 읽기 전용 문장을 복제본으로 보내는 Session
+
+    AsyncSession(sync_session_class=RoutingSession, router=...)로 사용한다.
+    router가 없거나 표시하지 않으면 일반 Session과 같다 (모두 기본 DB).
+    """
+
+    def __init__(self, *args, router: Optional[DatabaseRouter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        router = self.router
+        if router is None or not router.replicas:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        if not is_read_only(clause):
+            self.info[WRITE_PENDING_KEY] = True
+            return router.primary.sync_engine
+
+        if not self.info.get(USE_REPLICA_KEY) or self._reads_from_primary():
+            return router.primary.sync_engine
+
+        replica = self.info.get(REPLICA_KEY)
+        if replica is None:
+            replica = self.info[REPLICA_KEY] = router.next_replica()
+        return replica
+
+    def _reads_from_primary(self) -> bool:
+        if self.info.get(FORCE_PRIMARY_KEY) or self.info.get(WRITE_PENDING_KEY):
+            return True
+        last_write_at = self.info.get(LAST_WRITE_AT_KEY)
+        return (
+            last_write_at is not None
+            and time.monotonic() - last_write_at < self.router.read_your_writes_seconds
+        )
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush_write(session, flush_context):
+    session.info[WRITE_PENDING_KEY] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _start_read_your_writes_window(session):
+    if session.info.pop(WRITE_PENDING_KEY, False):
+        session.info[LAST_WRITE_AT_KEY] = time.monotonic()
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _clear_pending_write(session):
+    session.info.pop(WRITE_PENDING_KEY, None)
+
+
+def use_replica(session) -> None:
+    """
+    이 세션의 읽기 전용 SELECT를 복제본으로 보내도록 표시
+
+    읽은 값으로 다시 쓰지 않는 조회 경로에서만 사용한다.
+    복제 지연만큼 오래된 값을 읽을 수 있다 (같은 세션의 쓰기는 read-your-writes로 보호).
+
+    Args:
+        session: AsyncSession 또는 Session
+    """
+    session.info[USE_REPLICA_KEY] = True
+
+
+def use_primary(session) -> None:
+    """
+    이 세션의 이후 모든 읽기를 기본 DB로 고정 (복제 지연을 허용할 수 없는 작업)
+
+    use_replica()로 표시된 세션이어도 기본 DB를 사용한다.
+
+    Args:
+        session: AsyncSession 또는 Session
+    """
+    session.info[FORCE_PRIMARY_KEY] = True
+
+
+def parse_replica_urls(value: str) -> List[str]:
+    """
+    쉼표로 구분한 복제본 URL 목록 파싱
+
+    Examples:
+        >>> parse_replica_urls("postgresql+asyncpg://a/db, postgresql+asyncpg://b/db")
+        ['postgresql+asyncpg://a/db', 'postgresql+asyncpg://b/db']
+        >>> parse_replica_urls("")
+        []
+    """
+    return [url.strip() for url in value.split(",") if url.strip()]
@@ -1,17 +1,68 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from typing import Any, Optional
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from contextlib import asynccontextmanager
 from app.config import settings
+from app.db.pool import InstrumentedAsyncQueuePool, PoolMetrics
+from app.db.routing import DatabaseRouter, RoutingSession, parse_replica_urls, use_replica
 
-# Async Engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True,
-    future=True
+
+def create_engine(
+    url: Optional[str] = None,
+    metrics: Optional[PoolMetrics] = None,
+    **overrides: Any
+) -> AsyncEngine:
+    """
+    설정(DB_*) 기반 비동기 엔진 생성
+
+    SQLite가 아니면 커넥션 대기 시간을 기록하는 InstrumentedAsyncQueuePool을 사용한다.
+
+    Args:
+        url: 데이터베이스 URL (None이면 settings.DATABASE_URL)
+        metrics: 풀 계측 객체 (None이면 새로 생성)
+        **overrides: create_async_engine() 인자 덮어쓰기
+
+    Returns:
+        AsyncEngine (계측 풀이면 engine.pool.metrics로 통계 접근)
+
+    Examples:
+        >>> worker_engine = create_engine(pool_size=2, max_overflow=0)
+    """
+    url = url or settings.DATABASE_URL
+    options = settings.engine_kwargs(url)
+    if not url.startswith("sqlite"):
+        options["poolclass"] = InstrumentedAsyncQueuePool
+    options.update(overrides)
+
+    new_engine = create_async_engine(url, **options)
+    if isinstance(new_engine.pool, InstrumentedAsyncQueuePool):
+        new_engine.pool.metrics = metrics or PoolMetrics()
+    return new_engine
+
+
+# Async Engine (primary)
+engine = create_engine()
+
+# Read Replica Engines
+replica_engines = [create_engine(url) for url in parse_replica_urls(settings.DB_REPLICA_URLS)]
+
+router = DatabaseRouter(
+    engine,
+    replica_engines,
+    read_your_writes_seconds=settings.DB_READ_YOUR_WRITES_SECONDS
 )
 
-# Async Session Factory
+# Async Session Factory (기본 DB, use_replica()로 표시한 세션만 읽기를 복제본으로 — app/db/routing.py 참고)
 async_session_maker = sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    router=router,
+    expire_on_commit=False
+)
+
+# 기본 DB 전용 Session Factory (라우팅 없음, 워커 등 복제본을 쓸 일이 없는 작업)
+primary_session_maker = sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False
@@ -50,5 +101,29 @@ async def get_db():
             await session.close()
 
 
+async def get_replica_db():
+    """
+    FastAPI Depends용 읽기 전용 DB 세션 (SELECT를 복제본으로 보냄)
+
+    읽은 값으로 다시 쓰지 않는 조회 엔드포인트에서만 사용한다.
+    복제본이 없으면 get_db()와 같다.
+
+    Usage:
+        @app.get("/endpoint")
+        async def endpoint(db: AsyncSession = Depends(get_replica_db)):
+            ...
+    """
+    async with async_session_maker() as session:
+        use_replica(session)
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
 # Alias for MCP tools
 get_db_context = get_db_session
@@ -14,6 +14,7 @@ from app.mcp.tools import TOOL_REGISTRY
 from app.models.workflow_template import WorkflowTemplate as WorkflowTemplateModel
 from app.models.custom_tool import CustomTool as CustomToolModel
 from app.db.session import get_db_context
+from app.request_context import request_scope
 from sqlalchemy import select, delete
 
 logger = logging.getLogger(__name__)
@@ -51,10 +52,11 @@ class Node0MCPServicer(node0_mcp_pb2_grpc.Node0MCPServiceServicer):
         logger.info(f"Executing tool: {tool_name} with arguments: {arguments}")
 
         try:
-            # Built-in tool 찾기
+            # Built-in tool 찾기 (tool 내부 DB/MCP 호출은 RPC 단위 세션과 클라이언트를 공유)
             if tool_name in TOOL_REGISTRY:
                 tool = TOOL_REGISTRY[tool_name]
-                result_data = await tool.safe_execute(arguments)
+                async with request_scope():
+                    result_data = await tool.safe_execute(arguments)
 
                 execution_time = int((time.time() - start_time) * 1000)
 
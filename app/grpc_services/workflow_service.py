@@ -7,6 +7,7 @@ import grpc
 import sys
 import os
 import logging
+from typing import Any, Optional
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -27,8 +28,7 @@ from app.services.exam_prep_service import (
     ExamPrepService,
     ExamPrepRequest
 )
-from app.mcp.manager import MCPClientManager
-from app.db.session import get_db_session
+from app.request_context import request_scope, get_mcp_client
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +36,14 @@ logger = logging.getLogger(__name__)
 class WorkflowServiceServicer(student_hub_pb2_grpc.WorkflowServiceServicer):
     """워크플로우 서비스 gRPC 구현"""
 
-    def __init__(self):
-        self.mcp = MCPClientManager()
+    def __init__(self, mcp: Optional[Any] = None, session_factory=None):
+        """
+        Args:
+            mcp: 공유 MCP 클라이언트 (None이면 MCPClientManager 싱글톤)
+            session_factory: RPC별 세션 팩토리 (None이면 기본 async_session_maker)
+        """
+        self.mcp = mcp
+        self.session_factory = session_factory
         logger.info("WorkflowServiceServicer initialized")
 
     async def StartWeeklyDiagnostic(
@@ -49,8 +55,8 @@ class WorkflowServiceServicer(student_hub_pb2_grpc.WorkflowServiceServicer):
         try:
             logger.info(f"StartWeeklyDiagnostic called for student {request.student_id}")
 
-            async with get_db_session() as db:
-                service = WeeklyDiagnosticService(self.mcp, db)
+            async with request_scope(self.session_factory, self.mcp) as ctx:
+                service = WeeklyDiagnosticService(await get_mcp_client(), ctx.db)
 
                 service_request = WeeklyDiagnosticRequest(
                     student_id=request.student_id,
@@ -91,8 +97,8 @@ class WorkflowServiceServicer(student_hub_pb2_grpc.WorkflowServiceServicer):
         try:
             logger.info(f"StartErrorReview called for student {request.student_id}, question {request.question_id}")
 
-            async with get_db_session() as db:
-                service = ErrorReviewService(self.mcp, db)
+            async with request_scope(self.session_factory, self.mcp) as ctx:
+                service = ErrorReviewService(await get_mcp_client(), ctx.db)
 
                 service_request = ErrorReviewRequest(
                     student_id=request.student_id,
@@ -128,8 +134,8 @@ class WorkflowServiceServicer(student_hub_pb2_grpc.WorkflowServiceServicer):
         try:
             logger.info(f"GenerateLearningPath called for student {request.student_id}, target: {request.target_concept}")
 
-            async with get_db_session() as db:
-                service = LearningPathService(self.mcp, db)
+            async with request_scope(self.session_factory, self.mcp) as ctx:
+                service = LearningPathService(await get_mcp_client(), ctx.db)
 
                 service_request = LearningPathRequest(
                     student_id=request.student_id,
@@ -176,8 +182,8 @@ class WorkflowServiceServicer(student_hub_pb2_grpc.WorkflowServiceServicer):
         try:
             logger.info(f"PrepareExam called for student {request.student_id}, exam: {request.exam_date}")
 
-            async with get_db_session() as db:
-                service = ExamPrepService(self.mcp, db)
+            async with request_scope(self.session_factory, self.mcp) as ctx:
+                service = ExamPrepService(await get_mcp_client(), ctx.db)
 
                 service_request = ExamPrepRequest(
                     student_id=request.student_id,
@@ -55,13 +55,13 @@ class AnalyzeStudentWeaknessesTool(MCPTool):
             WeeklyDiagnosticService,
             WeeklyDiagnosticRequest
         )
-        from app.mcp.manager import MCPClientManager
-        from app.db.session import get_db_context
+        from app.request_context import get_mcp_client, use_db_session
 
         logger.info(f"Analyzing weaknesses for student {arguments['student_id']}")
 
-        mcp = MCPClientManager()
-        async with get_db_context() as db:
+        # 요청 범위의 세션/MCP 클라이언트 재사용 (범위 밖이면 새 세션, 싱글톤 클라이언트)
+        mcp = await get_mcp_client()
+        async with use_db_session() as db:
             service = WeeklyDiagnosticService(mcp, db)
             request = WeeklyDiagnosticRequest(
                 student_id=arguments["student_id"],
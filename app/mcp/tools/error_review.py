@@ -29,32 +29,28 @@ class CreateErrorReviewTool(MCPToolBase):
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute error review workflow"""
-        from app.mcp.manager import MCPClientManager
+        from app.request_context import get_mcp_client
         
-        mcp = MCPClientManager()
-        await mcp.initialize()
-        
-        try:
-            # Call Node 7 (Error Note) to create error note
-            error_note = await mcp.call("error-note", "create_error_note", {
-                "student_id": arguments["student_id"],
-                "question_id": arguments["question_id"],
-                "student_answer": arguments["student_answer"],
-                "correct_answer": arguments["correct_answer"]
-            })
-            
-            # Calculate Anki schedule
-            anki = await mcp.call("error-note", "calculate_anki_schedule", {
-                "error_note_id": error_note["id"],
-                "quality": 3  # Default medium quality
-            })
-            
-            return {
-                "error_note_id": error_note["id"],
-                "next_review_date": anki["next_review_date"],
-                "anki_interval_days": anki["interval_days"],
-                "analysis": error_note.get("analysis", {})
-            }
-        
-        finally:
-            await mcp.close_all()
+        # 요청 범위에서 공유하는 MCP 클라이언트 (호출마다 연결/해제하지 않음)
+        mcp = await get_mcp_client()
+
+        # Call Node 7 (Error Note) to create error note
+        error_note = await mcp.call("error-note", "create_error_note", {
+            "student_id": arguments["student_id"],
+            "question_id": arguments["question_id"],
+            "student_answer": arguments["student_answer"],
+            "correct_answer": arguments["correct_answer"]
+        })
+
+        # Calculate Anki schedule
+        anki = await mcp.call("error-note", "calculate_anki_schedule", {
+            "error_note_id": error_note["id"],
+            "quality": 3  # Default medium quality
+        })
+
+        return {
+            "error_note_id": error_note["id"],
+            "next_review_date": anki["next_review_date"],
+            "anki_interval_days": anki["interval_days"],
+            "analysis": error_note.get("analysis", {})
+        }
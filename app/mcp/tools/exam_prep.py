@@ -24,35 +24,31 @@ class PrepareExamTool(MCPToolBase):
         self.db_session = db_session
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        from app.mcp.manager import MCPClientManager
+        from app.request_context import get_mcp_client
         
-        mcp = MCPClientManager()
-        await mcp.initialize()
-        
-        try:
-            # Get exam scope
-            scope = await mcp.call("school-info", "get_exam_scope", {
-                "school_id": arguments["school_id"],
-                "curriculum_paths": arguments.get("curriculum_paths", [])
-            })
-            
-            # Get weak concepts
-            weak = await mcp.call("lab-node", "get_weak_concepts", {
-                "student_id": arguments["student_id"]
-            })
-            
-            # Generate mock exam
-            mock_exam = await mcp.call("q-metrics", "generate_mock_exam", {
-                "student_id": arguments["student_id"],
-                "scope": scope
-            })
-            
-            return {
-                "workflow_id": f"ep_{arguments['student_id']}",
-                "focus_concepts": [w["concept"] for w in weak.get("weak_concepts", [])[:5]],
-                "mock_exam_pdf_url": mock_exam.get("pdf_url", ""),
-                "exam_date": arguments["exam_date"]
-            }
-        
-        finally:
-            await mcp.close_all()
+        # 요청 범위에서 공유하는 MCP 클라이언트 (호출마다 연결/해제하지 않음)
+        mcp = await get_mcp_client()
+
+        # Get exam scope
+        scope = await mcp.call("school-info", "get_exam_scope", {
+            "school_id": arguments["school_id"],
+            "curriculum_paths": arguments.get("curriculum_paths", [])
+        })
+
+        # Get weak concepts
+        weak = await mcp.call("lab-node", "get_weak_concepts", {
+            "student_id": arguments["student_id"]
+        })
+
+        # Generate mock exam
+        mock_exam = await mcp.call("q-metrics", "generate_mock_exam", {
+            "student_id": arguments["student_id"],
+            "scope": scope
+        })
+
+        return {
+            "workflow_id": f"ep_{arguments['student_id']}",
+            "focus_concepts": [w["concept"] for w in weak.get("weak_concepts", [])[:5]],
+            "mock_exam_pdf_url": mock_exam.get("pdf_url", ""),
+            "exam_date": arguments["exam_date"]
+        }
@@ -23,34 +23,30 @@ class GenerateLearningPathTool(MCPToolBase):
         self.db_session = db_session
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        from app.mcp.manager import MCPClientManager
+        from app.request_context import get_mcp_client
         
-        mcp = MCPClientManager()
-        await mcp.initialize()
-        
-        try:
-            # Get concept heatmap
-            heatmap = await mcp.call("lab-node", "get_concept_heatmap", {
-                "student_id": arguments["student_id"]
-            })
-            
-            # Get prerequisite graph
-            graph = await mcp.call("logic-engine", "get_prerequisite_graph", {
-                "concept": arguments["target_concept"]
-            })
-            
-            # Estimate learning time
-            time_est = await mcp.call("q-dna", "estimate_learning_time", {
-                "concept": arguments["target_concept"],
-                "current_mastery": heatmap["heatmap"].get(arguments["target_concept"], 0.5)
-            })
-            
-            return {
-                "workflow_id": f"lp_{arguments['student_id']}",
-                "learning_path": [arguments["target_concept"]],
-                "total_estimated_hours": time_est.get("estimated_hours", 10),
-                "prerequisites": graph.get("graph", {}).get(arguments["target_concept"], {}).get("prerequisites", [])
-            }
-        
-        finally:
-            await mcp.close_all()
+        # 요청 범위에서 공유하는 MCP 클라이언트 (호출마다 연결/해제하지 않음)
+        mcp = await get_mcp_client()
+
+        # Get concept heatmap
+        heatmap = await mcp.call("lab-node", "get_concept_heatmap", {
+            "student_id": arguments["student_id"]
+        })
+
+        # Get prerequisite graph
+        graph = await mcp.call("logic-engine", "get_prerequisite_graph", {
+            "concept": arguments["target_concept"]
+        })
+
+        # Estimate learning time
+        time_est = await mcp.call("q-dna", "estimate_learning_time", {
+            "concept": arguments["target_concept"],
+            "current_mastery": heatmap["heatmap"].get(arguments["target_concept"], 0.5)
+        })
+
+        return {
+            "workflow_id": f"lp_{arguments['student_id']}",
+            "learning_path": [arguments["target_concept"]],
+            "total_estimated_hours": time_est.get("estimated_hours", 10),
+            "prerequisites": graph.get("graph", {}).get(arguments["target_concept"], {}).get("prerequisites", [])
+        }
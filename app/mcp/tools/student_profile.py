@@ -21,47 +21,43 @@ class GetStudentProfileTool(MCPToolBase):
         self.db_session = db_session
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        from app.mcp.manager import MCPClientManager
+        from app.request_context import get_mcp_client, use_db_session
         from app.repositories.student_repository import StudentRepository
         
-        mcp = MCPClientManager()
-        await mcp.initialize()
-        
-        try:
-            # Get student from DB
-            student_repo = StudentRepository(self.db_session)
-            student = await student_repo.get_by_id(arguments["student_id"])
-            
-            if not student:
-                return {"error": "Student not found"}
-            
-            # Get activity summary
-            activity = await mcp.call("lab-node", "get_activity_summary", {
-                "student_id": arguments["student_id"],
-                "days": 30
-            })
-            
-            # Get concept heatmap
-            heatmap = await mcp.call("lab-node", "get_concept_heatmap", {
-                "student_id": arguments["student_id"]
-            })
-            
-            # Get error notes
-            error_notes = await mcp.call("error-note", "list_error_notes_by_student", {
-                "student_id": arguments["student_id"]
-            })
-            
-            return {
-                "student": {
-                    "id": student.id,
-                    "name": student.name,
-                    "grade": student.grade,
-                    "school_id": student.school_id
-                },
-                "activity": activity,
-                "mastery": heatmap.get("heatmap", {}),
-                "error_notes_count": len(error_notes.get("error_notes", []))
-            }
-        
-        finally:
-            await mcp.close_all()
+        # 요청 범위에서 공유하는 MCP 클라이언트 (호출마다 연결/해제하지 않음)
+        mcp = await get_mcp_client()
+
+        # Get student from DB (주입된 세션 → 요청 범위 세션 → 새 세션)
+        async with use_db_session(self.db_session) as db:
+            student = await StudentRepository(db).get_by_id(arguments["student_id"])
+
+        if not student:
+            return {"error": "Student not found"}
+
+        # Get activity summary
+        activity = await mcp.call("lab-node", "get_activity_summary", {
+            "student_id": arguments["student_id"],
+            "days": 30
+        })
+
+        # Get concept heatmap
+        heatmap = await mcp.call("lab-node", "get_concept_heatmap", {
+            "student_id": arguments["student_id"]
+        })
+
+        # Get error notes
+        error_notes = await mcp.call("error-note", "list_error_notes_by_student", {
+            "student_id": arguments["student_id"]
+        })
+
+        return {
+            "student": {
+                "id": student.id,
+                "name": student.name,
+                "grade": student.grade,
+                "school_id": student.school_id
+            },
+            "activity": activity,
+            "mastery": heatmap.get("heatmap", {}),
+            "error_notes_count": len(error_notes.get("error_notes", []))
+        }
@@ -51,46 +51,42 @@ class AnalyzeStudentWeaknessesTool(MCPToolBase):
             WeeklyDiagnosticService,
             WeeklyDiagnosticRequest
         )
-        from app.mcp.manager import MCPClientManager
+        from app.request_context import get_mcp_client, use_db_session
         
         # Convert string boolean to actual boolean
         include_weak = arguments.get("include_weak_concepts", "true")
         if isinstance(include_weak, str):
             include_weak = include_weak.lower() == "true"
         
-        # Create MCP manager
-        mcp = MCPClientManager()
-        await mcp.initialize()
-        
-        try:
+        # 요청 범위에서 공유하는 MCP 클라이언트 (호출마다 연결/해제하지 않음)
+        mcp = await get_mcp_client()
+
+        async with use_db_session(self.db_session) as db:
             # Create service with MCP manager and DB session
-            service = WeeklyDiagnosticService(mcp, self.db_session)
-            
+            service = WeeklyDiagnosticService(mcp, db)
+
             # Create request
             request = WeeklyDiagnosticRequest(
                 student_id=arguments["student_id"],
                 curriculum_path=arguments["curriculum_path"],
                 include_weak_concepts=include_weak
             )
-            
+
             # Execute diagnostic
             result = await service.start_diagnostic(request)
-            
-            # Return formatted result
-            return {
-                "workflow_id": result.workflow_id,
-                "weak_concepts": result.weak_concepts,
-                "questions": [
-                    {
-                        "id": q.id,
-                        "content": q.content,
-                        "difficulty": q.difficulty,
-                        "concepts": q.concepts
-                    }
-                    for q in result.questions
-                ],
-                "total_estimated_time_minutes": result.total_estimated_time_minutes
-            }
-        
-        finally:
-            await mcp.close_all()
+
+        # Return formatted result
+        return {
+            "workflow_id": result.workflow_id,
+            "weak_concepts": result.weak_concepts,
+            "questions": [
+                {
+                    "id": q.id,
+                    "content": q.content,
+                    "difficulty": q.difficulty,
+                    "concepts": q.concepts
+                }
+                for q in result.questions
+            ],
+            "total_estimated_time_minutes": result.total_estimated_time_minutes
+        }
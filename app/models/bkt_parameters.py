@@ -0,0 +1,47 @@
+"""
+BKTParameters Model
+
+개념별로 적합(fitting)된 BKT 파라미터를 저장하는 모델입니다.
+
+scripts/fit_bkt_parameters.py가 student_attempts로부터 추정해 기록하고,
+BKTParameterStore가 프로세스 단위로 캐시해 MasteryService에 제공합니다.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, Float, DateTime
+from app.db.base import Base
+
+
+class BKTParameters(Base):
+    """
+    개념별 BKT 파라미터 모델
+
+    Attributes:
+        concept: 학습 개념 (PK)
+        p_init: 초기 숙련도 확률
+        p_learn: 학습 전이 확률
+        p_slip: 실수 확률
+        p_guess: 추측 확률
+        log_likelihood: 적합 시 최대 로그우도
+        n_sequences: 적합에 사용된 학생-개념 시퀀스 수
+        n_attempts: 적합에 사용된 시도 수
+        fitted_at: 적합 시각 (UTC)
+    """
+    __tablename__ = "bkt_parameters"
+
+    concept = Column(String(100), primary_key=True)
+    p_init = Column(Float, nullable=False)
+    p_learn = Column(Float, nullable=False)
+    p_slip = Column(Float, nullable=False)
+    p_guess = Column(Float, nullable=False)
+    log_likelihood = Column(Float, nullable=True)
+    n_sequences = Column(Integer, nullable=False, default=0)
+    n_attempts = Column(Integer, nullable=False, default=0)
+    fitted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"<BKTParameters(concept='{self.concept}', "
+            f"p_init={self.p_init}, p_learn={self.p_learn}, "
+            f"p_slip={self.p_slip}, p_guess={self.p_guess})>"
+        )
@@ -0,0 +1,47 @@
+"""
+ItemBankItem Model
+
+JMLE로 보정(calibration)된 문항별 IRT 파라미터를 저장하는 문항 은행 모델입니다.
+
+scripts/calibrate_item_bank.py가 student_attempts로부터 추정해 기록하고,
+추천 경로는 Mock Q-DNA 서버의 고정 난이도 대신 이 값을 사용합니다.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, Float, DateTime, Index
+from app.db.base import Base
+
+
+class ItemBankItem(Base):
+    """
+    문항 은행 모델
+
+    Attributes:
+        question_id: 문제 ID (PK)
+        concept: 문항의 학습 개념
+        difficulty: 난이도 b (로짓, 평균 0 척도)
+        discrimination: 변별도 a (1PL 보정이면 1.0)
+        model: 보정 모델 ("1PL" 또는 "2PL")
+        n_responses: 보정에 사용된 응답 수
+        calibrated_at: 보정 시각 (UTC)
+    """
+    __tablename__ = "item_bank"
+
+    question_id = Column(String(100), primary_key=True)
+    concept = Column(String(100), nullable=False)
+    difficulty = Column(Float, nullable=False)
+    discrimination = Column(Float, nullable=False, default=1.0)
+    model = Column(String(10), nullable=False, default="1PL")
+    n_responses = Column(Integer, nullable=False, default=0)
+    calibrated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_item_bank_concept_difficulty", "concept", "difficulty"),
+    )
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"<ItemBankItem(question_id='{self.question_id}', "
+            f"concept='{self.concept}', "
+            f"difficulty={self.difficulty}, discrimination={self.discrimination})>"
+        )
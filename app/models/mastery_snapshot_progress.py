@@ -0,0 +1,40 @@
+"""
+MasterySnapshotProgress Model
+
+숙련도 스냅샷 워커의 진행 상황을 저장하는 모델입니다.
+
+스냅샷 지연(staleness)은 행별 갱신 시각이 아니라 워커가 밀린 학생-개념 쌍을
+마지막으로 모두 반영한 시각을 기준으로 계산합니다
+(시도가 없는 개념의 스냅샷은 오래되어도 여전히 정확하므로).
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime
+from app.db.base import Base
+
+# 워커 진행 행 ID (워커가 여러 개여도 같은 행을 갱신)
+SNAPSHOT_WORKER_ID = "mastery_snapshot"
+
+
+class MasterySnapshotProgress(Base):
+    """
+    스냅샷 워커 진행 상황 모델
+
+    Attributes:
+        id: 워커 식별자 (SNAPSHOT_WORKER_ID)
+        caught_up_at: 이 시각 이전에 커밋된 상태 변경은 모두 스냅샷에 반영됨 (UTC)
+        updated_at: 마지막 갱신 시각 (UTC)
+    """
+    __tablename__ = "mastery_snapshot_progress"
+
+    id = Column(String(50), primary_key=True)
+    caught_up_at = Column(DateTime, nullable=False)
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return f"<MasterySnapshotProgress(id='{self.id}', caught_up_at={self.caught_up_at})>"
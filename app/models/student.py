@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 import uuid
@@ -7,7 +7,12 @@ import uuid
 class Student(Base):
     """학생 모델"""
     __tablename__ = "students"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # 학교/학년 필터와 (school_id, grade, id) 키셋 페이지네이션
+        # (school_id 단독 필터와 학교별 카운트도 이 인덱스의 접두로 처리)
+        Index('idx_students_school_grade_id', 'school_id', 'grade', 'id'),
+        {'extend_existing': True},
+    )
 
     id = Column(String, primary_key=True, default=lambda: f"student_{uuid.uuid4().hex[:12]}")
     name = Column(String(100), nullable=False)
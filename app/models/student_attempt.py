@@ -5,6 +5,11 @@ StudentAttempt Model
 각 시도는 정답 여부, 응답 시간, 개념 등을 포함합니다.
 
 이 데이터는 BKT 알고리즘을 통한 숙련도 계산의 기초가 됩니다.
+
+PostgreSQL에서는 attempted_at 기준 월별 RANGE 파티션 테이블입니다
+(alembic 20261016_partition_attempts, app/db/partitioning.py).
+파티션 키를 포함한 (id, attempted_at)이 DB 기본키지만 id는 시퀀스로 유일하므로
+ORM은 id만 기본키로 사용합니다. attempted_at 범위 조건이 있는 쿼리만 파티션이 제외됩니다.
 """
 from datetime import datetime
 from sqlalchemy import Column, String, Boolean, Integer, DateTime, Index
@@ -28,22 +33,30 @@ class StudentAttempt(Base):
     __tablename__ = "student_attempts"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    student_id = Column(String(100), nullable=False, index=True)
+    student_id = Column(String(100), nullable=False)
     question_id = Column(String(100), nullable=False)
-    concept = Column(String(100), nullable=False, index=True)
+    concept = Column(String(100), nullable=False)
     is_correct = Column(Boolean, nullable=False)
     response_time_ms = Column(Integer, nullable=True)
     attempted_at = Column(
         DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        index=True
+        default=datetime.utcnow
     )
 
-    # 복합 인덱스: 학생별, 개념별 쿼리 최적화
+    # 모든 조회가 student_id로 시작하므로 학생 접두 복합 인덱스 두 개로 충분하다
+    # (단일 컬럼 student_id/concept/attempted_at 인덱스는 두 인덱스의 접두와 겹쳐 제거).
+    # tests/integration/test_attempt_query_plans.py가 PostgreSQL 실행 계획으로 검증한다.
     __table_args__ = (
-        Index('idx_student_concept', 'student_id', 'concept'),
-        Index('idx_student_date', 'student_id', 'attempted_at'),
+        # 학생-개념 시간순 조회 (BKT 재생, 키셋 페이지, 개념 집계)
+        # INCLUDE 컬럼으로 is_correct/response_time_ms만 읽는 쿼리는 Index Only Scan
+        Index(
+            'idx_student_concept_time',
+            'student_id', 'concept', 'attempted_at', 'id',
+            postgresql_include=['is_correct', 'response_time_ms']
+        ),
+        # 학생 전체 시간순 조회 (최근 시도, 전체 개념 키셋 페이지, 개수)
+        Index('idx_student_date', 'student_id', 'attempted_at', 'id'),
     )
 
     def __repr__(self) -> str:
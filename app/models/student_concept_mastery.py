@@ -0,0 +1,48 @@
+"""
+StudentConceptMastery Model
+
+학생-개념별 숙련도 스냅샷(materialized) 모델입니다.
+
+workers/mastery_snapshot_worker.py가 student_mastery_states와 비교해 바뀐 행만 갱신하고,
+숙련도 라우터는 허용 지연(staleness) 안의 스냅샷이면 원시 시도 재계산 없이 읽습니다.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, Float, DateTime, UniqueConstraint, Index
+from app.db.base import Base
+
+
+class StudentConceptMastery(Base):
+    """
+    학생-개념별 숙련도 스냅샷 모델
+
+    Attributes:
+        id: 스냅샷 고유 ID (자동 생성)
+        student_id: 학생 ID
+        concept: 학습 개념
+        p_mastery: 갱신 시점 기준 숙련도 (망각 감쇠 반영)
+        last_attempt_id: 스냅샷에 반영된 상태의 last_attempt_id (갱신 대상 판단 기준)
+        refreshed_at: 스냅샷 갱신 시각 (UTC, staleness 기준)
+    """
+    __tablename__ = "student_concept_mastery"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    student_id = Column(String(100), nullable=False)
+    concept = Column(String(100), nullable=False)
+    p_mastery = Column(Float, nullable=False)
+    last_attempt_id = Column(Integer, nullable=False)
+    refreshed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint('student_id', 'concept', name='uq_concept_mastery_student_concept'),
+        # 코호트 집계: 개념별 숙련도 순위/임계값 필터
+        Index('idx_concept_mastery_concept_value', 'concept', 'p_mastery'),
+    )
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"<StudentConceptMastery(student_id='{self.student_id}', "
+            f"concept='{self.concept}', "
+            f"p_mastery={self.p_mastery}, "
+            f"refreshed_at={self.refreshed_at})>"
+        )
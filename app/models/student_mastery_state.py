@@ -0,0 +1,58 @@
+"""
+StudentMasteryState Model
+
+학생-개념 쌍별 BKT 숙련도 상태를 저장하는 모델입니다.
+
+새 시도가 기록될 때마다 BKT 한 스텝만 적용해 갱신하므로,
+숙련도 조회 시 전체 시도 기록을 p_init부터 다시 재생할 필요가 없습니다.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, Float, DateTime, UniqueConstraint
+from app.db.base import Base
+
+
+class StudentMasteryState(Base):
+    """
+    학생-개념별 증분 숙련도 상태 모델
+
+    Attributes:
+        id: 상태 고유 ID (자동 생성)
+        student_id: 학생 ID
+        concept: 학습 개념
+        p_mastery: 현재 숙련도 확률 P(L)
+        attempt_count: 반영된 시도 횟수
+        last_attempt_id: 마지막으로 반영된 StudentAttempt ID (시도 삭제 후 재계산 대기 중이면 -삭제한 ID)
+        last_attempted_at: 마지막으로 반영된 시도 시각 (조회 시 망각 감쇠 기준)
+        params_key: 상태 계산에 사용된 BKT 파라미터 식별자
+        updated_at: 마지막 갱신 시각 (UTC)
+    """
+    __tablename__ = "student_mastery_states"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    student_id = Column(String(100), nullable=False)
+    concept = Column(String(100), nullable=False)
+    p_mastery = Column(Float, nullable=False)
+    attempt_count = Column(Integer, nullable=False, default=0)
+    last_attempt_id = Column(Integer, nullable=True)
+    last_attempted_at = Column(DateTime, nullable=True)
+    params_key = Column(String(100), nullable=False)
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+
+    # 학생-개념 쌍당 하나의 상태 (조회용 인덱스 겸용)
+    __table_args__ = (
+        UniqueConstraint('student_id', 'concept', name='uq_mastery_state_student_concept'),
+    )
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"<StudentMasteryState(student_id='{self.student_id}', "
+            f"concept='{self.concept}', "
+            f"p_mastery={self.p_mastery}, "
+            f"attempt_count={self.attempt_count})>"
+        )
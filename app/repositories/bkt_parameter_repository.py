@@ -0,0 +1,74 @@
+"""
+BKTParameters Repository
+
+개념별 BKT 파라미터의 데이터 접근 로직을 캡슐화합니다.
+"""
+from typing import List, Optional, Dict, Any
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.bkt_parameters import BKTParameters
+
+
+class BKTParameterRepository:
+    """BKTParameters 데이터 접근 계층"""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Repository 초기화
+
+        Args:
+            db: AsyncSession 데이터베이스 세션
+        """
+        self.db = db
+
+    async def list_all(self) -> List[BKTParameters]:
+        """
+        전체 개념의 파라미터 조회
+
+        Returns:
+            BKTParameters 리스트
+        """
+        result = await self.db.execute(select(BKTParameters))
+        return list(result.scalars().all())
+
+    async def get_by_concept(self, concept: str) -> Optional[BKTParameters]:
+        """
+        개념의 파라미터 조회
+
+        Args:
+            concept: 개념명
+
+        Returns:
+            BKTParameters 객체 또는 None
+        """
+        return await self.db.get(BKTParameters, concept)
+
+    async def save(self, concept: str, fitted: Dict[str, Any]) -> BKTParameters:
+        """
+        개념의 파라미터 저장 (있으면 덮어쓰기)
+
+        Args:
+            concept: 개념명
+            fitted: BKTGridFitter.best_params 결과
+
+        Returns:
+            저장된 BKTParameters 객체
+        """
+        params = await self.get_by_concept(concept)
+        if params is None:
+            params = BKTParameters(concept=concept)
+            self.db.add(params)
+
+        params.p_init = fitted["p_init"]
+        params.p_learn = fitted["p_learn"]
+        params.p_slip = fitted["p_slip"]
+        params.p_guess = fitted["p_guess"]
+        params.log_likelihood = fitted.get("log_likelihood")
+        params.n_sequences = fitted.get("n_sequences", 0)
+        params.n_attempts = fitted.get("n_attempts", 0)
+        params.fitted_at = datetime.utcnow()
+
+        await self.db.commit()
+        return params
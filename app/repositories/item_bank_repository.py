@@ -0,0 +1,106 @@
+"""
+ItemBank Repository
+
+문항 은행(ItemBankItem)의 데이터 접근 로직을 캡슐화합니다.
+"""
+from typing import List, Dict, Any, Iterable
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.item_bank import ItemBankItem
+
+
+class ItemBankRepository:
+    """ItemBankItem 데이터 접근 계층"""
+
+    SAVE_CHUNK_SIZE = 500
+
+    def __init__(self, db: AsyncSession):
+        """
+        Repository 초기화
+
+        Args:
+            db: AsyncSession 데이터베이스 세션
+        """
+        self.db = db
+
+    async def list_all(self) -> List[ItemBankItem]:
+        """
+        전체 문항 조회
+
+        Returns:
+            ItemBankItem 리스트
+        """
+        result = await self.db.execute(select(ItemBankItem))
+        return list(result.scalars().all())
+
+    async def list_by_concept(self, concept: str) -> List[ItemBankItem]:
+        """
+        개념의 문항을 난이도순으로 조회
+
+        Args:
+            concept: 개념명
+
+        Returns:
+            ItemBankItem 리스트 (난이도 오름차순)
+        """
+        stmt = (
+            select(ItemBankItem)
+            .where(ItemBankItem.concept == concept)
+            .order_by(ItemBankItem.difficulty)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_by_ids(self, question_ids: Iterable[str]) -> Dict[str, ItemBankItem]:
+        """
+        여러 문항을 한 번에 조회
+
+        Args:
+            question_ids: 문제 ID 목록
+
+        Returns:
+            {question_id: ItemBankItem} 딕셔너리 (보정되지 않은 문항은 제외)
+        """
+        question_ids = list(question_ids)
+        if not question_ids:
+            return {}
+
+        stmt = select(ItemBankItem).where(ItemBankItem.question_id.in_(question_ids))
+        result = await self.db.execute(stmt)
+        return {item.question_id: item for item in result.scalars().all()}
+
+    async def save_many(self, items: List[Dict[str, Any]]) -> int:
+        """
+        보정 결과 저장 (있으면 덮어쓰기)
+
+        Args:
+            items: [{"question_id", "concept", "difficulty", "discrimination",
+                     "model", "n_responses"}, ...]
+
+        Returns:
+            저장된 문항 수
+        """
+        calibrated_at = datetime.utcnow()
+
+        # IN 절 바인드 변수 수 제한을 피하기 위해 청크 단위로 기존 행 조회
+        for start in range(0, len(items), self.SAVE_CHUNK_SIZE):
+            chunk = items[start:start + self.SAVE_CHUNK_SIZE]
+            existing = await self.get_by_ids(item["question_id"] for item in chunk)
+
+            for item in chunk:
+                row = existing.get(item["question_id"])
+                if row is None:
+                    row = ItemBankItem(question_id=item["question_id"])
+                    self.db.add(row)
+
+                row.concept = item["concept"]
+                row.difficulty = item["difficulty"]
+                row.discrimination = item.get("discrimination", 1.0)
+                row.model = item.get("model", "1PL")
+                row.n_responses = item.get("n_responses", 0)
+                row.calibrated_at = calibrated_at
+
+        await self.db.commit()
+        return len(items)
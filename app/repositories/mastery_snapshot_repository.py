@@ -0,0 +1,323 @@
+"""
+StudentConceptMastery Repository
+
+숙련도 스냅샷의 데이터 접근 로직을 캡슐화합니다.
+
+갱신 대상은 student_mastery_states(시도와 같은 트랜잭션에서 갱신되는 학생-개념 상태)와
+스냅샷의 last_attempt_id를 비교해 찾는다. 전역 ID 워터마크와 달리 커밋 순서와
+무관하게, 커밋된 상태 변경은 반영될 때까지 계속 대상으로 남는다.
+시도를 삭제하면 상태의 last_attempt_id가 음수(-삭제한 ID)로 바뀌어 같은 방식으로 대상이 된다.
+"""
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import select, func, tuple_, case, and_, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.mastery_snapshot_progress import MasterySnapshotProgress, SNAPSHOT_WORKER_ID
+from app.models.student import Student
+from app.models.student_concept_mastery import StudentConceptMastery
+from app.models.student_mastery_state import StudentMasteryState
+
+# 코호트 분포에서 보고하는 백분위 (nearest-rank)
+COHORT_PERCENTILES = (25, 50, 75)
+
+
+class MasterySnapshotRepository:
+    """StudentConceptMastery 데이터 접근 계층"""
+
+    SAVE_CHUNK_SIZE = 500
+
+    def __init__(self, db: AsyncSession):
+        """
+        Repository 초기화
+
+        Args:
+            db: AsyncSession 데이터베이스 세션
+        """
+        self.db = db
+
+    async def get_pending(
+        self,
+        limit: int = 1000,
+        student_id: Optional[str] = None,
+        school_id: Optional[str] = None,
+        grade: Optional[int] = None,
+        concepts: Optional[List[str]] = None
+    ) -> List[Tuple[str, str, int, datetime]]:
+        """
+        스냅샷에 아직 반영되지 않은 학생-개념 상태 조회
+
+        스냅샷이 없거나 스냅샷의 last_attempt_id가 상태와 다른 쌍이다
+        (같은 쌍의 시도는 상태 행 잠금으로 직렬화되므로 ID 대소가 아닌 일치 여부로 비교).
+
+        Args:
+            limit: 최대 행 수
+            student_id: 학생 제한 (None이면 전체)
+            school_id: 학교 코호트 제한 (None이면 전체)
+            grade: 학년 제한 (school_id와 함께 사용)
+            concepts: 개념 제한 (None이면 전체)
+
+        Returns:
+            오래 밀린 순 [(student_id, concept, last_attempt_id, 상태 갱신 시각), ...]
+        """
+        stmt = (
+            select(
+                StudentMasteryState.student_id,
+                StudentMasteryState.concept,
+                StudentMasteryState.last_attempt_id,
+                StudentMasteryState.updated_at,
+            )
+            .outerjoin(
+                StudentConceptMastery,
+                and_(
+                    StudentConceptMastery.student_id == StudentMasteryState.student_id,
+                    StudentConceptMastery.concept == StudentMasteryState.concept
+                )
+            )
+            .where(
+                StudentMasteryState.last_attempt_id.is_not(None),
+                or_(
+                    StudentConceptMastery.id.is_(None),
+                    StudentConceptMastery.last_attempt_id != StudentMasteryState.last_attempt_id
+                )
+            )
+            .order_by(StudentMasteryState.updated_at, StudentMasteryState.id)
+            .limit(limit)
+        )
+        if student_id is not None:
+            stmt = stmt.where(StudentMasteryState.student_id == student_id)
+        if school_id is not None:
+            stmt = stmt.join(Student, Student.id == StudentMasteryState.student_id).where(
+                Student.school_id == school_id
+            )
+            if grade is not None:
+                stmt = stmt.where(Student.grade == grade)
+        if concepts is not None:
+            stmt = stmt.where(StudentMasteryState.concept.in_(concepts))
+
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
+    async def get_caught_up_at(self) -> Optional[datetime]:
+        """
+        워커가 밀린 쌍을 마지막으로 모두 반영한 시각
+
+        Returns:
+            이 시각 이전에 커밋된 상태 변경은 모두 반영됨 (기록이 없으면 None)
+        """
+        result = await self.db.execute(
+            select(MasterySnapshotProgress.caught_up_at).where(
+                MasterySnapshotProgress.id == SNAPSHOT_WORKER_ID
+            )
+        )
+        return result.scalar()
+
+    async def mark_caught_up(self, caught_up_at: datetime) -> None:
+        """
+        워커 진행 시각 기록 (기존 값보다 이후일 때만)
+
+        Args:
+            caught_up_at: 밀린 쌍 조회를 시작한 시각
+        """
+        connection = await self.db.connection()
+        dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(MasterySnapshotProgress).values(
+            id=SNAPSHOT_WORKER_ID, caught_up_at=caught_up_at, updated_at=datetime.utcnow()
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["id"],
+                set_={"caught_up_at": stmt.excluded.caught_up_at, "updated_at": stmt.excluded.updated_at},
+                where=MasterySnapshotProgress.caught_up_at < stmt.excluded.caught_up_at
+            )
+        )
+        await self.db.commit()
+
+    async def get_by_student(self, student_id: str) -> List[StudentConceptMastery]:
+        """
+        학생의 전체 스냅샷 조회
+
+        Args:
+            student_id: 학생 ID
+
+        Returns:
+            StudentConceptMastery 리스트 (개념순)
+        """
+        stmt = (
+            select(StudentConceptMastery)
+            .where(StudentConceptMastery.student_id == student_id)
+            .order_by(StudentConceptMastery.concept)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def save_many(
+        self,
+        snapshots: List[Dict[str, Any]],
+        refreshed_at: datetime
+    ) -> int:
+        """
+        스냅샷 저장 (있으면 덮어쓰기)
+
+        Args:
+            snapshots: [{"student_id", "concept", "p_mastery", "last_attempt_id"}, ...]
+            refreshed_at: 갱신 시각
+
+        Returns:
+            저장된 행 수
+        """
+        for start in range(0, len(snapshots), self.SAVE_CHUNK_SIZE):
+            chunk = snapshots[start:start + self.SAVE_CHUNK_SIZE]
+            keys = [(s["student_id"], s["concept"]) for s in chunk]
+
+            result = await self.db.execute(
+                select(StudentConceptMastery).where(
+                    tuple_(StudentConceptMastery.student_id, StudentConceptMastery.concept).in_(keys)
+                )
+            )
+            existing = {(row.student_id, row.concept): row for row in result.scalars().all()}
+
+            for snapshot in chunk:
+                row = existing.get((snapshot["student_id"], snapshot["concept"]))
+                if row is None:
+                    row = StudentConceptMastery(
+                        student_id=snapshot["student_id"],
+                        concept=snapshot["concept"]
+                    )
+                    self.db.add(row)
+
+                row.p_mastery = snapshot["p_mastery"]
+                row.last_attempt_id = snapshot["last_attempt_id"]
+                row.refreshed_at = refreshed_at
+
+        await self.db.commit()
+        return len(snapshots)
+
+    def _cohort_filter(self, stmt, school_id: str, grade: Optional[int]):
+        """students와 조인해 학교/학년 코호트로 제한"""
+        stmt = stmt.join(Student, Student.id == StudentConceptMastery.student_id).where(
+            Student.school_id == school_id
+        )
+        if grade is not None:
+            stmt = stmt.where(Student.grade == grade)
+        return stmt
+
+    async def aggregate_concepts(
+        self,
+        school_id: str,
+        grade: Optional[int] = None,
+        threshold: float = 0.5,
+        concepts: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        코호트의 개념별 숙련도 분포 (한 쿼리)
+
+        개념 파티션별 row_number()/count() 윈도 함수로 순위를 매긴 뒤 GROUP BY로
+        평균, 최소/최대, 임계값 미만 학생 수, nearest-rank 백분위
+        (rank = ceil(p/100 · n))를 계산한다. percentile_cont가 없는 DB에서도 동작한다.
+
+        Args:
+            school_id: 학교 ID
+            grade: 학년 (None이면 학교 전체)
+            threshold: 미달 판단 임계값
+            concepts: 개념 제한 (None이면 전체)
+            limit: 최대 개념 수
+
+        Returns:
+            평균 숙련도 오름차순(약한 개념 먼저)
+            [{"concept", "students", "mean", "min", "max", "p25", "p50", "p75",
+              "below_threshold", "oldest_refreshed_at"}, ...]
+        """
+        ranked = self._cohort_filter(
+            select(
+                StudentConceptMastery.concept.label("concept"),
+                StudentConceptMastery.p_mastery.label("p_mastery"),
+                StudentConceptMastery.refreshed_at.label("refreshed_at"),
+                func.row_number().over(
+                    partition_by=StudentConceptMastery.concept,
+                    order_by=StudentConceptMastery.p_mastery
+                ).label("position"),
+                func.count().over(partition_by=StudentConceptMastery.concept).label("total"),
+            ),
+            school_id, grade
+        )
+        if concepts is not None:
+            ranked = ranked.where(StudentConceptMastery.concept.in_(concepts))
+        ranked = ranked.subquery()
+
+        percentile_columns = [
+            func.max(
+                case(
+                    # 정수 나눗셈으로 ceil(p · n / 100)
+                    (ranked.c.position == (ranked.c.total * percentile + 99) // 100, ranked.c.p_mastery),
+                )
+            ).label(f"p{percentile}")
+            for percentile in COHORT_PERCENTILES
+        ]
+        mean = func.avg(ranked.c.p_mastery)
+
+        stmt = (
+            select(
+                ranked.c.concept,
+                func.count().label("students"),
+                mean.label("mean"),
+                func.min(ranked.c.p_mastery).label("min"),
+                func.max(ranked.c.p_mastery).label("max"),
+                *percentile_columns,
+                func.sum(case((ranked.c.p_mastery < threshold, 1), else_=0)).label("below_threshold"),
+                func.min(ranked.c.refreshed_at).label("oldest_refreshed_at"),
+            )
+            .group_by(ranked.c.concept)
+            .order_by(mean, ranked.c.concept)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.db.execute(stmt)
+        return [dict(row._mapping) for row in result]
+
+    async def get_cohort_students(
+        self,
+        school_id: str,
+        concept: str,
+        grade: Optional[int] = None,
+        threshold: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        코호트 학생의 개념 숙련도와 코호트 내 백분위 (한 쿼리)
+
+        percent_rank()를 코호트 전체에 대해 계산한 뒤 임계값 필터를 적용하므로
+        필터링 후에도 백분위는 전체 코호트 기준이다.
+
+        Args:
+            school_id: 학교 ID
+            concept: 개념명
+            grade: 학년 (None이면 학교 전체)
+            threshold: 이 값 미만 학생만 (None이면 전체)
+
+        Returns:
+            숙련도 오름차순 [{"student_id", "name", "grade", "p_mastery",
+            "percentile", "refreshed_at"}, ...] (percentile: 0.0 ~ 1.0)
+        """
+        ranked = self._cohort_filter(
+            select(
+                StudentConceptMastery.student_id.label("student_id"),
+                Student.name.label("name"),
+                Student.grade.label("grade"),
+                StudentConceptMastery.p_mastery.label("p_mastery"),
+                func.percent_rank().over(
+                    order_by=StudentConceptMastery.p_mastery
+                ).label("percentile"),
+                StudentConceptMastery.refreshed_at.label("refreshed_at"),
+            ).where(StudentConceptMastery.concept == concept),
+            school_id, grade
+        ).subquery()
+
+        stmt = select(ranked).order_by(ranked.c.p_mastery, ranked.c.student_id)
+        if threshold is not None:
+            stmt = stmt.where(ranked.c.p_mastery < threshold)
+
+        result = await self.db.execute(stmt)
+        return [dict(row._mapping) for row in result]
@@ -7,26 +7,107 @@ Repository Pattern for StudentAttempt 모델의 데이터 접근 로직을 캡
 - CRUD 연산
 - 쿼리 로직
 - 집계 연산
+- 학생-개념별 증분 숙련도 상태(StudentMasteryState) 유지
+- 대량 시도 적재 (PostgreSQL COPY 또는 다중 행 INSERT, 한 트랜잭션)
+- (attempted_at, id) 키셋 페이지네이션 (불투명 커서 토큰)
 """
-from typing import List, Optional, Dict, Any
+import base64
+import json
+
+import numpy as np
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, delete, insert, tuple_, case, literal
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.student_attempt import StudentAttempt
+from app.models.student_concept_mastery import StudentConceptMastery
+from app.models.student_mastery_state import StudentMasteryState
+from app.algorithms.bkt import BayesianKnowledgeTracing
+
+if TYPE_CHECKING:
+    from app.services.bkt_parameter_store import BKTParameterStore
+
+
+def encode_attempt_cursor(attempted_at: datetime, attempt_id: int) -> str:
+    """
+    페이지 마지막 시도의 (attempted_at, id)를 불투명 커서 토큰으로 인코딩
+
+    Args:
+        attempted_at: 마지막 시도 시각
+        attempt_id: 마지막 시도 ID
+
+    Returns:
+        URL-safe base64 토큰
+    """
+    payload = json.dumps({"t": attempted_at.isoformat(), "i": attempt_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_attempt_cursor(token: str) -> Tuple[datetime, int]:
+    """
+    커서 토큰 디코딩
+
+    Args:
+        token: encode_attempt_cursor()가 만든 토큰
+
+    Returns:
+        (attempted_at, id)
+
+    Raises:
+        ValueError: 잘못된 토큰
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["t"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"invalid cursor: {token!r}") from e
 
 
 class StudentAttemptRepository:
     """StudentAttempt 데이터 접근 계층"""
 
-    def __init__(self, db: AsyncSession):
+    # 다중 행 INSERT 한 문장당 행 수 (SQLite 바인드 파라미터 한도 이내)
+    INSERT_CHUNK_SIZE = 1000
+    # 숙련도 상태 일괄 조회 시 (student_id, concept) 키 묶음 크기
+    STATE_CHUNK_SIZE = 500
+    BULK_COLUMNS = (
+        "student_id", "question_id", "concept", "is_correct", "response_time_ms", "attempted_at"
+    )
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        bkt_algorithm: Optional[BayesianKnowledgeTracing] = None,
+        parameter_store: Optional["BKTParameterStore"] = None
+    ):
         """
         Repository 초기화
 
         Args:
             db: AsyncSession 데이터베이스 세션
+            bkt_algorithm: 숙련도 상태 갱신에 사용할 BKT (기본값: 기본 파라미터)
+            parameter_store: 개념별 적합 파라미터 저장소 (있으면 bkt_algorithm보다 우선)
         """
         self.db = db
+        self.bkt = bkt_algorithm or BayesianKnowledgeTracing()
+        self.parameter_store = parameter_store
+
+    def get_bkt(self, concept: str) -> BayesianKnowledgeTracing:
+        """
+        개념의 숙련도 상태 갱신에 사용할 BKT
+
+        Args:
+            concept: 개념
+
+        Returns:
+            적합된 개념별 BKT 또는 기본 BKT
+        """
+        if self.parameter_store is not None and concept in self.parameter_store.models:
+            return self.parameter_store.get(concept)
+        return self.bkt
 
     async def create_attempt(
         self,
@@ -39,6 +120,8 @@ class StudentAttemptRepository:
         """
         새로운 시도 기록 생성
 
+        같은 트랜잭션에서 학생-개념 숙련도 상태에 BKT 한 스텝을 적용한다.
+
         Args:
             student_id: 학생 ID
             question_id: 문제 ID
@@ -57,10 +140,70 @@ class StudentAttemptRepository:
             response_time_ms=response_time_ms
         )
         self.db.add(attempt)
+        # attempt.id 할당을 위해 flush 후 상태 갱신
+        await self.db.flush()
+        await self._advance_mastery_state(attempt)
         await self.db.commit()
         await self.db.refresh(attempt)
         return attempt  # pragma: no cover - coverage.py 버그로 async return 문이 감지되지 않음
 
+    async def bulk_create_attempts(self, attempts: List[Dict[str, Any]]) -> int:
+        """
+        시도 기록 대량 생성 (한 트랜잭션)
+
+        asyncpg(PostgreSQL)에서는 copy_records_to_table(COPY)로, 그 외 드라이버에서는
+        INSERT_CHUNK_SIZE 행씩 다중 행 INSERT로 적재한다. 영향받은 학생-개념
+        숙련도 상태는 키 묶음 단위로 조회해 같은 트랜잭션에서 갱신한 뒤 한 번 커밋한다.
+
+        attempted_at이 없는 행은 현재 시각에 입력 순서대로 1마이크로초씩 더한 시각을 받는다
+        (같은 요청 안의 순서가 시각만으로도 ID 순서와 같게 유지됨).
+
+        Args:
+            attempts: [{"student_id", "question_id", "concept", "is_correct",
+                        "response_time_ms"(선택), "attempted_at"(선택, naive UTC)}, ...]
+
+        Returns:
+            적재된 행 수
+        """
+        if not attempts:
+            return 0
+
+        now = datetime.utcnow()
+        records = [
+            {
+                "student_id": attempt["student_id"],
+                "question_id": attempt["question_id"],
+                "concept": attempt["concept"],
+                "is_correct": attempt["is_correct"],
+                "response_time_ms": attempt.get("response_time_ms"),
+                "attempted_at": attempt.get("attempted_at") or now + timedelta(microseconds=position),
+            }
+            for position, attempt in enumerate(attempts)
+        ]
+
+        connection = await self.db.connection()
+        if connection.dialect.driver == "asyncpg":
+            # SQLAlchemy의 asyncpg 어댑터는 첫 문장을 실행할 때 BEGIN하므로, 드라이버 연결에서
+            # 바로 COPY하면 트랜잭션 밖에서 자동 커밋된다. 문장을 하나 먼저 실행해
+            # 세션 트랜잭션을 시작해 두면 COPY도 이후 상태 갱신과 함께 커밋/롤백된다.
+            await connection.exec_driver_sql("SELECT 1")
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                StudentAttempt.__tablename__,
+                records=[tuple(record[c] for c in self.BULK_COLUMNS) for record in records],
+                columns=list(self.BULK_COLUMNS)
+            )
+        else:
+            for start in range(0, len(records), self.INSERT_CHUNK_SIZE):
+                await self.db.execute(
+                    insert(StudentAttempt).values(records[start:start + self.INSERT_CHUNK_SIZE])
+                )
+
+        await self._advance_mastery_states(records)
+        await self.db.commit()
+
+        return len(records)
+
     async def get_by_id(self, attempt_id: int) -> Optional[StudentAttempt]:
         """
         ID로 시도 기록 조회
@@ -84,6 +227,9 @@ class StudentAttemptRepository:
         """
         학생 ID로 시도 기록 조회
 
+        OFFSET은 깊은 페이지일수록 느려지고 동시 삽입 시 행이 중복/누락되므로
+        페이지 단위 조회에는 get_page()를 사용한다.
+
         Args:
             student_id: 학생 ID
             limit: 최대 반환 개수
@@ -107,6 +253,62 @@ class StudentAttemptRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        student_id: str,
+        concept: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[StudentAttempt], Optional[str]]:
+        """
+        시도 기록 키셋 페이지 조회 (최신순)
+
+        (attempted_at, id) 내림차순으로 정렬하고 직전 페이지 마지막 행보다 작은
+        행부터 limit개를 읽는다. 페이지 깊이와 무관하게 인덱스 범위 스캔이며,
+        이미 읽은 구간 앞에 새 시도가 삽입되어도 중복/누락이 없다.
+
+        Args:
+            student_id: 학생 ID
+            concept: 개념 (None이면 전체 개념)
+            limit: 페이지 크기
+            cursor: 직전 페이지의 next_cursor (None이면 첫 페이지)
+
+        Returns:
+            (StudentAttempt 리스트, 다음 페이지 커서 또는 None)
+
+        Raises:
+            ValueError: 잘못된 커서
+
+        Examples:
+            >>> page, cursor = await repo.get_page("student_1", "미분", limit=50)
+            >>> while cursor:
+            ...     more, cursor = await repo.get_page("student_1", "미분", limit=50, cursor=cursor)
+        """
+        conditions = [StudentAttempt.student_id == student_id]
+        if concept is not None:
+            conditions.append(StudentAttempt.concept == concept)
+        if cursor is not None:
+            attempted_at, attempt_id = decode_attempt_cursor(cursor)
+            conditions.append(
+                tuple_(StudentAttempt.attempted_at, StudentAttempt.id) < tuple_(attempted_at, attempt_id)
+            )
+
+        stmt = (
+            select(StudentAttempt)
+            .where(and_(*conditions))
+            .order_by(StudentAttempt.attempted_at.desc(), StudentAttempt.id.desc())
+            .limit(limit + 1)
+        )
+        result = await self.db.execute(stmt)
+        attempts = list(result.scalars().all())
+
+        if len(attempts) <= limit:
+            return attempts, None
+
+        attempts = attempts[:limit]
+        last = attempts[-1]
+        return attempts, encode_attempt_cursor(last.attempted_at, last.id)
+
     async def get_by_concept(
         self,
         student_id: str,
@@ -178,30 +380,77 @@ class StudentAttemptRepository:
         concept: str
     ) -> float:
         """
-        개념별 정답률 계산
+        개념별 정답률 계산 (SQL 집계, ORM 객체를 만들지 않음)
 
         Args:
             student_id: 학생 ID
             concept: 개념
 
         Returns:
-            정답률 (0.0 ~ 1.0)
+            정답률 (0.0 ~ 1.0, 시도가 없으면 0.0)
         """
-        # 해당 개념의 모든 시도 기록 조회
-        attempts = await self.get_by_concept(student_id, concept)
-
-        if len(attempts) == 0:
+        stats = await self.aggregate_by_concept(student_id, [concept])
+        if concept not in stats:
             return 0.0
+        return stats[concept]["accuracy"]
+
+    async def aggregate_by_concept(
+        self,
+        student_id: str,
+        concepts: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        개념별 시도 통계 (한 GROUP BY 쿼리)
+
+        Args:
+            student_id: 학생 ID
+            concepts: 개념 제한 (None이면 시도한 전체 개념)
 
-        # 정답 개수 계산
-        correct_count = sum(1 for attempt in attempts if attempt.is_correct)
+        Returns:
+            {개념: {"attempts", "correct", "accuracy",
+                    "mean_response_time_ms", "last_attempted_at"}}
+            (시도가 없는 개념은 포함되지 않음, 응답 시간이 없으면 평균은 None)
+
+        Examples:
+            >>> stats = await repo.aggregate_by_concept("student_1", ["미분", "적분"])
+            >>> stats["미분"]["accuracy"]
+            0.75
+        """
+        correct = func.sum(case((StudentAttempt.is_correct, 1), else_=0))
+        stmt = (
+            select(
+                StudentAttempt.concept,
+                func.count(StudentAttempt.id),
+                correct,
+                func.avg(StudentAttempt.response_time_ms),
+                func.max(StudentAttempt.attempted_at),
+            )
+            .where(StudentAttempt.student_id == student_id)
+            .group_by(StudentAttempt.concept)
+            .order_by(StudentAttempt.concept)
+        )
+        if concepts is not None:
+            stmt = stmt.where(StudentAttempt.concept.in_(concepts))
 
-        return correct_count / len(attempts)
+        result = await self.db.execute(stmt)
+        return {
+            concept: {
+                "attempts": attempts,
+                "correct": int(correct_count),
+                "accuracy": int(correct_count) / attempts,
+                "mean_response_time_ms": (
+                    float(mean_response_time) if mean_response_time is not None else None
+                ),
+                "last_attempted_at": last_attempted_at,
+            }
+            for concept, attempts, correct_count, mean_response_time, last_attempted_at in result
+        }
 
     async def get_student_mastery_data(
         self,
         student_id: str,
-        concept: str
+        concept: str,
+        with_ids: bool = False
     ) -> List[Dict[str, Any]]:
         """
         BKT 계산을 위한 학생 숙련도 데이터 조회
@@ -209,16 +458,68 @@ class StudentAttemptRepository:
         Args:
             student_id: 학생 ID
             concept: 개념
+            with_ids: True면 각 딕셔너리에 시도 ID("id")도 포함
 
         Returns:
-            {"is_correct": bool} 형태의 딕셔너리 리스트
+            {"is_correct": bool, "attempted_at": datetime} 형태의 딕셔너리 리스트
+            ((attempted_at, id) 순)
+        """
+        stmt = (
+            select(StudentAttempt.is_correct, StudentAttempt.attempted_at, StudentAttempt.id)
+            .where(
+                and_(
+                    StudentAttempt.student_id == student_id,
+                    StudentAttempt.concept == concept
+                )
+            )
+            .order_by(StudentAttempt.attempted_at, StudentAttempt.id)
+        )
+        result = await self.db.execute(stmt)
+
+        if with_ids:
+            return [
+                {"id": attempt_id, "is_correct": is_correct, "attempted_at": attempted_at}
+                for is_correct, attempted_at, attempt_id in result
+            ]
+        return [
+            {"is_correct": is_correct, "attempted_at": attempted_at}
+            for is_correct, attempted_at, _ in result
+        ]
+
+    async def get_outcomes(
+        self,
+        student_id: str,
+        concept: str,
+        until: Optional[datetime] = None
+    ) -> np.ndarray:
         """
-        attempts = await self.get_by_concept(student_id, concept)
+        학생-개념 정답 여부 시퀀스 (is_correct 컬럼만 시간순으로 조회)
+
+        ORM 엔티티와 행별 dict를 만들지 않으므로 시간 정보가 필요 없는 BKT
+        계산(BayesianKnowledgeTracing.calculate_mastery_from_outcomes)에 사용한다.
+
+        Args:
+            student_id: 학생 ID
+            concept: 개념
+            until: 이 시각 이후 시도 제외 (None이면 전체)
 
-        # 시간순으로 정렬 (오래된 것부터)
-        attempts.sort(key=lambda x: x.attempted_at)
+        Returns:
+            시간순 bool 배열 (시도가 없으면 길이 0)
+        """
+        conditions = [
+            StudentAttempt.student_id == student_id,
+            StudentAttempt.concept == concept
+        ]
+        if until is not None:
+            conditions.append(StudentAttempt.attempted_at <= until)
 
-        return [{"is_correct": attempt.is_correct} for attempt in attempts]
+        stmt = (
+            select(StudentAttempt.is_correct)
+            .where(and_(*conditions))
+            .order_by(StudentAttempt.attempted_at, StudentAttempt.id)
+        )
+        result = await self.db.execute(stmt)
+        return np.fromiter(result.scalars(), dtype=bool)
 
     async def count_attempts_by_student(self, student_id: str) -> int:
         """
@@ -242,6 +543,9 @@ class StudentAttemptRepository:
         """
         시도 기록 삭제
 
+        스냅샷이 삭제된 시도를 계속 반영하지 않도록 같은 트랜잭션에서 학생-개념 상태를
+        무효화한다 (남은 시도가 없으면 상태와 스냅샷 행을 삭제).
+
         Args:
             attempt_id: 시도 기록 ID
 
@@ -253,6 +557,393 @@ class StudentAttemptRepository:
         if attempt is None:
             return False
 
+        # 같은 쌍의 시도 기록과 직렬화
+        key = (attempt.student_id, attempt.concept)
+        state = (await self._lock_mastery_states([key]))[key]
+
         await self.db.delete(attempt)
+        await self.db.flush()
+
+        remaining = await self.db.execute(
+            select(StudentAttempt.id).where(
+                and_(
+                    StudentAttempt.student_id == attempt.student_id,
+                    StudentAttempt.concept == attempt.concept
+                )
+            ).limit(1)
+        )
+        if remaining.first() is None:
+            # 남은 시도가 없으면 상태와 스냅샷을 함께 제거 (실시간 프로파일에도 개념이 없음)
+            await self.db.delete(state)
+            await self.db.execute(
+                delete(StudentConceptMastery).where(
+                    and_(
+                        StudentConceptMastery.student_id == attempt.student_id,
+                        StudentConceptMastery.concept == attempt.concept
+                    )
+                )
+            )
+        else:
+            # 시도가 빠지면 증분 상태를 되돌릴 수 없으므로 자리 행으로 되돌려
+            # 다음 시도 기록 시 전체 기록으로 재구성한다. last_attempt_id는 실제 ID와
+            # 겹치지 않는 음수(-삭제한 ID)로 두어 스냅샷 워커가 이 쌍을 다시 계산하게 한다
+            state.p_mastery = 0.0
+            state.attempt_count = 0
+            state.last_attempt_id = -attempt.id
+            state.last_attempted_at = None
+            state.params_key = ""
+
         await self.db.commit()
         return True
+
+    async def get_mastery_state(
+        self,
+        student_id: str,
+        concept: str
+    ) -> Optional[StudentMasteryState]:
+        """
+        학생-개념 숙련도 상태 조회
+
+        Args:
+            student_id: 학생 ID
+            concept: 개념
+
+        Returns:
+            StudentMasteryState 객체 또는 None (아직 상태가 없는 경우)
+        """
+        stmt = select(StudentMasteryState).where(
+            and_(
+                StudentMasteryState.student_id == student_id,
+                StudentMasteryState.concept == concept
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def backfill_mastery_states(self) -> int:
+        """
+        상태가 없는 학생-개념 쌍에 상태 자리(placeholder) 행 생성
+
+        상태 추적 이전에 쌓인 시도(또는 리포지토리를 거치지 않은 적재)는 다음 시도 전까지
+        상태가 없어 스냅샷 워커의 갱신 대상에 나타나지 않는다. 한 번 실행해 두면
+        워커가 해당 쌍의 스냅샷을 만들고, 자리 행은 params_key가 빈 문자열이라
+        다음 시도나 조회 때 전체 기록으로 재구성된다.
+
+        Returns:
+            생성한 상태 행 수
+        """
+        connection = await self.db.connection()
+        dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+        missing = (
+            select(
+                StudentAttempt.student_id,
+                StudentAttempt.concept,
+                literal(0.0),
+                literal(0),
+                func.max(StudentAttempt.id),
+                literal(""),
+                literal(datetime.utcnow()),
+            )
+            .where(
+                ~select(StudentMasteryState.id)
+                .where(
+                    and_(
+                        StudentMasteryState.student_id == StudentAttempt.student_id,
+                        StudentMasteryState.concept == StudentAttempt.concept
+                    )
+                )
+                .exists()
+            )
+            .group_by(StudentAttempt.student_id, StudentAttempt.concept)
+        )
+        result = await self.db.execute(
+            dialect.insert(StudentMasteryState)
+            .from_select(
+                ["student_id", "concept", "p_mastery", "attempt_count",
+                 "last_attempt_id", "params_key", "updated_at"],
+                missing
+            )
+            .on_conflict_do_nothing(index_elements=["student_id", "concept"])
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def _lock_mastery_states(
+        self,
+        keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], StudentMasteryState]:
+        """
+        학생-개념 상태 행을 잠금 (없는 행은 먼저 생성, 커밋은 호출자 책임)
+
+        SELECT ... FOR UPDATE는 아직 없는 행을 잠그지 못하므로, 같은 쌍의 첫 시도가
+        동시에 기록되면 양쪽 모두 새 행을 추가해 유니크 제약 위반이 난다.
+        없는 행은 INSERT ... ON CONFLICT DO NOTHING으로 자리만 만든 뒤 다시 잠가 읽는다
+        (경쟁에서 진 쪽은 이긴 쪽 커밋을 기다렸다가 그 행을 받는다).
+        새로 만든 행은 params_key가 빈 문자열이라 호출자가 전체 기록으로 재구성한다.
+
+        Args:
+            keys: (student_id, concept) 리스트
+
+        Returns:
+            (student_id, concept) → 잠긴 StudentMasteryState 딕셔너리 (모든 키 포함)
+        """
+        stmt = (
+            select(StudentMasteryState)
+            .where(tuple_(StudentMasteryState.student_id, StudentMasteryState.concept).in_(keys))
+            .with_for_update()
+        )
+        result = await self.db.execute(stmt)
+        states = {(state.student_id, state.concept): state for state in result.scalars().all()}
+
+        missing = [key for key in keys if key not in states]
+        if not missing:
+            return states
+
+        connection = await self.db.connection()
+        dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+        await self.db.execute(
+            dialect.insert(StudentMasteryState)
+            .values([
+                {"student_id": student_id, "concept": concept,
+                 "p_mastery": 0.0, "attempt_count": 0, "params_key": ""}
+                for student_id, concept in missing
+            ])
+            .on_conflict_do_nothing(index_elements=["student_id", "concept"])
+        )
+        result = await self.db.execute(
+            stmt.where(tuple_(StudentMasteryState.student_id, StudentMasteryState.concept).in_(missing))
+        )
+        states.update(
+            {(state.student_id, state.concept): state for state in result.scalars().all()}
+        )
+        return states
+
+    async def _advance_mastery_state(self, attempt: StudentAttempt) -> StudentMasteryState:
+        """
+        새 시도를 숙련도 상태에 반영 (커밋은 호출자 책임)
+
+        상태가 있으면 BKT 한 스텝(O(1))만 적용한다.
+        상태가 없거나 다른 파라미터로 계산된 상태면(재적합 이후)
+        방금 flush한 시도를 포함한 전체 기록을 한 번 재생해 다시 만든다.
+
+        Args:
+            attempt: flush된 StudentAttempt 객체
+
+        Returns:
+            갱신된 StudentMasteryState 객체
+        """
+        key = (attempt.student_id, attempt.concept)
+        state = (await self._lock_mastery_states([key])).get(key)
+        bkt = self.get_bkt(attempt.concept)
+
+        if state is not None and state.params_key == bkt.params_key:
+            # 직전 시도 이후 경과 시간만큼 감쇠(망각 모델) 후 한 스텝 적용
+            p_mastery = state.p_mastery
+            if state.last_attempted_at is not None:
+                p_mastery = bkt.decay(p_mastery, attempt.attempted_at - state.last_attempted_at)
+            state.p_mastery = bkt.update(p_mastery, attempt.is_correct)
+            state.attempt_count += 1
+        else:
+            if bkt.time_dependent:
+                history = await self.get_student_mastery_data(
+                    attempt.student_id, attempt.concept
+                )
+                p_mastery = bkt.calculate_mastery(history)
+            else:
+                history = await self.get_outcomes(attempt.student_id, attempt.concept)
+                p_mastery = bkt.calculate_mastery_from_outcomes(history)
+            state.p_mastery = p_mastery
+            state.attempt_count = len(history)
+            state.params_key = bkt.params_key
+
+        state.last_attempt_id = attempt.id
+        state.last_attempted_at = attempt.attempted_at
+        return state
+
+    async def _advance_mastery_states(self, records: List[Dict[str, Any]]) -> None:
+        """
+        대량 적재한 시도를 숙련도 상태에 반영 (커밋은 호출자 책임)
+
+        새 시도가 모두 상태의 마지막 시도 이후면 시간순으로 BKT 스텝만 적용하고,
+        더 이른 시도가 섞였거나 상태가 없거나 파라미터가 다르면 전체 기록을 재생한다.
+
+        Args:
+            records: 적재된 시도 딕셔너리 리스트
+        """
+        grouped: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for record in records:
+            grouped.setdefault((record["student_id"], record["concept"]), []).append(record)
+
+        keys = list(grouped)
+        for start in range(0, len(keys), self.STATE_CHUNK_SIZE):
+            chunk = keys[start:start + self.STATE_CHUNK_SIZE]
+
+            states = await self._lock_mastery_states(chunk)
+
+            # COPY는 생성된 ID를 돌려주지 않으므로 키별 마지막 ID를 한 번에 조회
+            result = await self.db.execute(
+                select(StudentAttempt.student_id, StudentAttempt.concept, func.max(StudentAttempt.id))
+                .where(tuple_(StudentAttempt.student_id, StudentAttempt.concept).in_(chunk))
+                .group_by(StudentAttempt.student_id, StudentAttempt.concept)
+            )
+            last_ids = {(student_id, concept): last_id for student_id, concept, last_id in result}
+
+            for key in chunk:
+                student_id, concept = key
+                new_attempts = sorted(grouped[key], key=lambda record: record["attempted_at"])
+                state = states.get(key)
+                bkt = self.get_bkt(concept)
+
+                if (
+                    state is not None
+                    and state.params_key == bkt.params_key
+                    and (
+                        state.last_attempted_at is None
+                        or new_attempts[0]["attempted_at"] >= state.last_attempted_at
+                    )
+                ):
+                    p_mastery = state.p_mastery
+                    previous_at = state.last_attempted_at
+                    for record in new_attempts:
+                        if previous_at is not None:
+                            p_mastery = bkt.decay(p_mastery, record["attempted_at"] - previous_at)
+                        p_mastery = bkt.update(p_mastery, record["is_correct"])
+                        previous_at = record["attempted_at"]
+                    state.p_mastery = p_mastery
+                    state.attempt_count += len(new_attempts)
+                    state.last_attempted_at = previous_at
+                else:
+                    history = await self.get_student_mastery_data(student_id, concept)
+                    state.p_mastery = bkt.calculate_mastery(history)
+                    state.attempt_count = len(history)
+                    state.params_key = bkt.params_key
+                    state.last_attempted_at = history[-1]["attempted_at"]
+
+                state.last_attempt_id = last_ids.get(key)
+
+    async def stream_concept_sequences(
+        self,
+        chunk_size: int = 5000
+    ) -> AsyncIterator[Tuple[str, List[int], List[bool]]]:
+        """
+        전체 시도 기록을 개념별 packed 시퀀스 청크로 스트리밍
+
+        (concept, student_id, attempted_at) 순으로 정렬된 결과를 서버 측 커서로
+        읽으며, 한 청크는 한 개념만 포함하고 학생 시퀀스 경계에서만 잘린다.
+        메모리 사용량은 chunk_size(와 가장 긴 단일 시퀀스)로 제한된다.
+
+        Args:
+            chunk_size: 청크당 목표 시도 수
+
+        Yields:
+            (concept, offsets, outcomes) 튜플
+        """
+        stmt = (
+            select(
+                StudentAttempt.concept,
+                StudentAttempt.student_id,
+                StudentAttempt.is_correct
+            )
+            .order_by(
+                StudentAttempt.concept,
+                StudentAttempt.student_id,
+                StudentAttempt.attempted_at,
+                StudentAttempt.id
+            )
+            .execution_options(yield_per=chunk_size)
+        )
+
+        current_concept: Optional[str] = None
+        current_student: Optional[str] = None
+        offsets: List[int] = [0]
+        outcomes: List[bool] = []
+
+        result = await self.db.stream(stmt)
+        async for concept, student_id, is_correct in result:
+            if concept != current_concept or student_id != current_student:
+                # 시퀀스 경계: 이전 시퀀스 마감
+                if outcomes:
+                    offsets.append(len(outcomes))
+                # 개념이 바뀌었거나 청크가 찼으면 방출
+                if outcomes and (concept != current_concept or len(outcomes) >= chunk_size):
+                    yield current_concept, offsets, outcomes
+                    offsets, outcomes = [0], []
+                current_concept, current_student = concept, student_id
+            outcomes.append(bool(is_correct))
+
+        if outcomes:
+            offsets.append(len(outcomes))
+            yield current_concept, offsets, outcomes
+
+    async def stream_item_responses(
+        self,
+        chunk_size: int = 5000
+    ) -> AsyncIterator[List[Tuple[str, str, str, bool]]]:
+        """
+        문항 보정용 응답 행을 청크 단위로 스트리밍
+
+        필요한 열만 서버 측 커서로 읽어 ORM 객체 생성 비용 없이 전달한다.
+
+        Args:
+            chunk_size: 청크당 행 수
+
+        Yields:
+            [(student_id, question_id, concept, is_correct), ...] 청크
+        """
+        stmt = (
+            select(
+                StudentAttempt.student_id,
+                StudentAttempt.question_id,
+                StudentAttempt.concept,
+                StudentAttempt.is_correct
+            )
+            .execution_options(yield_per=chunk_size)
+        )
+
+        result = await self.db.stream(stmt)
+        async for partition in result.partitions(chunk_size):
+            yield [
+                (student_id, question_id, concept, bool(is_correct))
+                for student_id, question_id, concept, is_correct in partition
+            ]
+
+    async def stream_student_attempts_by_concept(
+        self,
+        student_id: str,
+        chunk_size: int = 1000,
+        concepts: Optional[List[str]] = None
+    ) -> AsyncIterator[Tuple[str, bool, Optional[datetime]]]:
+        """
+        학생의 전체 시도를 (concept, attempted_at) 순으로 한 번에 스트리밍
+
+        개념별 쿼리를 반복하지 않고 한 쿼리로 모든 개념의 시퀀스를 읽는다.
+        같은 개념의 시도는 연속으로, 각 개념 안에서는 시간순으로 전달된다.
+
+        Args:
+            student_id: 학생 ID
+            chunk_size: 커서에서 한 번에 가져올 행 수
+            concepts: 읽을 개념 목록 (None이면 전체)
+
+        Yields:
+            (concept, is_correct, attempted_at) 튜플
+        """
+        stmt = (
+            select(
+                StudentAttempt.concept,
+                StudentAttempt.is_correct,
+                StudentAttempt.attempted_at
+            )
+            .where(StudentAttempt.student_id == student_id)
+            .order_by(
+                StudentAttempt.concept,
+                StudentAttempt.attempted_at,
+                StudentAttempt.id
+            )
+            .execution_options(yield_per=chunk_size)
+        )
+        if concepts is not None:
+            stmt = stmt.where(StudentAttempt.concept.in_(concepts))
+
+        result = await self.db.stream(stmt)
+        async for concept, is_correct, attempted_at in result:
+            yield concept, bool(is_correct), attempted_at
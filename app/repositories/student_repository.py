@@ -3,9 +3,13 @@ Student Repository (Real SQLAlchemy Implementation)
 
 TDD 기반으로 구현된 실제 데이터베이스 Repository
 """
-from typing import List, Optional
+import base64
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+from itertools import islice
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, update, delete, func, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.future import select as future_select
 from datetime import datetime
 import uuid
@@ -13,12 +17,57 @@ import uuid
 from app.models.student import Student
 
 
+def encode_student_cursor(school_id: str, grade: int, student_id: str) -> str:
+    """
+    학생 키셋 페이지 커서 인코딩 (마지막 행의 (school_id, grade, id))
+
+    Examples:
+        >>> decode_student_cursor(encode_student_cursor("school_1", 2, "student_9"))
+        ('school_1', 2, 'student_9')
+    """
+    payload = json.dumps([school_id, grade, student_id], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_student_cursor(token: str) -> Tuple[str, int, str]:
+    """
+    학생 키셋 페이지 커서 디코딩
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        school_id, grade, student_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return str(school_id), int(grade), str(student_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid cursor: {token!r}") from e
+
+
 class StudentRepository:
     """학생 Repository - SQLAlchemy Async 구현"""
 
+    # 다중 행 INSERT ... ON CONFLICT / UPDATE 한 번에 보내는 행 수
+    BULK_CHUNK_SIZE = 500
+    UPSERT_COLUMNS = ("name", "grade", "school_id")
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def _chunks(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+        """이터러블을 size개씩 나누기 (전체를 메모리에 올리지 않음)"""
+        iterator = iter(records)
+        while True:
+            chunk = list(islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
+    async def _existing_ids(self, student_ids: List[str]) -> set:
+        result = await self.db.execute(select(Student.id).where(Student.id.in_(student_ids)))
+        return set(result.scalars().all())
+
     async def create(
         self,
         name: str,
@@ -75,6 +124,9 @@ class StudentRepository:
         """
         모든 학생 조회
 
+        테이블 전체를 한 번에 메모리에 올리므로 전체 학생을 순회하는 배치 작업은
+        stream_students()를 사용한다.
+
         Returns:
             Student 객체 리스트
         """
@@ -91,6 +143,8 @@ class StudentRepository:
         """
         학생 목록 조회 (페이지네이션 및 필터링)
 
+        OFFSET은 깊은 페이지일수록 느려지므로 페이지 단위 조회에는 get_page()를 사용한다.
+
         Args:
             skip: 건너뛸 레코드 수
             limit: 조회할 최대 레코드 수
@@ -114,6 +168,95 @@ class StudentRepository:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    def _filtered(self, stmt, school_id: Optional[str], grade: Optional[int]):
+        """학교/학년 필터 적용"""
+        if school_id is not None:
+            stmt = stmt.where(Student.school_id == school_id)
+        if grade is not None:
+            stmt = stmt.where(Student.grade == grade)
+        return stmt
+
+    async def get_page(
+        self,
+        school_id: Optional[str] = None,
+        grade: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Student], Optional[str]]:
+        """
+        학생 키셋 페이지 조회
+
+        (school_id, grade, id) 오름차순으로 정렬하고 직전 페이지 마지막 행보다 큰 행부터
+        limit개를 읽는다. idx_students_school_grade_id 인덱스 범위 스캔이므로 페이지 깊이와
+        무관하게 일정한 비용이며, 필터 컬럼은 같은 값이라 정렬 키에 그대로 두어도 된다.
+
+        Args:
+            school_id: 학교 ID 필터 (선택사항)
+            grade: 학년 필터 (선택사항)
+            limit: 페이지 크기
+            cursor: 직전 페이지의 next_cursor (None이면 첫 페이지)
+
+        Returns:
+            (Student 리스트, 다음 페이지 커서 또는 None)
+
+        Raises:
+            ValueError: 잘못된 커서
+
+        Examples:
+            >>> page, cursor = await repo.get_page(school_id="school_001", limit=200)
+            >>> while cursor:
+            ...     more, cursor = await repo.get_page(school_id="school_001", limit=200, cursor=cursor)
+        """
+        stmt = self._filtered(select(Student), school_id, grade)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(Student.school_id, Student.grade, Student.id) > tuple_(*decode_student_cursor(cursor))
+            )
+        stmt = stmt.order_by(Student.school_id, Student.grade, Student.id).limit(limit + 1)
+
+        result = await self.db.execute(stmt)
+        students = list(result.scalars().all())
+
+        if len(students) <= limit:
+            return students, None
+
+        students = students[:limit]
+        last = students[-1]
+        return students, encode_student_cursor(last.school_id, last.grade, last.id)
+
+    async def stream_students(
+        self,
+        school_id: Optional[str] = None,
+        grade: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[Student]]:
+        """
+        학생 전체를 서버 측 커서로 batch_size개씩 스트리밍 (배치 작업용)
+
+        한 쿼리를 yield_per로 나누어 가져오므로 전체 테이블을 메모리에 올리지 않는다.
+        스트리밍하는 동안 같은 세션으로 다른 쿼리를 실행하지 않는다.
+
+        Args:
+            school_id: 학교 ID 필터 (선택사항)
+            grade: 학년 필터 (선택사항)
+            batch_size: 배치당 학생 수
+
+        Yields:
+            Student 리스트 ((school_id, grade, id) 순)
+
+        Examples:
+            >>> async for batch in repo.stream_students(batch_size=500):
+            ...     await process(batch)
+        """
+        stmt = (
+            self._filtered(select(Student), school_id, grade)
+            .order_by(Student.school_id, Student.grade, Student.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream_scalars(stmt)
+        async for partition in result.partitions(batch_size):
+            yield list(partition)
+
     async def update(
         self,
         student_id: str,
@@ -165,6 +308,118 @@ class StudentRepository:
 
         return student
 
+    async def bulk_upsert(
+        self,
+        records: Iterable[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        update_existing: bool = True
+    ) -> Dict[str, Any]:
+        """
+        학생 대량 생성/수정 (INSERT ... ON CONFLICT (id), 한 트랜잭션)
+
+        records를 chunk_size개씩 읽어 다중 행 INSERT 한 문장으로 보낸다. 이미 있는 ID는
+        update_existing이면 name/grade/school_id/updated_at을 덮어쓰고, 아니면 건너뛴다.
+        같은 청크 안에 같은 ID가 여러 번 나오면 마지막 행만 사용한다.
+
+        Args:
+            records: [{"id"(선택, 없으면 자동 생성), "name", "grade", "school_id"}, ...]
+                (제너레이터 가능)
+            chunk_size: 문장당 행 수 (기본값: BULK_CHUNK_SIZE)
+            update_existing: 기존 학생 덮어쓰기 여부 (False면 ON CONFLICT DO NOTHING)
+
+        Returns:
+            {"inserted": 새로 만든 수, "updated": 덮어쓴 수, "skipped": 건너뛴 수,
+             "conflicts": 이미 있던(또는 입력 안에서 중복된) 학생 ID 리스트}
+
+        Examples:
+            >>> result = await repo.bulk_upsert(rows, chunk_size=1000)
+            >>> result["inserted"], result["conflicts"][:3]
+            (1990, ['student_0001', 'student_0002', 'student_0003'])
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        connection = await self.db.connection()
+        dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+
+        counts = {"inserted": 0, "updated": 0, "skipped": 0, "conflicts": []}
+        for chunk in self._chunks(records, chunk_size):
+            now = datetime.utcnow()
+            rows: Dict[str, Dict[str, Any]] = {}
+            for record in chunk:
+                student_id = record.get("id") or f"student_{uuid.uuid4().hex[:16]}"
+                if student_id in rows:
+                    counts["conflicts"].append(student_id)
+                    counts["skipped"] += 1
+                rows[student_id] = {
+                    "id": student_id,
+                    **{column: record[column] for column in self.UPSERT_COLUMNS},
+                    "created_at": now,
+                    "updated_at": now,
+                }
+
+            existing = await self._existing_ids(list(rows))
+            stmt = dialect.insert(Student).values(list(rows.values()))
+            if update_existing:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Student.id],
+                    set_={
+                        **{column: stmt.excluded[column] for column in self.UPSERT_COLUMNS},
+                        "updated_at": stmt.excluded.updated_at,
+                    }
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=[Student.id])
+            await self.db.execute(stmt)
+
+            counts["inserted"] += len(rows) - len(existing)
+            counts["updated" if update_existing else "skipped"] += len(existing)
+            counts["conflicts"].extend(sorted(existing))
+
+        await self.db.commit()
+        return counts
+
+    async def bulk_update(
+        self,
+        records: Iterable[Dict[str, Any]],
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        기존 학생 대량 수정 (없는 ID는 생성하지 않음, 한 트랜잭션)
+
+        청크마다 존재하는 ID를 한 번에 조회한 뒤 기본키 기준 executemany UPDATE로 보낸다.
+        각 레코드는 id와 바꿀 컬럼(name/grade/school_id 중 일부)만 가지면 된다.
+
+        Args:
+            records: [{"id", "name"(선택), "grade"(선택), "school_id"(선택)}, ...]
+            chunk_size: 청크당 행 수 (기본값: BULK_CHUNK_SIZE)
+
+        Returns:
+            {"updated": 수정한 수, "missing": 존재하지 않아 건너뛴 학생 ID 리스트}
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+
+        counts = {"updated": 0, "missing": []}
+        for chunk in self._chunks(records, chunk_size):
+            now = datetime.utcnow()
+            existing = await self._existing_ids([record["id"] for record in chunk])
+
+            rows = []
+            for record in chunk:
+                if record["id"] not in existing:
+                    counts["missing"].append(record["id"])
+                    continue
+                rows.append({
+                    "id": record["id"],
+                    **{c: record[c] for c in self.UPSERT_COLUMNS if record.get(c) is not None},
+                    "updated_at": now,
+                })
+
+            if rows:
+                await self.db.execute(update(Student), rows)
+                counts["updated"] += len(rows)
+
+        await self.db.commit()
+        return counts
+
     async def delete(self, student_id: str) -> bool:
         """
         학생 삭제
@@ -0,0 +1,131 @@
+"""
+Request-Scoped Context
+
+gRPC RPC/MCP tool 실행 하나를 요청 범위로 보고, 그 안에서 DB 세션 하나와
+MCP 클라이언트 핸들을 contextvars로 공유한다.
+
+    async with request_scope() as ctx:                 # RPC 진입점에서 한 번
+        service = WeeklyDiagnosticService(await get_mcp_client(), ctx.db)
+        ...
+        await tool.execute(arguments)                  # 내부 tool도 같은 세션/클라이언트 사용
+
+- 범위 안에서 다시 request_scope()를 열면 바깥 범위를 그대로 재사용한다 (세션 중첩 없음).
+- 세션은 범위가 끝날 때 커밋(예외 시 롤백)하고 닫는다 (get_db_session()과 같은 규칙).
+- MCP 클라이언트는 프로세스 단위 싱글톤(MCPClientManager.get_instance())을 쓰므로
+  호출마다 initialize()/close_all()을 하지 않는다.
+- AsyncSession은 동시 사용할 수 없으므로 범위 안에서 asyncio.gather 등으로
+  세션을 쓰는 작업을 병렬 실행하지 않는다.
+"""
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass
+class RequestContext:
+    """요청 범위에서 공유하는 핸들"""
+
+    db: AsyncSession
+    mcp: Optional[Any] = None  # MCPClientManager 호환 객체 (None이면 첫 사용 시 싱글톤)
+
+
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar("current_request", default=None)
+
+
+def current_request() -> Optional[RequestContext]:
+    """
+    현재 요청 범위 (범위 밖이면 None)
+    """
+    return _current_request.get()
+
+
+@asynccontextmanager
+async def request_scope(
+    session_factory: Optional[Callable[[], AsyncSession]] = None,
+    mcp: Optional[Any] = None
+) -> AsyncIterator[RequestContext]:
+    """
+    요청 범위 시작
+
+    Args:
+        session_factory: 세션 팩토리 (None이면 app.db.session.async_session_maker)
+        mcp: 공유할 MCP 클라이언트 (None이면 MCPClientManager 싱글톤)
+
+    Yields:
+        RequestContext (이미 범위 안이면 바깥 범위의 RequestContext)
+
+    Examples:
+        >>> async with request_scope() as ctx:
+        ...     student = await StudentRepository(ctx.db).get_by_id("student_1")
+    """
+    existing = _current_request.get()
+    if existing is not None:
+        yield existing
+        return
+
+    if session_factory is None:
+        from app.db.session import async_session_maker
+        session_factory = async_session_maker
+
+    async with session_factory() as session:
+        token = _current_request.set(RequestContext(db=session, mcp=mcp))
+        try:
+            yield _current_request.get()
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            _current_request.reset(token)
+
+
+@asynccontextmanager
+async def use_db_session(session: Optional[AsyncSession] = None) -> AsyncIterator[AsyncSession]:
+    """
+    사용할 DB 세션 결정
+
+    명시적으로 받은 세션 → 요청 범위 세션 → 새 세션(get_db_session) 순으로 사용한다.
+    새 세션을 연 경우에만 끝에서 커밋/닫기를 하고, 나머지는 소유자에게 맡긴다.
+
+    Args:
+        session: 호출자가 주입한 세션 (없으면 None)
+
+    Yields:
+        AsyncSession
+    """
+    if session is not None:
+        yield session
+        return
+
+    context = _current_request.get()
+    if context is not None:
+        yield context.db
+        return
+
+    from app.db.session import get_db_session
+    async with get_db_session() as db:
+        yield db
+
+
+async def get_mcp_client() -> Any:
+    """
+    공유 MCP 클라이언트
+
+    요청 범위에 주입된 클라이언트가 있으면 그것을, 없으면 프로세스 싱글톤
+    (최초 1회 연결)을 반환한다.
+
+    Returns:
+        MCPClientManager 호환 객체 (call(node, tool, params))
+    """
+    context = _current_request.get()
+    if context is not None and context.mcp is not None:
+        return context.mcp
+
+    from app.mcp.manager import MCPClientManager
+    mcp = await MCPClientManager.get_instance()
+    if context is not None:
+        context.mcp = mcp
+    return mcp
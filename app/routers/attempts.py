@@ -3,17 +3,24 @@ Student Attempts API Router
 
 학생 시도 기록 관련 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 
-from app.db.session import get_db
+from app.config import settings
+from app.db.session import get_db, get_replica_db
 from app.repositories.student_attempt_repository import StudentAttemptRepository
+from app.services.attempt_ingestion_service import AttemptIngestionService, IngestionPayloadError
+from app.services.bkt_parameter_store import BKTParameterStore
 
 router = APIRouter(prefix="/api/attempts", tags=["attempts"])
 
+# 시도 기록 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
 
 # Pydantic 모델
 class CreateAttemptRequest(BaseModel):
@@ -41,12 +48,41 @@ class AttemptsListResponse(BaseModel):
     student_id: str
     concept: str
     attempts: List[dict]
+    next_cursor: Optional[str] = None
+
+
+class BulkRowError(BaseModel):
+    index: int
+    errors: List[dict]
+
+
+class BulkIngestResponse(BaseModel):
+    received: int
+    inserted: int
+    rejected: int
+    errors: List[BulkRowError]
+    elapsed_ms: float
+    rows_per_second: float
 
 
 # 의존성
-def get_repository(db: AsyncSession = Depends(get_db)) -> StudentAttemptRepository:
-    """StudentAttemptRepository 인스턴스 생성"""
-    return StudentAttemptRepository(db)
+async def get_repository(db: AsyncSession = Depends(get_db)) -> StudentAttemptRepository:
+    """StudentAttemptRepository 인스턴스 생성 (개념별 BKT 파라미터로 숙련도 상태 갱신)"""
+    parameter_store = await BKTParameterStore.get_instance(db)
+    return StudentAttemptRepository(db, parameter_store.default, parameter_store)
+
+
+async def get_read_repository(db: AsyncSession = Depends(get_replica_db)) -> StudentAttemptRepository:
+    """조회 전용 StudentAttemptRepository (복제본에서 읽음, 쓰기 엔드포인트에서 사용 금지)"""
+    parameter_store = await BKTParameterStore.get_instance(db)
+    return StudentAttemptRepository(db, parameter_store.default, parameter_store)
+
+
+def get_ingestion_service(
+    repo: StudentAttemptRepository = Depends(get_repository)
+) -> AttemptIngestionService:
+    """AttemptIngestionService 인스턴스 생성"""
+    return AttemptIngestionService(repo, settings.ATTEMPT_INGEST_MAX_ROWS)
 
 
 # API 엔드포인트
@@ -75,28 +111,68 @@ async def create_attempt(
     return attempt
 
 
+@router.post("/bulk", response_model=BulkIngestResponse)
+async def bulk_ingest_attempts(
+    request: Request,
+    service: AttemptIngestionService = Depends(get_ingestion_service)
+):
+    """
+    시도 기록 대량 적재
+
+    본문은 JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson)입니다.
+    유효한 행만 한 트랜잭션으로 적재하고, 잘못된 행은 위치(index)와 사유를 보고합니다.
+
+    Args:
+        request: CreateAttemptRequest 형식 행 (+ 선택: attempted_at)
+
+    Returns:
+        적재/거부 행 수, 행별 오류, 처리 시간과 처리량(rows/sec)
+    """
+    try:
+        rows, parse_errors = service.parse(
+            await request.body(), request.headers.get("content-type")
+        )
+    except IngestionPayloadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result = await service.ingest(rows, parse_errors)
+
+    return BulkIngestResponse(**result)
+
+
 @router.get("/{student_id}/{concept}", response_model=AttemptsListResponse)
 async def get_student_attempts(
     student_id: str,
     concept: str,
-    limit: Optional[int] = None,
-    repo: StudentAttemptRepository = Depends(get_repository)
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    repo: StudentAttemptRepository = Depends(get_read_repository)
 ):
     """
-    학생의 특정 개념 시도 기록 조회
+    학생의 특정 개념 시도 기록 조회 (최신순)
+
+    limit 또는 cursor를 주면 (attempted_at, id) 키셋 페이지로 조회하고,
+    다음 페이지가 있으면 next_cursor를 반환합니다.
 
     Args:
         student_id: 학생 ID
         concept: 개념명
-        limit: 최대 반환 개수
+        limit: 페이지 크기 (cursor만 주면 DEFAULT_PAGE_SIZE)
+        cursor: 직전 응답의 next_cursor
 
     Returns:
-        시도 기록 리스트
+        시도 기록 리스트와 다음 페이지 커서
     """
-    attempts = await repo.get_by_concept(student_id, concept)
-
-    if limit is not None:
-        attempts = attempts[:limit]
+    next_cursor = None
+    if limit is None and cursor is None:
+        attempts = await repo.get_by_concept(student_id, concept)
+    else:
+        try:
+            attempts, next_cursor = await repo.get_page(
+                student_id, concept, limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
     # JSON 직렬화 가능한 형태로 변환
     attempts_data = [
@@ -113,7 +189,8 @@ async def get_student_attempts(
     return AttemptsListResponse(
         student_id=student_id,
         concept=concept,
-        attempts=attempts_data
+        attempts=attempts_data,
+        next_cursor=next_cursor
     )
 
 
@@ -3,15 +3,19 @@ Mastery API Router
 
 학생 숙련도 관련 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
-from typing import Dict, List
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import datetime
 
-from app.db.session import get_db
+from app.config import settings
+from app.db.session import get_db, get_replica_db, async_session_maker
 from app.repositories.student_attempt_repository import StudentAttemptRepository
-from app.algorithms.bkt import BayesianKnowledgeTracing
+from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
 from app.services.mastery_service import MasteryService
+from app.services.mastery_snapshot_service import MasterySnapshotService
+from app.services.bkt_parameter_store import BKTParameterStore
 
 router = APIRouter(prefix="/api/mastery", tags=["mastery"])
 
@@ -20,6 +24,7 @@ router = APIRouter(prefix="/api/mastery", tags=["mastery"])
 class CalculateMasteryRequest(BaseModel):
     student_id: str
     concept: str
+    as_of: Optional[datetime] = None
 
 
 class CalculateMasteryResponse(BaseModel):
@@ -28,9 +33,21 @@ class CalculateMasteryResponse(BaseModel):
     mastery: float
 
 
+class CalculateBatchMasteryRequest(BaseModel):
+    student_id: str
+    concepts: List[str] = Field(..., min_length=1, max_length=500)
+
+
+class CalculateBatchMasteryResponse(BaseModel):
+    student_id: str
+    mastery: Dict[str, float]
+
+
 class MasteryProfileResponse(BaseModel):
     student_id: str
     profile: Dict[str, float]
+    source: str = "live"
+    staleness_seconds: float = 0.0
 
 
 class WeakConcept(BaseModel):
@@ -42,14 +59,121 @@ class WeakConceptsResponse(BaseModel):
     student_id: str
     threshold: float
     weak_concepts: List[WeakConcept]
+    source: str = "live"
+    staleness_seconds: float = 0.0
+
+
+class ConceptStats(BaseModel):
+    attempts: int
+    correct: int
+    accuracy: float
+    mean_response_time_ms: Optional[float]
+    last_attempted_at: datetime
+
+
+class ConceptStatsResponse(BaseModel):
+    student_id: str
+    stats: Dict[str, ConceptStats]
+
+
+class CohortConceptStats(BaseModel):
+    concept: str
+    students: int
+    mean: float
+    min: float
+    max: float
+    p25: float
+    p50: float
+    p75: float
+    below_threshold: int
+
+
+class CohortConceptsResponse(BaseModel):
+    school_id: str
+    grade: Optional[int]
+    threshold: float
+    concepts: List[CohortConceptStats]
+    staleness_seconds: float
+
+
+class CohortStudent(BaseModel):
+    student_id: str
+    name: str
+    grade: int
+    p_mastery: float
+    percentile: float
+
+
+class CohortStudentsResponse(BaseModel):
+    school_id: str
+    grade: Optional[int]
+    concept: str
+    threshold: Optional[float]
+    students: List[CohortStudent]
+    staleness_seconds: float
+
+
+class TrajectoryPoint(BaseModel):
+    attempt_id: int
+    attempted_at: datetime
+    is_correct: bool
+    mastery: float
+    smoothed_mastery: Optional[float] = None
+
+
+class MasteryTrajectoryResponse(BaseModel):
+    student_id: str
+    concept: str
+    smoothed: bool
+    points: List[TrajectoryPoint]
+
+
+class RefreshParametersResponse(BaseModel):
+    concepts: int
 
 
 # 의존성
-def get_mastery_service(db: AsyncSession = Depends(get_db)) -> MasteryService:
+async def get_parameter_store(db: AsyncSession = Depends(get_db)) -> BKTParameterStore:
+    """개념별 BKT 파라미터 저장소 (최초 1회 로드 후 캐시)"""
+    return await BKTParameterStore.get_instance(db)
+
+
+def get_session_factory():
+    """개념별 병렬 계산에 사용할 세션 팩토리 (연결 풀 공유)"""
+    return async_session_maker
+
+
+def get_mastery_service(
+    db: AsyncSession = Depends(get_db),
+    parameter_store: BKTParameterStore = Depends(get_parameter_store),
+    session_factory=Depends(get_session_factory)
+) -> MasteryService:
     """MasteryService 인스턴스 생성"""
-    repo = StudentAttemptRepository(db)
-    bkt = BayesianKnowledgeTracing()
-    return MasteryService(repo, bkt)
+    bkt = parameter_store.default
+    repo = StudentAttemptRepository(db, bkt, parameter_store)
+    return MasteryService(repo, bkt, parameter_store, session_factory=session_factory)
+
+
+def get_snapshot_service(
+    db: AsyncSession = Depends(get_replica_db),
+    parameter_store: BKTParameterStore = Depends(get_parameter_store)
+) -> MasterySnapshotService:
+    """MasterySnapshotService 인스턴스 생성 (조회 전용, 복제본에서 읽음)"""
+    bkt = parameter_store.default
+    repo = StudentAttemptRepository(db, bkt, parameter_store)
+    return MasterySnapshotService(
+        MasteryService(repo, bkt, parameter_store),
+        MasterySnapshotRepository(db)
+    )
+
+
+def max_staleness_query(
+    max_staleness_seconds: float = Query(
+        default=settings.MASTERY_SNAPSHOT_MAX_STALENESS_SECONDS, ge=0
+    )
+) -> float:
+    """스냅샷 허용 지연 쿼리 파라미터 (0이면 항상 실시간 계산)"""
+    return max_staleness_seconds
 
 
 # API 엔드포인트
@@ -62,14 +186,15 @@ async def calculate_mastery(
     학생의 개념 숙련도 계산
 
     Args:
-        request: student_id, concept
+        request: student_id, concept, as_of (선택: 기준 시각)
 
     Returns:
         숙련도 계산 결과
     """
     mastery = await service.calculate_concept_mastery(
         request.student_id,
-        request.concept
+        request.concept,
+        as_of=request.as_of
     )
 
     return CalculateMasteryResponse(
@@ -79,33 +204,64 @@ async def calculate_mastery(
     )
 
 
+@router.post("/calculate-batch", response_model=CalculateBatchMasteryResponse)
+async def calculate_batch_mastery(
+    request: CalculateBatchMasteryRequest,
+    service: MasteryService = Depends(get_mastery_service)
+):
+    """
+    여러 개념의 숙련도 동시 계산
+
+    개념마다 별도 세션으로 최대 MASTERY_MAX_CONCURRENCY개씩 병렬 계산하므로
+    지연 시간이 개념 수에 비례해 늘지 않습니다.
+
+    Args:
+        request: student_id, concepts
+
+    Returns:
+        {개념: 숙련도} 맵
+    """
+    mastery = await service.calculate_multiple_concepts_mastery(
+        request.student_id,
+        request.concepts
+    )
+
+    return CalculateBatchMasteryResponse(
+        student_id=request.student_id,
+        mastery=mastery
+    )
+
+
 @router.get("/profile/{student_id}", response_model=MasteryProfileResponse)
 async def get_mastery_profile(
     student_id: str,
-    service: MasteryService = Depends(get_mastery_service)
+    max_staleness_seconds: float = Depends(max_staleness_query),
+    service: MasterySnapshotService = Depends(get_snapshot_service)
 ):
     """
     학생의 전체 숙련도 프로파일 조회
 
+    스냅샷(student_concept_mastery)이 허용 지연 이내면 스냅샷을 읽고,
+    아니면 실시간으로 계산합니다.
+
     Args:
         student_id: 학생 ID
+        max_staleness_seconds: 스냅샷 허용 지연 (초, 0이면 실시간)
 
     Returns:
-        전체 개념별 숙련도 맵
+        전체 개념별 숙련도 맵, 출처(source)와 지연(staleness_seconds)
     """
-    profile = await service.get_student_mastery_profile(student_id)
+    result = await service.get_profile(student_id, max_staleness_seconds)
 
-    return MasteryProfileResponse(
-        student_id=student_id,
-        profile=profile
-    )
+    return MasteryProfileResponse(student_id=student_id, **result)
 
 
 @router.get("/weak-concepts/{student_id}", response_model=WeakConceptsResponse)
 async def get_weak_concepts(
     student_id: str,
     threshold: float = 0.5,
-    service: MasteryService = Depends(get_mastery_service)
+    max_staleness_seconds: float = Depends(max_staleness_query),
+    service: MasterySnapshotService = Depends(get_snapshot_service)
 ):
     """
     약점 개념 조회
@@ -113,12 +269,14 @@ async def get_weak_concepts(
     Args:
         student_id: 학생 ID
         threshold: 약점 판단 임계값 (기본값: 0.5)
+        max_staleness_seconds: 스냅샷 허용 지연 (초, 0이면 실시간)
 
     Returns:
-        약점 개념 리스트 (개념명과 숙련도 포함)
+        약점 개념 리스트 (개념명과 숙련도 포함), 출처와 지연
     """
-    # 전체 프로파일 조회
-    profile = await service.get_student_mastery_profile(student_id)
+    # 전체 프로파일 조회 (허용 지연 이내면 스냅샷)
+    result = await service.get_profile(student_id, max_staleness_seconds)
+    profile = result["profile"]
 
     # 약점 개념 필터링 (threshold 미만)
     weak_concepts = [
@@ -133,5 +291,142 @@ async def get_weak_concepts(
     return WeakConceptsResponse(
         student_id=student_id,
         threshold=threshold,
-        weak_concepts=weak_concepts
+        weak_concepts=weak_concepts,
+        source=result["source"],
+        staleness_seconds=result["staleness_seconds"]
+    )
+
+
+@router.get("/stats/{student_id}", response_model=ConceptStatsResponse)
+async def get_concept_stats(
+    student_id: str,
+    concepts: Optional[List[str]] = Query(default=None),
+    service: MasteryService = Depends(get_mastery_service)
+):
+    """
+    학생의 개념별 시도 통계 조회 (SQL GROUP BY 한 번)
+
+    Args:
+        student_id: 학생 ID
+        concepts: 개념 제한 (선택, 반복 파라미터)
+
+    Returns:
+        개념별 시도 수, 정답 수, 정답률, 평균 응답 시간, 마지막 시도 시각
+    """
+    stats = await service.get_concept_stats(student_id, concepts)
+
+    return ConceptStatsResponse(student_id=student_id, stats=stats)
+
+
+@router.get("/cohort/{school_id}/concepts", response_model=CohortConceptsResponse)
+async def get_cohort_concepts(
+    school_id: str,
+    grade: Optional[int] = None,
+    threshold: float = 0.5,
+    concepts: Optional[List[str]] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1),
+    service: MasterySnapshotService = Depends(get_snapshot_service)
+):
+    """
+    학교/학년 코호트의 개념별 숙련도 분포 (약한 개념 먼저)
+
+    숙련도 스냅샷을 students와 조인해 한 쿼리로 집계합니다.
+
+    Args:
+        school_id: 학교 ID
+        grade: 학년 (선택)
+        threshold: 미달 판단 임계값 (기본값: 0.5)
+        concepts: 개념 제한 (선택, 반복 파라미터)
+        limit: 최대 개념 수 (선택)
+
+    Returns:
+        개념별 평균/최소/최대/백분위/미달 학생 수, 스냅샷 지연
+    """
+    result = await service.get_cohort_concepts(
+        school_id, grade=grade, threshold=threshold, concepts=concepts, limit=limit
+    )
+
+    return CohortConceptsResponse(
+        school_id=school_id,
+        grade=grade,
+        threshold=threshold,
+        concepts=[CohortConceptStats(**row) for row in result["concepts"]],
+        staleness_seconds=result["staleness_seconds"]
+    )
+
+
+@router.get("/cohort/{school_id}/students", response_model=CohortStudentsResponse)
+async def get_cohort_students(
+    school_id: str,
+    concept: str,
+    grade: Optional[int] = None,
+    threshold: Optional[float] = None,
+    service: MasterySnapshotService = Depends(get_snapshot_service)
+):
+    """
+    코호트 학생의 개념 숙련도 조회 (예: 이차방정식 0.5 미만 학생)
+
+    Args:
+        school_id: 학교 ID
+        concept: 개념명
+        grade: 학년 (선택)
+        threshold: 이 값 미만 학생만 (선택)
+
+    Returns:
+        숙련도 오름차순 학생 리스트 (코호트 내 백분위 포함), 스냅샷 지연
+    """
+    result = await service.get_cohort_students(
+        school_id, concept, grade=grade, threshold=threshold
+    )
+
+    return CohortStudentsResponse(
+        school_id=school_id,
+        grade=grade,
+        concept=concept,
+        threshold=threshold,
+        students=[CohortStudent(**row) for row in result["students"]],
+        staleness_seconds=result["staleness_seconds"]
     )
+
+
+@router.get("/trajectory", response_model=MasteryTrajectoryResponse)
+async def get_mastery_trajectory(
+    student_id: str,
+    concept: str,
+    smoothed: bool = False,
+    service: MasteryService = Depends(get_mastery_service)
+):
+    """
+    학생의 개념 숙련도 궤적 조회 (시도별 숙련도 차트용)
+
+    Args:
+        student_id: 학생 ID
+        concept: 개념명
+        smoothed: True면 전체 기록을 반영한 smoothed 숙련도 포함
+
+    Returns:
+        시간순 시도별 숙련도 리스트
+    """
+    points = await service.get_mastery_trajectory(student_id, concept, smoothed)
+
+    return MasteryTrajectoryResponse(
+        student_id=student_id,
+        concept=concept,
+        smoothed=smoothed,
+        points=[TrajectoryPoint(**point) for point in points]
+    )
+
+
+@router.post("/parameters/refresh", response_model=RefreshParametersResponse)
+async def refresh_parameters(db: AsyncSession = Depends(get_db)):
+    """
+    개념별 BKT 파라미터 캐시 갱신
+
+    파라미터 적합(scripts/fit_bkt_parameters.py) 후 재시작 없이 반영할 때 사용
+
+    Returns:
+        로드된 개념 수
+    """
+    store = await BKTParameterStore.refresh(db)
+
+    return RefreshParametersResponse(concepts=len(store.models))
@@ -6,7 +6,7 @@ Phase 1-4 워크플로우 API 엔드포인트
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, date
 
 from app.db.session import get_db
@@ -28,6 +28,13 @@ from app.services.exam_prep_service import (
     ExamPrepService,
     ExamPrepRequest as ServiceExamRequest
 )
+from app.services.adaptive_diagnostic_service import (
+    AdaptiveDiagnosticService,
+    AdaptiveDiagnosticRequest as ServiceAdaptiveRequest,
+    AdaptiveDiagnosticStep
+)
+from app.services.item_bank_store import ItemBankIndexStore
+from app.algorithms.item_bank_index import ItemBankIndex
 
 router = APIRouter(prefix="/api/v1/workflows", tags=["workflows"])
 
@@ -48,6 +55,7 @@ class Question(BaseModel):
     content: str
     difficulty: str
     concepts: List[str]
+    irt_difficulty: Optional[float] = None
 
 
 class WeeklyDiagnosticResponse(BaseModel):
@@ -124,6 +132,40 @@ class ExamPrepResponse(BaseModel):
     focus_concepts: List[str]
 
 
+# Adaptive Diagnostic Models
+class AdaptiveDiagnosticRequest(BaseModel):
+    student_id: str = Field(..., description="학생 ID")
+    concepts: Optional[List[str]] = Field(None, description="출제 개념 제한 (생략 시 전체)")
+    se_threshold: float = Field(0.3, gt=0, description="종료 기준 능력 표준오차")
+    max_items: int = Field(20, ge=1, le=100, description="최대 문항 수")
+
+
+class AdaptiveResponseRequest(BaseModel):
+    question_id: str = Field(..., description="응답한 문제 ID")
+    is_correct: bool = Field(..., description="정답 여부")
+
+
+class AdaptiveQuestion(BaseModel):
+    question_id: str
+    concept: str
+    difficulty: float
+    discrimination: float
+
+
+class AdaptiveDiagnosticResponse(BaseModel):
+    workflow_id: str
+    status: str
+    next_question: Optional[AdaptiveQuestion]
+    theta: float
+    standard_error: float
+    answered: int
+    stop_reason: Optional[str]
+
+
+class RefreshItemBankResponse(BaseModel):
+    items: int
+
+
 # ============================================================================
 # Dependencies
 # ============================================================================
@@ -133,6 +175,23 @@ def get_mcp_manager() -> MCPClientManager:
     return MCPClientManager()
 
 
+async def get_item_bank_index(db: AsyncSession = Depends(get_db)) -> ItemBankIndex:
+    """문항 은행 인덱스 (프로세스 캐시)"""
+    return await ItemBankIndexStore.get_instance(db)
+
+
+def _to_adaptive_response(step: AdaptiveDiagnosticStep) -> AdaptiveDiagnosticResponse:
+    return AdaptiveDiagnosticResponse(
+        workflow_id=step.workflow_id,
+        status=step.status,
+        next_question=AdaptiveQuestion(**step.next_question) if step.next_question else None,
+        theta=step.theta,
+        standard_error=step.standard_error,
+        answered=step.answered,
+        stop_reason=step.stop_reason
+    )
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -174,7 +233,8 @@ async def weekly_diagnostic(
                     id=q.id,
                     content=q.content,
                     difficulty=q.difficulty,
-                    concepts=q.concepts
+                    concepts=q.concepts,
+                    irt_difficulty=q.irt_difficulty
                 )
                 for q in result.questions
             ],
@@ -336,3 +396,61 @@ async def exam_prep(
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Exam preparation failed: {str(e)}")
+
+
+@router.post("/adaptive-diagnostic", response_model=AdaptiveDiagnosticResponse)
+async def start_adaptive_diagnostic(
+    request: AdaptiveDiagnosticRequest,
+    db: AsyncSession = Depends(get_db),
+    index: ItemBankIndex = Depends(get_item_bank_index)
+):
+    """
+    적응형(CAT) 진단 시작
+
+    문항 은행에서 현재 능력 추정치에 대해 정보량이 가장 큰 문항을 하나씩 출제합니다.
+    응답은 POST /adaptive-diagnostic/{workflow_id}/responses 로 제출합니다.
+    """
+    service = AdaptiveDiagnosticService(db, index)
+    step = await service.start_diagnostic(ServiceAdaptiveRequest(
+        student_id=request.student_id,
+        concepts=request.concepts,
+        se_threshold=request.se_threshold,
+        max_items=request.max_items
+    ))
+    return _to_adaptive_response(step)
+
+
+@router.post("/adaptive-diagnostic/{workflow_id}/responses", response_model=AdaptiveDiagnosticResponse)
+async def submit_adaptive_response(
+    workflow_id: str,
+    request: AdaptiveResponseRequest,
+    db: AsyncSession = Depends(get_db),
+    index: ItemBankIndex = Depends(get_item_bank_index)
+):
+    """
+    적응형 진단 응답 제출
+
+    능력 추정치와 표준오차를 갱신하고 다음 문항을 반환합니다.
+    표준오차가 기준 이하가 되거나 최대 문항 수에 도달하면 next_question=null, status=completed.
+    """
+    service = AdaptiveDiagnosticService(db, index)
+    try:
+        step = await service.submit_response(workflow_id, request.question_id, request.is_correct)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    if step is None:
+        raise HTTPException(status_code=404, detail=f"Adaptive diagnostic {workflow_id} not found")
+
+    return _to_adaptive_response(step)
+
+
+@router.post("/item-bank/refresh", response_model=RefreshItemBankResponse)
+async def refresh_item_bank(db: AsyncSession = Depends(get_db)):
+    """
+    문항 은행 인덱스 캐시 갱신
+
+    scripts/calibrate_item_bank.py로 재보정한 뒤 호출하면 재시작 없이 반영됩니다.
+    """
+    index = await ItemBankIndexStore.refresh(db)
+    return RefreshItemBankResponse(items=len(index))
@@ -12,7 +12,7 @@ import uuid
 import json
 import logging
 
-from app.db.session import get_db
+from app.db.session import get_db, get_replica_db
 from app.models.workflow_template import WorkflowTemplate
 from app.services.workflow_engine import WorkflowEngine
 from app.mcp.tools import TOOL_REGISTRY
@@ -97,7 +97,7 @@ async def create_template(
 async def list_templates(
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_replica_db)
 ):
     """
     워크플로우 템플릿 목록 조회
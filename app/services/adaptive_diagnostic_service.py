@@ -0,0 +1,168 @@
+"""
+Adaptive Diagnostic Service
+
+적응형(CAT) 진단 워크플로우를 구현합니다.
+고정 10문항을 받는 주간 진단과 달리, 응답마다 θ를 갱신하고 문항 은행에서
+다음 최대 정보량 문항을 골라 표준오차가 충분히 작아지면 종료합니다.
+
+세션 상태는 WorkflowSession.workflow_metadata["cat"]에 저장됩니다.
+"""
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+import logging
+
+from app.algorithms.cat import AdaptiveTestSession
+from app.db.routing import use_primary
+from app.algorithms.item_bank_index import ItemBankIndex
+from app.models.workflow_session import WorkflowSession
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_TYPE = "adaptive_diagnostic"
+
+
+@dataclass
+class AdaptiveDiagnosticRequest:
+    """적응형 진단 시작 요청"""
+    student_id: str
+    concepts: Optional[List[str]] = None
+    se_threshold: float = 0.3
+    max_items: int = 20
+
+
+@dataclass
+class AdaptiveDiagnosticStep:
+    """적응형 진단 진행 상태"""
+    workflow_id: str
+    status: str
+    next_question: Optional[Dict[str, Any]]
+    theta: float
+    standard_error: float
+    answered: int
+    stop_reason: Optional[str]
+
+
+class AdaptiveDiagnosticService:
+    """적응형 진단 워크플로우 서비스"""
+
+    def __init__(self, db: AsyncSession, index: ItemBankIndex):
+        """
+        서비스 초기화
+
+        세션 상태를 읽어 다시 쓰므로 세션의 읽기를 기본 DB로 고정한다.
+
+        Args:
+            db: AsyncSession 데이터베이스 세션
+            index: 문항 은행 인덱스
+        """
+        self.db = db
+        self.index = index
+        use_primary(db)
+
+    async def start_diagnostic(self, request: AdaptiveDiagnosticRequest) -> AdaptiveDiagnosticStep:
+        """
+        적응형 진단 시작 (첫 문항 선택 후 세션 저장)
+
+        Args:
+            request: AdaptiveDiagnosticRequest
+
+        Returns:
+            첫 문항이 담긴 AdaptiveDiagnosticStep
+
+        Raises:
+            ValueError: 잘못된 종료 조건
+        """
+        session = AdaptiveTestSession(
+            se_threshold=request.se_threshold,
+            min_items=min(3, request.max_items),
+            max_items=request.max_items,
+            concepts=request.concepts
+        )
+        session.select_next(self.index)
+
+        workflow_session = WorkflowSession(
+            student_id=request.student_id,
+            workflow_type=WORKFLOW_TYPE,
+            status="in_progress",
+            workflow_metadata={
+                "cat": session.to_dict(),
+                "started_at": datetime.now().isoformat()
+            }
+        )
+        self._apply_status(workflow_session, session)
+
+        self.db.add(workflow_session)
+        await self.db.commit()
+        await self.db.refresh(workflow_session)
+
+        logger.info(f"Started adaptive diagnostic {workflow_session.workflow_id} for {request.student_id}")
+        return self._to_step(workflow_session, session)
+
+    async def submit_response(
+        self,
+        workflow_id: str,
+        question_id: str,
+        is_correct: bool
+    ) -> Optional[AdaptiveDiagnosticStep]:
+        """
+        응답 기록 후 다음 문항 선택
+
+        Args:
+            workflow_id: 워크플로우 ID
+            question_id: 응답한 문제 ID
+            is_correct: 정답 여부
+
+        Returns:
+            AdaptiveDiagnosticStep (종료 시 next_question=None, status="completed"),
+            세션이 없으면 None
+
+        Raises:
+            ValueError: 이미 종료된 세션이거나 출제하지 않은 문항에 응답한 경우
+        """
+        # 같은 세션에 동시에 응답이 들어와도 갱신이 유실되지 않도록 행 잠금
+        stmt = select(WorkflowSession).where(
+            WorkflowSession.workflow_id == workflow_id,
+            WorkflowSession.workflow_type == WORKFLOW_TYPE
+        ).with_for_update()
+        workflow_session = (await self.db.execute(stmt)).scalar_one_or_none()
+        if workflow_session is None:
+            return None
+
+        session = AdaptiveTestSession.from_dict(workflow_session.workflow_metadata["cat"])
+        if session.is_finished:
+            raise ValueError(f"workflow {workflow_id} is already completed")
+
+        session.record_response(question_id, is_correct)
+        session.select_next(self.index)
+
+        # JSON 컬럼 변경 감지를 위해 새 딕셔너리로 교체
+        workflow_session.workflow_metadata = {
+            **workflow_session.workflow_metadata,
+            "cat": session.to_dict()
+        }
+        self._apply_status(workflow_session, session)
+        await self.db.commit()
+
+        return self._to_step(workflow_session, session)
+
+    @staticmethod
+    def _apply_status(workflow_session: WorkflowSession, session: AdaptiveTestSession) -> None:
+        """세션 종료 시 워크플로우 완료 처리"""
+        if session.is_finished:
+            workflow_session.status = "completed"
+            workflow_session.completed_at = datetime.now(timezone.utc)
+
+    @staticmethod
+    def _to_step(workflow_session: WorkflowSession, session: AdaptiveTestSession) -> AdaptiveDiagnosticStep:
+        return AdaptiveDiagnosticStep(
+            workflow_id=workflow_session.workflow_id,
+            status=workflow_session.status,
+            next_question=session.pending,
+            theta=session.theta,
+            standard_error=session.standard_error,
+            answered=len(session.responses),
+            stop_reason=session.stop_reason
+        )
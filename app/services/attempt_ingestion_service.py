@@ -0,0 +1,150 @@
+"""
+Attempt Ingestion Service
+
+학습 세션 종료 시 Node 4 등이 보내는 대량 시도 기록 적재
+
+책임:
+- NDJSON 또는 JSON 배열 본문 파싱
+- 행 단위 검증 (잘못된 행은 건너뛰고 위치와 사유 보고)
+- 유효한 행을 한 트랜잭션으로 적재 (StudentAttemptRepository.bulk_create_attempts)
+- 처리량(rows/sec) 측정
+"""
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from app.repositories.student_attempt_repository import StudentAttemptRepository
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class AttemptRecord(BaseModel):
+    """대량 적재 시도 한 행"""
+    student_id: str = Field(..., min_length=1, max_length=100)
+    question_id: str = Field(..., min_length=1, max_length=100)
+    concept: str = Field(..., min_length=1, max_length=100)
+    is_correct: bool
+    response_time_ms: Optional[int] = Field(None, ge=0)
+    attempted_at: Optional[datetime] = None
+
+    @field_validator("attempted_at")
+    @classmethod
+    def to_naive_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """시간대가 있으면 naive UTC로 변환 (attempted_at 컬럼 규칙)"""
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+
+class IngestionPayloadError(ValueError):
+    """본문 전체를 해석할 수 없음 (행 단위 오류가 아님)"""
+
+
+class AttemptIngestionService:
+    """대량 시도 적재 서비스"""
+
+    def __init__(self, repository: StudentAttemptRepository, max_rows: int):
+        """
+        서비스 초기화
+
+        Args:
+            repository: StudentAttemptRepository 인스턴스
+            max_rows: 요청당 최대 행 수
+        """
+        self.repository = repository
+        self.max_rows = max_rows
+
+    def parse(self, body: bytes, content_type: Optional[str]) -> Tuple[List[Any], List[Dict[str, Any]]]:
+        """
+        본문을 행 목록으로 파싱
+
+        NDJSON은 빈 줄을 건너뛰며 줄마다 파싱하고, JSON으로 해석되지 않는 줄은
+        행 오류로 보고한다. 그 외 Content-Type은 JSON 배열로 해석한다.
+
+        Args:
+            body: 요청 본문
+            content_type: Content-Type 헤더
+
+        Returns:
+            (행 목록, 파싱 오류 목록). 파싱 오류 행도 index를 차지한다.
+
+        Raises:
+            IngestionPayloadError: JSON 배열이 아니거나 max_rows 초과
+        """
+        media_type = (content_type or "").split(";")[0].strip().lower()
+        rows: List[Any] = []
+        errors: List[Dict[str, Any]] = []
+
+        if media_type in NDJSON_CONTENT_TYPES:
+            for line in body.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except ValueError as e:
+                    errors.append(self._error(len(rows), [{"loc": [], "msg": f"invalid JSON: {e}"}]))
+                    rows.append(None)
+        else:
+            try:
+                rows = json.loads(body)
+            except ValueError as e:
+                raise IngestionPayloadError(f"invalid JSON body: {e}")
+            if not isinstance(rows, list):
+                raise IngestionPayloadError("expected a JSON array of attempts")
+
+        if len(rows) > self.max_rows:
+            raise IngestionPayloadError(f"too many rows: {len(rows)} > {self.max_rows}")
+
+        return rows, errors
+
+    async def ingest(
+        self,
+        rows: List[Any],
+        parse_errors: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        행 검증 후 유효한 행 적재
+
+        Args:
+            rows: 행 목록 (파싱 실패 행은 None)
+            parse_errors: parse()의 오류 목록
+
+        Returns:
+            {"received", "inserted", "rejected", "errors": [{"index", "errors"}],
+             "elapsed_ms", "rows_per_second"}
+        """
+        started = time.perf_counter()
+        errors = list(parse_errors or [])
+        failed = {error["index"] for error in errors}
+
+        valid: List[Dict[str, Any]] = []
+        for index, row in enumerate(rows):
+            if index in failed:
+                continue
+            try:
+                valid.append(AttemptRecord.model_validate(row).model_dump())
+            except ValidationError as e:
+                errors.append(self._error(index, [
+                    {"loc": list(error["loc"]), "msg": error["msg"]} for error in e.errors()
+                ]))
+
+        inserted = await self.repository.bulk_create_attempts(valid)
+        elapsed = time.perf_counter() - started
+        errors.sort(key=lambda error: error["index"])
+
+        return {
+            "received": len(rows),
+            "inserted": inserted,
+            "rejected": len(errors),
+            "errors": errors,
+            "elapsed_ms": elapsed * 1000,
+            "rows_per_second": inserted / elapsed if elapsed > 0 else 0.0,
+        }
+
+    @staticmethod
+    def _error(index: int, details: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """행 오류 항목"""
+        return {"index": index, "errors": details}
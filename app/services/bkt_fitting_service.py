@@ -0,0 +1,80 @@
+"""
+BKT Fitting Service
+
+student_attempts 전체로부터 개념별 BKT 파라미터를 적합해 저장하는 오프라인 작업
+
+책임:
+- StudentAttemptRepository에서 개념별 시퀀스 청크 스트리밍
+- BKTGridFitter로 로그우도 누적 및 최대우도 파라미터 선택
+- 충분한 데이터가 있는 개념만 bkt_parameters 테이블에 저장
+"""
+import logging
+from typing import Dict, Any, Optional
+
+from app.algorithms.bkt_fitting import BKTGridFitter
+from app.repositories.student_attempt_repository import StudentAttemptRepository
+from app.repositories.bkt_parameter_repository import BKTParameterRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BKTFittingService:
+    """개념별 BKT 파라미터 적합 서비스"""
+
+    def __init__(
+        self,
+        attempt_repository: StudentAttemptRepository,
+        parameter_repository: BKTParameterRepository,
+        fitter: Optional[BKTGridFitter] = None
+    ):
+        """
+        서비스 초기화
+
+        Args:
+            attempt_repository: StudentAttemptRepository 인스턴스
+            parameter_repository: BKTParameterRepository 인스턴스
+            fitter: BKTGridFitter 인스턴스 (기본값: 기본 격자)
+        """
+        self.attempt_repository = attempt_repository
+        self.parameter_repository = parameter_repository
+        self.fitter = fitter or BKTGridFitter()
+
+    async def fit_all(
+        self,
+        chunk_size: int = 5000,
+        min_attempts: int = 50
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        전체 개념 파라미터 적합 및 저장
+
+        Args:
+            chunk_size: 스트리밍 청크당 시도 수
+            min_attempts: 저장에 필요한 최소 시도 수 (미만이면 기본 파라미터 유지)
+
+        Returns:
+            {개념: 적합 결과} 딕셔너리 (저장된 개념만)
+
+        Examples:
+            >>> service = BKTFittingService(attempt_repo, parameter_repo)
+            >>> fitted = await service.fit_all(chunk_size=10000)
+            >>> fitted["이차방정식"]["p_learn"]
+            0.2
+        """
+        async for concept, offsets, outcomes in self.attempt_repository.stream_concept_sequences(
+            chunk_size=chunk_size
+        ):
+            self.fitter.partial_fit(concept, offsets, outcomes)
+
+        fitted = {}
+        for concept in self.fitter.concepts:
+            params = self.fitter.best_params(concept)
+            if params["n_attempts"] < min_attempts:
+                logger.info(
+                    f"Skipping {concept}: {params['n_attempts']} attempts < {min_attempts}"
+                )
+                continue
+
+            await self.parameter_repository.save(concept, params)
+            fitted[concept] = params
+
+        return fitted
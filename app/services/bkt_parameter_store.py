@@ -0,0 +1,121 @@
+"""
+BKT Parameter Store
+
+개념별 BKT 파라미터를 프로세스 단위로 캐시하는 저장소
+
+책임:
+- bkt_parameters 테이블을 한 번만 읽어 개념 → BayesianKnowledgeTracing 캐시 구성
+- 적합되지 않은 개념은 기본 BKT로 대체
+- BKT_FORGETTING_HALF_LIFE_DAYS 설정 시 모든 BKT를 망각 변형으로 생성
+- 프로세스 재시작 없이 refresh()로 캐시 갱신
+"""
+import asyncio
+import logging
+from typing import Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.algorithms.bkt import BayesianKnowledgeTracing
+from app.algorithms.bkt_forgetting import create_bkt
+from app.config import settings
+from app.repositories.bkt_parameter_repository import BKTParameterRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BKTParameterStore:
+    """개념별 BKT 파라미터 캐시 (싱글톤)"""
+
+    _instance: Optional['BKTParameterStore'] = None
+    _lock: Optional[asyncio.Lock] = None
+
+    def __init__(
+        self,
+        models: Optional[Dict[str, BayesianKnowledgeTracing]] = None,
+        default: Optional[BayesianKnowledgeTracing] = None
+    ):
+        """
+        저장소 초기화
+
+        Args:
+            models: {개념: BKT} 딕셔너리
+            default: 적합된 파라미터가 없는 개념에 사용할 BKT
+                     (기본값: 설정에 따른 기본 파라미터 BKT)
+        """
+        self.models = models or {}
+        self.default = default or create_bkt(settings.BKT_FORGETTING_HALF_LIFE_DAYS)
+
+    def get(self, concept: str) -> BayesianKnowledgeTracing:
+        """
+        개념의 BKT 조회
+
+        Args:
+            concept: 개념명
+
+        Returns:
+            적합된 BKT 또는 기본 BKT
+        """
+        return self.models.get(concept, self.default)
+
+    @staticmethod
+    async def _load_models(db: AsyncSession) -> Dict[str, BayesianKnowledgeTracing]:
+        """bkt_parameters 테이블에서 개념별 BKT 구성"""
+        rows = await BKTParameterRepository(db).list_all()
+        return {
+            row.concept: create_bkt(
+                settings.BKT_FORGETTING_HALF_LIFE_DAYS,
+                p_init=row.p_init,
+                p_learn=row.p_learn,
+                p_slip=row.p_slip,
+                p_guess=row.p_guess
+            )
+            for row in rows
+        }
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    async def get_instance(cls, db: AsyncSession) -> 'BKTParameterStore':
+        """
+        싱글톤 저장소 조회 (최초 호출 시 한 번만 로드)
+
+        Args:
+            db: 최초 로드에 사용할 DB 세션
+
+        Returns:
+            BKTParameterStore 인스턴스
+        """
+        if cls._instance is None:
+            async with cls._get_lock():
+                if cls._instance is None:
+                    models = await cls._load_models(db)
+                    cls._instance = cls(models)
+                    logger.info(f"Loaded BKT parameters for {len(models)} concepts")
+        return cls._instance
+
+    @classmethod
+    async def refresh(cls, db: AsyncSession) -> 'BKTParameterStore':
+        """
+        캐시를 DB 내용으로 다시 로드
+
+        기존 인스턴스를 참조 중인 요청은 교체 전 파라미터로 끝까지 처리된다.
+
+        Args:
+            db: DB 세션
+
+        Returns:
+            새 BKTParameterStore 인스턴스
+        """
+        async with cls._get_lock():
+            models = await cls._load_models(db)
+            cls._instance = cls(models)
+            logger.info(f"Refreshed BKT parameters for {len(models)} concepts")
+        return cls._instance
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """캐시 제거 (다음 get_instance에서 다시 로드)"""
+        cls._instance = None
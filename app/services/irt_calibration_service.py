@@ -0,0 +1,175 @@
+"""
+IRT Calibration Service
+
+student_attempts 전체로부터 문항 난이도/변별도를 보정해 문항 은행에 저장하는 오프라인 작업
+
+책임:
+- StudentAttemptRepository에서 응답 행을 청크 스트리밍해 희소(COO) 배열 구성
+- JointMLECalibrator로 학생 능력과 문항 모수를 함께 추정
+- 체크포인트 파일로 중단된 긴 작업 재개
+- 충분한 응답이 있는 문항만 item_bank 테이블에 저장
+"""
+import logging
+import os
+from array import array
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from app.algorithms.irt_calibration import JointMLECalibrator
+from app.repositories.student_attempt_repository import StudentAttemptRepository
+from app.repositories.item_bank_repository import ItemBankRepository
+
+logger = logging.getLogger(__name__)
+
+
+class IRTCalibrationService:
+    """문항 은행 보정 서비스"""
+
+    def __init__(
+        self,
+        attempt_repository: StudentAttemptRepository,
+        item_bank_repository: ItemBankRepository,
+        calibrator: Optional[JointMLECalibrator] = None
+    ):
+        """
+        서비스 초기화
+
+        Args:
+            attempt_repository: StudentAttemptRepository 인스턴스
+            item_bank_repository: ItemBankRepository 인스턴스
+            calibrator: JointMLECalibrator 인스턴스 (기본값: 1PL)
+        """
+        self.attempt_repository = attempt_repository
+        self.item_bank_repository = item_bank_repository
+        self.calibrator = calibrator or JointMLECalibrator()
+
+    async def _load_responses(self, chunk_size: int) -> Dict[str, Any]:
+        """
+        응답 행을 정수 인덱스 배열로 변환
+
+        학생/문항 인덱스는 ID 정렬 순서로 부여해 같은 데이터면 실행마다
+        같은 배치가 되도록 한다 (체크포인트 재개 조건).
+        """
+        student_index: Dict[str, int] = {}
+        item_index: Dict[str, int] = {}
+        item_concepts: List[str] = []
+        students = array("l")
+        items = array("l")
+        responses = array("b")
+
+        async for chunk in self.attempt_repository.stream_item_responses(chunk_size=chunk_size):
+            for student_id, question_id, concept, is_correct in chunk:
+                s = student_index.setdefault(student_id, len(student_index))
+                i = item_index.get(question_id)
+                if i is None:
+                    i = item_index[question_id] = len(item_index)
+                    item_concepts.append(concept)
+                students.append(s)
+                items.append(i)
+                responses.append(is_correct)
+
+        student_ids = sorted(student_index)
+        question_ids = sorted(item_index)
+        student_rank = np.empty(len(student_ids), dtype=np.int64)
+        student_rank[[student_index[s] for s in student_ids]] = np.arange(len(student_ids))
+        item_rank = np.empty(len(question_ids), dtype=np.int64)
+        item_rank[[item_index[q] for q in question_ids]] = np.arange(len(question_ids))
+
+        return {
+            "student_indices": student_rank[np.frombuffer(students, dtype=students.typecode)],
+            "item_indices": item_rank[np.frombuffer(items, dtype=items.typecode)],
+            "responses": np.frombuffer(responses, dtype=np.int8).astype(bool),
+            "question_ids": question_ids,
+            "concepts": [item_concepts[item_index[q]] for q in question_ids],
+            "n_students": len(student_ids),
+        }
+
+    def _resume_state(self, checkpoint_path: Optional[str], n_students: int, n_items: int):
+        """체크포인트가 있고 현재 데이터와 맞으면 재개 상태 반환"""
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return None
+
+        state = JointMLECalibrator.load_checkpoint(checkpoint_path)
+        if (
+            state["model"] != self.calibrator.model
+            or state["n_students"] != n_students
+            or state["n_items"] != n_items
+        ):
+            logger.warning(f"Ignoring checkpoint {checkpoint_path}: does not match current data")
+            return None
+
+        logger.info(f"Resuming calibration from iteration {state['iteration']}")
+        return state
+
+    async def calibrate(
+        self,
+        chunk_size: int = 5000,
+        min_responses: int = 30,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 10
+    ) -> Dict[str, Any]:
+        """
+        전체 문항 보정 및 저장
+
+        Args:
+            chunk_size: 스트리밍 청크당 행 수
+            min_responses: 저장에 필요한 최소 응답 수 (미만 문항은 보정에만 사용)
+            checkpoint_path: 체크포인트 .npz 경로 (있으면 재개, 저장 완료 후 삭제)
+            checkpoint_every: 체크포인트 주기 (반복 수)
+
+        Returns:
+            {"n_students", "n_items", "n_responses", "saved", "iteration", "converged"}
+
+        Examples:
+            >>> service = IRTCalibrationService(attempt_repo, item_bank_repo)
+            >>> summary = await service.calibrate(checkpoint_path="/tmp/irt.npz")
+            >>> summary["saved"]
+            1200
+        """
+        data = await self._load_responses(chunk_size)
+        n_items = len(data["question_ids"])
+        resume_from = self._resume_state(checkpoint_path, data["n_students"], n_items)
+
+        checkpoint = None
+        if checkpoint_path:
+            def checkpoint(state):
+                JointMLECalibrator.save_checkpoint(checkpoint_path, state)
+
+        state = self.calibrator.calibrate(
+            data["student_indices"],
+            data["item_indices"],
+            data["responses"],
+            n_students=data["n_students"],
+            n_items=n_items,
+            resume_from=resume_from,
+            checkpoint=checkpoint,
+            checkpoint_every=checkpoint_every
+        )
+
+        counts = np.bincount(data["item_indices"], minlength=n_items)
+        items = [
+            {
+                "question_id": question_id,
+                "concept": data["concepts"][i],
+                "difficulty": float(state["difficulty"][i]),
+                "discrimination": float(state["discrimination"][i]),
+                "model": self.calibrator.model,
+                "n_responses": int(counts[i]),
+            }
+            for i, question_id in enumerate(data["question_ids"])
+            if counts[i] >= min_responses
+        ]
+        saved = await self.item_bank_repository.save_many(items)
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        return {
+            "n_students": data["n_students"],
+            "n_items": n_items,
+            "n_responses": int(data["responses"].size),
+            "saved": saved,
+            "iteration": state["iteration"],
+            "converged": state["converged"],
+        }
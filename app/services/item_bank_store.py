@@ -0,0 +1,75 @@
+"""
+Item Bank Index Store
+
+문항 은행 인덱스를 프로세스 단위로 캐시하는 저장소
+
+책임:
+- item_bank 테이블을 한 번만 읽어 ItemBankIndex 구성
+- 재보정 후 refresh()로 캐시 갱신
+"""
+import asyncio
+import logging
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.algorithms.item_bank_index import ItemBankIndex
+from app.repositories.item_bank_repository import ItemBankRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ItemBankIndexStore:
+    """문항 은행 인덱스 캐시 (싱글톤)"""
+
+    _instance: Optional[ItemBankIndex] = None
+    _lock: Optional[asyncio.Lock] = None
+
+    @staticmethod
+    async def _load_index(db: AsyncSession) -> ItemBankIndex:
+        """item_bank 테이블에서 인덱스 구성"""
+        return ItemBankIndex(await ItemBankRepository(db).list_all())
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    async def get_instance(cls, db: AsyncSession) -> ItemBankIndex:
+        """
+        싱글톤 인덱스 조회 (최초 호출 시 한 번만 로드)
+
+        Args:
+            db: 최초 로드에 사용할 DB 세션
+
+        Returns:
+            ItemBankIndex 인스턴스
+        """
+        if cls._instance is None:
+            async with cls._get_lock():
+                if cls._instance is None:
+                    cls._instance = await cls._load_index(db)
+                    logger.info(f"Loaded item bank index with {len(cls._instance)} items")
+        return cls._instance
+
+    @classmethod
+    async def refresh(cls, db: AsyncSession) -> ItemBankIndex:
+        """
+        캐시를 DB 내용으로 다시 로드
+
+        Args:
+            db: DB 세션
+
+        Returns:
+            새 ItemBankIndex 인스턴스
+        """
+        async with cls._get_lock():
+            cls._instance = await cls._load_index(db)
+            logger.info(f"Refreshed item bank index with {len(cls._instance)} items")
+        return cls._instance
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """캐시 제거 (다음 get_instance에서 다시 로드)"""
+        cls._instance = None
@@ -7,11 +7,20 @@ Mastery Calculation Service
 - StudentAttemptRepository와 BKT 알고리즘 통합
 - 개념별 숙련도 계산
 - 약점 개념 식별
-- 학생 숙련도 프로파일 생성
+- 학생 숙련도 프로파일 생성 (단일 쿼리 스트리밍)
+- 저장된 증분 숙련도 상태 우선 조회 (없으면 전체 기록 재생)
+- 개념별 적합 BKT 파라미터 적용 (BKTParameterStore)
+- 조회 시점 기준 망각 감쇠 지연 계산 (as_of)
+- 여러 개념 숙련도의 제한된 병렬 계산 (개념별 별도 세션)
 """
-from typing import List, Dict
+import asyncio
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
 from app.repositories.student_attempt_repository import StudentAttemptRepository
 from app.algorithms.bkt import BayesianKnowledgeTracing
+from app.services.bkt_parameter_store import BKTParameterStore
 
 
 class MasteryService:
@@ -20,29 +29,58 @@ class MasteryService:
     def __init__(
         self,
         repository: StudentAttemptRepository,
-        bkt_algorithm: BayesianKnowledgeTracing
+        bkt_algorithm: BayesianKnowledgeTracing,
+        parameter_store: Optional[BKTParameterStore] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        max_concurrency: Optional[int] = None
     ):
         """
         서비스 초기화
 
         Args:
             repository: StudentAttemptRepository 인스턴스
-            bkt_algorithm: BayesianKnowledgeTracing 인스턴스
+            bkt_algorithm: BayesianKnowledgeTracing 인스턴스 (적합 파라미터가 없는 개념용)
+            parameter_store: 개념별 적합 파라미터 저장소 (선택)
+            session_factory: 개념별 병렬 계산에 사용할 세션 팩토리 (없으면 단일 쿼리 경로)
+            max_concurrency: 동시에 계산할 최대 개념 수
+                             (기본값: settings.MASTERY_MAX_CONCURRENCY)
         """
         self.repository = repository
         self.bkt = bkt_algorithm
+        self.parameter_store = parameter_store
+        self.session_factory = session_factory
+        self.max_concurrency = max_concurrency or settings.MASTERY_MAX_CONCURRENCY
+
+    def get_bkt(self, concept: str) -> BayesianKnowledgeTracing:
+        """
+        개념의 숙련도 계산에 사용할 BKT
+
+        Args:
+            concept: 개념명
+
+        Returns:
+            적합된 개념별 BKT 또는 서비스 기본 BKT
+        """
+        if self.parameter_store is not None and concept in self.parameter_store.models:
+            return self.parameter_store.get(concept)
+        return self.bkt
 
     async def calculate_concept_mastery(
         self,
         student_id: str,
-        concept: str
+        concept: str,
+        as_of: Optional[datetime] = None
     ) -> float:
         """
         학생의 특정 개념 숙련도 계산
 
+        망각 모델(ForgettingKnowledgeTracing)을 사용하면 마지막 시도 이후
+        조회 시점까지의 감쇠를 읽는 시점에 적용한다. 기본 BKT에서는 감쇠가 없다.
+
         Args:
             student_id: 학생 ID
             concept: 개념명
+            as_of: 기준 시각 (None이면 현재 시각, 이후의 시도는 무시)
 
         Returns:
             숙련도 확률 (0.0 ~ 1.0)
@@ -53,16 +91,93 @@ class MasteryService:
             >>> print(f"Mastery: {mastery:.2f}")
             Mastery: 0.75
         """
-        # Repository에서 학습 데이터 조회
+        bkt = self.get_bkt(concept)
+
+        # 저장된 증분 상태가 같은 BKT 파라미터로 계산되었고 기준 시각 이전 상태면 그대로 사용
+        state = await self.repository.get_mastery_state(student_id, concept)
+        if (
+            state is not None
+            and state.params_key == bkt.params_key
+            and (as_of is None or state.last_attempted_at is None or state.last_attempted_at <= as_of)
+        ):
+            if state.last_attempted_at is None:
+                return state.p_mastery
+            return bkt.decay(
+                state.p_mastery,
+                (as_of or datetime.utcnow()) - state.last_attempted_at
+            )
+
+        # 상태가 없거나 파라미터가 다르면 전체 기록을 재생
+        if not bkt.time_dependent:
+            # 감쇠가 없으므로 정답 여부 컬럼만 읽어 계산
+            outcomes = await self.repository.get_outcomes(student_id, concept, until=as_of)
+            return bkt.calculate_mastery_from_outcomes(outcomes)
+
         attempts_data = await self.repository.get_student_mastery_data(
             student_id, concept
         )
 
-        # BKT로 숙련도 계산
-        mastery = self.bkt.calculate_mastery(attempts_data)
+        if as_of is not None:
+            return bkt.mastery_at(attempts_data, as_of)
+
+        # BKT로 숙련도 계산 (조회 시점이 마지막 시도보다 이르면 감쇠 없음)
+        mastery = bkt.calculate_mastery(attempts_data)
+        if attempts_data:
+            mastery = bkt.decay(
+                mastery, datetime.utcnow() - attempts_data[-1]["attempted_at"]
+            )
 
         return mastery
 
+    async def get_mastery_trajectory(
+        self,
+        student_id: str,
+        concept: str,
+        smoothed: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        학생의 개념 숙련도 궤적 조회 (시도별 숙련도, O(N) 한 번 계산)
+
+        Args:
+            student_id: 학생 ID
+            concept: 개념명
+            smoothed: True면 forward-backward smoothed 숙련도도 포함
+
+        Returns:
+            시간순 포인트 리스트
+            [{"attempt_id", "attempted_at", "is_correct", "mastery", "smoothed_mastery"}]
+            (smoothed_mastery는 smoothed=True일 때만 값이 있음)
+
+        Examples:
+            >>> points = await service.get_mastery_trajectory("student_1", "이차방정식")
+            >>> [round(p["mastery"], 2) for p in points]
+            [0.4, 0.58, 0.23]
+        """
+        # (attempted_at, id) 순 — 같은 시각의 시도도 숙련도 계산과 같은 순서
+        attempts = await self.repository.get_student_mastery_data(
+            student_id, concept, with_ids=True
+        )
+
+        bkt = self.get_bkt(concept)
+        trajectory = bkt.calculate_trajectory(attempts)
+        smoothed_trajectory = (
+            bkt.calculate_smoothed_trajectory(attempts) if smoothed
+            else [None] * len(attempts)
+        )
+
+        return [
+            {
+                "attempt_id": attempt["id"],
+                "attempted_at": attempt["attempted_at"],
+                "is_correct": attempt["is_correct"],
+                "mastery": mastery,
+                "smoothed_mastery": smoothed_mastery,
+            }
+            for attempt, mastery, smoothed_mastery in zip(
+                attempts, trajectory, smoothed_trajectory
+            )
+        ]
+
     async def calculate_multiple_concepts_mastery(
         self,
         student_id: str,
@@ -71,12 +186,17 @@ class MasteryService:
         """
         여러 개념에 대한 숙련도 계산
 
+        session_factory가 있으면 개념마다 풀에서 별도 세션을 받아 최대
+        max_concurrency개씩 동시에 calculate_concept_mastery를 실행한다
+        (AsyncSession은 동시 사용할 수 없으므로 세션을 공유하지 않는다).
+        없으면 요청 세션 하나로 해당 개념들의 시도를 한 쿼리로 읽어 계산한다.
+
         Args:
             student_id: 학생 ID
             concepts: 개념 리스트
 
         Returns:
-            {개념: 숙련도} 딕셔너리
+            {개념: 숙련도} 딕셔너리 (concepts 순서)
 
         Examples:
             >>> concepts = ["이차방정식", "삼각함수", "미분"]
@@ -84,13 +204,31 @@ class MasteryService:
             >>> print(mastery_map)
             {'이차방정식': 0.75, '삼각함수': 0.45, '미분': 0.82}
         """
-        mastery_map = {}
-
-        for concept in concepts:
-            mastery = await self.calculate_concept_mastery(student_id, concept)
-            mastery_map[concept] = mastery
-
-        return mastery_map
+        concepts = list(dict.fromkeys(concepts))
+        if not concepts:
+            return {}
+
+        if self.session_factory is None:
+            profile = await self._fold_attempts(student_id, concepts)
+            return {
+                concept: profile.get(concept, self.get_bkt(concept).p_init)
+                for concept in concepts
+            }
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def calculate(concept: str) -> float:
+            async with semaphore:
+                async with self.session_factory() as session:
+                    service = MasteryService(
+                        StudentAttemptRepository(session, self.bkt, self.parameter_store),
+                        self.bkt,
+                        self.parameter_store
+                    )
+                    return await service.calculate_concept_mastery(student_id, concept)
+
+        results = await asyncio.gather(*(calculate(concept) for concept in concepts))
+        return dict(zip(concepts, results))
 
     async def get_student_mastery_profile(
         self,
@@ -99,6 +237,9 @@ class MasteryService:
         """
         학생이 학습한 모든 개념의 숙련도 프로파일 조회
 
+        개념별 쿼리(N+1) 대신 학생의 시도를 한 번만 스트리밍하며 개념 그룹마다
+        BKT를 누적한다. 결과는 개념별 calculate_concept_mastery와 같다.
+
         Args:
             student_id: 학생 ID
 
@@ -110,19 +251,58 @@ class MasteryService:
             >>> print(f"Total concepts: {len(profile)}")
             Total concepts: 15
         """
-        # 학생의 모든 시도 기록 조회
-        all_attempts = await self.repository.get_by_student(student_id)
-
-        # 유니크한 개념 추출
-        unique_concepts = list(set(attempt.concept for attempt in all_attempts))
+        return await self._fold_attempts(student_id)
 
-        # 각 개념별 숙련도 계산
-        profile = await self.calculate_multiple_concepts_mastery(
-            student_id, unique_concepts
-        )
+    async def _fold_attempts(
+        self,
+        student_id: str,
+        concepts: Optional[List[str]] = None
+    ) -> Dict[str, float]:
+        """학생 시도를 한 쿼리로 스트리밍하며 개념별 BKT 누적 (시도가 있는 개념만)"""
+        now = datetime.utcnow()
+        profile: Dict[str, float] = {}
+
+        current_concept: Optional[str] = None
+        bkt = self.bkt
+        p_mastery = 0.0
+        previous_at: Optional[datetime] = None
+
+        # 한 쿼리로 (concept, attempted_at) 순 스트리밍하며 개념 그룹별로 BKT 누적
+        async for concept, is_correct, attempted_at in (
+            self.repository.stream_student_attempts_by_concept(student_id, concepts=concepts)
+        ):
+            if concept != current_concept:
+                if current_concept is not None:
+                    profile[current_concept] = self._decay_to(bkt, p_mastery, previous_at, now)
+                current_concept = concept
+                bkt = self.get_bkt(concept)
+                p_mastery = bkt.p_init
+                previous_at = None
+
+            # 망각 모델이면 시도 간 간격만큼 감쇠 (기본 BKT는 no-op)
+            if previous_at is not None and attempted_at is not None:
+                p_mastery = bkt.decay(p_mastery, attempted_at - previous_at)
+            p_mastery = bkt.update(p_mastery, is_correct)
+            if attempted_at is not None:
+                previous_at = attempted_at
+
+        if current_concept is not None:
+            profile[current_concept] = self._decay_to(bkt, p_mastery, previous_at, now)
 
         return profile
 
+    @staticmethod
+    def _decay_to(
+        bkt: BayesianKnowledgeTracing,
+        p_mastery: float,
+        last_attempted_at: Optional[datetime],
+        as_of: datetime
+    ) -> float:
+        """마지막 시도 이후 기준 시각까지 감쇠"""
+        if last_attempted_at is None:
+            return p_mastery
+        return bkt.decay(p_mastery, as_of - last_attempted_at)
+
     async def identify_weak_concepts(
         self,
         student_id: str,
@@ -179,3 +359,20 @@ class MasteryService:
         )
 
         return accuracy
+
+    async def get_concept_stats(
+        self,
+        student_id: str,
+        concepts: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        개념별 시도 통계 조회 (정답률, 시도 수, 평균 응답 시간, 마지막 시도)
+
+        Args:
+            student_id: 학생 ID
+            concepts: 개념 제한 (None이면 전체)
+
+        Returns:
+            {개념: 통계} 딕셔너리 (StudentAttemptRepository.aggregate_by_concept 참고)
+        """
+        return await self.repository.aggregate_by_concept(student_id, concepts)
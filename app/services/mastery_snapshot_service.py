@@ -0,0 +1,231 @@
+"""
+Mastery Snapshot Service
+
+학생-개념별 숙련도 스냅샷(student_concept_mastery) 갱신과 조회
+
+책임:
+- 스냅샷과 다른 학생-개념 상태(student_mastery_states)를 배치로 찾아 그 행만 재계산
+- 허용 지연 이내의 스냅샷이면 스냅샷으로 프로파일 응답, 아니면 실시간 계산
+- 응답에 스냅샷 지연(staleness) 보고
+- 학교/학년 코호트의 개념별 숙련도 분포와 미달 학생 조회 (스냅샷 집계 쿼리)
+
+지연(staleness)은 워커 진행 상황으로 계산한다.
+- 조회 범위(학생 또는 코호트)에 반영되지 않은 상태 변경이 없으면 0
+  (시도가 없는 개념의 스냅샷은 오래되어도 정확하다)
+- 있으면 워커가 밀린 쌍을 마지막으로 모두 반영한 시각(caught_up_at)부터의 경과 시간
+  (그 이전 커밋은 모두 반영되었으므로 빠진 변경은 그 이후의 것뿐이다)
+- 망각 감쇠를 쓰는 개념은 스냅샷 값이 갱신 시점까지만 감쇠되어 있으므로
+  행 갱신 후 경과 시간도 포함한다
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+from app.services.mastery_service import MasteryService
+
+logger = logging.getLogger(__name__)
+
+SOURCE_SNAPSHOT = "snapshot"
+SOURCE_LIVE = "live"
+
+
+class MasterySnapshotService:
+    """숙련도 스냅샷 서비스"""
+
+    def __init__(
+        self,
+        mastery_service: MasteryService,
+        snapshot_repository: MasterySnapshotRepository
+    ):
+        """
+        서비스 초기화
+
+        Args:
+            mastery_service: 스냅샷 값 계산에 사용할 MasteryService
+            snapshot_repository: MasterySnapshotRepository 인스턴스
+        """
+        self.mastery_service = mastery_service
+        self.snapshot_repository = snapshot_repository
+
+    async def refresh(self, batch_size: int = 1000) -> Dict[str, Any]:
+        """
+        반영되지 않은 학생-개념 상태 한 배치를 스냅샷에 반영
+
+        상태는 시도와 같은 트랜잭션에서 갱신되므로, 늦게 커밋된 긴 트랜잭션(대량 적재 등)의
+        시도도 커밋되는 순간 대상에 나타난다. 스냅샷에는 조회 시점의 상태
+        last_attempt_id를 기록하므로, 계산 도중 새 시도가 들어오면 다음 배치에서 다시 계산한다.
+
+        Args:
+            batch_size: 한 번에 갱신할 최대 학생-개념 쌍 수
+
+        밀린 쌍을 모두 처리한 배치는 조회 시작 시각을 워커 진행 시각으로 기록한다.
+
+        Returns:
+            {"snapshots": 갱신한 행 수, "caught_up": 밀린 쌍을 모두 처리했는지}
+        """
+        started_at = datetime.utcnow()
+        pending = await self.snapshot_repository.get_pending(limit=batch_size)
+        if not pending:
+            await self.snapshot_repository.mark_caught_up(started_at)
+            return {"snapshots": 0, "caught_up": True}
+
+        # 학생별 {개념: 상태의 last_attempt_id}
+        affected: Dict[str, Dict[str, int]] = {}
+        for student_id, concept, last_attempt_id, _ in pending:
+            affected.setdefault(student_id, {})[concept] = last_attempt_id
+
+        refreshed_at = datetime.utcnow()
+        snapshots = []
+        for student_id, concepts in affected.items():
+            mastery = await self.mastery_service.calculate_multiple_concepts_mastery(
+                student_id, list(concepts)
+            )
+            snapshots.extend(
+                {
+                    "student_id": student_id,
+                    "concept": concept,
+                    "p_mastery": mastery[concept],
+                    "last_attempt_id": last_attempt_id,
+                }
+                for concept, last_attempt_id in concepts.items()
+            )
+
+        saved = await self.snapshot_repository.save_many(snapshots, refreshed_at)
+        caught_up = len(pending) < batch_size
+        if caught_up:
+            await self.snapshot_repository.mark_caught_up(started_at)
+        return {"snapshots": saved, "caught_up": caught_up}
+
+    async def get_profile(
+        self,
+        student_id: str,
+        max_staleness_seconds: float
+    ) -> Dict[str, Any]:
+        """
+        학생 숙련도 프로파일 (허용 지연 이내면 스냅샷)
+
+        Args:
+            student_id: 학생 ID
+            max_staleness_seconds: 스냅샷 허용 지연 (초, 0이면 항상 실시간)
+
+        Returns:
+            {"profile": {개념: 숙련도}, "source": "snapshot" | "live",
+             "staleness_seconds": 스냅샷 지연 (실시간이면 0.0)}
+        """
+        rows = await self.snapshot_repository.get_by_student(student_id)
+
+        if rows and max_staleness_seconds > 0:
+            staleness = await self._staleness(
+                [(row.concept, row.refreshed_at) for row in rows],
+                student_id=student_id
+            )
+            if staleness <= max_staleness_seconds:
+                return {
+                    "profile": {row.concept: row.p_mastery for row in rows},
+                    "source": SOURCE_SNAPSHOT,
+                    "staleness_seconds": staleness,
+                }
+
+        profile = await self.mastery_service.get_student_mastery_profile(student_id)
+        return {"profile": profile, "source": SOURCE_LIVE, "staleness_seconds": 0.0}
+
+    async def get_cohort_concepts(
+        self,
+        school_id: str,
+        grade: Optional[int] = None,
+        threshold: float = 0.5,
+        concepts: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        코호트의 개념별 숙련도 분포 (약한 개념 먼저)
+
+        학생별 MasteryService 계산 없이 스냅샷을 한 번에 집계한다.
+
+        Args:
+            school_id: 학교 ID
+            grade: 학년 (None이면 학교 전체)
+            threshold: 미달 판단 임계값
+            concepts: 개념 제한 (None이면 전체)
+            limit: 최대 개념 수
+
+        Returns:
+            {"concepts": [개념별 분포], "staleness_seconds": 스냅샷 지연 (모듈 설명 참고)}
+        """
+        rows = await self.snapshot_repository.aggregate_concepts(
+            school_id, grade=grade, threshold=threshold, concepts=concepts, limit=limit
+        )
+        return {
+            "concepts": rows,
+            "staleness_seconds": await self._staleness(
+                [(row["concept"], row["oldest_refreshed_at"]) for row in rows],
+                school_id=school_id, grade=grade, concepts=concepts
+            ),
+        }
+
+    async def get_cohort_students(
+        self,
+        school_id: str,
+        concept: str,
+        grade: Optional[int] = None,
+        threshold: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        코호트 학생의 개념 숙련도 (임계값 미만 필터 선택)
+
+        Args:
+            school_id: 학교 ID
+            concept: 개념명
+            grade: 학년 (None이면 학교 전체)
+            threshold: 이 값 미만 학생만 (None이면 전체)
+
+        Returns:
+            {"students": [학생별 숙련도와 코호트 백분위], "staleness_seconds": ...}
+        """
+        rows = await self.snapshot_repository.get_cohort_students(
+            school_id, concept, grade=grade, threshold=threshold
+        )
+        return {
+            "students": rows,
+            "staleness_seconds": await self._staleness(
+                [(concept, row["refreshed_at"]) for row in rows],
+                school_id=school_id, grade=grade, concepts=[concept]
+            ),
+        }
+
+    async def _staleness(
+        self,
+        refreshed: List[Tuple[str, datetime]],
+        **scope: Any
+    ) -> float:
+        """
+        스냅샷 지연 (초, 모듈 설명 참고)
+
+        워커가 아직 한 번도 따라잡지 못했으면(진행 기록 없음) 가장 오래된 행의
+        갱신 후 경과 시간을 쓴다.
+
+        Args:
+            refreshed: 응답에 포함된 스냅샷의 [(개념, 갱신 시각), ...]
+            **scope: get_pending 범위 (student_id 또는 school_id/grade/concepts)
+
+        Returns:
+            지연 (행이 없으면 0.0)
+        """
+        if not refreshed:
+            return 0.0
+
+        now = datetime.utcnow()
+        staleness = 0.0
+        if await self.snapshot_repository.get_pending(limit=1, **scope):
+            caught_up_at = await self.snapshot_repository.get_caught_up_at()
+            if caught_up_at is None:
+                caught_up_at = min(refreshed_at for _, refreshed_at in refreshed)
+            staleness = (now - caught_up_at).total_seconds()
+
+        # 망각 감쇠 개념은 스냅샷 값이 갱신 시점까지만 감쇠되어 있음
+        for concept, refreshed_at in refreshed:
+            if self.mastery_service.get_bkt(concept).time_dependent:
+                staleness = max(staleness, (now - refreshed_at).total_seconds())
+
+        return max(0.0, staleness)
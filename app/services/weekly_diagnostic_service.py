@@ -13,6 +13,7 @@ import logging
 
 from app.mcp.manager import MCPClientManager
 from app.models.workflow_session import WorkflowSession
+from app.repositories.item_bank_repository import ItemBankRepository
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ class Question:
     content: str
     difficulty: str
     concepts: List[str]
+    irt_difficulty: Optional[float] = None
 
 
 @dataclass
@@ -111,6 +113,12 @@ class WeeklyDiagnosticService:
             for q in questions_response.get("questions", [])
         ]
 
+        # 문항 은행에 보정된 IRT 난이도가 있으면 Q-DNA 난이도 라벨 대신 사용
+        calibrated = await ItemBankRepository(self.db).get_by_ids(q.id for q in questions)
+        for q in questions:
+            if q.id in calibrated:
+                q.irt_difficulty = calibrated[q.id].difficulty
+
         # Step 5: 워크플로우 세션 생성
         workflow_session = WorkflowSession(
             student_id=request.student_id,
@@ -119,7 +127,10 @@ class WeeklyDiagnosticService:
             workflow_metadata={
                 "curriculum_path": request.curriculum_path,
                 "weak_concepts": weak_concepts,
-                "questions": [{"id": q.id, "difficulty": q.difficulty} for q in questions],
+                "questions": [
+                    {"id": q.id, "difficulty": q.difficulty, "irt_difficulty": q.irt_difficulty}
+                    for q in questions
+                ],
                 "started_at": datetime.now().isoformat()
             }
         )
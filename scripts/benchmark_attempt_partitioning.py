@@ -0,0 +1,161 @@
+"""
+student_attempts 파티셔닝 벤치마크 (PostgreSQL)
+
+같은 합성 데이터를 일반 테이블과 월별 RANGE 파티션 테이블에 적재한 뒤
+최근 구간 쿼리(get_recent_attempts와 같은 형태)의 지연 시간과 실행 계획을 비교합니다.
+데이터는 generate_series로 서버에서 생성하므로 네트워크 전송이 없습니다.
+
+    bench_attempts_plain         일반 테이블 + student_attempts와 같은 인덱스
+    bench_attempts_partitioned   attempted_at 월별 RANGE 파티션 + 같은 인덱스
+
+Usage:
+    python scripts/benchmark_attempt_partitioning.py --rows 50000000 --months 24
+    python scripts/benchmark_attempt_partitioning.py --rows 1000000 --keep
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.db.session import engine
+from app.db.partitioning import add_months, month_floor, create_partition_ddl
+
+PLAIN = "bench_attempts_plain"
+PARTITIONED = "bench_attempts_partitioned"
+
+COLUMNS = """
+    id BIGINT NOT NULL,
+    student_id VARCHAR(100) NOT NULL,
+    question_id VARCHAR(100) NOT NULL,
+    concept VARCHAR(100) NOT NULL,
+    is_correct BOOLEAN NOT NULL,
+    response_time_ms INTEGER,
+    attempted_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+"""
+
+INDEXES = (
+    ("student_id", "student_id"),
+    ("concept", "concept"),
+    ("attempted_at", "attempted_at"),
+    ("student_concept", "student_id, concept"),
+    ("student_date", "student_id, attempted_at"),
+)
+
+QUERIES = {
+    "recent_7d (student)": (
+        "SELECT * FROM {table} WHERE student_id = :student_id "
+        "AND attempted_at >= :now - interval '7 days' ORDER BY attempted_at DESC"
+    ),
+    "recent_30d count (all)": (
+        "SELECT count(*) FROM {table} WHERE attempted_at >= :now - interval '30 days'"
+    ),
+    "full history (student)": (
+        "SELECT * FROM {table} WHERE student_id = :student_id ORDER BY attempted_at DESC"
+    ),
+}
+
+
+async def load(conn, table: str, rows: int, students: int, months: int, end: datetime):
+    """generate_series로 합성 시도 적재 (months개월에 균등 분포)"""
+    span_seconds = (end - add_months(month_floor(end), -months + 1)).total_seconds()
+    await conn.execute(text(f"""
+        INSERT INTO {table}
+        SELECT g,
+               'student_' || (g % {students}),
+               'q_' || (g % 5000),
+               'concept_' || (g % 40),
+               random() < 0.65,
+               (random() * 60000)::int,
+               :end - make_interval(secs => random() * {span_seconds})
+        FROM generate_series(1, {rows}) AS g
+    """), {"end": end})
+
+
+async def setup(rows: int, students: int, months: int, end: datetime):
+    """두 테이블 생성 및 적재"""
+    async with engine.begin() as conn:
+        for table in (PLAIN, PARTITIONED):
+            await conn.execute(text(f"DROP TABLE IF EXISTS {table} CASCADE"))
+
+        await conn.execute(text(f"CREATE TABLE {PLAIN} ({COLUMNS}, PRIMARY KEY (id))"))
+        await conn.execute(text(
+            f"CREATE TABLE {PARTITIONED} ({COLUMNS}, PRIMARY KEY (id, attempted_at)) "
+            f"PARTITION BY RANGE (attempted_at)"
+        ))
+        first = add_months(month_floor(end), -months + 1)
+        for offset in range(months + 1):
+            await conn.execute(text(create_partition_ddl(PARTITIONED, add_months(first, offset))))
+
+    for table in (PLAIN, PARTITIONED):
+        start = time.perf_counter()
+        async with engine.begin() as conn:
+            await load(conn, table, rows, students, months, end)
+            for suffix, columns in INDEXES:
+                await conn.execute(text(f"CREATE INDEX {table}_{suffix} ON {table} ({columns})"))
+            await conn.execute(text(f"ANALYZE {table}"))
+        print(f"loaded {table:28s} {time.perf_counter() - start:8.1f}s")
+
+
+async def measure(query: str, params: dict, repeat: int):
+    """쿼리 지연 시간 측정 (ms, 중앙값/p95)과 실행 계획"""
+    async with engine.connect() as conn:
+        plan = [row[0] for row in await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"), params)]
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await conn.execute(text(query), params)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return statistics.median(timings), p95, plan
+
+
+def scanned_partitions(plan) -> int:
+    """실행 계획에서 스캔한 파티션 수"""
+    return sum(1 for line in plan if PARTITIONED in line and " on " in line)
+
+
+async def run(args):
+    end = datetime.utcnow()
+    if not args.skip_load:
+        await setup(args.rows, args.students, args.months, end)
+
+    params = {"student_id": "student_7", "now": end}
+    print(f"\n{'query':26s} {'table':12s} {'median ms':>10s} {'p95 ms':>10s} {'partitions':>11s}")
+    for name, template in QUERIES.items():
+        for label, table in (("plain", PLAIN), ("partitioned", PARTITIONED)):
+            median, p95, plan = await measure(template.format(table=table), params, args.repeat)
+            partitions = scanned_partitions(plan) if table == PARTITIONED else "-"
+            print(f"{name:26s} {label:12s} {median:10.2f} {p95:10.2f} {partitions!s:>11s}")
+            if args.verbose:
+                print("\n".join(f"    {line}" for line in plan))
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            for table in (PLAIN, PARTITIONED):
+                await conn.execute(text(f"DROP TABLE IF EXISTS {table} CASCADE"))
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="student_attempts partitioning benchmark")
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--students", type=int, default=200_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--skip-load", action="store_true", help="기존 벤치마크 테이블 재사용")
+    parser.add_argument("--keep", action="store_true", help="종료 후 테이블 유지")
+    parser.add_argument("--verbose", action="store_true", help="실행 계획 출력")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
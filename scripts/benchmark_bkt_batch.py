@@ -0,0 +1,79 @@
+"""
+BKT 배치 계산 벤치마크
+
+calculate_mastery(시퀀스별 Python 루프)와 calculate_mastery_batch(packed NumPy 배열)의
+실행 시간을 비교하고, 두 결과가 1e-12 이내로 일치하는지 확인합니다.
+
+Usage:
+    python scripts/benchmark_bkt_batch.py --sequences 20000 --max-length 60
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.algorithms.bkt import BayesianKnowledgeTracing
+
+
+def generate_sequences(n_sequences: int, max_length: int, seed: int):
+    """무작위 길이/정답률의 시도 시퀀스 생성"""
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(0, max_length + 1, size=n_sequences)
+    accuracies = rng.uniform(0.2, 0.9, size=n_sequences)
+    return [
+        (rng.random(length) < accuracy).tolist()
+        for length, accuracy in zip(lengths, accuracies)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BKT batch benchmark")
+    parser.add_argument("--sequences", type=int, default=20000)
+    parser.add_argument("--max-length", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    bkt = BayesianKnowledgeTracing()
+    sequences = generate_sequences(args.sequences, args.max_length, args.seed)
+    total_attempts = sum(len(sequence) for sequence in sequences)
+
+    print("=== BKT 배치 벤치마크 ===")
+    print(f"시퀀스: {args.sequences:,}개, 총 시도: {total_attempts:,}개\n")
+
+    # 기존 경로: 시퀀스마다 dict 리스트를 순회
+    attempt_lists = [
+        [{"is_correct": is_correct} for is_correct in sequence]
+        for sequence in sequences
+    ]
+    start = time.perf_counter()
+    scalar_result = np.array([bkt.calculate_mastery(attempts) for attempts in attempt_lists])
+    scalar_elapsed = time.perf_counter() - start
+
+    # 배치 경로: packing 시간은 별도 측정
+    start = time.perf_counter()
+    offsets, outcomes = BayesianKnowledgeTracing.pack_sequences(sequences)
+    pack_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_result = bkt.calculate_mastery_batch(offsets, outcomes)
+    batch_elapsed = time.perf_counter() - start
+
+    max_diff = float(np.max(np.abs(scalar_result - batch_result))) if len(sequences) else 0.0
+
+    print(f"scalar loop : {scalar_elapsed * 1000:10.1f} ms")
+    print(f"batch       : {batch_elapsed * 1000:10.1f} ms (packing {pack_elapsed * 1000:.1f} ms 별도)")
+    print(f"speedup     : {scalar_elapsed / batch_elapsed:10.1f}x")
+    print(f"max |diff|  : {max_diff:.3e}")
+
+    if max_diff > 1e-12:
+        print("❌ 결과 불일치")
+        sys.exit(1)
+    print("✅ 결과 일치 (<= 1e-12)")
+
+
+if __name__ == "__main__":
+    main()
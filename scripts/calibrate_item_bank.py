@@ -0,0 +1,69 @@
+"""
+문항 은행 IRT 보정 스크립트
+
+student_attempts 테이블을 청크 단위로 스트리밍해 JMLE로 문항 난이도(와 2PL 변별도)를
+학생 능력과 함께 추정하고 item_bank 테이블에 저장합니다.
+
+--checkpoint 경로를 주면 주기적으로 중간 상태를 저장하며, 중단 후 같은 명령으로
+다시 실행하면 마지막 체크포인트부터 이어서 반복합니다.
+
+실행 중인 API 서버에는 POST /api/v1/workflows/item-bank/refresh 로 반영합니다.
+
+Usage:
+    python scripts/calibrate_item_bank.py --model 2PL --checkpoint /tmp/item_bank.npz
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.algorithms.irt_calibration import JointMLECalibrator
+from app.db.session import get_db_session
+from app.repositories.student_attempt_repository import StudentAttemptRepository
+from app.repositories.item_bank_repository import ItemBankRepository
+from app.services.irt_calibration_service import IRTCalibrationService
+
+
+async def calibrate(args):
+    """문항 보정 실행"""
+    print(f"=== 문항 은행 보정 시작 ({args.model}) ===\n")
+    start = time.perf_counter()
+
+    async with get_db_session() as db:
+        service = IRTCalibrationService(
+            StudentAttemptRepository(db),
+            ItemBankRepository(db),
+            JointMLECalibrator(model=args.model, max_iterations=args.max_iterations)
+        )
+        summary = await service.calibrate(
+            chunk_size=args.chunk_size,
+            min_responses=args.min_responses,
+            checkpoint_path=args.checkpoint,
+            checkpoint_every=args.checkpoint_every
+        )
+
+    elapsed = time.perf_counter() - start
+
+    print(f"학생 {summary['n_students']:,}명, 문항 {summary['n_items']:,}개, 응답 {summary['n_responses']:,}개")
+    print(f"반복 {summary['iteration']}회 (수렴: {summary['converged']})")
+    print(f"\n✅ {summary['saved']:,}개 문항 저장 ({elapsed:.1f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate item bank with joint maximum likelihood")
+    parser.add_argument("--model", choices=JointMLECalibrator.MODELS, default="1PL")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--min-responses", type=int, default=30)
+    parser.add_argument("--max-iterations", type=int, default=100)
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file path (.npz)")
+    parser.add_argument("--checkpoint-every", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(calibrate(args))
+
+
+if __name__ == "__main__":
+    main()
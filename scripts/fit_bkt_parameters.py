@@ -0,0 +1,61 @@
+"""
+개념별 BKT 파라미터 적합 스크립트
+
+student_attempts 테이블을 청크 단위로 스트리밍하며 개념별 BKT 파라미터를
+그리드 서치로 추정하고 bkt_parameters 테이블에 저장합니다.
+
+실행 중인 API 서버에는 POST /api/mastery/parameters/refresh 로 반영합니다.
+
+Usage:
+    python scripts/fit_bkt_parameters.py --chunk-size 10000 --min-attempts 50
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import get_db_session
+from app.repositories.student_attempt_repository import StudentAttemptRepository
+from app.repositories.bkt_parameter_repository import BKTParameterRepository
+from app.services.bkt_fitting_service import BKTFittingService
+
+
+async def fit(chunk_size: int, min_attempts: int):
+    """파라미터 적합 실행"""
+    print("=== BKT 파라미터 적합 시작 ===\n")
+    start = time.perf_counter()
+
+    async with get_db_session() as db:
+        service = BKTFittingService(
+            StudentAttemptRepository(db),
+            BKTParameterRepository(db)
+        )
+        fitted = await service.fit_all(chunk_size=chunk_size, min_attempts=min_attempts)
+
+    elapsed = time.perf_counter() - start
+
+    for concept, params in sorted(fitted.items()):
+        print(
+            f"{concept:20s} "
+            f"L0={params['p_init']:.2f} T={params['p_learn']:.2f} "
+            f"S={params['p_slip']:.2f} G={params['p_guess']:.2f} "
+            f"(시퀀스 {params['n_sequences']:,}, 시도 {params['n_attempts']:,})"
+        )
+
+    print(f"\n✅ {len(fitted)}개 개념 저장 ({elapsed:.1f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit per-concept BKT parameters")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--min-attempts", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(fit(args.chunk_size, args.min_attempts))
+
+
+if __name__ == "__main__":
+    main()
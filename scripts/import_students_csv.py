@@ -0,0 +1,138 @@
+"""
+학생 CSV 일괄 등록 스크립트
+
+CSV를 한 줄씩 읽어 StudentRepository.bulk_upsert()/bulk_update()에 청크 단위로
+넘긴다 (파일 전체를 메모리에 올리지 않음). 전체가 한 트랜잭션으로 반영된다.
+
+CSV 헤더: id,name,grade,school_id
+- id가 비어 있으면 자동 생성 (업서트 모드)
+- school_id 열이 없거나 비어 있으면 --school-id 값 사용
+- --update-only 모드에서는 id만 필수이며 빈 칸은 기존 값 유지
+
+형식이 잘못된 행은 건너뛰고 줄 번호와 함께 보고한다.
+
+Usage:
+    python scripts/import_students_csv.py students.csv --school-id school_001
+    python scripts/import_students_csv.py students.csv --skip-existing --chunk-size 1000
+    python scripts/import_students_csv.py grades_2027.csv --update-only
+"""
+import argparse
+import asyncio
+import csv
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import get_db_session, engine
+from app.repositories.student_repository import StudentRepository
+
+MAX_REPORTED_ERRORS = 20
+
+
+def read_student_rows(
+    stream: TextIO,
+    errors: List[Tuple[int, str]],
+    default_school_id: Optional[str] = None,
+    update_only: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    CSV 행을 학생 레코드로 변환하며 하나씩 생성
+
+    Args:
+        stream: CSV 텍스트 스트림
+        errors: 잘못된 행의 (줄 번호, 사유)를 추가할 리스트
+        default_school_id: school_id가 비었을 때 사용할 값
+        update_only: True면 id만 필수, 빈 칸은 None
+
+    Yields:
+        {"id", "name", "grade", "school_id"} 딕셔너리
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        line = reader.line_num
+        values = {key: (value or "").strip() for key, value in row.items() if key}
+        record: Dict[str, Any] = {
+            "id": values.get("id") or None,
+            "name": values.get("name") or None,
+            "grade": values.get("grade") or None,
+            "school_id": values.get("school_id") or default_school_id,
+        }
+
+        required = ("id",) if update_only else ("name", "grade", "school_id")
+        missing = [column for column in required if not record[column]]
+        if missing:
+            errors.append((line, f"missing {', '.join(missing)}"))
+            continue
+
+        if record["grade"] is not None:
+            try:
+                record["grade"] = int(record["grade"])
+            except ValueError:
+                errors.append((line, f"invalid grade: {record['grade']!r}"))
+                continue
+
+        yield record
+
+
+async def import_students(
+    path: str,
+    chunk_size: int,
+    default_school_id: Optional[str] = None,
+    skip_existing: bool = False,
+    update_only: bool = False
+) -> Dict[str, Any]:
+    """CSV 적재 실행"""
+    errors: List[Tuple[int, str]] = []
+
+    with open(path, newline="", encoding="utf-8-sig") as stream:
+        rows = read_student_rows(stream, errors, default_school_id, update_only)
+        async with get_db_session() as db:
+            repo = StudentRepository(db)
+            if update_only:
+                result = await repo.bulk_update(rows, chunk_size=chunk_size)
+            else:
+                result = await repo.bulk_upsert(
+                    rows, chunk_size=chunk_size, update_existing=not skip_existing
+                )
+
+    await engine.dispose()
+    result["errors"] = errors
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import students from a CSV file")
+    parser.add_argument("path", help="CSV 파일 경로 (헤더: id,name,grade,school_id)")
+    parser.add_argument("--chunk-size", type=int, default=StudentRepository.BULK_CHUNK_SIZE,
+                        help="문장당 행 수")
+    parser.add_argument("--school-id", help="school_id가 비어 있는 행에 사용할 학교 ID")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--skip-existing", action="store_true",
+                      help="이미 있는 학생은 수정하지 않음 (ON CONFLICT DO NOTHING)")
+    mode.add_argument("--update-only", action="store_true",
+                      help="기존 학생만 수정 (없는 ID는 보고만 함)")
+    args = parser.parse_args()
+
+    result = asyncio.run(import_students(
+        args.path, args.chunk_size, args.school_id, args.skip_existing, args.update_only
+    ))
+
+    errors = result.pop("errors")
+    for line, reason in errors[:MAX_REPORTED_ERRORS]:
+        print(f"line {line}: {reason}", file=sys.stderr)
+    if len(errors) > MAX_REPORTED_ERRORS:
+        print(f"... {len(errors) - MAX_REPORTED_ERRORS} more invalid rows", file=sys.stderr)
+
+    if args.update_only:
+        print(f"✅ updated {result['updated']}, missing {len(result['missing'])}, invalid {len(errors)}")
+    else:
+        print(
+            f"✅ inserted {result['inserted']}, updated {result['updated']}, "
+            f"skipped {result['skipped']}, conflicts {len(result['conflicts'])}, invalid {len(errors)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
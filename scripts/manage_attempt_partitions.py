@@ -0,0 +1,62 @@
+"""
+student_attempts 월 파티션 관리 스크립트 (PostgreSQL)
+
+- 현재 월부터 --ahead개월 뒤까지 파티션을 미리 생성
+- --detach-before 월 이전 파티션을 분리해 보관 (분리된 테이블은 pg_dump 후 DROP)
+
+매월 cron 등으로 실행합니다. DEFAULT 파티션에 행이 쌓인 월은 파티션을 만들 수 없으므로
+--ahead를 충분히 크게 둡니다. DEFAULT 파티션이 있으면 DETACH ... CONCURRENTLY를 쓸 수
+없으므로 분리는 일반 DETACH로 한 트랜잭션에서 실행합니다.
+
+Usage:
+    python scripts/manage_attempt_partitions.py --ahead 3
+    python scripts/manage_attempt_partitions.py --detach-before 2025-01
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import engine
+from app.db.partitioning import (
+    add_months, month_floor, list_partitions, ensure_partitions, detach_partitions_before
+)
+
+
+async def manage(ahead: int, detach_before: datetime = None):
+    """파티션 생성/분리 실행"""
+    now = month_floor(datetime.utcnow())
+
+    async with engine.begin() as conn:
+        created = await ensure_partitions(conn, now, add_months(now, ahead))
+    for name in created:
+        print(f"created  {name}")
+
+    if detach_before is not None:
+        async with engine.begin() as conn:
+            detached = await detach_partitions_before(conn, detach_before)
+        for name in detached:
+            print(f"detached {name}")
+
+    async with engine.connect() as conn:
+        partitions = await list_partitions(conn)
+    print(f"\n✅ {len(partitions)}개 파티션 연결됨")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage student_attempts monthly partitions")
+    parser.add_argument("--ahead", type=int, default=3, help="미리 만들 개월 수")
+    parser.add_argument("--detach-before", type=lambda v: datetime.strptime(v, "%Y-%m"),
+                        help="이 월(YYYY-MM) 이전 파티션 분리")
+    args = parser.parse_args()
+
+    asyncio.run(manage(args.ahead, args.detach_before))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,11 @@ from app.models.workflow_template import WorkflowTemplate
 from app.models.custom_tool import CustomTool
 from app.models.workflow_session import WorkflowSession
 from app.models.student_attempt import StudentAttempt
+from app.models.student_mastery_state import StudentMasteryState
+from app.models.bkt_parameters import BKTParameters
+from app.models.item_bank import ItemBankItem
+from app.models.student_concept_mastery import StudentConceptMastery
+from app.models.mastery_snapshot_progress import MasterySnapshotProgress
 
 
 # Event Loop Fixture
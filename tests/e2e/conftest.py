@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 
 from app.db.base import Base
 from app.api_app import app
-from app.db.session import get_db
+from app.db.session import get_db, get_replica_db
 from app.config import settings
 
 # Import models
@@ -68,6 +68,7 @@ def run_server(port: int, db_url: str):
                 await session.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_replica_db] = override_get_db
 
     uvicorn.run(app, host="127.0.0.1", port=port, log_level="error")
 
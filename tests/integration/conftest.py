@@ -11,11 +11,16 @@ from sqlalchemy.pool import StaticPool
 
 from app.db.base import Base
 from app.api_app import app
-from app.db.session import get_db
+from app.db.session import get_db, get_replica_db
 
 # Import all models
 from app.models.student import Student
 from app.models.student_attempt import StudentAttempt
+from app.models.student_mastery_state import StudentMasteryState
+from app.models.bkt_parameters import BKTParameters
+from app.models.item_bank import ItemBankItem
+from app.models.student_concept_mastery import StudentConceptMastery
+from app.models.mastery_snapshot_progress import MasterySnapshotProgress
 from app.models.workflow_session import WorkflowSession
 
 # Import MockMCPManager from parent conftest
@@ -77,11 +82,21 @@ async def api_client(db_session):
     def override_get_mcp_manager():
         return mock_mcp_manager
 
+    # 병렬 숙련도 계산용 세션 팩토리도 테스트 엔진으로
+    test_session_maker = async_sessionmaker(
+        db_session.bind,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+
     # Import the dependency function from routers
     from app.routers.workflows import get_mcp_manager
+    from app.routers.mastery import get_session_factory
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_replica_db] = override_get_db
     app.dependency_overrides[get_mcp_manager] = override_get_mcp_manager
+    app.dependency_overrides[get_session_factory] = lambda: test_session_maker
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -0,0 +1,84 @@
+"""
+Integration Tests for Adaptive Diagnostic API
+
+적응형(CAT) 진단 엔드포인트 테스트
+"""
+import pytest
+
+
+@pytest.fixture
+def item_bank_index():
+    """문항 은행 인덱스 캐시를 테스트 문항으로 교체"""
+    from app.algorithms.item_bank_index import ItemBankIndex
+    from app.services.item_bank_store import ItemBankIndexStore
+
+    ItemBankIndexStore._instance = ItemBankIndex([
+        {"question_id": f"q{i}", "concept": "일차함수", "difficulty": -2.0 + 0.5 * i, "discrimination": 1.5}
+        for i in range(9)
+    ])
+    yield ItemBankIndexStore._instance
+    ItemBankIndexStore.invalidate()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_adaptive_diagnostic_api_flow(api_client, item_bank_index):
+    """
+    Test: POST /api/v1/workflows/adaptive-diagnostic → 응답 제출 반복
+    Expected: 최대 문항 수에서 completed, 잘못된 응답 409, 없는 세션 404
+    """
+    response = await api_client.post(
+        "/api/v1/workflows/adaptive-diagnostic",
+        json={"student_id": "student_api_cat", "max_items": 3}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "in_progress"
+    assert data["next_question"]["question_id"] == "q4"
+
+    wrong = await api_client.post(
+        f"/api/v1/workflows/adaptive-diagnostic/{data['workflow_id']}/responses",
+        json={"question_id": "q0", "is_correct": True}
+    )
+    assert wrong.status_code == 409
+
+    while data["next_question"] is not None:
+        response = await api_client.post(
+            f"/api/v1/workflows/adaptive-diagnostic/{data['workflow_id']}/responses",
+            json={"question_id": data["next_question"]["question_id"], "is_correct": True}
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+    assert data["status"] == "completed"
+    assert data["answered"] == 3
+    assert data["theta"] > 0
+
+    missing = await api_client.post(
+        "/api/v1/workflows/adaptive-diagnostic/wf_missing/responses",
+        json={"question_id": "q1", "is_correct": True}
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_refresh_item_bank_api(api_client, db_session):
+    """
+    Test: POST /api/v1/workflows/item-bank/refresh
+    Expected: item_bank 테이블 내용으로 인덱스 재구성
+    """
+    from app.repositories.item_bank_repository import ItemBankRepository
+    from app.services.item_bank_store import ItemBankIndexStore
+
+    await ItemBankRepository(db_session).save_many([
+        {"question_id": "q1", "concept": "일차함수", "difficulty": 0.1},
+        {"question_id": "q2", "concept": "일차함수", "difficulty": 0.9},
+    ])
+
+    response = await api_client.post("/api/v1/workflows/item-bank/refresh")
+    assert response.status_code == 200
+    assert response.json() == {"items": 2}
+    assert len(await ItemBankIndexStore.get_instance(db_session)) == 2
+
+    ItemBankIndexStore.invalidate()
@@ -242,3 +242,291 @@ async def test_api_validation_error(api_client):
         }
     )
     assert response.status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_refresh_bkt_parameters_api(api_client, db_session):
+    """
+    Test: POST /api/mastery/parameters/refresh
+    Expected: 200 OK, 재시작 없이 적합 파라미터가 계산에 반영됨
+    """
+    from app.repositories.bkt_parameter_repository import BKTParameterRepository
+    from app.services.bkt_parameter_store import BKTParameterStore
+
+    BKTParameterStore.invalidate()
+    await api_client.post("/api/mastery/calculate", json={"student_id": "student_1", "concept": "A"})
+
+    # Given: 서버가 캐시를 로드한 뒤 새 파라미터 저장
+    await BKTParameterRepository(db_session).save(
+        "A", {"p_init": 0.7, "p_learn": 0.2, "p_slip": 0.1, "p_guess": 0.2}
+    )
+
+    # When
+    response = await api_client.post("/api/mastery/parameters/refresh")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"concepts": 1}
+
+    response = await api_client.post("/api/mastery/calculate", json={"student_id": "student_1", "concept": "A"})
+    assert response.json()["mastery"] == pytest.approx(0.7)
+
+    BKTParameterStore.invalidate()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_mastery_trajectory_api(api_client, db_session):
+    """
+    Test: GET /api/mastery/trajectory
+    Expected: 200 OK, 시도별 숙련도 궤적 반환
+    """
+    from app.models.student_attempt import StudentAttempt
+
+    attempts = [
+        StudentAttempt(student_id="student_1", question_id="q_1", concept="A", is_correct=True,
+                       attempted_at=datetime(2026, 1, 1, 9, 0)),
+        StudentAttempt(student_id="student_1", question_id="q_2", concept="A", is_correct=False,
+                       attempted_at=datetime(2026, 1, 1, 9, 5)),
+    ]
+    for attempt in attempts:
+        db_session.add(attempt)
+    await db_session.commit()
+
+    response = await api_client.get(
+        "/api/mastery/trajectory",
+        params={"student_id": "student_1", "concept": "A", "smoothed": True}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["smoothed"] is True
+    assert [p["is_correct"] for p in data["points"]] == [True, False]
+    assert all(p["smoothed_mastery"] is not None for p in data["points"])
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_calculate_batch_mastery_api(api_client, db_session):
+    """
+    Test: POST /api/mastery/calculate-batch
+    Expected: 요청한 개념 순서대로 숙련도, 시도 없는 개념은 초기 숙련도
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+
+    repo = StudentAttemptRepository(db_session)
+    await repo.create_attempt("student_batch", "q_1", "A", True)
+    await repo.create_attempt("student_batch", "q_2", "B", False)
+
+    response = await api_client.post(
+        "/api/mastery/calculate-batch",
+        json={"student_id": "student_batch", "concepts": ["B", "A", "C"]}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert list(data["mastery"]) == ["B", "A", "C"]
+    assert data["mastery"]["A"] > data["mastery"]["B"]
+    assert data["mastery"]["C"] == pytest.approx(0.1)
+
+    empty = await api_client.post(
+        "/api/mastery/calculate-batch",
+        json={"student_id": "student_batch", "concepts": []}
+    )
+    assert empty.status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_mastery_profile_reads_snapshot_api(api_client, db_session):
+    """
+    Test: GET /api/mastery/profile/{student_id}, weak-concepts (스냅샷)
+    Expected: 허용 지연 이내면 source="snapshot", max_staleness_seconds=0이면 실시간
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+    from app.services.mastery_service import MasteryService
+    from app.services.mastery_snapshot_service import MasterySnapshotService
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    repo = StudentAttemptRepository(db_session)
+    await repo.create_attempt("student_snap", "q_1", "A", True)
+    await repo.create_attempt("student_snap", "q_2", "B", False)
+
+    response = await api_client.get("/api/mastery/profile/student_snap")
+    assert response.status_code == 200
+    assert response.json()["source"] == "live"
+
+    bkt = BayesianKnowledgeTracing()
+    await MasterySnapshotService(
+        MasteryService(repo, bkt), MasterySnapshotRepository(db_session)
+    ).refresh()
+
+    response = await api_client.get("/api/mastery/profile/student_snap")
+    data = response.json()
+    assert data["source"] == "snapshot"
+    assert data["staleness_seconds"] >= 0
+    assert set(data["profile"]) == {"A", "B"}
+
+    live = await api_client.get(
+        "/api/mastery/profile/student_snap", params={"max_staleness_seconds": 0}
+    )
+    assert live.json()["source"] == "live"
+    assert live.json()["profile"] == pytest.approx(data["profile"], abs=1e-6)
+
+    weak = await api_client.get("/api/mastery/weak-concepts/student_snap")
+    assert weak.json()["source"] == "snapshot"
+    assert [c["concept"] for c in weak.json()["weak_concepts"]] == ["B"]
+
+    invalid = await api_client.get(
+        "/api/mastery/profile/student_snap", params={"max_staleness_seconds": -1}
+    )
+    assert invalid.status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_cohort_mastery_api(api_client, db_session):
+    """
+    Test: GET /api/mastery/cohort/{school_id}/concepts, /students
+    Expected: 약한 개념 먼저 분포 반환, 임계값 미만 학생 목록
+    """
+    from app.models.student import Student
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    values = {"s1": (0.2, 0.9), "s2": (0.4, 0.8), "s3": (0.7, 0.6), "s4": (0.3, 0.95)}
+    snapshots = []
+    for student_id, (quadratic, trig) in values.items():
+        db_session.add(Student(id=student_id, name=student_id, grade=3, school_id="school_x"))
+        snapshots.append({"student_id": student_id, "concept": "이차방정식",
+                          "p_mastery": quadratic, "last_attempt_id": 1})
+        snapshots.append({"student_id": student_id, "concept": "삼각함수",
+                          "p_mastery": trig, "last_attempt_id": 1})
+    db_session.add(Student(id="other", name="other", grade=2, school_id="school_x"))
+    snapshots.append({"student_id": "other", "concept": "이차방정식", "p_mastery": 0.1, "last_attempt_id": 1})
+    await db_session.commit()
+    await MasterySnapshotRepository(db_session).save_many(snapshots, datetime.utcnow())
+
+    response = await api_client.get("/api/mastery/cohort/school_x/concepts", params={"grade": 3})
+    assert response.status_code == 200
+    data = response.json()
+    assert [c["concept"] for c in data["concepts"]] == ["이차방정식", "삼각함수"]
+    weakest = data["concepts"][0]
+    assert weakest["students"] == 4
+    assert weakest["mean"] == pytest.approx(0.4)
+    assert weakest["below_threshold"] == 3
+    assert weakest["p50"] == pytest.approx(0.3)
+    assert data["staleness_seconds"] >= 0
+
+    response = await api_client.get(
+        "/api/mastery/cohort/school_x/students",
+        params={"concept": "이차방정식", "grade": 3, "threshold": 0.5}
+    )
+    assert response.status_code == 200
+    students = response.json()["students"]
+    assert [s["student_id"] for s in students] == ["s1", "s4", "s2"]
+
+    whole_school = await api_client.get(
+        "/api/mastery/cohort/school_x/students", params={"concept": "이차방정식"}
+    )
+    assert [s["student_id"] for s in whole_school.json()["students"]][0] == "other"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_bulk_ingest_attempts_api(api_client):
+    """
+    Test: POST /api/attempts/bulk (JSON 배열, NDJSON)
+    Expected: 유효한 행 적재, 행별 오류와 처리량 보고, 숙련도 반영
+    """
+    rows = [
+        {"student_id": "student_bulk", "question_id": f"q_{i}", "concept": "확률", "is_correct": True}
+        for i in range(50)
+    ]
+    rows.append({"student_id": "student_bulk", "question_id": "q_bad", "concept": "확률"})
+
+    response = await api_client.post("/api/attempts/bulk", json=rows)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inserted"] == 50
+    assert data["rejected"] == 1
+    assert data["errors"][0]["index"] == 50
+    assert data["rows_per_second"] > 0
+
+    ndjson = "\n".join(
+        '{"student_id": "student_bulk", "question_id": "q_x", "concept": "통계", "is_correct": false}'
+        for _ in range(3)
+    )
+    response = await api_client.post(
+        "/api/attempts/bulk", content=ndjson, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.json()["inserted"] == 3
+
+    attempts = await api_client.get("/api/attempts/student_bulk/확률")
+    assert len(attempts.json()["attempts"]) == 50
+
+    mastery = await api_client.post(
+        "/api/mastery/calculate", json={"student_id": "student_bulk", "concept": "확률"}
+    )
+    assert mastery.json()["mastery"] > 0.9
+
+    invalid = await api_client.post(
+        "/api/attempts/bulk", content="{}", headers={"Content-Type": "application/json"}
+    )
+    assert invalid.status_code == 400
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_student_attempts_cursor_pagination_api(api_client, db_session):
+    """
+    Test: GET /api/attempts/{student_id}/{concept}?limit=&cursor=
+    Expected: next_cursor로 전체를 최신순 순회, 잘못된 커서는 400
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+
+    repo = StudentAttemptRepository(db_session)
+    for i in range(7):
+        await repo.create_attempt("student_page", f"q_{i}", "극한", i % 2 == 0)
+
+    question_ids = []
+    params = {"limit": 3}
+    while True:
+        response = await api_client.get("/api/attempts/student_page/극한", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        question_ids.extend(a["question_id"] for a in data["attempts"])
+        if data["next_cursor"] is None:
+            break
+        params = {"limit": 3, "cursor": data["next_cursor"]}
+
+    assert question_ids == [f"q_{i}" for i in reversed(range(7))]
+
+    invalid = await api_client.get("/api/attempts/student_page/극한", params={"cursor": "bogus"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_concept_stats_api(api_client, db_session):
+    """
+    Test: GET /api/mastery/stats/{student_id}
+    Expected: 개념별 시도 통계, concepts 파라미터로 제한
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+
+    repo = StudentAttemptRepository(db_session)
+    await repo.create_attempt("student_stats", "q_1", "A", True, response_time_ms=1000)
+    await repo.create_attempt("student_stats", "q_2", "A", False, response_time_ms=2000)
+    await repo.create_attempt("student_stats", "q_3", "B", True)
+
+    response = await api_client.get("/api/mastery/stats/student_stats")
+    assert response.status_code == 200
+    stats = response.json()["stats"]
+    assert stats["A"]["attempts"] == 2
+    assert stats["A"]["accuracy"] == pytest.approx(0.5)
+    assert stats["A"]["mean_response_time_ms"] == pytest.approx(1500)
+    assert stats["B"]["mean_response_time_ms"] is None
+
+    limited = await api_client.get("/api/mastery/stats/student_stats", params={"concepts": ["B"]})
+    assert list(limited.json()["stats"]) == ["B"]
@@ -0,0 +1,27 @@
+"""
+Integration Tests for Metrics API
+
+Test Coverage:
+- GET /metrics/db-pool - DB 커넥션 풀 상태
+"""
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_db_pool_metrics_api(api_client):
+    """
+    Test: GET /metrics/db-pool
+    Expected: 200 OK, 풀 크기/체크아웃 수/대기 시간 히스토그램 반환
+    """
+    from app.config import settings
+
+    response = await api_client.get("/metrics/db-pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pool_class"] == "InstrumentedAsyncQueuePool"
+    assert data["size"] == settings.DB_POOL_SIZE
+    assert data["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert data["checked_out"] >= 0
+    assert data["wait"]["histogram"][-1]["le"] == "+Inf"
@@ -0,0 +1,87 @@
+"""
+PostgreSQL COPY Bulk Ingestion Tests
+
+asyncpg에서 StudentAttemptRepository.bulk_create_attempts의 COPY 경로가
+세션 트랜잭션 안에서 실행되는지 확인한다 (COPY 이후 실패 시 적재 행도 롤백).
+
+PostgreSQL에 연결할 수 없으면 건너뛴다.
+
+Usage:
+    pytest tests/integration/test_attempt_bulk_copy.py -m postgres --no-cov
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models.student_attempt import StudentAttempt
+from app.models.student_mastery_state import StudentMasteryState
+from app.repositories.student_attempt_repository import StudentAttemptRepository
+
+pytestmark = [pytest.mark.integration, pytest.mark.postgres]
+
+TABLES = [StudentAttempt.__table__, StudentMasteryState.__table__]
+
+
+@pytest_asyncio.fixture
+async def copy_engine():
+    """student_attempts/student_mastery_states를 새로 만든 PostgreSQL 테스트 DB 엔진 (연결 불가 시 skip)"""
+    engine = create_async_engine(settings.TEST_DATABASE_URL, echo=False)
+    try:
+        async with asyncio.timeout(5):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL test database unavailable: {e}")
+
+    async with engine.begin() as conn:
+        for table in TABLES:
+            await conn.run_sync(table.drop, checkfirst=True)
+            await conn.run_sync(table.create)
+
+    yield engine
+
+    async with engine.begin() as conn:
+        for table in TABLES:
+            await conn.run_sync(table.drop, checkfirst=True)
+    await engine.dispose()
+
+
+def _rows(count):
+    return [
+        {"student_id": f"student_{i % 3}", "question_id": f"q_{i}", "concept": "미분", "is_correct": i % 2 == 0}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_copy_rolls_back_when_state_update_fails(copy_engine, monkeypatch):
+    """
+    Test: COPY 이후 상태 갱신 단계에서 실패
+    Expected: COPY로 넣은 행도 남지 않음, 성공 시에는 상태까지 함께 커밋
+    """
+    session_maker = async_sessionmaker(copy_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def fail(records):
+        raise RuntimeError("state update failed")
+
+    async with session_maker() as session:
+        repo = StudentAttemptRepository(session)
+        monkeypatch.setattr(repo, "_advance_mastery_states", fail)
+        with pytest.raises(RuntimeError):
+            await repo.bulk_create_attempts(_rows(50))
+        await session.rollback()
+
+    async with copy_engine.connect() as conn:
+        assert (await conn.execute(text("SELECT count(*) FROM student_attempts"))).scalar() == 0
+
+    async with session_maker() as session:
+        assert await StudentAttemptRepository(session).bulk_create_attempts(_rows(50)) == 50
+
+    async with copy_engine.connect() as conn:
+        assert (await conn.execute(text("SELECT count(*) FROM student_attempts"))).scalar() == 50
+        assert (await conn.execute(text("SELECT count(*) FROM student_mastery_states"))).scalar() == 3
@@ -0,0 +1,194 @@
+"""
+Query Plan Regression Tests for StudentAttempt Queries
+
+StudentAttemptRepository 조회 쿼리를 실제 PostgreSQL에서 EXPLAIN해
+student_attempts 순차 스캔(Seq Scan)이 없는지 확인한다.
+
+- 테스트 DB(settings.TEST_DATABASE_URL)에 student_attempts를 만들고
+  generate_series로 약 20만 행(학생 2,000명, 개념 40개)을 넣은 뒤 ANALYZE한다.
+- 리포지토리 메서드를 그대로 실행하면서 before_cursor_execute로 SQL/파라미터를
+  가로채고, 같은 SQL을 EXPLAIN (FORMAT JSON)으로 다시 실행해 계획 트리를 검사한다.
+- 전체 테이블을 읽는 학습용 스트림(stream_concept_sequences, stream_item_responses)은 제외한다.
+
+PostgreSQL에 연결할 수 없으면 건너뛴다.
+
+Usage:
+    pytest tests/integration/test_attempt_query_plans.py -m postgres --no-cov
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models.student_attempt import StudentAttempt
+from app.repositories.student_attempt_repository import (
+    StudentAttemptRepository,
+    encode_attempt_cursor,
+)
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.postgres,
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+SEED_ROWS = 200_000
+SEED_STUDENTS = 2_000
+SEED_CONCEPTS = 40
+SEED_START = datetime(2026, 1, 1)
+
+STUDENT = "student_42"
+CONCEPT = "concept_7"
+
+# 학생 g % 2000, 개념 (g / 2000) % 40 → 학생당 약 100회, 개념당 2~3회
+SEED_SQL = f"""
+    INSERT INTO student_attempts
+        (student_id, question_id, concept, is_correct, response_time_ms, attempted_at)
+    SELECT
+        'student_' || (g % {SEED_STUDENTS}),
+        'q_' || (g % 5000),
+        'concept_' || ((g / {SEED_STUDENTS}) % {SEED_CONCEPTS}),
+        g % 3 <> 0,
+        1000 + g % 60000,
+        timestamp '{SEED_START.isoformat(sep=' ')}' + g * interval '1 minute'
+    FROM generate_series(1, {SEED_ROWS}) AS g
+"""
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def plan_engine():
+    """시드 데이터가 들어 있는 PostgreSQL 테스트 DB 엔진 (연결 불가 시 skip)"""
+    engine = create_async_engine(settings.TEST_DATABASE_URL, echo=False)
+    try:
+        async with asyncio.timeout(5):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL test database unavailable: {e}")
+
+    table = StudentAttempt.__table__
+    async with engine.begin() as conn:
+        await conn.run_sync(table.drop, checkfirst=True)
+        await conn.run_sync(table.create)
+        await conn.execute(text(SEED_SQL))
+
+    # VACUUM은 트랜잭션 밖에서만 실행 가능, visibility map이 있어야 Index Only Scan 선택
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE student_attempts"))
+
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(table.drop, checkfirst=True)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def plan_session(plan_engine):
+    session_maker = async_sessionmaker(plan_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        yield session
+
+
+async def _capture(session, engine, call):
+    """call(repo) 실행 중 발생한 SELECT 문과 파라미터 수집"""
+    captured = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        result = call(StudentAttemptRepository(session))
+        if hasattr(result, "__aiter__"):
+            async for _ in result:
+                pass
+        else:
+            await result
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+
+    assert captured, "no query captured"
+    return captured
+
+
+async def _explain(session, statement, parameters):
+    """asyncpg 연결에서 EXPLAIN (FORMAT JSON) 실행, 최상위 Plan 노드 반환"""
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    plan = await raw.driver_connection.fetchval(
+        f"EXPLAIN (FORMAT JSON) {statement}", *(parameters or ())
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def _nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+def _attempt_scans(plan):
+    """student_attempts(및 파티션)를 읽는 스캔 노드의 (노드 종류, 인덱스 이름)"""
+    return [
+        (node["Node Type"], node.get("Index Name"))
+        for node in _nodes(plan)
+        if node.get("Relation Name", "").startswith("student_attempts")
+    ]
+
+
+CURSOR = encode_attempt_cursor(SEED_START + timedelta(days=60), 10**9)
+UNTIL = SEED_START + timedelta(days=90)
+
+# (이름, 리포지토리 호출, Index Only Scan 기대 여부)
+QUERY_CASES = [
+    ("get_by_student", lambda repo: repo.get_by_student(STUDENT, limit=20), False),
+    ("get_by_student_all", lambda repo: repo.get_by_student(STUDENT), False),
+    ("get_page", lambda repo: repo.get_page(STUDENT, limit=20), False),
+    ("get_page_cursor", lambda repo: repo.get_page(STUDENT, limit=20, cursor=CURSOR), False),
+    ("get_page_concept", lambda repo: repo.get_page(STUDENT, CONCEPT, limit=20), False),
+    ("get_page_concept_cursor", lambda repo: repo.get_page(STUDENT, CONCEPT, limit=20, cursor=CURSOR), False),
+    ("get_by_concept", lambda repo: repo.get_by_concept(STUDENT, CONCEPT), False),
+    ("get_recent_attempts", lambda repo: repo.get_recent_attempts(STUDENT, days=30), False),
+    ("calculate_concept_accuracy", lambda repo: repo.calculate_concept_accuracy(STUDENT, CONCEPT), True),
+    ("aggregate_by_concept", lambda repo: repo.aggregate_by_concept(STUDENT), True),
+    ("get_student_mastery_data", lambda repo: repo.get_student_mastery_data(STUDENT, CONCEPT), True),
+    ("get_student_mastery_data_ids", lambda repo: repo.get_student_mastery_data(STUDENT, CONCEPT, with_ids=True), True),
+    ("get_outcomes", lambda repo: repo.get_outcomes(STUDENT, CONCEPT), True),
+    ("get_outcomes_until", lambda repo: repo.get_outcomes(STUDENT, CONCEPT, until=UNTIL), True),
+    ("count_attempts_by_student", lambda repo: repo.count_attempts_by_student(STUDENT), True),
+    ("stream_student_attempts_by_concept", lambda repo: repo.stream_student_attempts_by_concept(STUDENT), True),
+]
+
+
+@pytest.mark.parametrize(
+    "call, index_only",
+    [case[1:] for case in QUERY_CASES],
+    ids=[case[0] for case in QUERY_CASES]
+)
+async def test_attempt_query_uses_index(plan_engine, plan_session, call, index_only):
+    """
+    Test: 리포지토리 조회 쿼리 실행 계획
+    Expected: student_attempts 순차 스캔 없음, 커버링 인덱스 대상 쿼리는 Index Only Scan
+    """
+    for statement, parameters in await _capture(plan_session, plan_engine, call):
+        scans = _attempt_scans(await _explain(plan_session, statement, parameters))
+
+        assert scans, f"no student_attempts scan in plan:\n{statement}"
+        assert all(node_type != "Seq Scan" for node_type, _ in scans), (
+            f"sequential scan on student_attempts: {scans}\n{statement}"
+        )
+        if index_only:
+            assert all(node_type == "Index Only Scan" for node_type, _ in scans), (
+                f"expected index-only scan: {scans}\n{statement}"
+            )
@@ -11,6 +11,11 @@ from app.db.base import Base
 # Import all models to register them with Base.metadata
 from app.models.student import Student  # noqa: F401
 from app.models.student_attempt import StudentAttempt  # noqa: F401
+from app.models.student_mastery_state import StudentMasteryState  # noqa: F401
+from app.models.bkt_parameters import BKTParameters  # noqa: F401
+from app.models.item_bank import ItemBankItem  # noqa: F401
+from app.models.student_concept_mastery import StudentConceptMastery  # noqa: F401
+from app.models.mastery_snapshot_progress import MasterySnapshotProgress  # noqa: F401
 from app.models.workflow_session import WorkflowSession  # noqa: F401
 
 
@@ -0,0 +1,68 @@
+"""
+Unit Tests for AttemptIngestionService
+
+대량 시도 적재: 본문 파싱(NDJSON/배열), 행 단위 검증, 처리량 보고
+"""
+import json
+import pytest
+
+
+def _service(db_session, max_rows=100):
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.services.attempt_ingestion_service import AttemptIngestionService
+
+    return AttemptIngestionService(StudentAttemptRepository(db_session), max_rows)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ingest_ndjson_reports_row_errors(db_session):
+    """
+    Test: NDJSON 본문에 잘못된 행이 섞인 경우
+    Expected: 유효한 행만 적재, 잘못된 행은 index와 사유 보고
+    """
+    service = _service(db_session)
+    lines = [
+        json.dumps({"student_id": "s1", "question_id": "q1", "concept": "미분", "is_correct": True}),
+        "",
+        "{not json",
+        json.dumps({"student_id": "s1", "question_id": "q2", "concept": "미분"}),
+        json.dumps({"student_id": "s1", "question_id": "q3", "concept": "미분", "is_correct": False,
+                    "attempted_at": "2026-01-05T09:00:00+09:00", "response_time_ms": 1200}),
+    ]
+    rows, parse_errors = service.parse("\n".join(lines).encode(), "application/x-ndjson")
+    assert len(rows) == 4
+
+    result = await service.ingest(rows, parse_errors)
+
+    assert result["received"] == 4
+    assert result["inserted"] == 2
+    assert result["rejected"] == 2
+    assert [error["index"] for error in result["errors"]] == [1, 2]
+    assert "invalid JSON" in result["errors"][0]["errors"][0]["msg"]
+    assert result["errors"][1]["errors"][0]["loc"] == ["is_correct"]
+    assert result["rows_per_second"] > 0
+
+    attempts = await service.repository.get_by_concept("s1", "미분")
+    converted = next(a for a in attempts if a.question_id == "q3")
+    assert converted.attempted_at.isoformat() == "2026-01-05T00:00:00"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_parse_rejects_invalid_payload(db_session):
+    """
+    Test: 배열이 아닌 JSON, 잘못된 JSON, 최대 행 수 초과
+    Expected: IngestionPayloadError
+    """
+    from app.services.attempt_ingestion_service import IngestionPayloadError
+
+    service = _service(db_session, max_rows=2)
+
+    rows, errors = service.parse(b'[{"a": 1}]', "application/json")
+    assert rows == [{"a": 1}]
+    assert errors == []
+
+    for body in (b'{"student_id": "s1"}', b"[1, 2", b"[{}, {}, {}]"):
+        with pytest.raises(IngestionPayloadError):
+            service.parse(body, "application/json")
@@ -0,0 +1,98 @@
+"""
+Unit Tests for Monthly Partitioning Helpers
+
+student_attempts 월별 RANGE 파티션 이름/구간/DDL 생성 테스트
+(DDL 실행은 PostgreSQL 전용이므로 여기서는 문자열만 검증)
+"""
+import pytest
+from datetime import datetime
+
+
+class RecordingConnection:
+    """pg_inherits 조회에 파티션 목록을 돌려주고 실행한 DDL을 기록하는 연결"""
+
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql.startswith("SELECT"):
+            return [(name,) for name in sorted(self.partitions)]
+        self.statements.append(sql)
+        return None
+
+
+@pytest.mark.unit
+def test_month_ranges_cross_year():
+    """
+    Test: 연도를 넘는 월 구간
+    Expected: [월 시작, 다음 월 시작) 연속 구간
+    """
+    from app.db.partitioning import month_ranges, add_months, month_floor
+
+    ranges = month_ranges(datetime(2026, 11, 20, 13, 5), datetime(2027, 2, 1))
+
+    assert ranges == [
+        (datetime(2026, 11, 1), datetime(2026, 12, 1)),
+        (datetime(2026, 12, 1), datetime(2027, 1, 1)),
+        (datetime(2027, 1, 1), datetime(2027, 2, 1)),
+        (datetime(2027, 2, 1), datetime(2027, 3, 1)),
+    ]
+    assert month_ranges(datetime(2026, 5, 1), datetime(2026, 4, 30)) == []
+    assert add_months(datetime(2026, 1, 1), -13) == datetime(2024, 12, 1)
+    assert month_floor(datetime(2026, 2, 28, 23, 59)) == datetime(2026, 2, 1)
+
+
+@pytest.mark.unit
+def test_partition_names_and_ddl():
+    """
+    Test: 파티션 이름 왕복과 생성/분리 DDL
+    Expected: 이름에서 월 복원, DEFAULT는 월 파티션이 아님
+    """
+    from app.db.partitioning import (
+        partition_name, parse_partition_month, create_partition_ddl,
+        create_default_partition_ddl, detach_partition_ddl
+    )
+
+    name = partition_name("student_attempts", datetime(2026, 3, 15))
+    assert name == "student_attempts_y2026m03"
+    assert parse_partition_month("student_attempts", name) == datetime(2026, 3, 1)
+    assert parse_partition_month("student_attempts", "student_attempts_default") is None
+    assert parse_partition_month("other", name) is None
+
+    assert create_partition_ddl("student_attempts", datetime(2026, 12, 9)) == (
+        "CREATE TABLE IF NOT EXISTS student_attempts_y2026m12 PARTITION OF student_attempts "
+        "FOR VALUES FROM ('2026-12-01 00:00:00') TO ('2027-01-01 00:00:00')"
+    )
+    assert create_default_partition_ddl("student_attempts").endswith("PARTITION OF student_attempts DEFAULT")
+    assert detach_partition_ddl("student_attempts", datetime(2025, 1, 1)) == (
+        "ALTER TABLE student_attempts DETACH PARTITION student_attempts_y2025m01"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_detach_keeps_default_partition():
+    """
+    Test: DEFAULT 파티션이 있는 테이블에서 cutoff 이전 파티션 분리
+    Expected: 이전 월 파티션만 일반 DETACH로 분리
+              (DEFAULT 파티션이 있으면 CONCURRENTLY는 PostgreSQL이 거부), DEFAULT는 유지
+    """
+    from app.db.partitioning import detach_partitions_before
+
+    conn = RecordingConnection([
+        "student_attempts_default",
+        "student_attempts_y2024m12",
+        "student_attempts_y2025m01",
+        "student_attempts_y2025m02",
+    ])
+
+    detached = await detach_partitions_before(conn, datetime(2025, 2, 10))
+
+    assert detached == ["student_attempts_y2024m12", "student_attempts_y2025m01"]
+    assert conn.statements == [
+        "ALTER TABLE student_attempts DETACH PARTITION student_attempts_y2024m12",
+        "ALTER TABLE student_attempts DETACH PARTITION student_attempts_y2025m01",
+    ]
+    assert not any("CONCURRENTLY" in sql or "default" in sql for sql in conn.statements)
@@ -392,3 +392,164 @@ def test_bkt_repr():
     assert "0.4" in repr_str
     assert "0.05" in repr_str
     assert "0.15" in repr_str
+
+
+@pytest.mark.unit
+def test_bkt_batch_matches_scalar():
+    """
+    Test: 배치 계산 결과가 시퀀스별 calculate_mastery와 일치
+    Expected: 모든 시퀀스에서 오차 1e-12 이내 (빈 시퀀스 포함)
+    """
+    import random
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    rng = random.Random(7)
+    sequences = [
+        [rng.random() < 0.6 for _ in range(rng.randint(0, 30))]
+        for _ in range(200)
+    ]
+    sequences.append([])
+
+    for params in [
+        {},
+        {"p_init": 0.37, "p_learn": 0.05, "p_slip": 0.22, "p_guess": 0.31},
+        {"p_init": 0.5, "p_learn": 0.1, "p_slip": 1.0, "p_guess": 0.0},  # 정답 분모 0
+        {"p_init": 0.5, "p_learn": 0.1, "p_slip": 0.0, "p_guess": 1.0},  # 오답 분모 0
+    ]:
+        bkt = BayesianKnowledgeTracing(**params)
+        offsets, outcomes = BayesianKnowledgeTracing.pack_sequences(sequences)
+
+        batch = bkt.calculate_mastery_batch(offsets, outcomes)
+
+        assert batch.shape == (len(sequences),)
+        for sequence, mastery in zip(sequences, batch):
+            expected = bkt.calculate_mastery([{"is_correct": c} for c in sequence])
+            assert mastery == pytest.approx(expected, abs=1e-12)
+
+
+@pytest.mark.unit
+def test_bkt_batch_empty_input():
+    """
+    Test: 시퀀스가 없거나 모든 시퀀스가 비어있는 경우
+    Expected: 시퀀스 수만큼 p_init 반환
+    """
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    bkt = BayesianKnowledgeTracing(p_init=0.15)
+
+    assert bkt.calculate_mastery_batch([0], []).shape == (0,)
+    assert list(bkt.calculate_mastery_batch([0, 0, 0], [])) == [0.15, 0.15]
+
+
+@pytest.mark.unit
+def test_bkt_batch_invalid_offsets():
+    """
+    Test: 잘못된 offsets 전달 시 에러
+    Expected: ValueError 발생
+    """
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    bkt = BayesianKnowledgeTracing()
+
+    with pytest.raises(ValueError, match="non-empty 1-D"):
+        bkt.calculate_mastery_batch([], [])
+
+    with pytest.raises(ValueError, match="outcomes must be a 1-D"):
+        bkt.calculate_mastery_batch([0, 1], [[True]])
+
+    with pytest.raises(ValueError, match="start at 0"):
+        bkt.calculate_mastery_batch([1, 2], [True, False])
+
+    with pytest.raises(ValueError, match="non-decreasing"):
+        bkt.calculate_mastery_batch([0, 2, 1, 2], [True, False])
+
+
+@pytest.mark.unit
+def test_bkt_trajectory_matches_prefixes():
+    """
+    Test: 궤적의 각 값이 prefix에 대한 calculate_mastery와 일치
+    Expected: trajectory[i] == calculate_mastery(attempts[:i+1])
+    """
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    bkt = BayesianKnowledgeTracing()
+    attempts = [{"is_correct": c} for c in [True, False, False, True, True, False]]
+
+    trajectory = bkt.calculate_trajectory(attempts)
+
+    assert len(trajectory) == len(attempts)
+    for i, mastery in enumerate(trajectory):
+        assert mastery == bkt.calculate_mastery(attempts[:i + 1])
+    assert bkt.calculate_trajectory([]) == []
+
+
+@pytest.mark.unit
+def test_bkt_smoothed_trajectory_matches_enumeration():
+    """
+    Test: forward-backward smoothed 궤적이 은닉 상태 전수 열거 결과와 일치
+    Expected: 오차 1e-12 이내, 마지막 값은 필터링 값과 동일
+    """
+    import itertools
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    bkt = BayesianKnowledgeTracing(p_init=0.2, p_learn=0.3, p_slip=0.1, p_guess=0.25)
+    outcomes = [False, True, False, True, True]
+    n = len(outcomes)
+
+    # K_1..K_{n+1} 모든 경로의 결합확률로 P(K_{t+1}=1 | 전체) 계산
+    known_weight = [0.0] * (n + 1)
+    total = 0.0
+    for path in itertools.product([0, 1], repeat=n + 1):
+        prob = bkt.p_init if path[0] else 1 - bkt.p_init
+        for t, is_correct in enumerate(outcomes):
+            if path[t]:
+                prob *= (1 - bkt.p_slip) if is_correct else bkt.p_slip
+                prob *= 1.0 if path[t + 1] else 0.0
+            else:
+                prob *= bkt.p_guess if is_correct else (1 - bkt.p_guess)
+                learn = bkt.p_learn if is_correct else 0.0
+                prob *= learn if path[t + 1] else (1 - learn)
+        total += prob
+        for t in range(n + 1):
+            if path[t]:
+                known_weight[t] += prob
+    expected = [known_weight[t + 1] / total for t in range(n)]
+
+    smoothed = bkt.calculate_smoothed_trajectory([{"is_correct": c} for c in outcomes])
+
+    assert smoothed == pytest.approx(expected, abs=1e-12)
+    assert smoothed[-1] == bkt.calculate_trajectory([{"is_correct": c} for c in outcomes])[-1]
+    # 이후 정답이 과거 숙련 가능성을 높임
+    assert smoothed[0] > bkt.calculate_trajectory([{"is_correct": False}])[0]
+    assert bkt.calculate_smoothed_trajectory([]) == []
+
+    # p_init = p_learn = 0 → 숙련 불가, 0으로 나누지 않음
+    never = BayesianKnowledgeTracing(p_init=0.0, p_learn=0.0)
+    assert never.calculate_smoothed_trajectory([{"is_correct": True}] * 3) == [0.0, 0.0, 0.0]
+
+
+@pytest.mark.unit
+def test_calculate_mastery_from_outcomes_matches_dict_path():
+    """
+    Test: 정답 여부 배열(bool ndarray/bytearray)만으로 숙련도 계산
+    Expected: dict 리스트 경로와 같은 값, 빈 시퀀스는 p_init
+    """
+    import numpy as np
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+
+    bkt = BayesianKnowledgeTracing(p_init=0.2, p_learn=0.25, p_slip=0.05, p_guess=0.3)
+    rng = np.random.default_rng(7)
+    outcomes = rng.random(200) < 0.6
+
+    expected = bkt.calculate_mastery([{"is_correct": bool(c)} for c in outcomes])
+    assert bkt.calculate_mastery_from_outcomes(outcomes) == expected
+    assert bkt.calculate_mastery_from_outcomes(bytearray(outcomes.astype(np.uint8))) == expected
+    assert bkt.calculate_mastery_from_outcomes(np.array([], dtype=bool)) == 0.2
+
+    assert not bkt.time_dependent
+    forgetting = ForgettingKnowledgeTracing()
+    assert forgetting.time_dependent
+    # 시각 정보가 없으면 간격 0 (attempted_at 없는 dict 경로와 동일)
+    assert forgetting.calculate_mastery_from_outcomes(outcomes) == \
+        forgetting.calculate_mastery([{"is_correct": bool(c)} for c in outcomes])
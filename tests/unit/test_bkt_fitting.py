@@ -0,0 +1,243 @@
+"""
+Unit Tests for BKT Parameter Fitting
+
+TDD: 개념별 BKT 파라미터 적합과 파라미터 저장소 테스트
+
+- BKTGridFitter: 벡터화 그리드 서치 (청크 누적)
+- StudentAttemptRepository.stream_concept_sequences: 개념별 청크 스트리밍
+- BKTFittingService: 적합 결과 저장
+- BKTParameterStore: 프로세스 캐시 및 refresh
+"""
+import random
+import pytest
+from datetime import datetime, timedelta
+
+
+def _simulate_sequences(n_sequences, p_init, p_learn, p_slip, p_guess, seed=0):
+    """BKT 생성 모델로 시도 시퀀스 시뮬레이션 (학습 전이는 정답 후에만)"""
+    rng = random.Random(seed)
+    sequences = []
+    for _ in range(n_sequences):
+        known = rng.random() < p_init
+        sequence = []
+        for _ in range(rng.randint(3, 20)):
+            is_correct = (rng.random() > p_slip) if known else (rng.random() < p_guess)
+            sequence.append(is_correct)
+            if is_correct and not known and rng.random() < p_learn:
+                known = True
+        sequences.append(sequence)
+    return sequences
+
+
+@pytest.mark.unit
+def test_grid_fitter_recovers_generating_parameters():
+    """
+    Test: 알려진 파라미터로 생성한 데이터에서 파라미터 복원
+    Expected: 청크로 나눠 누적해도 생성 파라미터가 최대우도 후보
+    """
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.algorithms.bkt_fitting import BKTGridFitter
+
+    sequences = _simulate_sequences(3000, p_init=0.15, p_learn=0.2, p_slip=0.1, p_guess=0.2)
+    fitter = BKTGridFitter()
+
+    for start in range(0, len(sequences), 500):
+        offsets, outcomes = BayesianKnowledgeTracing.pack_sequences(sequences[start:start + 500])
+        fitter.partial_fit("이차방정식", offsets, outcomes)
+
+    params = fitter.best_params("이차방정식")
+    assert params["p_init"] == 0.15
+    assert params["p_learn"] == 0.2
+    assert params["p_slip"] == 0.1
+    assert params["p_guess"] == 0.2
+    assert params["n_sequences"] == 3000
+    assert params["n_attempts"] == sum(len(s) for s in sequences)
+
+    bkt = fitter.best_model("이차방정식")
+    assert bkt.params == (0.15, 0.2, 0.1, 0.2)
+    assert fitter.best_params("없는_개념") is None
+    assert fitter.best_model("없는_개념") is None
+
+
+@pytest.mark.unit
+def test_grid_fitter_chunking_is_additive():
+    """
+    Test: 청크별 로그우도 합 == 전체 로그우도
+    Expected: 스트리밍 적합이 한 번에 적합한 것과 동일
+    """
+    import numpy as np
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.algorithms.bkt_fitting import BKTGridFitter
+
+    sequences = _simulate_sequences(200, 0.3, 0.1, 0.1, 0.2, seed=3)
+    fitter = BKTGridFitter(p_init_grid=(0.1, 0.3), p_learn_grid=(0.1,), p_slip_grid=(0.1, 0.2), p_guess_grid=(0.2,))
+
+    whole = fitter.log_likelihood(*BayesianKnowledgeTracing.pack_sequences(sequences))
+    parts = (
+        fitter.log_likelihood(*BayesianKnowledgeTracing.pack_sequences(sequences[:77]))
+        + fitter.log_likelihood(*BayesianKnowledgeTracing.pack_sequences(sequences[77:]))
+    )
+
+    assert np.allclose(whole, parts, rtol=0, atol=1e-9)
+    assert list(fitter.log_likelihood([0], [])) == [0.0] * fitter.grid_size
+
+
+@pytest.mark.unit
+def test_grid_fitter_invalid_grid():
+    """
+    Test: 잘못된 후보 격자
+    Expected: ValueError 발생
+    """
+    from app.algorithms.bkt_fitting import BKTGridFitter
+
+    with pytest.raises(ValueError, match="must not be empty"):
+        BKTGridFitter(p_init_grid=())
+
+    with pytest.raises(ValueError, match="must be between 0 and 1"):
+        BKTGridFitter(p_learn_grid=(1.5,))
+
+    with pytest.raises(ValueError, match="below 0.5"):
+        BKTGridFitter(p_guess_grid=(0.2, 0.6))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_concept_sequences_respects_boundaries(db_session):
+    """
+    Test: 개념별 시퀀스 청크 스트리밍
+    Expected: 청크는 한 개념만 포함, 학생 시퀀스는 잘리지 않고 시간순 유지
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.models.student_attempt import StudentAttempt
+
+    now = datetime.utcnow()
+    data = {
+        ("s1", "A"): [True, False, True],
+        ("s2", "A"): [False, False],
+        ("s3", "A"): [True],
+        ("s1", "B"): [True, True],
+    }
+    for (student_id, concept), outcomes in data.items():
+        # 역순으로 넣어도 attempted_at 순으로 읽혀야 함
+        for i, is_correct in reversed(list(enumerate(outcomes))):
+            db_session.add(StudentAttempt(
+                student_id=student_id,
+                question_id=f"q_{i}",
+                concept=concept,
+                is_correct=is_correct,
+                attempted_at=now + timedelta(seconds=i)
+            ))
+    await db_session.commit()
+
+    repo = StudentAttemptRepository(db_session)
+    chunks = [chunk async for chunk in repo.stream_concept_sequences(chunk_size=3)]
+
+    assert chunks == [
+        ("A", [0, 3], [True, False, True]),
+        ("A", [0, 2, 3], [False, False, True]),
+        ("B", [0, 2], [True, True]),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fitting_service_saves_parameters(db_session):
+    """
+    Test: 적합 서비스가 충분한 데이터가 있는 개념만 저장
+    Expected: 저장된 개념의 파라미터가 bkt_parameters에 기록됨
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.bkt_parameter_repository import BKTParameterRepository
+    from app.services.bkt_fitting_service import BKTFittingService
+    from app.models.student_attempt import StudentAttempt
+
+    now = datetime.utcnow()
+    for s, sequence in enumerate(_simulate_sequences(30, 0.3, 0.2, 0.1, 0.2)):
+        for i, is_correct in enumerate(sequence):
+            db_session.add(StudentAttempt(
+                student_id=f"s{s}", question_id=f"q_{i}", concept="미분",
+                is_correct=is_correct, attempted_at=now + timedelta(seconds=i)
+            ))
+    db_session.add(StudentAttempt(student_id="s0", question_id="q", concept="희귀개념", is_correct=True))
+    await db_session.commit()
+
+    parameter_repo = BKTParameterRepository(db_session)
+    service = BKTFittingService(StudentAttemptRepository(db_session), parameter_repo)
+    fitted = await service.fit_all(chunk_size=50, min_attempts=10)
+
+    assert list(fitted.keys()) == ["미분"]
+    saved = await parameter_repo.get_by_concept("미분")
+    assert saved.p_learn == fitted["미분"]["p_learn"]
+    assert saved.n_sequences == 30
+    assert await parameter_repo.get_by_concept("희귀개념") is None
+
+    # 재적합 시 덮어쓰기
+    await parameter_repo.save("미분", {**fitted["미분"], "p_init": 0.5})
+    assert len(await parameter_repo.list_all()) == 1
+    assert (await parameter_repo.get_by_concept("미분")).p_init == 0.5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_parameter_store_cache_and_refresh(db_session):
+    """
+    Test: 파라미터 저장소는 한 번만 로드하고 refresh로 갱신
+    Expected: refresh 전에는 캐시 유지, 후에는 새 파라미터 반영
+    """
+    from app.services.bkt_parameter_store import BKTParameterStore
+    from app.repositories.bkt_parameter_repository import BKTParameterRepository
+
+    BKTParameterStore.invalidate()
+    parameter_repo = BKTParameterRepository(db_session)
+    fitted = {"p_init": 0.3, "p_learn": 0.2, "p_slip": 0.05, "p_guess": 0.1}
+    await parameter_repo.save("적분", fitted)
+
+    store = await BKTParameterStore.get_instance(db_session)
+    assert store.get("적분").params == (0.3, 0.2, 0.05, 0.1)
+    assert store.get("없는_개념") is store.default
+
+    # 캐시 유지
+    await parameter_repo.save("적분", {**fitted, "p_init": 0.6})
+    assert (await BKTParameterStore.get_instance(db_session)) is store
+    assert store.get("적분").p_init == 0.3
+
+    # refresh 후 반영
+    refreshed = await BKTParameterStore.refresh(db_session)
+    assert refreshed.get("적분").p_init == 0.6
+    assert (await BKTParameterStore.get_instance(db_session)) is refreshed
+
+    BKTParameterStore.invalidate()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_mastery_uses_per_concept_parameters(db_session):
+    """
+    Test: 저장소에 적합된 개념은 개념별 파라미터로 숙련도 계산/상태 갱신
+    Expected: 재적합으로 파라미터가 바뀌면 저장된 상태 대신 재계산
+    """
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.services.bkt_parameter_store import BKTParameterStore
+    from app.services.mastery_service import MasteryService
+
+    fitted = BayesianKnowledgeTracing(p_init=0.4, p_learn=0.1, p_slip=0.05, p_guess=0.1)
+    store = BKTParameterStore({"도함수": fitted})
+    bkt = BayesianKnowledgeTracing()
+    repo = StudentAttemptRepository(db_session, bkt, store)
+    service = MasteryService(repo, bkt, store)
+
+    await repo.create_attempt("student_1", "q_1", "도함수", True)
+    await repo.create_attempt("student_1", "q_2", "도함수", False)
+
+    expected = fitted.calculate_mastery([{"is_correct": True}, {"is_correct": False}])
+    state = await repo.get_mastery_state("student_1", "도함수")
+    assert state.params_key == fitted.params_key
+    assert await service.calculate_concept_mastery("student_1", "도함수") == pytest.approx(expected, abs=1e-12)
+
+    # 재적합 → 상태의 params_key 불일치 → 재생
+    refit = BayesianKnowledgeTracing(p_init=0.2, p_learn=0.3, p_slip=0.1, p_guess=0.2)
+    new_store = BKTParameterStore({"도함수": refit})
+    new_service = MasteryService(StudentAttemptRepository(db_session, bkt, new_store), bkt, new_store)
+    expected_refit = refit.calculate_mastery([{"is_correct": True}, {"is_correct": False}])
+    assert await new_service.calculate_concept_mastery("student_1", "도함수") == pytest.approx(expected_refit, abs=1e-12)
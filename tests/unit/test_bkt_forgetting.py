@@ -0,0 +1,233 @@
+"""
+Unit Tests for Time-aware BKT (Forgetting)
+
+TDD: 시도 간 시간 간격에 따른 숙련도 감쇠 테스트
+
+감쇠 수식 (반감기 h일):
+- r = 0.5 ^ (Δt / h)
+- P(L) ← p_init + (P(L) - p_init) * r   (P(L) > p_init 인 경우만)
+"""
+import pytest
+from datetime import datetime, timedelta
+
+
+@pytest.mark.unit
+def test_forgetting_decay_half_life():
+    """
+    Test: 반감기만큼 지나면 p_init 초과분이 절반
+    Expected: 감쇠는 p_init 아래로 내려가지 않고, 음수 경과는 무시
+    """
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+
+    bkt = ForgettingKnowledgeTracing(p_init=0.1, half_life_days=30)
+
+    assert bkt.decay(0.9, timedelta(days=30)) == pytest.approx(0.5)
+    assert bkt.decay(0.9, timedelta(days=60)) == pytest.approx(0.3)
+    assert bkt.decay(0.9, timedelta(0)) == 0.9
+    assert bkt.decay(0.9, timedelta(days=-1)) == 0.9
+    assert bkt.decay(0.05, timedelta(days=365)) == 0.05
+
+
+@pytest.mark.unit
+def test_forgetting_invalid_half_life():
+    """
+    Test: 반감기가 0 이하
+    Expected: ValueError 발생
+    """
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+
+    with pytest.raises(ValueError, match="half_life_days must be positive"):
+        ForgettingKnowledgeTracing(half_life_days=0)
+
+
+@pytest.mark.unit
+def test_forgetting_trajectory_applies_gaps():
+    """
+    Test: 시도 간 간격이 있으면 다음 시도 전에 감쇠
+    Expected: 간격 없는 시도는 기본 BKT와 동일, 긴 간격 후에는 더 낮음
+    """
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+
+    start = datetime(2026, 1, 1)
+    same_time = [{"is_correct": True, "attempted_at": start} for _ in range(3)]
+    gapped = [
+        {"is_correct": True, "attempted_at": start},
+        {"is_correct": True, "attempted_at": start + timedelta(days=1)},
+        {"is_correct": True, "attempted_at": start + timedelta(days=90)},
+    ]
+
+    forgetting = ForgettingKnowledgeTracing(half_life_days=30)
+    plain = BayesianKnowledgeTracing()
+
+    assert forgetting.calculate_mastery(same_time) == plain.calculate_mastery(same_time)
+    assert forgetting.calculate_mastery(gapped) < plain.calculate_mastery(gapped)
+    assert forgetting.calculate_trajectory(gapped)[-1] == forgetting.calculate_mastery(gapped)
+    assert forgetting.calculate_mastery([]) == forgetting.p_init
+
+    # attempted_at이 없는 시도는 간격 0
+    untimed = [{"is_correct": True}, {"is_correct": False}]
+    assert forgetting.calculate_mastery(untimed) == plain.calculate_mastery(untimed)
+
+
+@pytest.mark.unit
+def test_mastery_at_ignores_future_attempts_and_decays():
+    """
+    Test: 특정 시각 기준 숙련도
+    Expected: as_of 이후 시도는 무시, 마지막 시도부터 as_of까지 감쇠
+    """
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+
+    start = datetime(2026, 1, 1)
+    attempts = [
+        {"is_correct": True, "attempted_at": start},
+        {"is_correct": True, "attempted_at": start + timedelta(days=1)},
+        {"is_correct": False, "attempted_at": start + timedelta(days=40)},
+    ]
+    bkt = ForgettingKnowledgeTracing(half_life_days=30)
+
+    as_of = start + timedelta(days=31)
+    expected = bkt.decay(bkt.calculate_mastery(attempts[:2]), timedelta(days=30))
+    assert bkt.mastery_at(attempts, as_of) == pytest.approx(expected)
+    assert bkt.mastery_at(attempts, start - timedelta(days=1)) == bkt.p_init
+
+    # 기본 BKT는 감쇠 없이 as_of 이전 시도만 반영
+    plain = BayesianKnowledgeTracing()
+    assert plain.mastery_at(attempts, as_of) == plain.calculate_mastery(attempts[:2])
+    assert plain.mastery_at([{"is_correct": True}], as_of) == plain.calculate_mastery([{"is_correct": True}])
+
+
+@pytest.mark.unit
+def test_forgetting_untimed_modes_and_params_key():
+    """
+    Test: 시각 정보가 없는 계산 경로와 파라미터 식별자
+    Expected: outcome/batch 계산은 간격 0(기본 BKT와 동일), params_key에 반감기 포함
+    """
+    import numpy as np
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing, create_bkt
+
+    bkt = ForgettingKnowledgeTracing(half_life_days=30)
+    plain = BayesianKnowledgeTracing()
+    outcomes = [True, False, True]
+
+    assert bkt.calculate_mastery_from_outcomes(outcomes) == plain.calculate_mastery_from_outcomes(outcomes)
+    assert bkt.calculate_mastery_batch(np.array([0, 1, 3]), np.array(outcomes)).tolist() == \
+        plain.calculate_mastery_batch(np.array([0, 1, 3]), np.array(outcomes)).tolist()
+
+    assert bkt.params_key != BayesianKnowledgeTracing().params_key
+    assert bkt.params_key != ForgettingKnowledgeTracing(half_life_days=60).params_key
+    assert "half_life_days=30" in repr(bkt)
+
+    assert type(create_bkt()) is BayesianKnowledgeTracing
+    assert create_bkt(14, p_init=0.2).half_life_days == 14
+
+
+@pytest.mark.unit
+def test_forgetting_smoothed_trajectory_matches_enumeration():
+    """
+    Test: 감쇠 전이를 넣은 forward-backward smoothed 궤적
+    Expected: 은닉 상태 전수 열거 결과와 일치, 마지막 값은 필터링 값과 동일,
+              간격이 없으면 기본 BKT smoothing과 동일
+    """
+    import itertools
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+
+    params = dict(p_init=0.2, p_learn=0.3, p_slip=0.1, p_guess=0.25)
+    bkt = ForgettingKnowledgeTracing(half_life_days=10, **params)
+    start = datetime(2026, 1, 1)
+    outcomes = [True, True, True, False, True]
+    days = [0, 3, 20, 21, 60]
+    attempts = [
+        {"is_correct": c, "attempted_at": start + timedelta(days=d)}
+        for c, d in zip(outcomes, days)
+    ]
+    filtered = bkt.calculate_trajectory(attempts)
+    # 열거는 매 간격을 감쇠 전이로 보므로 감쇠 직전 필터링 값이 모두 p_init 초과인 경우로 비교
+    assert all(p > bkt.p_init for p in filtered[:-1])
+
+    n = len(outcomes)
+    retention = [1.0] + [
+        bkt.retention(timedelta(days=days[t] - days[t - 1])) for t in range(1, n)
+    ]
+    # S_0..S_n 과 시도 직전 상태 K_1..K_n 모든 경로의 결합확률로 P(S_t=1 | 전체) 계산
+    known_weight = [0.0] * (n + 1)
+    total = 0.0
+    for path in itertools.product([0, 1], repeat=2 * n + 1):
+        states, befores = path[:n + 1], path[n + 1:]
+        prob = bkt.p_init if states[0] else 1 - bkt.p_init
+        for t, is_correct in enumerate(outcomes):
+            r = retention[t]
+            relearn, forget = (1 - r) * bkt.p_init, (1 - r) * (1 - bkt.p_init)
+            if states[t]:
+                prob *= (1 - forget) if befores[t] else forget
+            else:
+                prob *= relearn if befores[t] else (1 - relearn)
+            if befores[t]:
+                prob *= (1 - bkt.p_slip) if is_correct else bkt.p_slip
+                prob *= 1.0 if states[t + 1] else 0.0
+            else:
+                prob *= bkt.p_guess if is_correct else (1 - bkt.p_guess)
+                learn = bkt.p_learn if is_correct else 0.0
+                prob *= learn if states[t + 1] else (1 - learn)
+        total += prob
+        for t in range(n + 1):
+            if states[t]:
+                known_weight[t] += prob
+    expected = [known_weight[t + 1] / total for t in range(n)]
+
+    smoothed = bkt.calculate_smoothed_trajectory(attempts)
+
+    assert smoothed == pytest.approx(expected, abs=1e-12)
+    assert smoothed[-1] == pytest.approx(filtered[-1], abs=1e-12)
+    assert bkt.calculate_smoothed_trajectory([]) == []
+
+    same_time = [{"is_correct": c, "attempted_at": start} for c in outcomes]
+    plain = BayesianKnowledgeTracing(**params)
+    assert bkt.calculate_smoothed_trajectory(same_time) == pytest.approx(
+        plain.calculate_smoothed_trajectory(same_time), abs=1e-12
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_mastery_state_decays_lazily_at_read_time(db_session):
+    """
+    Test: 저장된 상태는 마지막 시도 직후 값이고, 조회 시점에 감쇠 적용
+    Expected: 증분 상태 = 전체 재생 결과, 조회 시각이 늦을수록 낮은 숙련도
+    """
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.services.mastery_service import MasteryService
+
+    bkt = ForgettingKnowledgeTracing(half_life_days=30)
+    repo = StudentAttemptRepository(db_session, bkt)
+    service = MasteryService(repo, bkt)
+
+    first = await repo.create_attempt("student_1", "q_1", "삼각함수", True)
+    # 두 번째 시도를 10일 뒤로 기록된 것처럼 조정
+    state = await repo.get_mastery_state("student_1", "삼각함수")
+    state.last_attempted_at = first.attempted_at - timedelta(days=10)
+    first.attempted_at = state.last_attempted_at
+    await db_session.commit()
+    second = await repo.create_attempt("student_1", "q_2", "삼각함수", True)
+
+    history = await repo.get_student_mastery_data("student_1", "삼각함수")
+    state = await repo.get_mastery_state("student_1", "삼각함수")
+    assert state.last_attempted_at == second.attempted_at
+    assert state.p_mastery == pytest.approx(bkt.calculate_mastery(history), abs=1e-12)
+
+    now = await service.calculate_concept_mastery("student_1", "삼각함수")
+    later = await service.calculate_concept_mastery(
+        "student_1", "삼각함수", as_of=second.attempted_at + timedelta(days=90)
+    )
+    assert later < now
+    assert later == pytest.approx(bkt.decay(state.p_mastery, timedelta(days=90)))
+
+    # 마지막 시도 이전 시점 → 기록 재생
+    before = await service.calculate_concept_mastery(
+        "student_1", "삼각함수", as_of=first.attempted_at
+    )
+    assert before == pytest.approx(bkt.calculate_mastery(history[:1]))
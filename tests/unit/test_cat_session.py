@@ -0,0 +1,180 @@
+"""
+Unit Tests for Adaptive Testing (CAT) Session
+
+TDD: 적응형 진단 세션 진행과 저장 테스트
+
+- AdaptiveTestSession: 문항 선택, warm-start MAP 갱신, SE 기반 종료, 직렬화
+- AdaptiveDiagnosticService: WorkflowSession.workflow_metadata 저장/복원
+"""
+import math
+import random
+import pytest
+
+
+def _make_index(n=400, discrimination=2.0, seed=0):
+    from app.algorithms.item_bank_index import ItemBankIndex
+
+    rng = random.Random(seed)
+    return ItemBankIndex([
+        {
+            "question_id": f"q{i}",
+            "concept": "일차함수" if i % 2 else "이차함수",
+            "difficulty": rng.uniform(-3, 3),
+            "discrimination": discrimination,
+        }
+        for i in range(n)
+    ])
+
+
+def _answer(item, true_theta, rng):
+    """2PL 모델로 응답 시뮬레이션"""
+    a = item["discrimination"]
+    p = 1.0 / (1.0 + math.exp(-a * (true_theta - item["difficulty"])))
+    return rng.random() < p
+
+
+@pytest.mark.unit
+def test_cat_session_stops_on_standard_error():
+    """
+    Test: SE 임계값 도달 시 종료
+    Expected: 최대 문항 수보다 적게 출제, 중복 출제 없음, θ는 실제 능력 근처
+    """
+    from app.algorithms.cat import AdaptiveTestSession
+
+    index = _make_index()
+    rng = random.Random(1)
+    session = AdaptiveTestSession(se_threshold=0.3, max_items=40)
+
+    while (item := session.select_next(index)) is not None:
+        session.record_response(item["question_id"], _answer(item, 1.0, rng))
+
+    assert session.stop_reason == AdaptiveTestSession.STOP_SE_THRESHOLD
+    assert session.standard_error <= 0.3
+    assert 3 <= len(session.responses) < 40
+    assert len(set(session.administered)) == len(session.administered)
+    assert abs(session.theta - 1.0) < 3 * session.standard_error
+
+
+@pytest.mark.unit
+def test_cat_session_map_estimate_stays_finite():
+    """
+    Test: 전부 정답인 응답 패턴
+    Expected: MLE처럼 ±5로 발산하지 않고, 응답할수록 θ 증가/SE 감소
+    """
+    from app.algorithms.cat import AdaptiveTestSession
+
+    index = _make_index()
+    session = AdaptiveTestSession(max_items=5)
+    thetas, errors = [], []
+
+    while (item := session.select_next(index)) is not None:
+        session.record_response(item["question_id"], True)
+        thetas.append(session.theta)
+        errors.append(session.standard_error)
+
+    assert session.stop_reason == AdaptiveTestSession.STOP_MAX_ITEMS
+    assert thetas == sorted(thetas)
+    assert errors == sorted(errors, reverse=True)
+    assert thetas[-1] < 5.0
+
+
+@pytest.mark.unit
+def test_cat_session_concepts_exhaustion_and_validation():
+    """
+    Test: 개념 제한, 문항 소진, 잘못된 응답
+    Expected: 제한된 개념만 출제, 소진 시 종료, 대기 문항과 다른 응답은 ValueError
+    """
+    from app.algorithms.cat import AdaptiveTestSession
+    from app.algorithms.item_bank_index import ItemBankIndex
+
+    index = ItemBankIndex([
+        {"question_id": "a1", "concept": "A", "difficulty": 0.0},
+        {"question_id": "a2", "concept": "A", "difficulty": 0.5},
+        {"question_id": "b1", "concept": "B", "difficulty": 0.1},
+    ])
+    session = AdaptiveTestSession(concepts=["A"])
+
+    with pytest.raises(ValueError, match="no question is awaiting"):
+        session.record_response("a1", True)
+
+    item = session.select_next(index)
+    assert session.select_next(index) is item
+    with pytest.raises(ValueError, match="expected response to a1"):
+        session.record_response("b1", True)
+
+    session.record_response("a1", False)
+    session.record_response(session.select_next(index)["question_id"], True)
+    assert session.select_next(index) is None
+    assert session.stop_reason == AdaptiveTestSession.STOP_ITEM_BANK_EXHAUSTED
+    assert session.administered == ["a1", "a2"]
+
+    with pytest.raises(ValueError, match="se_threshold must be positive"):
+        AdaptiveTestSession(se_threshold=0)
+    with pytest.raises(ValueError, match="min_items <= max_items"):
+        AdaptiveTestSession(min_items=5, max_items=3)
+
+
+@pytest.mark.unit
+def test_cat_session_round_trips_through_dict():
+    """
+    Test: to_dict/from_dict 직렬화
+    Expected: JSON 왕복 후 같은 상태에서 같은 다음 문항 선택
+    """
+    import json
+    from app.algorithms.cat import AdaptiveTestSession
+
+    index = _make_index()
+    session = AdaptiveTestSession()
+    item = session.select_next(index)
+    session.record_response(item["question_id"], True)
+    session.select_next(index)
+
+    restored = AdaptiveTestSession.from_dict(json.loads(json.dumps(session.to_dict())))
+    assert restored.to_dict() == session.to_dict()
+    restored.record_response(restored.pending["question_id"], False)
+    session.record_response(session.pending["question_id"], False)
+    assert restored.select_next(index) == session.select_next(index)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_adaptive_diagnostic_service_persists_session(db_session):
+    """
+    Test: 적응형 진단 서비스 진행
+    Expected: 응답마다 workflow_metadata 갱신, 종료 시 completed, 종료 후 응답은 ValueError
+    """
+    from sqlalchemy import select
+    from app.models.workflow_session import WorkflowSession
+    from app.services.adaptive_diagnostic_service import (
+        AdaptiveDiagnosticService,
+        AdaptiveDiagnosticRequest
+    )
+
+    service = AdaptiveDiagnosticService(db_session, _make_index())
+    step = await service.start_diagnostic(
+        AdaptiveDiagnosticRequest(student_id="student_1", concepts=["일차함수"], max_items=4)
+    )
+    assert step.status == "in_progress"
+    assert step.next_question["concept"] == "일차함수"
+
+    answered = []
+    while step.next_question is not None:
+        answered.append(step.next_question["question_id"])
+        step = await service.submit_response(step.workflow_id, step.next_question["question_id"], True)
+
+    assert step.status == "completed"
+    assert step.answered == 4
+    assert step.stop_reason == "max_items"
+
+    result = await db_session.execute(
+        select(WorkflowSession).where(WorkflowSession.workflow_id == step.workflow_id)
+    )
+    workflow_session = result.scalar_one()
+    cat = workflow_session.workflow_metadata["cat"]
+    assert [r["question_id"] for r in cat["responses"]] == answered
+    assert cat["theta"] == step.theta
+    assert workflow_session.completed_at is not None
+
+    with pytest.raises(ValueError, match="already completed"):
+        await service.submit_response(step.workflow_id, answered[0], True)
+    assert await service.submit_response("wf_missing", "q1", True) is None
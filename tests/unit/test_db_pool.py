@@ -0,0 +1,137 @@
+"""
+Unit Tests for Database Engine Factory and Pool Metrics
+
+DB_* 설정 기반 엔진 생성과 커넥션 풀 계측(대기 시간 히스토그램, 타임아웃) 테스트
+"""
+import pytest
+
+
+@pytest.mark.unit
+def test_pool_metrics_cumulative_histogram():
+    """
+    Test: 대기 시간 관측값을 누적 버킷으로 집계
+    Expected: 각 버킷 count는 상한 이하 관측 수, 마지막 버킷은 전체 수
+    """
+    from app.db.pool import PoolMetrics
+
+    metrics = PoolMetrics(buckets=(0.1, 0.01, 1.0))
+    for seconds in (0.001, 0.01, 0.05, 0.5, 3.0):
+        metrics.observe_wait(seconds)
+    metrics.record_timeout()
+
+    assert metrics.histogram() == [
+        {"le": 0.01, "count": 2},
+        {"le": 0.1, "count": 3},
+        {"le": 1.0, "count": 4},
+        {"le": "+Inf", "count": 5},
+    ]
+    assert metrics.wait_count == 5
+    assert metrics.wait_seconds_sum == pytest.approx(3.561)
+    assert metrics.wait_seconds_max == 3.0
+    assert metrics.timeouts == 1
+
+    metrics.reset()
+    assert metrics.wait_count == 0
+    assert metrics.timeouts == 0
+    assert [bucket["count"] for bucket in metrics.histogram()] == [0, 0, 0, 0]
+
+
+@pytest.mark.unit
+def test_engine_kwargs_from_settings():
+    """
+    Test: 설정값으로 엔진 인자 구성
+    Expected: PostgreSQL은 풀 크기/statement 캐시 포함, SQLite는 echo/pre_ping만
+    """
+    from app.config import Settings
+
+    config = Settings(
+        DB_ECHO="debug",
+        DB_POOL_SIZE=5,
+        DB_MAX_OVERFLOW=2,
+        DB_POOL_TIMEOUT=3,
+        DB_POOL_RECYCLE=600,
+        DB_POOL_PRE_PING=False,
+        DB_STATEMENT_CACHE_SIZE=0,
+    )
+
+    options = config.engine_kwargs(config.DATABASE_URL)
+    assert options == {
+        "echo": "debug",
+        "pool_pre_ping": False,
+        "pool_size": 5,
+        "max_overflow": 2,
+        "pool_timeout": 3,
+        "pool_recycle": 600,
+        "connect_args": {"prepared_statement_cache_size": 0},
+    }
+    assert config.engine_kwargs("sqlite+aiosqlite:///:memory:") == {
+        "echo": "debug",
+        "pool_pre_ping": False,
+    }
+    assert Settings().DB_ECHO is False
+
+
+@pytest.mark.unit
+def test_default_engine_uses_instrumented_pool():
+    """
+    Test: 기본 엔진 풀 구성
+    Expected: 계측 풀, SQL echo 비활성, 설정된 풀 크기
+    """
+    from app.config import settings
+    from app.db.pool import InstrumentedAsyncQueuePool, pool_statistics
+    from app.db.session import engine
+
+    assert isinstance(engine.pool, InstrumentedAsyncQueuePool)
+    assert engine.echo is False
+
+    stats = pool_statistics(engine)
+    assert stats["size"] == settings.DB_POOL_SIZE
+    assert stats["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert stats["checked_out"] == 0
+    assert stats["overflow"] == 0
+    assert "histogram" in stats["wait"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_instrumented_pool_records_checkouts_and_timeouts(tmp_path):
+    """
+    Test: 풀이 가득 찬 상태에서 커넥션 요청
+    Expected: 체크아웃 수 보고, pool_timeout 초과 시 타임아웃과 대기 시간 기록
+    """
+    from sqlalchemy import exc, text
+    from app.db.pool import InstrumentedAsyncQueuePool, PoolMetrics, pool_statistics
+    from app.db.session import create_engine
+
+    metrics = PoolMetrics()
+    engine = create_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        metrics=metrics,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            stats = pool_statistics(engine)
+            assert stats["checked_out"] == 1
+            assert stats["wait"]["count"] == 1
+
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        stats = pool_statistics(engine)
+        assert stats["checked_out"] == 0
+        assert stats["checked_in"] == 1
+        assert stats["wait"]["timeouts"] == 1
+        assert stats["wait"]["count"] == 2
+        assert stats["wait"]["max_seconds"] >= 0.2
+
+        # dispose() 후 새 풀도 같은 metrics 사용
+        await engine.dispose()
+        assert engine.pool.metrics is metrics
+    finally:
+        await engine.dispose()
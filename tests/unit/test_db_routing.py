@@ -0,0 +1,168 @@
+"""
+Unit Tests for Read-Replica Session Routing
+
+SQLite 파일 여러 개를 기본 DB/복제본으로 사용해 RoutingSession 라우팅 테스트
+(복제는 하지 않으므로 어느 DB에서 읽었는지 행 내용으로 구분한다)
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+from app.db.base import Base
+from app.models.student_attempt import StudentAttempt
+
+
+@pytest_asyncio.fixture
+async def routed_engines(tmp_path):
+    """기본 DB 1개, 복제본 2개 (각 DB에 자기 이름의 question_id 행 1개)"""
+    engines = {}
+    for name in ("primary", "replica_a", "replica_b"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(StudentAttempt(student_id="s1", question_id=name, concept="A", is_correct=True))
+            await session.commit()
+        engines[name] = engine
+
+    yield engines
+
+    for engine in engines.values():
+        await engine.dispose()
+
+
+def _session_maker(engines, read_your_writes_seconds=60.0, replicas=("replica_a", "replica_b")):
+    from app.db.routing import DatabaseRouter, RoutingSession
+
+    router = DatabaseRouter(
+        engines["primary"],
+        [engines[name] for name in replicas],
+        read_your_writes_seconds=read_your_writes_seconds
+    )
+    return async_sessionmaker(
+        engines["primary"],
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        router=router,
+        expire_on_commit=False
+    )
+
+
+def _replica_session(session_maker):
+    """use_replica()로 표시한 세션"""
+    from app.db.routing import use_replica
+
+    session = session_maker()
+    use_replica(session)
+    return session
+
+
+async def _read_source(session) -> set:
+    """세션이 읽은 DB 이름 (question_id 집합)"""
+    result = await session.execute(select(StudentAttempt.question_id))
+    return set(result.scalars().all())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reads_use_primary_by_default(routed_engines):
+    """
+    Test: use_replica()로 표시하지 않은 세션의 SELECT
+    Expected: 복제본이 있어도 기본 DB
+    """
+    session_maker = _session_maker(routed_engines)
+    for _ in range(2):
+        async with session_maker() as session:
+            assert await _read_source(session) == {"primary"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reads_round_robin_across_replicas(routed_engines):
+    """
+    Test: use_replica()로 표시한, 쓰기가 없는 세션의 SELECT
+    Expected: 세션마다 복제본을 번갈아 선택, 한 세션 안에서는 같은 복제본 유지
+    """
+    session_maker = _session_maker(routed_engines)
+
+    sources = []
+    for _ in range(4):
+        async with _replica_session(session_maker) as session:
+            first = await _read_source(session)
+            assert await _read_source(session) == first
+            sources.append(first)
+
+    assert sources == [{"replica_a"}, {"replica_b"}, {"replica_a"}, {"replica_b"}]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_writes_go_to_primary_with_read_your_writes(routed_engines):
+    """
+    Test: 세션에서 쓰기 후 읽기
+    Expected: 쓰기는 기본 DB, 커밋 전후 read-your-writes 구간 동안 읽기도 기본 DB
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+
+    session_maker = _session_maker(routed_engines)
+    async with _replica_session(session_maker) as session:
+        repo = StudentAttemptRepository(session)
+        assert await repo.count_attempts_by_student("s1") == 1
+
+        await repo.create_attempt("s1", "written", "A", False)
+        assert await _read_source(session) == {"primary", "written"}
+
+    async with AsyncSession(routed_engines["primary"]) as session:
+        assert await _read_source(session) == {"primary", "written"}
+    for name in ("replica_a", "replica_b"):
+        async with AsyncSession(routed_engines[name]) as session:
+            assert await _read_source(session) == {name}
+
+    # 구간이 0이면 커밋 직후 다시 복제본에서 읽음
+    session_maker = _session_maker(routed_engines, read_your_writes_seconds=0)
+    async with _replica_session(session_maker) as session:
+        session.add(StudentAttempt(student_id="s1", question_id="again", concept="A", is_correct=True))
+        await session.commit()
+        assert "again" not in await _read_source(session)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pending_flush_and_locking_reads_use_primary(routed_engines):
+    """
+    Test: use_replica() 세션에서 커밋하지 않은 flush, SELECT ... FOR UPDATE, use_primary()
+    Expected: 모두 기본 DB
+    """
+    from app.db.routing import is_read_only, use_primary
+
+    session_maker = _session_maker(routed_engines)
+
+    async with _replica_session(session_maker) as session:
+        session.add(StudentAttempt(student_id="s1", question_id="pending", concept="A", is_correct=True))
+        await session.flush()
+        assert await _read_source(session) == {"primary", "pending"}
+        await session.rollback()
+
+        # 롤백된 쓰기는 read-your-writes 구간을 만들지 않음
+        assert (await _read_source(session)) <= {"replica_a", "replica_b"}
+
+    stmt = select(StudentAttempt).with_for_update()
+    assert not is_read_only(stmt)
+    assert is_read_only(select(StudentAttempt))
+
+    async with _replica_session(session_maker) as session:
+        use_primary(session)
+        assert await _read_source(session) == {"primary"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_without_replicas_everything_uses_primary(routed_engines):
+    """
+    Test: 복제본이 설정되지 않은 라우터
+    Expected: 모든 읽기가 기본 DB
+    """
+    session_maker = _session_maker(routed_engines, replicas=())
+    async with _replica_session(session_maker) as session:
+        assert await _read_source(session) == {"primary"}
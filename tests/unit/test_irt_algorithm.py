@@ -360,3 +360,204 @@ def test_select_best_question_empty_list():
 
     best = irt.select_best_question(1.0, [])
     assert best == 0.0
+
+
+@pytest.mark.unit
+def test_estimate_abilities_batch_matches_scalar():
+    """
+    Test: 배치 능력 추정이 학생별 estimate_ability와 일치
+    Expected: 오차 1e-9 이내, 응답 없는 학생은 0.0, 전부 정답인 학생은 상한 5.0
+    """
+    import random
+    from app.algorithms.irt import ItemResponseTheory
+
+    irt = ItemResponseTheory()
+    rng = random.Random(11)
+    difficulties = [rng.uniform(-2, 2) for _ in range(30)]
+
+    students, items, responses = [], [], []
+    for student in range(40):
+        if student == 5:
+            continue  # 응답 없는 학생
+        for item in rng.sample(range(30), rng.randint(1, 15)):
+            students.append(student)
+            items.append(item)
+            responses.append(True if student == 7 else rng.random() < 0.6)
+
+    thetas = irt.estimate_abilities_batch(students, items, responses, difficulties, n_students=41)
+
+    assert thetas.shape == (41,)
+    for student in range(41):
+        attempts = [
+            {"difficulty": difficulties[i], "is_correct": y}
+            for s, i, y in zip(students, items, responses) if s == student
+        ]
+        assert thetas[student] == pytest.approx(irt.estimate_ability(attempts), abs=1e-9)
+    assert thetas[5] == 0.0
+    assert thetas[7] == 5.0
+
+
+@pytest.mark.unit
+def test_estimate_abilities_batch_options():
+    """
+    Test: 2PL 변별도, 학생별 초기값, 빈 입력, 잘못된 입력
+    Expected: 변별도가 높으면 같은 응답에서 추정이 덜 극단적, 잘못된 길이는 ValueError
+    """
+    import numpy as np
+    from app.algorithms.irt import ItemResponseTheory
+
+    irt = ItemResponseTheory()
+
+    # 빈 입력
+    assert irt.estimate_abilities_batch([], [], [], []).shape == (0,)
+    assert list(irt.estimate_abilities_batch([], [], [], [], n_students=2)) == [0.0, 0.0]
+
+    # 2PL: 한 학생이 쉬운 문제 정답, 어려운 문제 오답
+    args = ([0, 0], [0, 1], [True, False], [-1.0, 1.0])
+    theta_1pl = irt.estimate_abilities_batch(*args)[0]
+    theta_2pl = irt.estimate_abilities_batch(*args, item_discriminations=[2.0, 2.0])[0]
+    assert theta_1pl == pytest.approx(0.0, abs=1e-3)
+    assert theta_2pl == pytest.approx(0.0, abs=1e-3)
+
+    # 학생별 초기값 배열
+    thetas = irt.estimate_abilities_batch(
+        [0, 1], [0, 0], [True, False], [0.0], initial_theta=np.array([1.0, -1.0])
+    )
+    assert thetas[0] > 0 > thetas[1]
+
+    with pytest.raises(ValueError, match="equal length"):
+        irt.estimate_abilities_batch([0, 1], [0], [True, False], [0.0])
+
+
+def _brute_force_posterior(attempts, prior_mean=0.0, prior_sd=1.0):
+    """조밀한 격자 적분으로 사후 평균/표준편차/최빈값 계산"""
+    import numpy as np
+
+    grid = np.linspace(prior_mean - 8 * prior_sd, prior_mean + 8 * prior_sd, 40001)
+    posterior = np.exp(-0.5 * ((grid - prior_mean) / prior_sd) ** 2)
+    for attempt in attempts:
+        a = attempt.get("discrimination", 1.0)
+        c = attempt.get("guessing", 0.0)
+        p = c + (1 - c) / (1 + np.exp(-a * (grid - attempt["difficulty"])))
+        posterior *= p if attempt["is_correct"] else 1 - p
+    posterior /= posterior.sum()
+    mean = float((grid * posterior).sum())
+    sd = float(np.sqrt(((grid - mean) ** 2 * posterior).sum()))
+    return mean, sd, float(grid[posterior.argmax()])
+
+
+@pytest.mark.unit
+def test_3pl_probability_and_information():
+    """
+    Test: 3PL 확률/정보량
+    Expected: 하한이 c, c=0이면 2PL과 동일, 추측이 있으면 정보량 감소
+    """
+    from app.algorithms.irt import ItemResponseTheory
+
+    irt = ItemResponseTheory()
+
+    assert irt.calculate_probability(-20.0, 0.0, 1.0, guessing=0.25) == pytest.approx(0.25, abs=1e-6)
+    assert irt.calculate_probability(0.0, 0.0, 1.0, guessing=0.25) == pytest.approx(0.625)
+    assert irt.calculate_probability(0.5, 0.0, 1.2, guessing=0.0) == irt.calculate_probability(0.5, 0.0, 1.2)
+
+    assert irt.calculate_information(0.3, 0.0, 1.5, 0.0) == irt.calculate_information(0.3, 0.0, 1.5)
+    assert irt.calculate_information(0.0, 0.0, 1.5, 0.2) < irt.calculate_information(0.0, 0.0, 1.5)
+
+    # 3PL 정보량 = P'(θ)² / (P(1-P)) (수치 미분과 비교)
+    h = 1e-5
+    p = irt.calculate_probability(0.4, 0.1, 1.3, 0.2)
+    dp = (irt.calculate_probability(0.4 + h, 0.1, 1.3, 0.2) - irt.calculate_probability(0.4 - h, 0.1, 1.3, 0.2)) / (2 * h)
+    assert irt.calculate_information(0.4, 0.1, 1.3, 0.2) == pytest.approx(dp ** 2 / (p * (1 - p)), rel=1e-6)
+
+
+@pytest.mark.unit
+def test_eap_and_map_match_brute_force_posterior():
+    """
+    Test: Gauss-Hermite EAP, Fisher scoring MAP
+    Expected: 조밀한 격자 적분 결과와 일치 (1PL/2PL/3PL 혼합, 사전분포 변경)
+    """
+    from app.algorithms.irt import ItemResponseTheory
+
+    irt = ItemResponseTheory()
+    attempts = [
+        {"difficulty": 0.0, "is_correct": True},
+        {"difficulty": 1.0, "is_correct": True, "discrimination": 1.8},
+        {"difficulty": -0.5, "is_correct": False, "discrimination": 1.5, "guessing": 0.2},
+        {"difficulty": 0.7, "is_correct": True, "guessing": 0.25},
+    ]
+
+    for prior_mean, prior_sd in [(0.0, 1.0), (0.5, 1.5)]:
+        mean, sd, mode = _brute_force_posterior(attempts, prior_mean, prior_sd)
+
+        eap = irt.estimate_ability_eap(attempts, prior_mean, prior_sd)
+        assert eap["theta"] == pytest.approx(mean, abs=1e-4)
+        assert eap["standard_error"] == pytest.approx(sd, abs=1e-4)
+
+        map_estimate = irt.estimate_ability_map(attempts, prior_mean, prior_sd)
+        assert map_estimate["theta"] == pytest.approx(mode, abs=1e-3)
+
+
+@pytest.mark.unit
+def test_eap_stays_finite_on_extreme_patterns():
+    """
+    Test: 전부 정답/오답 응답 패턴
+    Expected: MLE는 ±5 클램프, EAP/MAP는 유한하고 대칭, 응답 없으면 사전분포
+    """
+    from app.algorithms.irt import ItemResponseTheory
+
+    irt = ItemResponseTheory()
+    all_correct = [{"difficulty": d, "is_correct": True} for d in (-1.0, 0.0, 1.0)]
+    all_wrong = [{"difficulty": d, "is_correct": False} for d in (-1.0, 0.0, 1.0)]
+
+    assert irt.estimate_ability(all_correct) == 5.0
+
+    high = irt.estimate_ability_eap(all_correct)
+    low = irt.estimate_ability_eap(all_wrong)
+    assert 0 < high["theta"] < 3
+    assert low["theta"] == pytest.approx(-high["theta"])
+    assert 0 < irt.estimate_ability_map(all_correct)["theta"] < high["theta"]
+
+    prior = irt.estimate_ability_eap([])
+    assert prior["theta"] == pytest.approx(0.0, abs=1e-12)
+    assert prior["standard_error"] == pytest.approx(1.0)
+
+    with pytest.raises(ValueError, match="prior_sd must be positive"):
+        irt.estimate_ability_eap(all_correct, prior_sd=0)
+    with pytest.raises(ValueError, match="guessing must be in"):
+        irt.estimate_ability_eap([{"difficulty": 0.0, "is_correct": True, "guessing": 1.0}])
+
+
+@pytest.mark.unit
+def test_eap_batch_matches_single():
+    """
+    Test: 응답 행렬 EAP 배치
+    Expected: 학생별 단일 EAP와 일치, NaN은 미응답으로 처리
+    """
+    import numpy as np
+    from app.algorithms.irt import ItemResponseTheory
+
+    irt = ItemResponseTheory()
+    difficulties = [-1.0, 0.0, 0.5, 1.5]
+    discriminations = [1.0, 1.5, 0.8, 2.0]
+    guessings = [0.0, 0.2, 0.0, 0.25]
+    matrix = np.array([
+        [1, 0, 1, np.nan],
+        [1, 1, 1, 1],
+        [np.nan, np.nan, np.nan, np.nan],
+        [0, 0, np.nan, 0],
+    ])
+
+    batch = irt.estimate_abilities_eap_batch(matrix, difficulties, discriminations, guessings)
+
+    for row, theta, se in zip(matrix, batch["theta"], batch["standard_error"]):
+        attempts = [
+            {"difficulty": b, "discrimination": a, "guessing": c, "is_correct": bool(y)}
+            for y, b, a, c in zip(row, difficulties, discriminations, guessings)
+            if not np.isnan(y)
+        ]
+        single = irt.estimate_ability_eap(attempts)
+        assert theta == pytest.approx(single["theta"], abs=1e-12)
+        assert se == pytest.approx(single["standard_error"], abs=1e-12)
+
+    with pytest.raises(ValueError, match="one column per item"):
+        irt.estimate_abilities_eap_batch([[1, 0]], difficulties)
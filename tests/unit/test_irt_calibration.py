@@ -0,0 +1,210 @@
+"""
+Unit Tests for IRT Joint Calibration (JMLE)
+
+TDD: 문항 난이도/변별도와 학생 능력 동시 추정 테스트
+
+- JointMLECalibrator: 교대 Newton 스텝, 체크포인트 재개
+- StudentAttemptRepository.stream_item_responses: 응답 행 청크 스트리밍
+- IRTCalibrationService: 문항 은행 저장
+- WeeklyDiagnosticService: 보정된 난이도 사용
+"""
+import numpy as np
+import pytest
+
+
+def _simulate_responses(n_students, n_items, discrimination=None, density=0.7, seed=0):
+    """알려진 θ, b, (a)로 응답 생성"""
+    rng = np.random.default_rng(seed)
+    theta = rng.normal(size=n_students)
+    difficulty = rng.normal(size=n_items)
+    difficulty -= difficulty.mean()
+    a = np.ones(n_items) if discrimination is None else discrimination
+
+    students = np.repeat(np.arange(n_students), n_items)
+    items = np.tile(np.arange(n_items), n_students)
+    keep = rng.random(students.size) < density
+    students, items = students[keep], items[keep]
+
+    p = 1.0 / (1.0 + np.exp(-a[items] * (theta[students] - difficulty[items])))
+    responses = rng.random(students.size) < p
+    return students, items, responses, theta, difficulty
+
+
+@pytest.mark.unit
+def test_jmle_recovers_item_difficulties():
+    """
+    Test: 1PL 생성 데이터에서 난이도 복원
+    Expected: 수렴, 난이도 평균 0, 생성 난이도와 높은 상관
+    """
+    from app.algorithms.irt_calibration import JointMLECalibrator
+
+    students, items, responses, theta, difficulty = _simulate_responses(1500, 30)
+    result = JointMLECalibrator().calibrate(students, items, responses)
+
+    assert result["converged"]
+    assert result["difficulty"].mean() == pytest.approx(0.0, abs=1e-9)
+    assert np.corrcoef(result["difficulty"], difficulty)[0, 1] > 0.98
+    assert np.corrcoef(result["theta"], theta)[0, 1] > 0.8
+    assert np.all(result["discrimination"] == 1.0)
+
+
+@pytest.mark.unit
+def test_jmle_2pl_estimates_discrimination():
+    """
+    Test: 2PL 보정
+    Expected: 변별도가 생성 변별도와 양의 상관, 범위 내로 클리핑
+    """
+    from app.algorithms.irt_calibration import JointMLECalibrator
+
+    a = np.random.default_rng(7).uniform(0.5, 2.0, size=30)
+    students, items, responses, _, difficulty = _simulate_responses(2000, 30, discrimination=a)
+    result = JointMLECalibrator(model="2PL", max_iterations=50).calibrate(students, items, responses)
+
+    assert np.corrcoef(result["discrimination"], a)[0, 1] > 0.8
+    assert np.corrcoef(result["difficulty"], difficulty)[0, 1] > 0.95
+    assert result["discrimination"].min() >= 0.2
+    assert result["discrimination"].max() <= 4.0
+
+
+@pytest.mark.unit
+def test_jmle_checkpoint_resume_matches_uninterrupted(tmp_path):
+    """
+    Test: 중간 체크포인트에서 재개
+    Expected: 중단 없이 실행한 결과와 동일, 형태 불일치 체크포인트는 거부
+    """
+    from app.algorithms.irt_calibration import JointMLECalibrator
+
+    students, items, responses, _, _ = _simulate_responses(300, 15, seed=1)
+    path = str(tmp_path / "calibration.npz")
+    saved = []
+
+    def checkpoint(state):
+        JointMLECalibrator.save_checkpoint(path, state)
+        saved.append(state["iteration"])
+
+    partial = JointMLECalibrator(max_iterations=3).calibrate(
+        students, items, responses, checkpoint=checkpoint, checkpoint_every=2
+    )
+    assert saved == [2, 3]
+    assert not partial["converged"]
+
+    resumed = JointMLECalibrator().calibrate(
+        students, items, responses, resume_from=JointMLECalibrator.load_checkpoint(path)
+    )
+    uninterrupted = JointMLECalibrator().calibrate(students, items, responses)
+
+    assert resumed["iteration"] == uninterrupted["iteration"]
+    assert np.array_equal(resumed["difficulty"], uninterrupted["difficulty"])
+    assert np.array_equal(resumed["theta"], uninterrupted["theta"])
+
+    with pytest.raises(ValueError, match="does not match"):
+        JointMLECalibrator().calibrate(
+            students, items, responses, n_items=20, resume_from=JointMLECalibrator.load_checkpoint(path)
+        )
+    with pytest.raises(ValueError, match="does not match"):
+        JointMLECalibrator(model="2PL").calibrate(
+            students, items, responses, resume_from=JointMLECalibrator.load_checkpoint(path)
+        )
+
+
+@pytest.mark.unit
+def test_jmle_invalid_input():
+    """
+    Test: 잘못된 모델/배열
+    Expected: ValueError 발생, 빈 입력은 초기값 그대로
+    """
+    from app.algorithms.irt_calibration import JointMLECalibrator
+
+    with pytest.raises(ValueError, match="model must be one of"):
+        JointMLECalibrator(model="3PL")
+
+    with pytest.raises(ValueError, match="equal length"):
+        JointMLECalibrator().calibrate([0, 1], [0], [True, False])
+
+    empty = JointMLECalibrator().calibrate([], [], [])
+    assert empty["iteration"] == 0
+    assert empty["difficulty"].size == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_calibration_service_saves_item_bank(db_session, tmp_path):
+    """
+    Test: student_attempts → item_bank 저장
+    Expected: 응답 수가 충분한 문항만 저장, 정답률 높은 문항이 더 낮은 난이도, 체크포인트 정리
+    """
+    from app.models.student_attempt import StudentAttempt
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.item_bank_repository import ItemBankRepository
+    from app.services.irt_calibration_service import IRTCalibrationService
+
+    students, items, responses, _, _ = _simulate_responses(120, 6, density=1.0, seed=2)
+    for s, i, is_correct in zip(students, items, responses):
+        db_session.add(StudentAttempt(
+            student_id=f"s{s}", question_id=f"q{i}", concept="일차함수", is_correct=bool(is_correct)
+        ))
+    db_session.add(StudentAttempt(student_id="s0", question_id="q_rare", concept="일차함수", is_correct=True))
+    await db_session.commit()
+
+    chunks = [
+        chunk async for chunk in StudentAttemptRepository(db_session).stream_item_responses(chunk_size=100)
+    ]
+    assert sum(len(chunk) for chunk in chunks) == 721
+    assert max(len(chunk) for chunk in chunks) == 100
+
+    bank = ItemBankRepository(db_session)
+    checkpoint_path = str(tmp_path / "item_bank.npz")
+    service = IRTCalibrationService(StudentAttemptRepository(db_session), bank)
+    summary = await service.calibrate(chunk_size=100, min_responses=10, checkpoint_path=checkpoint_path)
+
+    assert summary["n_items"] == 7
+    assert summary["n_responses"] == 721
+    assert summary["saved"] == 6
+
+    # 모든 학생이 모든 문항에 응답했으면 1PL 난이도 순서 = 정답률 역순
+    accuracy = np.bincount(items, weights=responses) / np.bincount(items)
+    saved = await bank.list_by_concept("일차함수")
+    assert [item.question_id for item in saved] == [f"q{i}" for i in np.argsort(-accuracy, kind="stable")]
+    assert all(item.n_responses == 120 and item.model == "1PL" for item in saved)
+    assert await bank.get_by_ids(["q_rare"]) == {}
+    assert not (tmp_path / "item_bank.npz").exists()
+
+    # 재보정 시 덮어쓰기
+    await service.calibrate(chunk_size=100, min_responses=10)
+    assert len(await bank.list_all()) == 6
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_weekly_diagnostic_uses_calibrated_difficulty(db_session):
+    """
+    Test: 추천 문항에 보정된 IRT 난이도 첨부
+    Expected: 문항 은행에 있는 문항만 irt_difficulty 설정, 세션 메타데이터에도 기록
+    """
+    from unittest.mock import AsyncMock
+    from app.repositories.item_bank_repository import ItemBankRepository
+    from app.services.weekly_diagnostic_service import (
+        WeeklyDiagnosticService,
+        WeeklyDiagnosticRequest
+    )
+
+    await ItemBankRepository(db_session).save_many([
+        {"question_id": "q_1", "concept": "일차함수", "difficulty": -0.8, "n_responses": 50}
+    ])
+
+    mcp = AsyncMock()
+    mcp.call.side_effect = [
+        {"concepts": []},
+        {"questions": [
+            {"id": "q_1", "content": "문제 1", "difficulty": "hard", "concepts": ["일차함수"]},
+            {"id": "q_2", "content": "문제 2", "difficulty": "easy", "concepts": ["일차함수"]},
+        ]},
+    ]
+
+    result = await WeeklyDiagnosticService(mcp, db_session).start_diagnostic(
+        WeeklyDiagnosticRequest(student_id="student_1", curriculum_path="중학수학.2학년.1학기")
+    )
+
+    assert [q.irt_difficulty for q in result.questions] == [-0.8, None]
+    status = await WeeklyDiagnosticService(mcp, db_session).get_workflow_status(result.workflow_id)
+    assert status["metadata"]["questions"][0]["irt_difficulty"] == -0.8
@@ -0,0 +1,125 @@
+"""
+Unit Tests for Item Bank Index
+
+TDD: 난이도 정렬 + 변별도 구간 인덱스의 최대 정보량 top-k 선택 테스트
+
+- 결과는 전체 스캔(brute force)과 동일해야 함
+- 제외 집합, 개념 필터 지원
+"""
+import math
+import random
+import pytest
+
+
+def _make_items(n, n_concepts=5, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "question_id": f"q{i}",
+            "concept": f"개념{i % n_concepts}",
+            "difficulty": rng.gauss(0, 1.5),
+            "discrimination": rng.lognormvariate(0, 0.4),
+        }
+        for i in range(n)
+    ]
+
+
+def _brute_force(items, theta, k, exclude=(), concepts=None):
+    """전체 스캔 기준 결과"""
+    scored = []
+    for item in items:
+        if item["question_id"] in exclude:
+            continue
+        if concepts is not None and item["concept"] not in concepts:
+            continue
+        a = item["discrimination"]
+        p = 1.0 / (1.0 + math.exp(-a * (theta - item["difficulty"])))
+        scored.append((a * a * p * (1 - p), item["question_id"]))
+    scored.sort(reverse=True)
+    return [question_id for _, question_id in scored[:k]]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("theta", [-4.0, -1.0, 0.0, 0.7, 3.5])
+def test_top_k_matches_brute_force(theta):
+    """
+    Test: 상한 기반 조기 종료 탐색
+    Expected: 전체 스캔과 같은 문항/순서, 정보량은 ItemResponseTheory와 일치
+    """
+    from app.algorithms.irt import ItemResponseTheory
+    from app.algorithms.item_bank_index import ItemBankIndex
+
+    items = _make_items(3000)
+    index = ItemBankIndex(items)
+    irt = ItemResponseTheory()
+
+    result = index.top_k(theta, k=10)
+
+    assert [item["question_id"] for item in result] == _brute_force(items, theta, 10)
+    for item in result:
+        assert item["information"] == pytest.approx(
+            irt.calculate_information(theta, item["difficulty"], item["discrimination"])
+        )
+
+
+@pytest.mark.unit
+def test_top_k_exclusion_and_concept_filter():
+    """
+    Test: 이미 출제한 문항 제외, 개념 필터
+    Expected: 제외/필터 조건을 반영한 전체 스캔 결과와 동일
+    """
+    from app.algorithms.item_bank_index import ItemBankIndex
+
+    items = _make_items(2000, seed=1)
+    index = ItemBankIndex(items)
+    seen = {item["question_id"] for item in items[::2]}
+
+    assert [i["question_id"] for i in index.top_k(0.3, k=5, exclude=seen)] == \
+        _brute_force(items, 0.3, 5, exclude=seen)
+
+    concepts = ["개념1", "개념3"]
+    result = index.top_k(0.3, k=5, exclude=seen, concepts=concepts)
+    assert [i["question_id"] for i in result] == _brute_force(items, 0.3, 5, seen, concepts)
+    assert {i["concept"] for i in result} <= set(concepts)
+
+    assert index.top_k(0.3, k=5, concepts=["없는_개념"]) == []
+    assert index.top_k(0.3, k=0) == []
+
+
+@pytest.mark.unit
+def test_top_k_small_bank_and_defaults():
+    """
+    Test: k가 남은 문항 수보다 큰 경우, 1PL 문항(변별도 생략)
+    Expected: 남은 문항 전부를 정보량 순으로 반환
+    """
+    from app.algorithms.item_bank_index import ItemBankIndex
+
+    index = ItemBankIndex([
+        {"question_id": "q1", "concept": "A", "difficulty": -1.0},
+        {"question_id": "q2", "concept": "A", "difficulty": 0.2, "discrimination": None},
+        {"question_id": "q3", "concept": "B", "difficulty": 2.0},
+    ])
+
+    assert len(index) == 3
+    assert index.concepts == ["A", "B"]
+    assert [i["question_id"] for i in index.top_k(0.0, k=10, exclude={"q2"})] == ["q1", "q3"]
+    assert index.top_k(0.0, k=1)[0]["discrimination"] == 1.0
+
+
+@pytest.mark.unit
+def test_index_accepts_item_bank_rows_and_rejects_invalid():
+    """
+    Test: ItemBankItem 객체로 구성, 잘못된 변별도
+    Expected: 속성 기반 구성 가능, 변별도 0 이하는 ValueError
+    """
+    from app.algorithms.item_bank_index import ItemBankIndex
+    from app.models.item_bank import ItemBankItem
+
+    rows = [
+        ItemBankItem(question_id="q1", concept="A", difficulty=0.5, discrimination=1.2),
+        ItemBankItem(question_id="q2", concept="A", difficulty=-0.5, discrimination=0.8),
+    ]
+    assert ItemBankIndex(rows).top_k(0.6, k=1)[0]["question_id"] == "q1"
+
+    with pytest.raises(ValueError, match="discrimination must be positive"):
+        ItemBankIndex([{"question_id": "q", "concept": "A", "difficulty": 0.0, "discrimination": 0.0}])
@@ -262,3 +262,186 @@ async def test_mastery_service_with_custom_bkt_params(db_session):
 
     # Then: 높은 p_learn으로 인해 더 큰 숙련도 증가
     assert mastery > 0.5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_calculate_concept_mastery_reads_stored_state(db_session):
+    """
+    Test: 저장된 숙련도 상태가 있으면 기록을 재생하지 않고 상태 값을 반환
+    Expected: 상태의 p_mastery 반환, 파라미터가 다르면 재계산
+    """
+    from app.services.mastery_service import MasteryService
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    # Given: create_attempt로 상태 생성 후 값을 임의로 변경
+    bkt = BayesianKnowledgeTracing()
+    repo = StudentAttemptRepository(db_session, bkt)
+    await repo.create_attempt("student_1", "q_1", "이차방정식", True)
+    state = await repo.get_mastery_state("student_1", "이차방정식")
+    state.p_mastery = 0.4242
+    await db_session.commit()
+
+    # When / Then: 같은 파라미터 → 저장된 상태 사용
+    service = MasteryService(repo, bkt)
+    assert await service.calculate_concept_mastery("student_1", "이차방정식") == 0.4242
+
+    # When / Then: 다른 파라미터 → 기록 재생
+    custom = MasteryService(repo, BayesianKnowledgeTracing(p_init=0.2, p_learn=0.5))
+    assert await custom.calculate_concept_mastery("student_1", "이차방정식") > 0.5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_mastery_trajectory(db_session):
+    """
+    Test: 시도별 숙련도 궤적 조회
+    Expected: 시간순 포인트, 마지막 숙련도는 calculate_concept_mastery와 동일
+    """
+    from app.services.mastery_service import MasteryService
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.models.student_attempt import StudentAttempt
+
+    now = datetime.utcnow()
+    outcomes = [False, True, True, False]
+    # 역순 삽입
+    for i, is_correct in reversed(list(enumerate(outcomes))):
+        db_session.add(StudentAttempt(
+            student_id="student_1", question_id=f"q_{i}", concept="이차방정식",
+            is_correct=is_correct, attempted_at=now + timedelta(seconds=i)
+        ))
+    await db_session.commit()
+
+    service = MasteryService(StudentAttemptRepository(db_session), BayesianKnowledgeTracing())
+
+    points = await service.get_mastery_trajectory("student_1", "이차방정식")
+    assert [p["is_correct"] for p in points] == outcomes
+    assert all(p["smoothed_mastery"] is None for p in points)
+    assert points[-1]["mastery"] == await service.calculate_concept_mastery("student_1", "이차방정식")
+
+    smoothed = await service.get_mastery_trajectory("student_1", "이차방정식", smoothed=True)
+    assert smoothed[-1]["smoothed_mastery"] == pytest.approx(smoothed[-1]["mastery"])
+    assert await service.get_mastery_trajectory("student_1", "없는_개념") == []
+
+    # 망각 모델도 smoothed 궤적 제공 (마지막 값은 필터링 값)
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+    forgetting = MasteryService(StudentAttemptRepository(db_session), ForgettingKnowledgeTracing(half_life_days=7))
+    decayed = await forgetting.get_mastery_trajectory("student_1", "이차방정식", smoothed=True)
+    assert decayed[-1]["smoothed_mastery"] == pytest.approx(decayed[-1]["mastery"])
+
+    # 같은 시각의 시도는 id 순 (숙련도 계산과 같은 순서)
+    for i, is_correct in enumerate([True, False, False]):
+        db_session.add(StudentAttempt(
+            student_id="student_1", question_id=f"tie_{i}", concept="일차함수",
+            is_correct=is_correct, attempted_at=now
+        ))
+    await db_session.commit()
+
+    tied = await service.get_mastery_trajectory("student_1", "일차함수")
+    assert [p["attempt_id"] for p in tied] == sorted(p["attempt_id"] for p in tied)
+    assert [p["is_correct"] for p in tied] == [True, False, False]
+    assert tied[-1]["mastery"] == await service.calculate_concept_mastery("student_1", "일차함수")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_mastery_profile_single_query_matches_per_concept(db_session):
+    """
+    Test: 프로파일은 학생 시도를 한 쿼리로 읽고 개념별로 BKT 누적
+    Expected: 개념 수와 무관하게 SELECT 1회, 값은 개념별 calculate_concept_mastery와 동일
+    """
+    from datetime import datetime, timedelta
+    from sqlalchemy import event
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+    from app.models.student_attempt import StudentAttempt
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.services.bkt_parameter_store import BKTParameterStore
+    from app.services.mastery_service import MasteryService
+
+    start = datetime.utcnow() - timedelta(days=60)
+    for c in range(8):
+        # 시간 역순으로 넣어도 attempted_at 순으로 누적되어야 함
+        for i in reversed(range(5)):
+            db_session.add(StudentAttempt(
+                student_id="student_1", question_id=f"q_{c}_{i}", concept=f"개념{c}",
+                is_correct=(i + c) % 3 != 0, attempted_at=start + timedelta(days=c + 7 * i)
+            ))
+    db_session.add(StudentAttempt(student_id="student_2", question_id="q", concept="개념0", is_correct=False))
+    await db_session.commit()
+
+    bkt = ForgettingKnowledgeTracing(half_life_days=30)
+    store = BKTParameterStore(
+        {"개념3": BayesianKnowledgeTracing(p_init=0.3, p_learn=0.2, p_slip=0.05, p_guess=0.1)},
+        default=bkt
+    )
+    service = MasteryService(StudentAttemptRepository(db_session, bkt, store), bkt, store)
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        profile = await service.get_student_mastery_profile("student_1")
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert sorted(profile) == [f"개념{c}" for c in range(8)]
+    for concept, mastery in profile.items():
+        # 조회 시점(utcnow) 차이만큼의 감쇠 차이는 허용
+        expected = await service.calculate_concept_mastery("student_1", concept)
+        assert mastery == pytest.approx(expected, abs=1e-6)
+
+    assert await service.get_student_mastery_profile("no_such_student") == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_multiple_concepts_mastery_bounded_concurrency(db_session):
+    """
+    Test: 세션 팩토리가 있으면 개념별 별도 세션으로 병렬 계산
+    Expected: 동시 세션 수 <= max_concurrency, 결과는 단일 세션(단일 쿼리) 경로와 동일
+    """
+    import asyncio
+    from contextlib import asynccontextmanager
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.services.mastery_service import MasteryService
+
+    bkt = BayesianKnowledgeTracing()
+    repo = StudentAttemptRepository(db_session, bkt)
+    concepts = [f"개념{c}" for c in range(6)]
+    for c, concept in enumerate(concepts[:5]):
+        for i in range(c + 1):
+            await repo.create_attempt("student_1", f"q_{c}_{i}", concept, i % 2 == 0)
+
+    maker = async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False)
+    active, peak = 0, 0
+
+    @asynccontextmanager
+    async def counting_factory():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            async with maker() as session:
+                await asyncio.sleep(0.01)
+                yield session
+        finally:
+            active -= 1
+
+    concurrent = MasteryService(repo, bkt, session_factory=counting_factory, max_concurrency=2)
+    single = MasteryService(repo, bkt)
+
+    concurrent_map = await concurrent.calculate_multiple_concepts_mastery("student_1", concepts)
+    single_map = await single.calculate_multiple_concepts_mastery("student_1", concepts)
+
+    assert peak == 2
+    assert list(concurrent_map) == concepts
+    assert concurrent_map == pytest.approx(single_map, abs=1e-12)
+    assert single_map["개념5"] == bkt.p_init
+    assert await concurrent.calculate_multiple_concepts_mastery("student_1", []) == {}
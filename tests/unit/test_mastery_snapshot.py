@@ -0,0 +1,413 @@
+"""
+Unit Tests for Mastery Snapshots
+
+student_concept_mastery 스냅샷 갱신(상태 비교 배치)과 허용 지연 기반 조회 테스트
+"""
+import pytest
+from datetime import datetime, timedelta
+
+
+def _snapshot_service(db_session):
+    from app.services.mastery_service import MasteryService
+    from app.services.mastery_snapshot_service import MasterySnapshotService
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    bkt = BayesianKnowledgeTracing()
+    mastery_service = MasteryService(StudentAttemptRepository(db_session, bkt), bkt)
+    return MasterySnapshotService(mastery_service, MasterySnapshotRepository(db_session))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_consumes_pending_states_in_batches(db_session):
+    """
+    Test: 스냅샷과 다른 학생-개념 상태를 배치로 반영
+    Expected: 스냅샷 값 = 실시간 계산 값, 바뀐 쌍이 없으면 갱신 없음
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    repo = StudentAttemptRepository(db_session)
+    for i in range(6):
+        await repo.create_attempt("s1", f"q{i}", "A" if i % 2 else "B", i % 3 != 0)
+    await repo.create_attempt("s2", "q9", "A", True)
+
+    service = _snapshot_service(db_session)
+    snapshot_repo = MasterySnapshotRepository(db_session)
+
+    # 학생-개념 쌍 3개를 배치 2개로
+    results = [await service.refresh(batch_size=2) for _ in range(3)]
+    assert [r["snapshots"] for r in results] == [2, 1, 0]
+    assert [r["caught_up"] for r in results] == [False, True, True]
+    assert await snapshot_repo.get_pending() == []
+
+    snapshots = await snapshot_repo.get_by_student("s1")
+    live = await service.mastery_service.get_student_mastery_profile("s1")
+    assert [row.concept for row in snapshots] == ["A", "B"]
+    for row in snapshots:
+        assert row.p_mastery == pytest.approx(live[row.concept])
+
+    # 새 시도가 반영되어 해당 학생-개념 행만 갱신
+    attempt = await repo.create_attempt("s2", "q10", "A", False)
+    assert [(sid, c) for sid, c, _, _ in await snapshot_repo.get_pending()] == [("s2", "A")]
+    result = await service.refresh(batch_size=2)
+    assert result == {"snapshots": 1, "caught_up": True}
+    (row,) = await snapshot_repo.get_by_student("s2")
+    assert row.last_attempt_id == attempt.id
+    assert row.p_mastery == pytest.approx(
+        (await service.mastery_service.get_student_mastery_profile("s2"))["A"]
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_picks_up_late_committed_lower_ids(db_session):
+    """
+    Test: 스냅샷이 더 큰 ID까지 반영된 뒤, 더 작은 ID의 시도가 늦게 커밋된 경우
+          (긴 대량 적재 트랜잭션 등)
+    Expected: ID 순서와 무관하게 다음 갱신에서 반영
+    """
+    from app.models.student_attempt import StudentAttempt
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    repo = StudentAttemptRepository(db_session)
+    db_session.add(StudentAttempt(id=500, student_id="s1", question_id="q1", concept="A", is_correct=True))
+    await db_session.flush()
+    await repo._advance_mastery_state(await repo.get_by_id(500))
+    await db_session.commit()
+
+    service = _snapshot_service(db_session)
+    await service.refresh()
+
+    # ID 50을 먼저 받았지만 이제야 커밋된 트랜잭션
+    late = StudentAttempt(id=50, student_id="s2", question_id="q2", concept="B", is_correct=False)
+    db_session.add(late)
+    await db_session.flush()
+    await repo._advance_mastery_state(late)
+    await db_session.commit()
+
+    assert (await service.refresh())["snapshots"] == 1
+    (row,) = await MasterySnapshotRepository(db_session).get_by_student("s2")
+    assert row.last_attempt_id == 50
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_profile_respects_staleness_bound(db_session):
+    """
+    Test: 지연은 워커 진행 기준 — 반영 안 된 변경이 없으면 0, 있으면 caught_up_at 이후 경과
+    Expected: 오래 시도가 없는 개념은 지연을 늘리지 않음, 허용 지연 초과 시 실시간
+    """
+    from app.models.mastery_snapshot_progress import MasterySnapshotProgress, SNAPSHOT_WORKER_ID
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    repo = StudentAttemptRepository(db_session)
+    await repo.create_attempt("s1", "q1", "A", True)
+
+    service = _snapshot_service(db_session)
+    snapshot_repo = MasterySnapshotRepository(db_session)
+
+    # 스냅샷이 없으면 실시간
+    result = await service.get_profile("s1", max_staleness_seconds=300)
+    assert result["source"] == "live"
+    assert result["staleness_seconds"] == 0.0
+
+    before = datetime.utcnow()
+    await service.refresh()
+    assert await snapshot_repo.get_caught_up_at() >= before
+    result = await service.get_profile("s1", max_staleness_seconds=300)
+    assert result["source"] == "snapshot"
+    assert result["staleness_seconds"] == 0.0
+    assert set(result["profile"]) == {"A"}
+
+    # 0이면 항상 실시간
+    assert (await service.get_profile("s1", 0))["source"] == "live"
+
+    # 한 시간 동안 시도가 없던 개념: 스냅샷이 오래되었어도 정확하므로 지연 0
+    rows = await snapshot_repo.get_by_student("s1")
+    await snapshot_repo.save_many(
+        [
+            {"student_id": r.student_id, "concept": r.concept,
+             "p_mastery": r.p_mastery, "last_attempt_id": r.last_attempt_id}
+            for r in rows
+        ],
+        refreshed_at=datetime.utcnow() - timedelta(hours=1)
+    )
+    result = await service.get_profile("s1", 300)
+    assert result["source"] == "snapshot"
+    assert result["staleness_seconds"] == 0.0
+
+    # 반영 안 된 새 시도: 워커가 마지막으로 따라잡은 시각부터의 경과 시간
+    await repo.create_attempt("s1", "q2", "B", False)
+    result = await service.get_profile("s1", 300)
+    assert result["source"] == "snapshot"
+    assert 0 < result["staleness_seconds"] <= 300
+    assert "B" not in result["profile"]
+
+    # 워커가 30분째 따라잡지 못함 → 허용 지연 300초 초과
+    progress = await db_session.get(MasterySnapshotProgress, SNAPSHOT_WORKER_ID)
+    progress.caught_up_at = datetime.utcnow() - timedelta(minutes=30)
+    await db_session.commit()
+    result = await service.get_profile("s1", 300)
+    assert result["source"] == "live"
+    assert "B" in result["profile"]
+    assert (await service.get_profile("s1", 3600))["source"] == "snapshot"
+
+    # 진행 시각은 뒤로 가지 않음
+    await snapshot_repo.mark_caught_up(datetime.utcnow() - timedelta(hours=2))
+    assert await snapshot_repo.get_caught_up_at() > datetime.utcnow() - timedelta(hours=1)
+
+    # 다른 학생의 밀린 변경은 이 학생의 지연에 영향 없음
+    await service.refresh()
+    await repo.create_attempt("s2", "q3", "A", True)
+    assert (await service.get_profile("s1", 300))["staleness_seconds"] == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_delete_attempt_invalidates_snapshot(db_session):
+    """
+    Test: 스냅샷에 반영된 시도를 삭제
+    Expected: 해당 쌍이 다시 갱신 대상이 되어 지연으로 보고되고, 다음 갱신에서 남은 기록으로 재계산,
+              마지막 시도까지 삭제하면 스냅샷 행도 제거
+    """
+    from app.models.mastery_snapshot_progress import MasterySnapshotProgress, SNAPSHOT_WORKER_ID
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    repo = StudentAttemptRepository(db_session)
+    first = await repo.create_attempt("s1", "q1", "A", True)
+    second = await repo.create_attempt("s1", "q2", "A", True)
+    await repo.create_attempt("s1", "q3", "B", False)
+
+    service = _snapshot_service(db_session)
+    snapshot_repo = MasterySnapshotRepository(db_session)
+    await service.refresh()
+    before = (await service.get_profile("s1", 300))["profile"]["A"]
+
+    # 마지막이 아닌 시도를 삭제해도 스냅샷의 last_attempt_id와 달라져 갱신 대상
+    await repo.delete_attempt(first.id)
+    assert [(sid, c) for sid, c, _, _ in await snapshot_repo.get_pending()] == [("s1", "A")]
+
+    progress = await db_session.get(MasterySnapshotProgress, SNAPSHOT_WORKER_ID)
+    progress.caught_up_at = datetime.utcnow() - timedelta(minutes=30)
+    await db_session.commit()
+    result = await service.get_profile("s1", 300)
+    assert result["source"] == "live"
+    assert result["profile"]["A"] != pytest.approx(before)
+
+    # 워커가 남은 기록으로 다시 계산
+    assert (await service.refresh())["snapshots"] == 1
+    assert await snapshot_repo.get_pending() == []
+    result = await service.get_profile("s1", 300)
+    assert result["source"] == "snapshot"
+    assert result["staleness_seconds"] == 0.0
+    live = await service.mastery_service.get_student_mastery_profile("s1")
+    assert result["profile"]["A"] == pytest.approx(live["A"])
+
+    # 마지막 시도 삭제 → 스냅샷 행 제거 (실시간 프로파일과 같은 개념만 남음)
+    await repo.delete_attempt(second.id)
+    assert [row.concept for row in await snapshot_repo.get_by_student("s1")] == ["B"]
+    assert set((await service.get_profile("s1", 300))["profile"]) == {"B"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_staleness_counts_row_age_with_forgetting(db_session):
+    """
+    Test: 망각 감쇠 사용 시 스냅샷 값은 갱신 시점까지만 감쇠
+    Expected: 반영 안 된 변경이 없어도 행 갱신 후 경과 시간이 지연에 포함
+    """
+    from app.algorithms.bkt_forgetting import ForgettingKnowledgeTracing
+    from app.services.mastery_service import MasteryService
+    from app.services.mastery_snapshot_service import MasterySnapshotService
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    bkt = ForgettingKnowledgeTracing(half_life_days=30)
+    repo = StudentAttemptRepository(db_session, bkt)
+    await repo.create_attempt("s1", "q1", "A", True)
+
+    snapshot_repo = MasterySnapshotRepository(db_session)
+    service = MasterySnapshotService(MasteryService(repo, bkt), snapshot_repo)
+    await service.refresh()
+    assert (await service.get_profile("s1", 300))["source"] == "snapshot"
+
+    (row,) = await snapshot_repo.get_by_student("s1")
+    row.refreshed_at = datetime.utcnow() - timedelta(hours=1)
+    await db_session.commit()
+
+    result = await service.get_profile("s1", 300)
+    assert result["source"] == "live"
+    assert (await service.get_profile("s1", 7200))["staleness_seconds"] >= 3600
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_worker_run_once_catches_up(db_engine, db_session):
+    """
+    Test: 워커가 배치를 반복해 밀린 학생-개념 쌍을 모두 반영
+    Expected: 모든 학생-개념 스냅샷 생성, 상태 없는 과거 시도는 backfill 후 반영
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+    from app.services.bkt_parameter_store import BKTParameterStore
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.models.student_attempt import StudentAttempt
+    from workers.mastery_snapshot_worker import MasterySnapshotWorker
+
+    repo = StudentAttemptRepository(db_session)
+    for i in range(25):
+        await repo.create_attempt(f"s{i % 5}", f"q{i}", f"C{i % 3}", i % 2 == 0)
+
+    BKTParameterStore.invalidate()
+    try:
+        worker = MasterySnapshotWorker(
+            session_factory=async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False),
+            batch_size=4
+        )
+        refreshed = await worker.run_once()
+
+        # 상태 추적 이전의 시도는 자리 상태를 만든 뒤 반영
+        db_session.add(StudentAttempt(student_id="legacy", question_id="q", concept="C0", is_correct=True))
+        await db_session.commit()
+        assert await worker.run_once() == 0
+        assert await worker.backfill_states() == 1
+        assert await worker.backfill_states() == 0
+        assert await worker.run_once() == 1
+    finally:
+        BKTParameterStore.invalidate()
+
+    assert refreshed == 15
+    snapshot_repo = MasterySnapshotRepository(db_session)
+    assert await snapshot_repo.get_pending() == []
+    for i in range(5):
+        assert len(await snapshot_repo.get_by_student(f"s{i}")) == 3
+    (legacy,) = await snapshot_repo.get_by_student("legacy")
+    assert legacy.p_mastery == pytest.approx(BayesianKnowledgeTracing().calculate_mastery([{"is_correct": True}]))
+
+
+async def _seed_cohort(db_session):
+    """학교 2개, 학년 2개 학생과 스냅샷 생성, {(학교, 학년): {개념: [숙련도]}} 반환"""
+    from app.models.student import Student
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    expected = {}
+    snapshots = []
+    for n in range(24):
+        school_id = "school_a" if n < 16 else "school_b"
+        grade = 2 + n % 2
+        student_id = f"st{n:02d}"
+        db_session.add(Student(id=student_id, name=f"학생{n}", grade=grade, school_id=school_id))
+        for c, concept in enumerate(["이차방정식", "삼각함수"]):
+            p_mastery = round(((n * 7 + c * 5) % 19) / 20 + 0.025, 3)
+            snapshots.append({
+                "student_id": student_id, "concept": concept,
+                "p_mastery": p_mastery, "last_attempt_id": n + 1,
+            })
+            expected.setdefault((school_id, grade), {}).setdefault(concept, []).append(p_mastery)
+    await db_session.commit()
+    await MasterySnapshotRepository(db_session).save_many(snapshots, datetime.utcnow())
+    return expected
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_aggregate_concepts_matches_python(db_session):
+    """
+    Test: 코호트 개념별 분포 집계 (윈도 함수)
+    Expected: 평균/최소/최대/미달 수/nearest-rank 백분위가 파이썬 계산과 같음
+    """
+    import math
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    expected = await _seed_cohort(db_session)
+    repo = MasterySnapshotRepository(db_session)
+
+    for grade in (None, 2, 3):
+        rows = await repo.aggregate_concepts("school_a", grade=grade, threshold=0.5)
+        values_by_concept = {}
+        for (school_id, g), concepts in expected.items():
+            if school_id == "school_a" and grade in (None, g):
+                for concept, values in concepts.items():
+                    values_by_concept.setdefault(concept, []).extend(values)
+
+        assert [row["mean"] for row in rows] == sorted(row["mean"] for row in rows)
+        assert {row["concept"] for row in rows} == set(values_by_concept)
+        for row in rows:
+            values = sorted(values_by_concept[row["concept"]])
+            assert row["students"] == len(values)
+            assert row["mean"] == pytest.approx(sum(values) / len(values))
+            assert row["min"] == values[0]
+            assert row["max"] == values[-1]
+            assert row["below_threshold"] == sum(v < 0.5 for v in values)
+            for percentile in (25, 50, 75):
+                rank = math.ceil(percentile * len(values) / 100)
+                assert row[f"p{percentile}"] == values[rank - 1]
+
+    limited = await repo.aggregate_concepts("school_a", concepts=["삼각함수"], limit=1)
+    assert [row["concept"] for row in limited] == ["삼각함수"]
+    assert await repo.aggregate_concepts("school_missing") == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_cohort_students_below_threshold(db_session):
+    """
+    Test: 코호트 학생 중 개념 숙련도 임계값 미만 조회
+    Expected: 숙련도 오름차순, 백분위는 필터 전 코호트 기준
+    """
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    expected = await _seed_cohort(db_session)
+    repo = MasterySnapshotRepository(db_session)
+
+    everyone = await repo.get_cohort_students("school_a", "이차방정식", grade=3)
+    values = sorted(expected[("school_a", 3)]["이차방정식"])
+    assert [row["p_mastery"] for row in everyone] == values
+    assert everyone[0]["percentile"] == 0.0
+    assert everyone[-1]["percentile"] == 1.0
+    assert all(row["grade"] == 3 for row in everyone)
+
+    below = await repo.get_cohort_students("school_a", "이차방정식", grade=3, threshold=0.5)
+    assert [row["p_mastery"] for row in below] == [v for v in values if v < 0.5]
+    assert [row["percentile"] for row in below] == [row["percentile"] for row in everyone[:len(below)]]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cohort_staleness_follows_worker_progress(db_session):
+    """
+    Test: 코호트 조회의 지연
+    Expected: 코호트에 반영 안 된 변경이 없으면 행이 오래되어도 0,
+              있으면 워커 진행 시각 기준 (기록이 없으면 가장 오래된 행 기준)
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+
+    await _seed_cohort(db_session)
+    snapshot_repo = MasterySnapshotRepository(db_session)
+    rows = await snapshot_repo.get_cohort_students("school_a", "이차방정식")
+    await snapshot_repo.save_many(
+        [{"student_id": row["student_id"], "concept": "이차방정식",
+          "p_mastery": row["p_mastery"], "last_attempt_id": 0} for row in rows],
+        refreshed_at=datetime.utcnow() - timedelta(hours=1)
+    )
+    service = _snapshot_service(db_session)
+
+    assert (await service.get_cohort_concepts("school_a"))["staleness_seconds"] == 0.0
+    assert (await service.get_cohort_students("school_a", "이차방정식"))["staleness_seconds"] == 0.0
+
+    await StudentAttemptRepository(db_session).create_attempt("st00", "q1", "이차방정식", True)
+    assert (await service.get_cohort_concepts("school_a"))["staleness_seconds"] >= 3600
+    assert (await service.get_cohort_concepts("school_b"))["staleness_seconds"] == 0.0
+    assert (await service.get_cohort_students("school_a", "삼각함수"))["staleness_seconds"] == 0.0
+
+    await snapshot_repo.mark_caught_up(datetime.utcnow() - timedelta(seconds=10))
+    staleness = (await service.get_cohort_students("school_a", "이차방정식"))["staleness_seconds"]
+    assert 10 <= staleness < 60
@@ -0,0 +1,112 @@
+"""
+Unit Tests for Request-Scoped Context
+
+요청 범위(contextvars)로 DB 세션과 MCP 클라이언트를 tool/워크플로우 체인에서 공유하는지 테스트
+"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class CountingSessionFactory:
+    """만든 세션 수를 세는 세션 팩토리"""
+
+    def __init__(self, engine):
+        self.maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        self.created = 0
+
+    def __call__(self):
+        self.created += 1
+        return self.maker()
+
+
+def factory_session(engine):
+    """카운트하지 않는 검증용 세션"""
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_request_scope_shares_one_session(db_engine):
+    """
+    Test: 중첩 request_scope / use_db_session
+    Expected: 세션 하나만 생성, 범위 종료 시 커밋, 범위 밖에서는 None
+    """
+    from app.models.student import Student
+    from app.request_context import current_request, request_scope, use_db_session
+
+    factory = CountingSessionFactory(db_engine)
+    assert current_request() is None
+
+    async with request_scope(factory) as ctx:
+        async with request_scope(factory) as inner:
+            assert inner is ctx
+        async with use_db_session() as db:
+            assert db is ctx.db
+            db.add(Student(id="st_1", name="학생", grade=2, school_id="school_a"))
+        assert current_request() is ctx
+
+    assert current_request() is None
+    assert factory.created == 1
+
+    async with factory.maker() as session:
+        assert await session.get(Student, "st_1") is not None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_request_scope_rolls_back_on_error(db_engine):
+    """
+    Test: 범위 안에서 예외 발생
+    Expected: 롤백 후 예외 전파, 컨텍스트 해제
+    """
+    from app.models.student import Student
+    from app.request_context import current_request, request_scope
+
+    factory = CountingSessionFactory(db_engine)
+    with pytest.raises(RuntimeError):
+        async with request_scope(factory) as ctx:
+            ctx.db.add(Student(id="st_2", name="학생", grade=2, school_id="school_a"))
+            await ctx.db.flush()
+            raise RuntimeError("boom")
+
+    assert current_request() is None
+    async with factory.maker() as session:
+        assert await session.get(Student, "st_2") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_tools_reuse_request_session_and_mcp_client(db_engine, mock_mcp):
+    """
+    Test: 레지스트리 tool(db_session 없음)을 요청 범위 안에서 연속 실행
+    Expected: 범위의 세션과 MCP 클라이언트를 사용, 호출마다 연결/해제 없음
+    """
+    from sqlalchemy import select
+    from app.mcp.tools.student_profile import GetStudentProfileTool
+    from app.mcp.tools.weekly_diagnostic import AnalyzeStudentWeaknessesTool
+    from app.models.student import Student
+    from app.models.workflow_session import WorkflowSession
+    from app.request_context import get_mcp_client, request_scope
+
+    async with factory_session(db_engine) as session:
+        session.add(Student(id="st_3", name="학생", grade=2, school_id="school_a"))
+        await session.commit()
+
+    factory = CountingSessionFactory(db_engine)
+    async with request_scope(factory, mcp=mock_mcp):
+        assert await get_mcp_client() is mock_mcp
+
+        profile = await GetStudentProfileTool().execute({"student_id": "st_3"})
+        diagnostic = await AnalyzeStudentWeaknessesTool().execute(
+            {"student_id": "st_3", "curriculum_path": "중학수학.2학년.1학기"}
+        )
+
+    assert profile["student"]["id"] == "st_3"
+    assert diagnostic["workflow_id"]
+    assert factory.created == 1
+    assert mock_mcp.called("lab-node", "get_concept_heatmap")
+    assert mock_mcp.called("q-dna", "recommend_questions")
+
+    async with factory_session(db_engine) as session:
+        result = await session.execute(select(WorkflowSession).where(WorkflowSession.student_id == "st_3"))
+        assert len(result.scalars().all()) == 1
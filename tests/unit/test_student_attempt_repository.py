@@ -445,3 +445,362 @@ async def test_create_attempt_returns_persisted_object(db_session):
     found = await repo.get_by_id(returned_attempt.id)
     assert found is not None
     assert found.id == returned_attempt.id
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_attempt_updates_mastery_state(db_session):
+    """
+    Test: create_attempt가 숙련도 상태를 증분 갱신하는지 확인
+    Expected: 상태의 P(L)이 전체 기록 재생 결과와 같고, 횟수/마지막 ID가 갱신됨
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    repo = StudentAttemptRepository(db_session)
+    bkt = BayesianKnowledgeTracing()
+
+    # Given: 아직 상태 없음
+    assert await repo.get_mastery_state("student_1", "이차방정식") is None
+
+    # When
+    outcomes = [True, False, True, True]
+    last = None
+    for i, is_correct in enumerate(outcomes):
+        last = await repo.create_attempt(
+            student_id="student_1",
+            question_id=f"q_{i}",
+            concept="이차방정식",
+            is_correct=is_correct
+        )
+
+    # Then
+    state = await repo.get_mastery_state("student_1", "이차방정식")
+    assert state is not None
+    assert state.attempt_count == 4
+    assert state.last_attempt_id == last.id
+    expected = bkt.calculate_mastery([{"is_correct": c} for c in outcomes])
+    assert state.p_mastery == pytest.approx(expected, abs=1e-12)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_attempt_backfills_state_from_history(db_session):
+    """
+    Test: 상태 없이 쌓인 기존 기록이 있을 때 첫 create_attempt에서 상태 생성
+    Expected: 기존 기록 + 새 시도를 모두 반영한 상태
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.models.student_attempt import StudentAttempt
+
+    # Given: 상태 갱신을 거치지 않은 기존 기록
+    now = datetime.utcnow() - timedelta(days=1)
+    for i, is_correct in enumerate([False, False, True]):
+        db_session.add(StudentAttempt(
+            student_id="student_1",
+            question_id=f"old_{i}",
+            concept="미분",
+            is_correct=is_correct,
+            attempted_at=now + timedelta(seconds=i)
+        ))
+    await db_session.commit()
+
+    # When
+    repo = StudentAttemptRepository(db_session)
+    await repo.create_attempt("student_1", "q_new", "미분", True)
+
+    # Then
+    state = await repo.get_mastery_state("student_1", "미분")
+    assert state.attempt_count == 4
+    expected = BayesianKnowledgeTracing().calculate_mastery(
+        [{"is_correct": c} for c in [False, False, True, True]]
+    )
+    assert state.p_mastery == pytest.approx(expected, abs=1e-12)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_attempt_when_state_created_concurrently(db_session):
+    """
+    Test: 상태 조회(FOR UPDATE) 직후 다른 트랜잭션이 같은 쌍의 첫 상태를 만든 경우
+    Expected: 유니크 제약 위반 없이 그 상태를 잠가 한 스텝 적용
+    """
+    from sqlalchemy import insert
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+    from app.models.student_mastery_state import StudentMasteryState
+
+    repo = StudentAttemptRepository(db_session)
+    bkt = BayesianKnowledgeTracing()
+    winner_p = bkt.update(bkt.p_init, True)
+    execute = db_session.execute
+    raced = []
+
+    async def execute_with_race(statement, *args, **kwargs):
+        result = await execute(statement, *args, **kwargs)
+        if not raced and getattr(statement, "_for_update_arg", None) is not None:
+            # 첫 잠금 조회 결과(행 없음)를 받은 뒤 경쟁 트랜잭션이 상태를 커밋
+            raced.append(True)
+            await execute(insert(StudentMasteryState).values(
+                student_id="student_1", concept="함수", p_mastery=winner_p,
+                attempt_count=1, params_key=bkt.params_key,
+                last_attempted_at=datetime.utcnow() - timedelta(seconds=1)
+            ))
+        return result
+
+    db_session.execute = execute_with_race
+    await repo.create_attempt("student_1", "q_1", "함수", False)
+    db_session.execute = execute
+
+    state = await repo.get_mastery_state("student_1", "함수")
+    assert raced
+    assert state.attempt_count == 2
+    assert state.p_mastery == pytest.approx(bkt.update(winner_p, False), abs=1e-12)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_delete_attempt_resets_mastery_state(db_session):
+    """
+    Test: 시도 삭제 시 해당 학생-개념 상태 무효화
+    Expected: 상태가 자리 행(-삭제한 ID)으로 바뀌고 다음 create_attempt에서 남은 기록으로 재구성,
+              마지막 시도까지 삭제하면 상태 제거
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+
+    repo = StudentAttemptRepository(db_session)
+    first = await repo.create_attempt("student_1", "q_1", "적분", False)
+    second = await repo.create_attempt("student_1", "q_2", "적분", True)
+
+    # When
+    await repo.delete_attempt(first.id)
+
+    # Then
+    state = await repo.get_mastery_state("student_1", "적분")
+    assert state.last_attempt_id == -first.id
+    assert state.params_key == ""
+
+    third = await repo.create_attempt("student_1", "q_3", "적분", True)
+    state = await repo.get_mastery_state("student_1", "적분")
+    assert state.attempt_count == 2
+    assert state.last_attempt_id == third.id
+
+    await repo.delete_attempt(second.id)
+    await repo.delete_attempt(third.id)
+    assert await repo.get_mastery_state("student_1", "적분") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_create_attempts_maintains_mastery_state(db_session):
+    """
+    Test: 대량 적재 후 숙련도 상태
+    Expected: 시도가 모두 저장되고, 상태가 개별 create_attempt 경로와 같음
+              (기존 상태 이후 시도는 증분 적용, 이전 시각 시도는 전체 재생)
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.algorithms.bkt import BayesianKnowledgeTracing
+
+    repo = StudentAttemptRepository(db_session)
+    await repo.create_attempt("student_1", "q_0", "미분", False)
+
+    base = datetime.utcnow() + timedelta(minutes=1)
+    rows = [
+        {"student_id": f"student_{i % 3}", "question_id": f"q_{i}",
+         "concept": "미분" if i % 2 else "적분", "is_correct": i % 3 != 1,
+         "attempted_at": base + timedelta(seconds=i)}
+        for i in range(1, 31)
+    ]
+    # 기존 상태보다 이른 시각의 시도 (전체 재생 경로)
+    rows.append({"student_id": "student_2", "question_id": "q_old", "concept": "적분",
+                 "is_correct": False, "attempted_at": base - timedelta(days=1)})
+
+    inserted = await repo.bulk_create_attempts(rows)
+
+    assert inserted == 31
+    assert await repo.count_attempts_by_student("student_1") == 11
+    bkt = BayesianKnowledgeTracing()
+    for student_id in ("student_0", "student_1", "student_2"):
+        for concept in ("미분", "적분"):
+            history = await repo.get_student_mastery_data(student_id, concept)
+            state = await repo.get_mastery_state(student_id, concept)
+            assert state.attempt_count == len(history)
+            assert state.p_mastery == pytest.approx(bkt.calculate_mastery(history), abs=1e-12)
+            assert state.last_attempted_at == history[-1]["attempted_at"]
+            attempts = await repo.get_by_concept(student_id, concept)
+            assert state.last_attempt_id == max(a.id for a in attempts)
+
+    assert await repo.bulk_create_attempts([]) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_create_attempts_rolls_back_on_failure(db_session, monkeypatch):
+    """
+    Test: 적재 후 상태 갱신 단계에서 실패
+    Expected: 적재한 시도까지 모두 롤백 (한 트랜잭션),
+              attempted_at이 없는 행은 입력 순서대로 서로 다른 시각
+    """
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+
+    repo = StudentAttemptRepository(db_session)
+    rows = [
+        {"student_id": "student_1", "question_id": f"q_{i}", "concept": "미분", "is_correct": i % 2 == 0}
+        for i in range(5)
+    ]
+
+    async def fail(records):
+        raise RuntimeError("state update failed")
+
+    monkeypatch.setattr(repo, "_advance_mastery_states", fail)
+    with pytest.raises(RuntimeError):
+        await repo.bulk_create_attempts(rows)
+    await db_session.rollback()
+    assert await repo.count_attempts_by_student("student_1") == 0
+
+    monkeypatch.undo()
+    assert await repo.bulk_create_attempts(rows) == 5
+    attempts = await repo.get_by_concept("student_1", "미분")
+    by_id = sorted(attempts, key=lambda a: a.id)
+    assert [a.question_id for a in by_id] == [f"q_{i}" for i in range(5)]
+    times = [a.attempted_at for a in by_id]
+    assert times == sorted(times) and len(set(times)) == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_page_keyset_pagination(db_session):
+    """
+    Test: (attempted_at, id) 키셋 페이지네이션
+    Expected: 같은 시각 행도 id로 구분해 중복/누락 없이 최신순으로 순회,
+              순회 중 새 시도가 삽입되어도 이후 페이지가 밀리지 않음
+    """
+    from app.repositories.student_attempt_repository import (
+        StudentAttemptRepository, decode_attempt_cursor
+    )
+    from app.models.student_attempt import StudentAttempt
+
+    now = datetime.utcnow()
+    for i in range(23):
+        db_session.add(StudentAttempt(
+            student_id="student_1", question_id=f"q_{i}", concept="미분" if i % 4 else "적분",
+            is_correct=True, attempted_at=now - timedelta(minutes=i // 3)
+        ))
+    await db_session.commit()
+    repo = StudentAttemptRepository(db_session)
+    expected = sorted(
+        await repo.get_by_student("student_1"), key=lambda a: (a.attempted_at, a.id), reverse=True
+    )
+
+    seen = []
+    page, cursor = await repo.get_page("student_1", limit=5)
+    seen.extend(page)
+    # 첫 페이지 이후 더 최신 시도가 삽입되어도 이후 페이지에는 영향 없음
+    await repo.create_attempt("student_1", "q_new", "미분", True)
+    while cursor:
+        page, cursor = await repo.get_page("student_1", limit=5, cursor=cursor)
+        assert 0 < len(page) <= 5
+        seen.extend(page)
+
+    assert [a.id for a in seen] == [a.id for a in expected]
+
+    concept_page, concept_cursor = await repo.get_page("student_1", "적분", limit=10)
+    assert [a.concept for a in concept_page] == ["적분"] * 6
+    assert concept_cursor is None
+
+    with pytest.raises(ValueError):
+        await repo.get_page("student_1", cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        decode_attempt_cursor("e30")  # "{}"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_aggregate_by_concept_single_query(db_session):
+    """
+    Test: 여러 개념 통계를 한 GROUP BY 쿼리로 집계
+    Expected: 시도 수/정답 수/정답률/평균 응답 시간/마지막 시도가 파이썬 계산과 같고
+              SELECT는 한 번만 실행
+    """
+    from sqlalchemy import event
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.models.student_attempt import StudentAttempt
+
+    now = datetime.utcnow()
+    rows = [
+        ("미분", True, 1000, now - timedelta(hours=3)),
+        ("미분", False, 3000, now - timedelta(hours=1)),
+        ("미분", True, None, now - timedelta(hours=2)),
+        ("적분", False, None, now),
+        ("극한", True, 500, now),
+    ]
+    for i, (concept, is_correct, response_time_ms, attempted_at) in enumerate(rows):
+        db_session.add(StudentAttempt(
+            student_id="student_1", question_id=f"q_{i}", concept=concept,
+            is_correct=is_correct, response_time_ms=response_time_ms, attempted_at=attempted_at
+        ))
+    db_session.add(StudentAttempt(student_id="student_2", question_id="q_x", concept="미분", is_correct=False))
+    await db_session.commit()
+
+    statements = []
+    sync_engine = db_session.bind.sync_engine
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        repo = StudentAttemptRepository(db_session)
+        stats = await repo.aggregate_by_concept("student_1", ["미분", "적분", "없는개념"])
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert set(stats) == {"미분", "적분"}
+    assert stats["미분"]["attempts"] == 3
+    assert stats["미분"]["correct"] == 2
+    assert stats["미분"]["accuracy"] == pytest.approx(2 / 3)
+    assert stats["미분"]["mean_response_time_ms"] == pytest.approx(2000)
+    assert stats["미분"]["last_attempted_at"] == now - timedelta(hours=1)
+    assert stats["적분"]["accuracy"] == 0.0
+    assert stats["적분"]["mean_response_time_ms"] is None
+
+    assert list(await repo.aggregate_by_concept("student_1")) == ["극한", "미분", "적분"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_outcomes_projected_read(db_session):
+    """
+    Test: is_correct 컬럼만 시간순으로 조회
+    Expected: 시간순 bool 배열, ORM 객체를 세션에 올리지 않음, until 이후 제외
+    """
+    import numpy as np
+    from app.repositories.student_attempt_repository import StudentAttemptRepository
+    from app.models.student_attempt import StudentAttempt
+
+    now = datetime.utcnow()
+    pattern = [True, False, False, True, True]
+    # 시간 역순으로 삽입해 정렬이 SQL에서 일어나는지 확인
+    for i, is_correct in reversed(list(enumerate(pattern))):
+        db_session.add(StudentAttempt(
+            student_id="student_1", question_id=f"q_{i}", concept="미분",
+            is_correct=is_correct, attempted_at=now + timedelta(minutes=i)
+        ))
+    await db_session.commit()
+    db_session.expunge_all()
+
+    repo = StudentAttemptRepository(db_session)
+    outcomes = await repo.get_outcomes("student_1", "미분")
+
+    assert outcomes.dtype == np.bool_
+    assert outcomes.tolist() == pattern
+    assert len(db_session.identity_map) == 0
+
+    until = await repo.get_outcomes("student_1", "미분", until=now + timedelta(minutes=2))
+    assert until.tolist() == pattern[:3]
+    assert (await repo.get_outcomes("student_1", "없는개념")).size == 0
+
+    history = await repo.get_student_mastery_data("student_1", "미분")
+    assert [h["is_correct"] for h in history] == pattern
@@ -274,3 +274,142 @@ async def test_student_exists(db_session: AsyncSession):
     # When/Then: 존재하지 않는 학생
     not_exists = await repo.exists("nonexistent_id")
     assert not_exists is False
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_students(db_session: AsyncSession):
+    """대량 생성/수정 테스트 (청크 단위 INSERT ... ON CONFLICT)"""
+    repo = StudentRepository(db_session)
+
+    # Given: 기존 학생 2명
+    await repo.create(name="기존1", grade=1, school_id="school_bulk", student_id="bulk_000")
+    await repo.create(name="기존2", grade=1, school_id="school_bulk", student_id="bulk_001")
+
+    # When: 제너레이터로 10명 (기존 2명 포함) 업서트, 청크 크기 3
+    records = (
+        {"id": f"bulk_{i:03d}", "name": f"학생{i}", "grade": 2, "school_id": "school_bulk"}
+        for i in range(10)
+    )
+    result = await repo.bulk_upsert(records, chunk_size=3)
+
+    # Then
+    assert result == {
+        "inserted": 8, "updated": 2, "skipped": 0, "conflicts": ["bulk_000", "bulk_001"]
+    }
+    assert await repo.count_by_school("school_bulk") == 10
+    updated = await repo.get_by_id("bulk_000")
+    await db_session.refresh(updated)
+    assert (updated.name, updated.grade) == ("학생0", 2)
+
+    # When: 기존 학생 건너뛰기 + 입력 내 중복 ID + ID 없는 행
+    result = await repo.bulk_upsert(
+        [
+            {"id": "bulk_001", "name": "무시", "grade": 3, "school_id": "school_bulk"},
+            {"id": "bulk_100", "name": "첫째", "grade": 3, "school_id": "school_bulk"},
+            {"id": "bulk_100", "name": "둘째", "grade": 3, "school_id": "school_bulk"},
+            {"name": "자동ID", "grade": 3, "school_id": "school_bulk"},
+        ],
+        update_existing=False
+    )
+
+    # Then: 중복은 마지막 행 사용
+    assert result["inserted"] == 2
+    assert result["skipped"] == 2
+    assert sorted(result["conflicts"]) == ["bulk_001", "bulk_100"]
+    assert (await repo.get_by_id("bulk_100")).name == "둘째"
+    skipped = await repo.get_by_id("bulk_001")
+    await db_session.refresh(skipped)
+    assert skipped.name == "학생1"
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_students(db_session: AsyncSession):
+    """대량 수정 테스트 (없는 ID는 missing으로 보고)"""
+    repo = StudentRepository(db_session)
+    await repo.bulk_upsert(
+        {"id": f"upd_{i}", "name": f"학생{i}", "grade": 1, "school_id": "school_upd"}
+        for i in range(5)
+    )
+
+    result = await repo.bulk_update(
+        [
+            {"id": "upd_0", "grade": 2},
+            {"id": "upd_1", "name": "개명", "school_id": "school_moved"},
+            {"id": "upd_missing", "grade": 3},
+            {"id": "upd_4", "grade": 2},
+        ],
+        chunk_size=2
+    )
+
+    assert result == {"updated": 3, "missing": ["upd_missing"]}
+    students = {s.id: s for s in await repo.list_all()}
+    for student in students.values():
+        await db_session.refresh(student)
+    assert (students["upd_0"].name, students["upd_0"].grade) == ("학생0", 2)
+    assert (students["upd_1"].name, students["upd_1"].school_id) == ("개명", "school_moved")
+    assert students["upd_2"].grade == 1
+    assert "upd_missing" not in students
+
+
+async def _seed_school_students(repo: StudentRepository):
+    """학교 2곳, 학년 2개 학생 12명"""
+    await repo.bulk_upsert(
+        {
+            "id": f"page_{i:02d}",
+            "name": f"학생{i}",
+            "grade": 1 + i % 2,
+            "school_id": "school_page_a" if i < 8 else "school_page_b",
+        }
+        for i in range(12)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_page_keyset_pagination(db_session: AsyncSession):
+    """키셋 페이지 조회 테스트 ((school_id, grade, id) 순, 커서로 이어 읽기)"""
+    repo = StudentRepository(db_session)
+    await _seed_school_students(repo)
+
+    for school_id, grade in [(None, None), ("school_page_a", None), ("school_page_a", 2)]:
+        expected = [
+            s.id for s in sorted(
+                await repo.list_students(limit=100, school_id=school_id, grade=grade),
+                key=lambda s: (s.school_id, s.grade, s.id)
+            )
+        ]
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = await repo.get_page(school_id=school_id, grade=grade, limit=3, cursor=cursor)
+            assert len(page) <= 3
+            seen.extend(s.id for s in page)
+            if cursor is None:
+                break
+
+        assert seen == expected
+
+    # 커서 이후 앞쪽에 삽입된 행은 다음 페이지에 끼어들지 않음
+    page, cursor = await repo.get_page(school_id="school_page_a", grade=1, limit=2)
+    await repo.create(name="새학생", grade=1, school_id="school_page_a", student_id="page_00a")
+    more, _ = await repo.get_page(school_id="school_page_a", grade=1, limit=10, cursor=cursor)
+    assert not set(s.id for s in page) & set(s.id for s in more)
+    assert "page_00a" not in [s.id for s in more]
+
+    with pytest.raises(ValueError):
+        await repo.get_page(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_stream_students_in_batches(db_session: AsyncSession):
+    """서버 측 커서 배치 스트리밍 테스트"""
+    repo = StudentRepository(db_session)
+    await _seed_school_students(repo)
+
+    batches = [batch async for batch in repo.stream_students(batch_size=5)]
+    assert [len(batch) for batch in batches] == [5, 5, 2]
+    streamed = [s.id for batch in batches for s in batch]
+    assert streamed == [s.id for s in (await repo.get_page(limit=100))[0]]
+
+    filtered = [s async for batch in repo.stream_students(school_id="school_page_b") for s in batch]
+    assert {s.school_id for s in filtered} == {"school_page_b"}
+    assert len(filtered) == 4
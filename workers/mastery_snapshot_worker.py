@@ -0,0 +1,138 @@
+"""
+Mastery Snapshot Worker
+
+student_mastery_states(시도 기록과 같은 트랜잭션에서 갱신)와 스냅샷을 비교해
+student_concept_mastery의 바뀐 학생-개념 행만 주기적으로 갱신하는 백그라운드 워커
+
+상태 추적 이전에 쌓인 시도는 상태가 없어 대상에 나타나지 않으므로, 처음 배포할 때
+--backfill-states로 한 번 상태 자리를 만들어 둔다.
+
+Usage:
+    python -m workers.mastery_snapshot_worker --poll-interval 5 --batch-size 1000
+    python -m workers.mastery_snapshot_worker --backfill-states --once
+"""
+import argparse
+import asyncio
+import logging
+from typing import Optional, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import primary_session_maker
+from app.repositories.student_attempt_repository import StudentAttemptRepository
+from app.repositories.mastery_snapshot_repository import MasterySnapshotRepository
+from app.services.bkt_parameter_store import BKTParameterStore
+from app.services.mastery_service import MasteryService
+from app.services.mastery_snapshot_service import MasterySnapshotService
+
+logger = logging.getLogger(__name__)
+
+
+class MasterySnapshotWorker:
+    """숙련도 스냅샷 갱신 워커"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = primary_session_maker,
+        poll_interval: float = 5.0,
+        batch_size: int = 1000
+    ):
+        """
+        워커 초기화
+
+        Args:
+            session_factory: 배치마다 새 세션을 만들 팩토리
+                (읽은 시도로 스냅샷을 쓰므로 기본값은 복제본을 쓰지 않는 primary_session_maker)
+            poll_interval: 갱신할 쌍이 없을 때 대기 시간 (초)
+            batch_size: 배치당 최대 학생-개념 쌍 수
+        """
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+
+    async def backfill_states(self) -> int:
+        """
+        상태가 없는 학생-개념 쌍에 상태 자리 생성 (StudentAttemptRepository.backfill_mastery_states)
+
+        Returns:
+            생성한 상태 행 수
+        """
+        async with self.session_factory() as session:
+            created = await StudentAttemptRepository(session).backfill_mastery_states()
+        logger.info(f"Backfilled {created} mastery states")
+        return created
+
+    async def run_once(self) -> int:
+        """
+        밀린 학생-개념 쌍을 모두 반영할 때까지 배치 반복
+
+        Returns:
+            갱신한 스냅샷 행 수
+        """
+        refreshed = 0
+        while True:
+            async with self.session_factory() as session:
+                store = await BKTParameterStore.get_instance(session)
+                mastery_service = MasteryService(
+                    StudentAttemptRepository(session, store.default, store),
+                    store.default,
+                    store
+                )
+                service = MasterySnapshotService(mastery_service, MasterySnapshotRepository(session))
+                result = await service.refresh(batch_size=self.batch_size)
+
+            refreshed += result["snapshots"]
+            if result["snapshots"]:
+                logger.info(f"Refreshed {result['snapshots']} snapshots")
+            if result["caught_up"]:
+                return refreshed
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """
+        stop_event가 설정될 때까지 주기적으로 run_once 실행
+
+        Args:
+            stop_event: 종료 신호 (None이면 무한 실행)
+        """
+        stop_event = stop_event or asyncio.Event()
+        logger.info("Mastery snapshot worker started")
+
+        while not stop_event.is_set():
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Mastery snapshot refresh failed")
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.info("Mastery snapshot worker stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh student_concept_mastery snapshots")
+    parser.add_argument("--poll-interval", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--once", action="store_true", help="catch up once and exit")
+    parser.add_argument("--backfill-states", action="store_true",
+                        help="create missing student_mastery_states rows before refreshing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    worker = MasterySnapshotWorker(
+        poll_interval=args.poll_interval,
+        batch_size=args.batch_size
+    )
+
+    async def start():
+        if args.backfill_states:
+            await worker.backfill_states()
+        await (worker.run_once() if args.once else worker.run())
+
+    asyncio.run(start())
+
+
+if __name__ == "__main__":
+    main()